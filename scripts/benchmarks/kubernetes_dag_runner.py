@@ -0,0 +1,162 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Stress benchmark of the Kubernetes orchestrator's DAG runner.
+
+Runs a fan-out pipeline `root->(step_0, ..., step_n)->sink` with a fake
+`run_fn` that sleeps instead of running a step pod. Reports the wall time,
+the peak number of concurrently running steps and the number of steps that
+were run when one of the fan-out steps fails.
+
+Usage:
+    python scripts/benchmarks/kubernetes_dag_runner.py --steps 500
+"""
+
+import argparse
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from zenml.integrations.kubernetes.orchestrators.dag_runner import (
+    FailurePolicy,
+    NodeStatus,
+    ThreadedDagRunner,
+)
+
+
+class FakeRunFn:
+    """Fake step pod that tracks how many steps run concurrently."""
+
+    def __init__(
+        self, duration: float, failing_steps: Optional[Set[str]] = None
+    ) -> None:
+        """Initializes the fake run function.
+
+        Args:
+            duration: Duration of each step in seconds.
+            failing_steps: Names of the steps that fail.
+        """
+        self.duration = duration
+        self.failing_steps = failing_steps or set()
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, step_name: str) -> None:
+        """Simulates running a step pod.
+
+        Args:
+            step_name: Name of the step.
+
+        Raises:
+            RuntimeError: If the step is configured to fail.
+        """
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(self.duration)
+            if step_name in self.failing_steps:
+                raise RuntimeError(f"Step `{step_name}` failed.")
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+def fan_out_dag(steps: int) -> Dict[str, List[str]]:
+    """Creates a fan-out DAG.
+
+    Args:
+        steps: Number of parallel steps.
+
+    Returns:
+        Adjacency list representation of the DAG.
+    """
+    dag = {"root": [], "sink": [f"step_{i}" for i in range(steps)]}
+    dag.update({f"step_{i}": ["root"] for i in range(steps)})
+    return dag
+
+
+def run(
+    dag: Dict[str, List[str]],
+    run_fn: FakeRunFn,
+    max_parallelism: Optional[int],
+    failure_policy: FailurePolicy = FailurePolicy.FAIL_FAST,
+) -> Tuple[float, int]:
+    """Runs a DAG with the given scheduler configuration.
+
+    Args:
+        dag: The DAG to run.
+        run_fn: The fake run function.
+        max_parallelism: Maximum number of concurrently running steps.
+        failure_policy: What to do when a step fails.
+
+    Returns:
+        The wall time in seconds and the number of completed steps.
+    """
+    runner = ThreadedDagRunner(
+        dag,
+        run_fn,
+        max_parallelism=max_parallelism,
+        failure_policy=failure_policy,
+    )
+    start = time.perf_counter()
+    try:
+        runner.run()
+    except RuntimeError:
+        pass
+    wall_time = time.perf_counter() - start
+    completed = sum(
+        state == NodeStatus.COMPLETED for state in runner.node_states.values()
+    )
+    return wall_time, completed
+
+
+def main() -> None:
+    """Runs the benchmark and prints the results as a table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=0.05)
+    parser.add_argument(
+        "--max-parallelism", type=int, nargs="+", default=[0, 100, 20]
+    )
+    args = parser.parse_args()
+
+    dag = fan_out_dag(args.steps)
+    print(f"Fan-out DAG with {len(dag)} steps of {args.duration}s each\n")
+    print(
+        f"{'max parallelism':<18}{'policy':<12}{'wall [s]':>10}"
+        f"{'peak':>8}{'completed':>11}"
+    )
+    for max_parallelism in args.max_parallelism:
+        for failure_policy, failing_steps in (
+            (FailurePolicy.FAIL_FAST, set()),
+            (FailurePolicy.FAIL_FAST, {"step_0"}),
+            (FailurePolicy.CONTINUE, {"step_0"}),
+        ):
+            run_fn = FakeRunFn(args.duration, failing_steps=failing_steps)
+            wall_time, completed = run(
+                dag,
+                run_fn,
+                max_parallelism=max_parallelism or None,
+                failure_policy=failure_policy,
+            )
+            policy = failure_policy.value if failing_steps else "-"
+            print(
+                f"{max_parallelism or 'unlimited':<18}{policy:<12}"
+                f"{wall_time:>10.2f}{run_fn.peak:>8}{completed:>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark of the parquet codecs supported by the pandas materializer.
+
+Usage:
+    python scripts/benchmarks/pandas_compression.py --rows 5000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List, Optional, Tuple, Type
+
+import numpy as np
+import pandas as pd
+
+from zenml.artifacts import DataArtifact
+from zenml.materializers.pandas_materializer import PandasMaterializer
+
+CODECS: List[Tuple[str, Optional[int]]] = [
+    ("none", None),
+    ("snappy", None),
+    ("lz4", None),
+    ("zstd", 1),
+    ("zstd", 3),
+    ("zstd", 9),
+    ("gzip", None),
+]
+
+
+def make_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Creates a dataframe resembling a typical tabular training dataset.
+
+    Args:
+        rows: Number of rows of the dataframe.
+        seed: Random seed.
+
+    Returns:
+        A dataframe with float, integer, categorical and string columns.
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "float_feature": rng.normal(size=rows),
+            "sparse_feature": np.where(
+                rng.random(rows) < 0.9, 0.0, rng.random(rows)
+            ),
+            "int_feature": rng.integers(0, 1_000_000, size=rows),
+            "category": rng.choice(["a", "b", "c", "d"], size=rows),
+            "user_id": [f"user_{i % 10_000}" for i in range(rows)],
+            "label": rng.integers(0, 2, size=rows),
+        }
+    )
+
+
+def run(
+    materializer_class: Type[PandasMaterializer], df: pd.DataFrame
+) -> Tuple[float, float, int]:
+    """Writes and reads a dataframe using the given materializer.
+
+    Args:
+        materializer_class: The materializer class to benchmark.
+        df: The dataframe to write and read.
+
+    Returns:
+        Write time and read time in seconds and the size of the file in bytes.
+    """
+    with tempfile.TemporaryDirectory() as artifact_uri:
+        artifact = DataArtifact()
+        artifact.uri = artifact_uri
+        materializer = materializer_class(artifact)
+
+        start = time.perf_counter()
+        materializer.handle_return(df)
+        write_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        materializer.handle_input(pd.DataFrame)
+        read_time = time.perf_counter() - start
+
+        size = sum(
+            os.path.getsize(os.path.join(artifact_uri, f))
+            for f in os.listdir(artifact_uri)
+        )
+    return write_time, read_time, size
+
+
+def main() -> None:
+    """Runs the benchmark and prints the results as a table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--row-group-size", type=int, default=None)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    in_memory_size = df.memory_usage(deep=True).sum()
+    print(f"Frame: {args.rows} rows, {in_memory_size / 1e6:.1f} MB in memory\n")
+    print(f"{'codec':<10}{'write [s]':>12}{'read [s]':>12}{'size [MB]':>12}")
+    for codec, level in CODECS:
+        materializer_class = type(
+            "BenchmarkPandasMaterializer",
+            (PandasMaterializer,),
+            {
+                "COMPRESSION": codec,
+                "COMPRESSION_LEVEL": level,
+                "ROW_GROUP_SIZE": args.row_group_size,
+            },
+        )
+        write_time, read_time, size = run(materializer_class, df)
+        name = codec if level is None else f"{codec}-{level}"
+        print(
+            f"{name:<10}{write_time:>12.2f}{read_time:>12.2f}"
+            f"{size / 1e6:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
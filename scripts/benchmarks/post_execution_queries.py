@@ -0,0 +1,238 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark of the metadata store queries of the post-execution layer.
+
+Records pipeline runs consisting of a chain of steps directly in a SQLite
+metadata store and counts the MLMD queries required to fetch all steps of a
+run including their inputs and outputs.
+
+Usage:
+    python scripts/benchmarks/post_execution_queries.py --steps 10 50 200
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Any, Callable, List, Tuple
+
+from ml_metadata.metadata_store import metadata_store
+from ml_metadata.proto import metadata_store_pb2
+
+from zenml.artifacts.constants import (
+    DATATYPE_PROPERTY_KEY,
+    MATERIALIZER_PROPERTY_KEY,
+)
+from zenml.metadata_stores import SQLiteMetadataStore
+from zenml.post_execution import PipelineRunView
+from zenml.steps.utils import (
+    INTERNAL_EXECUTION_PARAMETER_PREFIX,
+    PARAM_PIPELINE_PARAMETER_NAME,
+)
+
+
+class QueryCounter:
+    """Proxy of an MLMD store that counts all read queries."""
+
+    def __init__(self, store: metadata_store.MetadataStore) -> None:
+        """Initializes the proxy.
+
+        Args:
+            store: The MLMD store to proxy.
+        """
+        self._store = store
+        self.count = 0
+
+    def __getattr__(self, name: str) -> Any:
+        """Returns an attribute of the proxied store.
+
+        Args:
+            name: Name of the attribute.
+
+        Returns:
+            The attribute, wrapped to count the calls if it is a query.
+        """
+        attribute = getattr(self._store, name)
+        if not name.startswith("get_"):
+            return attribute
+
+        def _counted(*args: Any, **kwargs: Any) -> Any:
+            self.count += 1
+            return attribute(*args, **kwargs)
+
+        return _counted
+
+
+def record_run(store: metadata_store.MetadataStore, steps: int) -> int:
+    """Records a run of a pipeline with a chain of steps.
+
+    Each step consumes the output of the previous step.
+
+    Args:
+        store: The MLMD store in which to record the run.
+        steps: The number of steps of the pipeline.
+
+    Returns:
+        The id of the run context.
+    """
+    artifact_type = metadata_store_pb2.ArtifactType(name="DataArtifact")
+    artifact_type.properties[
+        MATERIALIZER_PROPERTY_KEY
+    ] = metadata_store_pb2.STRING
+    artifact_type.properties[DATATYPE_PROPERTY_KEY] = metadata_store_pb2.STRING
+    artifact_type_id = store.put_artifact_type(artifact_type)
+    context_type_id = store.put_context_type(
+        metadata_store_pb2.ContextType(name="pipeline_run")
+    )
+    [context_id] = store.put_contexts(
+        [
+            metadata_store_pb2.Context(
+                type_id=context_type_id, name=f"run_{steps}"
+            )
+        ]
+    )
+
+    previous_artifact_id = None
+    timestamp = int(time.time() * 1000)
+    for index in range(steps):
+        execution_type_id = store.put_execution_type(
+            metadata_store_pb2.ExecutionType(name=f"benchmark.step_{index}")
+        )
+        execution = metadata_store_pb2.Execution(
+            type_id=execution_type_id,
+            last_known_state=metadata_store_pb2.Execution.COMPLETE,
+        )
+        execution.custom_properties[
+            INTERNAL_EXECUTION_PARAMETER_PREFIX + PARAM_PIPELINE_PARAMETER_NAME
+        ].string_value = json.dumps(f"step_{index}")
+        [execution_id] = store.put_executions([execution])
+
+        artifact = metadata_store_pb2.Artifact(
+            type_id=artifact_type_id, uri=f"/artifacts/{index}"
+        )
+        artifact.properties[
+            MATERIALIZER_PROPERTY_KEY
+        ].string_value = (
+            "zenml.materializers.built_in_materializer.BuiltInMaterializer"
+        )
+        artifact.properties[DATATYPE_PROPERTY_KEY].string_value = "builtins.int"
+        [artifact_id] = store.put_artifacts([artifact])
+
+        events = []
+        for event_artifact_id, event_type, key in (
+            (previous_artifact_id, metadata_store_pb2.Event.INPUT, "input"),
+            (artifact_id, metadata_store_pb2.Event.OUTPUT, "output"),
+        ):
+            if event_artifact_id is None:
+                continue
+            timestamp += 1
+            event = metadata_store_pb2.Event(
+                artifact_id=event_artifact_id,
+                execution_id=execution_id,
+                type=event_type,
+                milliseconds_since_epoch=timestamp,
+            )
+            event.path.steps.add().key = key
+            events.append(event)
+        store.put_events(events)
+
+        store.put_attributions_and_associations(
+            [],
+            [
+                metadata_store_pb2.Association(
+                    context_id=context_id, execution_id=execution_id
+                )
+            ],
+        )
+        previous_artifact_id = artifact_id
+
+    return context_id
+
+
+def walk_run(run: PipelineRunView) -> None:
+    """Fetches all steps of a run including their inputs and outputs.
+
+    Args:
+        run: The run to walk.
+    """
+    for step in run.steps:
+        _ = step.inputs, step.outputs
+
+
+def walk_steps_individually(run: PipelineRunView) -> None:
+    """Fetches the inputs and outputs of all steps one by one.
+
+    Args:
+        run: The run to walk.
+    """
+    for step in run.steps:
+        run._metadata_store.get_step_artifacts(step)
+
+
+def count_queries(
+    directory: str, steps: int, walk: Callable[[PipelineRunView], None]
+) -> Tuple[int, float]:
+    """Counts the queries needed to walk a run with the given number of steps.
+
+    Args:
+        directory: Directory in which to create the metadata store.
+        steps: Number of steps of the run.
+        walk: Function that fetches information about the run.
+
+    Returns:
+        The number of queries and the duration in seconds.
+    """
+    zenml_metadata_store = SQLiteMetadataStore(
+        name="benchmark",
+        uri=os.path.join(directory, f"{walk.__name__}_{steps}.db"),
+    )
+    context_id = record_run(zenml_metadata_store.store, steps)
+
+    counter = QueryCounter(zenml_metadata_store.store)
+    zenml_metadata_store._store = counter  # type: ignore[assignment]
+    start = time.perf_counter()
+    run = PipelineRunView(
+        id_=context_id,
+        name=f"run_{steps}",
+        executions=counter.get_executions_by_context(context_id),
+        metadata_store=zenml_metadata_store,
+    )
+    walk(run)
+    return counter.count, time.perf_counter() - start
+
+
+def main() -> None:
+    """Runs the benchmark and prints the results as a table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, nargs="+", default=[10, 50, 200])
+    args = parser.parse_args()
+
+    walks: List[Callable[[PipelineRunView], None]] = [
+        walk_run,
+        walk_steps_individually,
+    ]
+    print(f"{'walk':<26}{'steps':>8}{'queries':>10}{'time [s]':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for walk in walks:
+            for steps in args.steps:
+                queries, duration = count_queries(directory, steps, walk)
+                print(
+                    f"{walk.__name__:<26}{steps:>8}{queries:>10}"
+                    f"{duration:>10.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Micro-benchmark of the per-call latency of the REST zen store.
+
+Starts a local ZenServer with uvicorn, backed by a temporary local zen store,
+and measures the latency of REST store calls. The `unpooled` rows open a new
+connection for every call, which is how the REST store sent requests before
+it used a pooled session.
+
+Usage:
+    python scripts/benchmarks/rest_zen_store_latency.py --calls 200
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from multiprocessing import Process
+from typing import Callable, List, Tuple
+
+import requests
+import uvicorn
+
+from zenml.config.global_config import GlobalConfiguration
+from zenml.config.profile_config import ProfileConfiguration
+from zenml.constants import (
+    DEFAULT_LOCAL_SERVICE_IP_ADDRESS,
+    DEFAULT_SERVICE_START_STOP_TIMEOUT,
+    ENV_ZENML_CONFIG_PATH,
+    ENV_ZENML_PROFILE_NAME,
+    STACK_CONFIGURATIONS,
+    STACKS,
+    STACKS_EMPTY,
+    ZEN_SERVER_ENTRYPOINT,
+)
+from zenml.utils.networking_utils import scan_for_available_port
+from zenml.zen_stores import LocalZenStore, RestZenStore
+
+
+def start_server(directory: str) -> Tuple[Process, str, str]:
+    """Starts a ZenServer backed by a local zen store.
+
+    Args:
+        directory: Directory in which to create the local zen store.
+
+    Returns:
+        The server process, the server URL and the name of the profile that
+        was created for the server.
+
+    Raises:
+        RuntimeError: If the server doesn't start.
+    """
+    backing_zen_store = LocalZenStore().initialize(directory)
+    profile = ProfileConfiguration(
+        name=f"rest_benchmark_{hash(directory)}",
+        store_url=backing_zen_store.url,
+        store_type=backing_zen_store.type,
+    )
+    global_config = GlobalConfiguration()
+    global_config.add_or_update_profile(profile)
+    env_file = os.path.join(directory, "environ.env")
+    with open(env_file, "w") as f:
+        f.write(f"{ENV_ZENML_PROFILE_NAME}='{profile.name}'\n")
+        f.write(f"{ENV_ZENML_CONFIG_PATH}='{global_config.config_directory}'\n")
+
+    port = scan_for_available_port(start=8003, stop=9000)
+    if not port:
+        raise RuntimeError("No available port found.")
+    process = Process(
+        target=uvicorn.run,
+        args=(ZEN_SERVER_ENTRYPOINT,),
+        kwargs=dict(
+            host=DEFAULT_LOCAL_SERVICE_IP_ADDRESS,
+            port=port,
+            log_level="warning",
+            env_file=env_file,
+        ),
+        daemon=True,
+    )
+    process.start()
+    url = f"http://{DEFAULT_LOCAL_SERVICE_IP_ADDRESS}:{port}"
+    for _ in range(DEFAULT_SERVICE_START_STOP_TIMEOUT):
+        try:
+            if requests.head(f"{url}/health").status_code == 200:
+                return process, url, profile.name
+        except requests.ConnectionError:
+            pass
+        time.sleep(1)
+    process.kill()
+    raise RuntimeError("Failed to start ZenServer.")
+
+
+def measure(call: Callable[[], object], calls: int) -> List[float]:
+    """Measures the latency of repeated calls.
+
+    Args:
+        call: The call to measure.
+        calls: Number of calls.
+
+    Returns:
+        The latency of each call in milliseconds.
+    """
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main() -> None:
+    """Runs the benchmark and prints the results as a table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        process, url, profile_name = start_server(directory)
+        try:
+            zen_store = RestZenStore().initialize(url)
+
+            print(f"{'call':<34}{'mean [ms]':>10}{'p50':>8}{'p95':>8}")
+            for path in (STACKS_EMPTY, STACK_CONFIGURATIONS, STACKS):
+                for name, call in (
+                    (
+                        "unpooled",
+                        lambda: zen_store._handle_response(
+                            requests.get(
+                                url + path,
+                                auth=zen_store._get_authentication(),
+                            )
+                        ),
+                    ),
+                    ("pooled", lambda: zen_store.get(path)),
+                ):
+                    latencies = sorted(measure(call, args.calls))
+                    print(
+                        f"{f'{name} GET {path}':<34}"
+                        f"{statistics.mean(latencies):>10.2f}"
+                        f"{statistics.median(latencies):>8.2f}"
+                        f"{latencies[int(len(latencies) * 0.95)]:>8.2f}"
+                    )
+        finally:
+            process.kill()
+            GlobalConfiguration().delete_profile(profile_name)
+
+
+if __name__ == "__main__":
+    main()
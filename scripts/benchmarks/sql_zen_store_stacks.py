@@ -0,0 +1,198 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark of listing stacks in the SQL zen store.
+
+Fills a SQLite zen store with stacks that each consist of their own
+components and counts the SQL statements and the time required to list the
+stack configurations and stacks. The `*_per_stack` and `*_per_component`
+rows fetch each stack or component individually for comparison.
+
+Usage:
+    python scripts/benchmarks/sql_zen_store_stacks.py --stacks 1000
+"""
+
+import argparse
+import base64
+import os
+import tempfile
+import time
+from typing import Any, Callable, List, Tuple
+from uuid import uuid4
+
+import yaml
+from sqlalchemy import event
+from sqlmodel import Session
+
+from zenml.enums import StackComponentType
+from zenml.zen_stores import BaseZenStore, SqlZenStore
+from zenml.zen_stores.sql_zen_store import (
+    ZenStack,
+    ZenStackComponent,
+    ZenStackDefinition,
+)
+
+COMPONENT_TYPES = [
+    StackComponentType.ORCHESTRATOR,
+    StackComponentType.METADATA_STORE,
+    StackComponentType.ARTIFACT_STORE,
+    StackComponentType.CONTAINER_REGISTRY,
+    StackComponentType.SECRETS_MANAGER,
+]
+
+
+def fill_store(zen_store: SqlZenStore, stacks: int) -> None:
+    """Registers stacks with five components each.
+
+    Args:
+        zen_store: The zen store to fill.
+        stacks: The number of stacks to register.
+    """
+    with Session(zen_store.engine) as session:
+        for index in range(stacks):
+            stack_name = f"stack_{index}"
+            session.add(ZenStack(name=stack_name, created_by=1))
+            for component_type in COMPONENT_TYPES:
+                component_name = f"{component_type.value}_{index}"
+                config = {"name": component_name, "uuid": str(uuid4())}
+                session.add(
+                    ZenStackComponent(
+                        component_type=component_type,
+                        name=component_name,
+                        component_flavor="default",
+                        configuration=base64.b64encode(
+                            yaml.dump(config).encode()
+                        ),
+                    )
+                )
+                session.add(
+                    ZenStackDefinition(
+                        stack_name=stack_name,
+                        component_type=component_type,
+                        component_name=component_name,
+                    )
+                )
+        session.commit()
+
+
+def stack_configurations(zen_store: SqlZenStore) -> Any:
+    """Lists all stack configurations.
+
+    Args:
+        zen_store: The zen store to query.
+
+    Returns:
+        The stack configurations.
+    """
+    return zen_store.stack_configurations
+
+
+def stack_configurations_per_stack(zen_store: SqlZenStore) -> Any:
+    """Lists all stack configurations by fetching each stack individually.
+
+    Args:
+        zen_store: The zen store to query.
+
+    Returns:
+        The stack configurations.
+    """
+    return {
+        name: zen_store.get_stack_configuration(name)
+        for name in zen_store.stack_names
+    }
+
+
+def stacks(zen_store: SqlZenStore) -> Any:
+    """Lists all stacks including their components.
+
+    Args:
+        zen_store: The zen store to query.
+
+    Returns:
+        The stacks.
+    """
+    return zen_store.stacks
+
+
+def stacks_per_component(zen_store: SqlZenStore) -> Any:
+    """Lists all stacks by fetching each component individually.
+
+    Args:
+        zen_store: The zen store to query.
+
+    Returns:
+        The stacks.
+    """
+    return BaseZenStore.stacks.fget(zen_store)  # type: ignore[attr-defined]
+
+
+def measure(
+    zen_store: SqlZenStore, query: Callable[[SqlZenStore], Any]
+) -> Tuple[int, float]:
+    """Counts the SQL statements and measures the duration of a query.
+
+    Args:
+        zen_store: The zen store to query.
+        query: Function that queries the zen store.
+
+    Returns:
+        The number of SQL statements and the duration in seconds.
+    """
+    statements = 0
+
+    def _count_statement(*args: Any, **kwargs: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(zen_store.engine, "before_cursor_execute", _count_statement)
+    start = time.perf_counter()
+    try:
+        query(zen_store)
+    finally:
+        duration = time.perf_counter() - start
+        event.remove(
+            zen_store.engine, "before_cursor_execute", _count_statement
+        )
+    return statements, duration
+
+
+def main() -> None:
+    """Runs the benchmark and prints the results as a table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stacks", type=int, default=1000)
+    args = parser.parse_args()
+
+    queries: List[Callable[[SqlZenStore], Any]] = [
+        stack_configurations,
+        stack_configurations_per_stack,
+        stacks,
+        stacks_per_component,
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        zen_store = SqlZenStore().initialize(
+            f"sqlite:///{os.path.join(directory, 'store.db')}",
+            skip_default_registrations=True,
+        )
+        fill_store(zen_store, args.stacks)
+        print(
+            f"{args.stacks} stacks with "
+            f"{args.stacks * len(COMPONENT_TYPES)} components\n"
+        )
+        print(f"{'query':<34}{'statements':>12}{'time [s]':>10}")
+        for query in queries:
+            statements, duration = measure(zen_store, query)
+            print(f"{query.__name__:<34}{statements:>12}{duration:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark of the syscalls made by `zenml stack list`.
+
+Creates a temporary global configuration with a local zen store containing
+the given number of stacks and runs `zenml stack list` under `strace` to
+count the syscalls. The `revalidate always` row checks the configuration
+files on every attribute access, which is how configuration files were
+synchronized before the revalidation interval was introduced.
+
+Requires `strace` (Linux only).
+
+Usage:
+    python scripts/benchmarks/stack_list_syscalls.py --stacks 10 100
+"""
+
+import argparse
+import collections
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Counter, Dict, Tuple
+
+from zenml.constants import (
+    ENV_ZENML_CONFIG_PATH,
+    ENV_ZENML_CONFIG_REVALIDATION_INTERVAL,
+)
+
+SETUP_SCRIPT = """
+import sys
+
+from zenml.repository import Repository
+from zenml.zen_stores.models import StackWrapper
+
+zen_store = Repository().zen_store
+components = zen_store.get_stack("default").components
+for index in range(int(sys.argv[1])):
+    zen_store.register_stack(
+        StackWrapper(name=f"stack_{index}", components=components)
+    )
+"""
+
+STAT_SYSCALLS = {"stat", "lstat", "fstat", "newfstatat", "statx", "access"}
+SYSCALL_PATTERN = re.compile(r"^\d+\s+(\w+)\(")
+
+
+def count_syscalls(env: Dict[str, str]) -> Tuple[Counter[str], float]:
+    """Runs `zenml stack list` under strace and counts the syscalls.
+
+    Args:
+        env: Environment of the `zenml` process.
+
+    Returns:
+        The number of calls per syscall and the duration in seconds.
+    """
+    with tempfile.NamedTemporaryFile() as trace_file:
+        start = time.perf_counter()
+        subprocess.run(
+            [
+                "strace",
+                "-f",
+                "-qq",
+                "-o",
+                trace_file.name,
+                sys.executable,
+                "-c",
+                "from zenml.cli.cli import cli; cli()",
+                "stack",
+                "list",
+            ],
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        duration = time.perf_counter() - start
+
+        syscalls: Counter[str] = collections.Counter()
+        with open(trace_file.name) as f:
+            for line in f:
+                match = SYSCALL_PATTERN.match(line)
+                if match:
+                    syscalls[match.group(1)] += 1
+    return syscalls, duration
+
+
+def main() -> None:
+    """Runs the benchmark and prints the results as a table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stacks", type=int, nargs="+", default=[10, 100])
+    args = parser.parse_args()
+
+    print(
+        f"{'stacks':>6}  {'mode':<20}{'syscalls':>10}{'stat':>8}"
+        f"{'time [s]':>10}"
+    )
+    for stacks in args.stacks:
+        with tempfile.TemporaryDirectory() as directory:
+            env = dict(os.environ)
+            env[ENV_ZENML_CONFIG_PATH] = directory
+            env["ZENML_ANALYTICS_OPT_IN"] = "false"
+            subprocess.run(
+                [sys.executable, "-c", SETUP_SCRIPT, str(stacks)],
+                env=env,
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+
+            for mode, interval in (
+                ("revalidate always", "0"),
+                ("revalidate interval", None),
+            ):
+                mode_env = dict(env)
+                if interval is not None:
+                    mode_env[ENV_ZENML_CONFIG_REVALIDATION_INTERVAL] = interval
+                syscalls, duration = count_syscalls(mode_env)
+                stat_calls = sum(
+                    count
+                    for name, count in syscalls.items()
+                    if name in STAT_SYSCALLS
+                )
+                print(
+                    f"{stacks:>6}  {mode:<20}{sum(syscalls.values()):>10}"
+                    f"{stat_calls:>8}{duration:>10.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
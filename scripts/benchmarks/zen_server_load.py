@@ -0,0 +1,221 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Load test of the ZenServer.
+
+Starts a local ZenServer with uvicorn, backed by a temporary SQLite zen store,
+and sends requests from the given numbers of concurrent clients for a fixed
+duration. Reports the throughput and latency percentiles of the requests.
+
+Usage:
+    python scripts/benchmarks/zen_server_load.py --clients 1 8 32 --duration 10
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from multiprocessing import Process
+from typing import List, Tuple
+
+import requests
+import uvicorn
+
+from zenml.config.global_config import GlobalConfiguration
+from zenml.config.profile_config import ProfileConfiguration
+from zenml.constants import (
+    DEFAULT_LOCAL_SERVICE_IP_ADDRESS,
+    DEFAULT_SERVICE_START_STOP_TIMEOUT,
+    ENV_ZENML_CONFIG_PATH,
+    ENV_ZENML_PROFILE_NAME,
+    STACK_CONFIGURATIONS,
+    STACKS,
+    STACKS_EMPTY,
+    ZEN_SERVER_ENTRYPOINT,
+    ZEN_SERVER_MAX_REQUESTS,
+)
+from zenml.utils.networking_utils import scan_for_available_port
+from zenml.zen_stores import RestZenStore, SqlZenStore
+from zenml.zen_stores.models import StackWrapper
+
+PATHS = [STACKS_EMPTY, STACK_CONFIGURATIONS, STACKS]
+
+
+def start_server(directory: str, stacks: int) -> Tuple[Process, str, str]:
+    """Starts a ZenServer backed by a SQLite zen store.
+
+    Args:
+        directory: Directory in which to create the SQLite database.
+        stacks: Number of stacks to register in addition to the default stack.
+
+    Returns:
+        The server process, the server URL and the name of the profile that
+        was created for the server.
+
+    Raises:
+        RuntimeError: If the server doesn't start.
+    """
+    backing_zen_store = SqlZenStore().initialize(
+        f"sqlite:///{os.path.join(directory, 'zen_store.db')}"
+    )
+    components = backing_zen_store.get_stack("default").components
+    for index in range(stacks):
+        backing_zen_store.register_stack(
+            StackWrapper(name=f"stack_{index}", components=components)
+        )
+
+    profile = ProfileConfiguration(
+        name=f"load_test_{hash(directory)}",
+        store_url=backing_zen_store.url,
+        store_type=backing_zen_store.type,
+    )
+    global_config = GlobalConfiguration()
+    global_config.add_or_update_profile(profile)
+    env_file = os.path.join(directory, "environ.env")
+    with open(env_file, "w") as f:
+        f.write(f"{ENV_ZENML_PROFILE_NAME}='{profile.name}'\n")
+        f.write(f"{ENV_ZENML_CONFIG_PATH}='{global_config.config_directory}'\n")
+
+    port = scan_for_available_port(start=8003, stop=9000)
+    if not port:
+        raise RuntimeError("No available port found.")
+    process = Process(
+        target=uvicorn.run,
+        args=(ZEN_SERVER_ENTRYPOINT,),
+        kwargs=dict(
+            host=DEFAULT_LOCAL_SERVICE_IP_ADDRESS,
+            port=port,
+            log_level="warning",
+            env_file=env_file,
+            limit_concurrency=ZEN_SERVER_MAX_REQUESTS,
+        ),
+        daemon=True,
+    )
+    process.start()
+    url = f"http://{DEFAULT_LOCAL_SERVICE_IP_ADDRESS}:{port}"
+    for _ in range(DEFAULT_SERVICE_START_STOP_TIMEOUT):
+        try:
+            if requests.head(f"{url}/health").status_code == 200:
+                return process, url, profile.name
+        except requests.ConnectionError:
+            pass
+        time.sleep(1)
+    process.kill()
+    raise RuntimeError("Failed to start ZenServer.")
+
+
+def run_clients(
+    url: str, clients: int, duration: float
+) -> Tuple[List[float], int]:
+    """Sends requests from concurrent clients for a fixed duration.
+
+    Each client cycles through all paths in `PATHS` using its own session.
+
+    Args:
+        url: The server URL.
+        clients: Number of concurrent clients.
+        duration: Duration of the test in seconds.
+
+    Returns:
+        The latencies of all successful requests in milliseconds and the
+        number of failed requests.
+    """
+    auth = RestZenStore().initialize(url)._get_authentication()
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def _client(index: int) -> None:
+        nonlocal errors
+        session = requests.Session()
+        session.auth = auth
+        request_count = index
+        while time.perf_counter() < deadline:
+            path = PATHS[request_count % len(PATHS)]
+            request_count += 1
+            start = time.perf_counter()
+            try:
+                response = session.get(url + path)
+                success = response.status_code == 200
+            except requests.ConnectionError:
+                success = False
+            latency = (time.perf_counter() - start) * 1000
+            with lock:
+                if success:
+                    latencies.append(latency)
+                else:
+                    errors += 1
+
+    threads = [
+        threading.Thread(target=_client, args=(index,))
+        for index in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors
+
+
+def percentile(latencies: List[float], p: float) -> float:
+    """Computes a percentile of sorted latencies.
+
+    Args:
+        latencies: The sorted latencies.
+        p: The percentile as a fraction between 0 and 1.
+
+    Returns:
+        The latency at the given percentile.
+    """
+    return latencies[min(int(len(latencies) * p), len(latencies) - 1)]
+
+
+def main() -> None:
+    """Runs the load test and prints the results as a table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--stacks", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        process, url, profile_name = start_server(directory, args.stacks)
+        try:
+            print(
+                f"{'clients':>7}{'req/s':>10}{'errors':>8}{'p50 [ms]':>10}"
+                f"{'p95':>8}{'p99':>8}"
+            )
+            for clients in args.clients:
+                latencies, errors = run_clients(url, clients, args.duration)
+                latencies.sort()
+                if not latencies:
+                    print(f"{clients:>7}{0:>10.1f}{errors:>8}")
+                    continue
+
+                print(
+                    f"{clients:>7}"
+                    f"{len(latencies) / args.duration:>10.1f}"
+                    f"{errors:>8}"
+                    f"{percentile(latencies, 0.5):>10.2f}"
+                    f"{percentile(latencies, 0.95):>8.2f}"
+                    f"{percentile(latencies, 0.99):>8.2f}"
+                )
+        finally:
+            process.kill()
+            GlobalConfiguration().delete_profile(profile_name)
+
+
+if __name__ == "__main__":
+    main()
@@ -41,7 +41,7 @@ from typing import (
     Union,
 )
 
-from pydantic import root_validator
+from pydantic import root_validator, validator
 from tfx.dsl.io.fileio import NotFoundError
 
 from zenml.enums import StackComponentType
@@ -94,9 +94,20 @@ class BaseArtifactStore(StackComponent):
 
     Attributes:
         path: The root path of the artifact store.
+        deduplicate: If `True`, files written to the artifact store are
+            stored content-addressed so identical files are only stored once.
+            Only supported for remote artifact stores. See
+            `zenml.artifact_stores.content_addressed_storage` for details.
+        local_cache_size_mb: Maximum size in MB of a local read-through cache
+            for files of remote artifact stores. Files read from the artifact
+            store are kept on the local disk and only downloaded again if
+            they were changed. Set to 0 (the default) to disable the cache.
+            See `zenml.artifact_stores.local_artifact_cache` for details.
     """
 
     path: str
+    deduplicate: bool = False
+    local_cache_size_mb: int = 0
 
     # Class Configuration
     TYPE: ClassVar[StackComponentType] = StackComponentType.ARTIFACT_STORE
@@ -308,6 +319,35 @@ class BaseArtifactStore(StackComponent):
 
         return values
 
+    @validator("deduplicate")
+    def _ensure_deduplication_is_remote(cls, deduplicate: bool) -> bool:
+        """Validator function that rejects deduplication for local stores.
+
+        Deduplicated files only contain a pointer to their contents when they
+        are read directly from disk instead of through `fileio`. Files of
+        remote artifact stores always need to be read through `fileio`, but
+        many materializers pass the paths of files in local artifact stores
+        directly to libraries like `datasets` or `transformers`.
+
+        Args:
+            deduplicate: The value to validate.
+
+        Returns:
+            The validated value.
+
+        Raises:
+            ArtifactStoreInterfaceError: If deduplication is enabled for a
+                local artifact store.
+        """
+        if deduplicate and "" in cls.SUPPORTED_SCHEMES:
+            raise ArtifactStoreInterfaceError(
+                f"Deduplication is not supported for artifact stores of "
+                f"flavor '{cls.FLAVOR}' as their files are read directly from "
+                f"the local disk. It is only available for remote artifact "
+                f"stores."
+            )
+        return deduplicate
+
     def _register(self, priority: int = 5) -> None:
         """Create and register a filesystem within the TFX registry.
 
@@ -317,13 +357,39 @@ class BaseArtifactStore(StackComponent):
         from tfx.dsl.io.filesystem import Filesystem
         from tfx.dsl.io.filesystem_registry import DEFAULT_FILESYSTEM_REGISTRY
 
+        open_ = self.open
+        copyfile = self.copyfile
+        stat = self.stat
+        if self.deduplicate:
+            from zenml.artifact_stores.content_addressed_storage import (
+                ContentAddressedStorage,
+            )
+
+            storage = ContentAddressedStorage(self)
+            open_ = storage.open
+            copyfile = storage.copyfile
+            stat = storage.stat
+
+        if self.local_cache_size_mb > 0 and "" not in self.SUPPORTED_SCHEMES:
+            from zenml.artifact_stores.local_artifact_cache import (
+                LocalArtifactCache,
+            )
+
+            cache = LocalArtifactCache(
+                artifact_store=self,
+                max_size=self.local_cache_size_mb * 1024 * 1024,
+                open_function=open_,
+                stat_function=stat,
+            )
+            open_ = cache.open
+
         filesystem_class = type(
             self.__class__.__name__,
             (Filesystem,),
             {
                 "SUPPORTED_SCHEMES": self.SUPPORTED_SCHEMES,
-                "open": staticmethod(_catch_not_found_error(self.open)),
-                "copy": staticmethod(_catch_not_found_error(self.copyfile)),
+                "open": staticmethod(_catch_not_found_error(open_)),
+                "copy": staticmethod(_catch_not_found_error(copyfile)),
                 "exists": staticmethod(self.exists),
                 "glob": staticmethod(self.glob),
                 "isdir": staticmethod(self.isdir),
@@ -333,7 +399,7 @@ class BaseArtifactStore(StackComponent):
                 "remove": staticmethod(_catch_not_found_error(self.remove)),
                 "rename": staticmethod(_catch_not_found_error(self.rename)),
                 "rmtree": staticmethod(_catch_not_found_error(self.rmtree)),
-                "stat": staticmethod(_catch_not_found_error(self.stat)),
+                "stat": staticmethod(_catch_not_found_error(stat)),
                 "walk": staticmethod(_catch_not_found_error(self.walk)),
             },
         )
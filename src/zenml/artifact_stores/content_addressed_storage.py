@@ -0,0 +1,494 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Content-addressed deduplication layer for artifact stores.
+
+If deduplication is enabled for an artifact store, every file written inside
+the artifact store is hashed while it is being written and stored as a blob
+named after its SHA-256 digest. The file at the original path only contains a
+small pointer to this blob, so identical files are stored only once no matter
+how many artifacts contain them.
+
+Reading or copying a pointer file through `fileio` returns the contents of
+the blob it points to. Code that reads the file at the original path by other
+means gets the pointer instead. Files of remote artifact stores can only be
+read through `fileio`, e.g. by copying them to a local directory first, which
+is why artifact stores only support deduplication if they are remote. Code
+that needs the path of the actual file, e.g. to memory-map it, can get it
+with `resolve_path()`.
+
+Blobs are buffered in a local temporary file and uploaded directly to their
+final path once their digest is known, or not at all if a blob with the same
+digest already exists. Blobs of a local file system are written to a
+temporary file next to the blobs instead and renamed. Reading a file costs
+an additional small read of the pointer file to find the blob it points to.
+
+Blobs are never deleted when the pointer files referencing them are removed.
+Instead, `ContentAddressedStorage.collect_garbage()` (or the
+`zenml artifact gc` CLI command) removes all blobs that are no longer
+referenced by any pointer file.
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple, Union
+from uuid import uuid4
+
+from zenml.logger import get_logger
+
+if TYPE_CHECKING:
+    from zenml.artifact_stores.base_artifact_store import (
+        BaseArtifactStore,
+        PathType,
+    )
+
+logger = get_logger(__name__)
+
+BLOB_DIRECTORY_NAME = ".zenml_blobs"
+TEMPORARY_DIRECTORY_NAME = "tmp"
+POINTER_PREFIX = b"zenml-blob-pointer:"
+# SHA-256 hex digest + prefix, used to avoid reading large files completely
+# when checking whether they are pointers.
+MAX_POINTER_SIZE = len(POINTER_PREFIX) + 64
+
+# Content addressed storages by the root path of their artifact store
+_storages: Dict[str, "ContentAddressedStorage"] = {}
+
+
+def _to_str(path: "PathType") -> str:
+    """Converts a path to a string.
+
+    Args:
+        path: The path to convert.
+
+    Returns:
+        The path as string.
+    """
+    return path.decode() if isinstance(path, bytes) else path
+
+
+def _get_size(stat: Any) -> int:
+    """Gets the file size from the stat descriptor of an artifact store.
+
+    Args:
+        stat: Either an `os.stat_result` or a dictionary as returned by
+            `fsspec` filesystems.
+
+    Returns:
+        The file size in bytes.
+    """
+    if isinstance(stat, dict):
+        return int(stat.get("size", 0))
+    return int(stat.st_size)
+
+
+def resolve_path(path: "PathType") -> str:
+    """Resolves a path to the blob it points to, if any.
+
+    This is useful for code that needs to access the file at the given
+    path directly instead of using `fileio`, e.g. to memory-map it.
+
+    Args:
+        path: The path to resolve.
+
+    Returns:
+        The path of the blob if the file at the given path is a pointer,
+        otherwise the unchanged path.
+    """
+    path = _to_str(path)
+    for root, storage in _storages.items():
+        if path.startswith(root):
+            return storage.resolve(path)
+    return path
+
+
+class _BlobWriter:
+    """File-like object that hashes data while writing it to a blob."""
+
+    def __init__(
+        self,
+        storage: "ContentAddressedStorage",
+        path: str,
+    ) -> None:
+        """Initializes the writer.
+
+        Args:
+            storage: The storage to which the blob is written.
+            path: The path of the pointer file to create once all data is
+                written.
+        """
+        self._storage = storage
+        self._path = path
+        self._hash = hashlib.sha256()
+        self._size = 0
+        if storage.is_local:
+            self._temporary_path = storage.temporary_path()
+            self._file = storage.artifact_store.open(self._temporary_path, "wb")
+        else:
+            fd, self._temporary_path = tempfile.mkstemp(prefix="zenml-blob-")
+            self._file = os.fdopen(fd, "wb")
+        self.closed = False
+
+    def write(self, data: Union[bytes, str]) -> int:
+        """Writes data to the blob.
+
+        Args:
+            data: The data to write.
+
+        Returns:
+            The number of bytes or characters written.
+        """
+        raw = data if isinstance(data, bytes) else data.encode("utf-8")
+        self._hash.update(raw)
+        self._size += len(raw)
+        self._file.write(raw)
+        return len(data)
+
+    def tell(self) -> int:
+        """Returns the number of bytes written so far.
+
+        Returns:
+            The number of bytes written so far.
+        """
+        return self._size
+
+    def flush(self) -> None:
+        """Flushes the underlying file."""
+        self._file.flush()
+
+    def writable(self) -> bool:
+        """Returns whether the file is writable.
+
+        Returns:
+            Always `True`.
+        """
+        return True
+
+    def seekable(self) -> bool:
+        """Returns whether the file is seekable.
+
+        Returns:
+            Always `False`, as the data is hashed while it is written.
+        """
+        return False
+
+    def close(self) -> None:
+        """Stores the blob and writes the pointer file."""
+        if self.closed:
+            return
+        self.closed = True
+        self._file.close()
+        self._storage.commit_blob(
+            temporary_path=self._temporary_path,
+            digest=self._hash.hexdigest(),
+            path=self._path,
+        )
+
+    def discard(self) -> None:
+        """Removes the written data without creating a blob or pointer file."""
+        if self.closed:
+            return
+        self.closed = True
+        self._file.close()
+        self._storage.remove_temporary_blob(self._temporary_path)
+
+    def __enter__(self) -> "_BlobWriter":
+        """Enters the context manager.
+
+        Returns:
+            The writer.
+        """
+        return self
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        """Closes the writer when exiting the context manager.
+
+        If the context was exited because of an exception, the incomplete
+        data is discarded instead of being stored.
+
+        Args:
+            exc_type: The type of the exception, if any.
+            *args: The remaining exception information, if any.
+        """
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class ContentAddressedStorage:
+    """Content-addressed deduplication layer on top of an artifact store."""
+
+    def __init__(self, artifact_store: "BaseArtifactStore") -> None:
+        """Initializes the storage and registers it for path resolution.
+
+        Args:
+            artifact_store: The artifact store in which the blobs and
+                pointer files are stored.
+        """
+        self.artifact_store = artifact_store
+        self.root = artifact_store.path.rstrip("/")
+        self.blob_directory = os.path.join(self.root, BLOB_DIRECTORY_NAME)
+        self.is_local = "" in artifact_store.SUPPORTED_SCHEMES
+        _storages[self.root] = self
+
+    def blob_path(self, digest: str) -> str:
+        """Returns the path of the blob with the given digest.
+
+        Args:
+            digest: The SHA-256 hex digest of the blob.
+
+        Returns:
+            The path of the blob.
+        """
+        return os.path.join(self.blob_directory, digest[:2], digest)
+
+    def temporary_path(self) -> str:
+        """Returns a new path to which a blob can be written before hashing.
+
+        Returns:
+            A unique temporary path inside the blob directory.
+        """
+        return os.path.join(
+            self.blob_directory, TEMPORARY_DIRECTORY_NAME, uuid4().hex
+        )
+
+    def is_managed_path(self, path: str) -> bool:
+        """Checks whether the given path is deduplicated by this storage.
+
+        Args:
+            path: The path to check.
+
+        Returns:
+            `True` if the path is inside the artifact store but not inside
+            the blob directory.
+        """
+        return path.startswith(self.root + "/") and not path.startswith(
+            self.blob_directory
+        )
+
+    def read_pointer(self, path: str) -> Optional[str]:
+        """Reads the digest from a pointer file.
+
+        Args:
+            path: The path of the file.
+
+        Returns:
+            The digest if the file is a pointer file, `None` otherwise.
+        """
+        with self.artifact_store.open(path, "rb") as f:
+            content = f.read(MAX_POINTER_SIZE + 1)
+        if content.startswith(POINTER_PREFIX) and len(content) <= (
+            MAX_POINTER_SIZE
+        ):
+            return content[len(POINTER_PREFIX) :].decode()
+        return None
+
+    def resolve(self, path: "PathType") -> str:
+        """Resolves a path to the blob it points to, if any.
+
+        Args:
+            path: The path to resolve.
+
+        Returns:
+            The path of the blob if the file at the given path is a pointer,
+            otherwise the unchanged path.
+        """
+        path = _to_str(path)
+        if not self.is_managed_path(path):
+            return path
+
+        try:
+            digest = self.read_pointer(path)
+        except OSError:
+            # The path doesn't exist or is a directory
+            return path
+        return self.blob_path(digest) if digest else path
+
+    def commit_blob(self, temporary_path: str, digest: str, path: str) -> None:
+        """Moves a written blob to its final location and creates the pointer.
+
+        Args:
+            temporary_path: The path to which the blob was written.
+            digest: The SHA-256 hex digest of the blob.
+            path: The path of the pointer file.
+        """
+        blob_path = self.blob_path(digest)
+        if self.artifact_store.exists(blob_path):
+            logger.debug("Reusing existing blob %s for `%s`.", digest, path)
+            self.remove_temporary_blob(temporary_path)
+        elif self.is_local:
+            self.artifact_store.makedirs(os.path.dirname(blob_path))
+            self.artifact_store.rename(
+                temporary_path, blob_path, overwrite=True
+            )
+        else:
+            self.artifact_store.makedirs(os.path.dirname(blob_path))
+            try:
+                with open(temporary_path, "rb") as source_file:
+                    with self.artifact_store.open(blob_path, "wb") as f:
+                        while True:
+                            chunk = source_file.read(1024 * 1024)
+                            if not chunk:
+                                break
+                            f.write(chunk)
+            finally:
+                self.remove_temporary_blob(temporary_path)
+
+        with self.artifact_store.open(path, "wb") as f:
+            f.write(POINTER_PREFIX + digest.encode())
+
+    def remove_temporary_blob(self, temporary_path: str) -> None:
+        """Removes a temporary blob that was written by a `_BlobWriter`.
+
+        Args:
+            temporary_path: The path to which the blob was written.
+        """
+        if self.is_local:
+            self.artifact_store.remove(temporary_path)
+        else:
+            os.remove(temporary_path)
+
+    def stat(self, path: "PathType") -> Any:
+        """Returns the stat descriptor of the file a path resolves to.
+
+        Args:
+            path: The path of the file.
+
+        Returns:
+            The stat descriptor of the blob if the file is a pointer, so the
+            size is the size of the actual content.
+        """
+        return self.artifact_store.stat(self.resolve(path))
+
+    def open(self, name: "PathType", mode: str = "r") -> Any:
+        """Opens a file, reading from or writing to content-addressed blobs.
+
+        Args:
+            name: The path of the file to open.
+            mode: The mode to open the file.
+
+        Returns:
+            The file object.
+        """
+        path = _to_str(name)
+        if not self.is_managed_path(path):
+            return self.artifact_store.open(name, mode)
+
+        if mode in ("w", "wb"):
+            if self.is_local:
+                self.artifact_store.makedirs(
+                    os.path.join(self.blob_directory, TEMPORARY_DIRECTORY_NAME)
+                )
+            return _BlobWriter(self, path=path)
+
+        if "a" in mode or "+" in mode:
+            # Appending to or updating a deduplicated file requires the
+            # actual content at the original path.
+            blob_path = self.resolve(path)
+            if blob_path != path:
+                self.artifact_store.copyfile(blob_path, path, overwrite=True)
+            return self.artifact_store.open(name, mode)
+
+        return self.artifact_store.open(self.resolve(path), mode)
+
+    def copyfile(
+        self, src: "PathType", dst: "PathType", overwrite: bool = False
+    ) -> None:
+        """Copies a file, deduplicating the destination.
+
+        Args:
+            src: The source path.
+            dst: The destination path.
+            overwrite: Whether to overwrite the destination file if it exists.
+
+        Raises:
+            FileExistsError: If the destination file exists and `overwrite`
+                is `False`.
+        """
+        if not self.is_managed_path(_to_str(dst)):
+            self.artifact_store.copyfile(self.resolve(src), dst, overwrite)
+            return
+
+        if not overwrite and self.artifact_store.exists(dst):
+            raise FileExistsError(
+                f"Destination file '{_to_str(dst)}' already exists and "
+                f"`overwrite` is false."
+            )
+
+        source_digest = None
+        if self.is_managed_path(_to_str(src)):
+            source_digest = self.read_pointer(_to_str(src))
+
+        if source_digest:
+            # Copying a pointer file only needs a new pointer.
+            with self.artifact_store.open(dst, "wb") as f:
+                f.write(POINTER_PREFIX + source_digest.encode())
+            return
+
+        with self.artifact_store.open(src, "rb") as source_file:
+            with self.open(dst, "wb") as destination_file:
+                while True:
+                    chunk = source_file.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    destination_file.write(chunk)
+
+    def collect_garbage(self, dry_run: bool = False) -> Tuple[int, int]:
+        """Removes all blobs that aren't referenced by any pointer file.
+
+        Temporary blobs of writes that are still in progress (or were
+        interrupted) are not removed.
+
+        Args:
+            dry_run: If `True`, only count the unreferenced blobs without
+                removing them.
+
+        Returns:
+            The number of unreferenced blobs and their total size in bytes.
+        """
+        referenced: Set[str] = set()
+        for directory, _, files in self.artifact_store.walk(self.root):
+            directory = _to_str(directory)
+            if directory.startswith(self.blob_directory):
+                continue
+            for file in files:
+                digest = self.read_pointer(
+                    os.path.join(directory, _to_str(file))
+                )
+                if digest:
+                    referenced.add(digest)
+
+        if not self.artifact_store.exists(self.blob_directory):
+            return 0, 0
+
+        removed_blobs = 0
+        removed_bytes = 0
+        for directory, _, files in self.artifact_store.walk(
+            self.blob_directory
+        ):
+            directory = _to_str(directory)
+            if os.path.basename(directory) == TEMPORARY_DIRECTORY_NAME:
+                continue
+            for file in files:
+                digest = _to_str(file)
+                if digest in referenced:
+                    continue
+                blob_path = os.path.join(directory, digest)
+                removed_bytes += _get_size(self.artifact_store.stat(blob_path))
+                removed_blobs += 1
+                if not dry_run:
+                    self.artifact_store.remove(blob_path)
+
+        return removed_blobs, removed_bytes
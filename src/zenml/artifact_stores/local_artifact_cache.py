@@ -0,0 +1,371 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Local read-through cache for files of remote artifact stores.
+
+Files that are opened for reading are downloaded once into a directory inside
+the ZenML global config directory and served from there for subsequent reads.
+Cache entries are keyed by the file path and its version (ETag, generation or
+modification time, plus size) as reported by the artifact store, so a file
+that is overwritten in the artifact store is downloaded again. If the cache
+grows beyond its configured size, the least recently used files are evicted.
+
+Each cache keeps a running total of the size of the cache directory, which is
+only computed by scanning the directory on the first download and whenever
+files need to be evicted. Hit, miss and eviction counters are kept in memory
+and appended to a statistics file every `STATS_FLUSH_INTERVAL` seconds and
+when the process exits, so multiple processes can share a cache directory
+without losing each other's counts.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from zenml.logger import get_logger
+from zenml.utils import io_utils
+
+if TYPE_CHECKING:
+    from zenml.artifact_stores.base_artifact_store import (
+        BaseArtifactStore,
+        PathType,
+    )
+
+logger = get_logger(__name__)
+
+LOCAL_ARTIFACT_CACHE_DIRECTORY_NAME = "artifact_cache"
+STATS_FILENAME = "stats.jsonl"
+STATS_FLUSH_INTERVAL = 30
+_STATS_KEYS = ("hits", "misses", "evictions")
+_DATA_DIRECTORY_NAME = "data"
+_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Keys under which different `fsspec` filesystems report the version of a file
+_VERSION_KEYS = (
+    "ETag",
+    "etag",
+    "generation",
+    "md5Hash",
+    "content_md5",
+    "LastModified",
+    "last_modified",
+    "updated",
+    "mtime",
+)
+
+
+def get_cache_directory() -> str:
+    """Returns the directory of the local artifact cache.
+
+    Returns:
+        The path of the cache directory inside the global config directory.
+    """
+    return os.path.join(
+        io_utils.get_global_config_directory(),
+        LOCAL_ARTIFACT_CACHE_DIRECTORY_NAME,
+    )
+
+
+def _get_file_version(stat: Any) -> Optional[Tuple[str, int]]:
+    """Extracts the version and size of a file from its stat descriptor.
+
+    Args:
+        stat: Either an `os.stat_result` or a dictionary as returned by
+            `fsspec` filesystems.
+
+    Returns:
+        The version and size of the file, or `None` if the stat descriptor
+        doesn't describe a regular file.
+    """
+    if isinstance(stat, dict):
+        if stat.get("type", "file") != "file":
+            return None
+        size = int(stat.get("size", 0))
+        for key in _VERSION_KEYS:
+            if stat.get(key) is not None:
+                return str(stat[key]), size
+        return "", size
+
+    return str(stat.st_mtime_ns), int(stat.st_size)
+
+
+class LocalArtifactCache:
+    """Size-bounded LRU cache of remote artifact store files on local disk."""
+
+    def __init__(
+        self,
+        artifact_store: Optional["BaseArtifactStore"] = None,
+        max_size: int = 0,
+        directory: Optional[str] = None,
+        open_function: Optional[Callable[..., Any]] = None,
+        stat_function: Optional[Callable[..., Any]] = None,
+    ) -> None:
+        """Initializes the cache.
+
+        Args:
+            artifact_store: The artifact store from which files are read.
+                Only required to read files through the cache, not to
+                inspect or clear it.
+            max_size: Maximum total size of all cached files in bytes.
+            directory: Optional directory in which to store the cached
+                files. Defaults to a directory inside the global config
+                directory which is shared by all artifact stores.
+            open_function: Optional function to open files in the artifact
+                store, e.g. a wrapper that resolves deduplicated files.
+                Defaults to the `open` method of the artifact store.
+            stat_function: Optional function to get the stat descriptor of
+                files in the artifact store. Must describe the file that is
+                opened by `open_function`, e.g. the blob a deduplicated file
+                points to instead of the pointer. Defaults to the `stat`
+                method of the artifact store.
+        """
+        self.artifact_store = artifact_store
+        self._open = open_function or (
+            artifact_store.open if artifact_store else None
+        )
+        self._stat = stat_function or (
+            artifact_store.stat if artifact_store else None
+        )
+        self.max_size = max_size
+        self.directory = directory or get_cache_directory()
+        self.data_directory = os.path.join(self.directory, _DATA_DIRECTORY_NAME)
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._size: Optional[int] = None
+        self._pending_stats = dict.fromkeys(_STATS_KEYS, 0)
+        self._last_stats_flush = time.monotonic()
+        atexit.register(self.flush_stats)
+
+    def open(self, name: "PathType", mode: str = "r") -> Any:
+        """Opens a file, reading it from the local cache if possible.
+
+        Args:
+            name: The path of the file to open.
+            mode: The mode to open the file.
+
+        Returns:
+            The file object.
+        """
+        assert self._open and self._stat
+        if mode not in ("r", "rb"):
+            return self._open(name, mode)
+
+        try:
+            version = _get_file_version(self._stat(name))
+        except OSError:
+            version = None
+        if version is None or version[1] > self.max_size:
+            # Let the artifact store handle missing files and directories and
+            # don't evict the whole cache for a single huge file.
+            return self._open(name, mode)
+
+        path = name.decode() if isinstance(name, bytes) else name
+        cache_path = self._get_cache_path(path, *version)
+        if os.path.exists(cache_path):
+            # Mark the file as most recently used
+            os.utime(cache_path)
+            self._record("hits")
+            logger.debug("Reading `%s` from local artifact cache.", path)
+        else:
+            self._record("misses")
+            self._download(path, cache_path)
+            self._add_to_size(version[1])
+
+        return open(cache_path, mode)
+
+    def _get_cache_path(self, path: str, version: str, size: int) -> str:
+        """Returns the local path of a cached file.
+
+        Args:
+            path: The path of the file in the artifact store.
+            version: The version of the file.
+            size: The size of the file.
+
+        Returns:
+            The path of the file in the cache directory.
+        """
+        key = hashlib.sha256(f"{path}\0{version}\0{size}".encode()).hexdigest()
+        return os.path.join(self.data_directory, key[:2], key)
+
+    def _download(self, path: str, cache_path: str) -> None:
+        """Downloads a file from the artifact store into the cache.
+
+        The file is written to a temporary file first and then moved to its
+        final location, so interrupted downloads never leave partial files in
+        the cache.
+
+        Args:
+            path: The path of the file in the artifact store.
+            cache_path: The path of the file in the cache directory.
+        """
+        assert self._open
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, temporary_path = tempfile.mkstemp(
+            dir=os.path.dirname(cache_path), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as destination_file:
+                with self._open(path, "rb") as source_file:
+                    shutil.copyfileobj(
+                        source_file, destination_file, _DOWNLOAD_CHUNK_SIZE
+                    )
+            os.replace(temporary_path, cache_path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def _list_entries(self) -> List[Tuple[float, int, str]]:
+        """Lists all files in the cache.
+
+        Returns:
+            Last access time, size and path of all cached files.
+        """
+        entries = []
+        for directory, _, files in os.walk(self.data_directory):
+            for file in files:
+                if file.endswith(".tmp"):
+                    continue
+                path = os.path.join(directory, file)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    # Evicted by another process in the meantime
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _add_to_size(self, size: int) -> None:
+        """Adds a downloaded file to the cache size and evicts if necessary.
+
+        Args:
+            size: The size of the downloaded file in bytes.
+        """
+        with self._lock:
+            if self._size is None:
+                # The scan already includes the downloaded file
+                self._size = sum(size for _, size, _ in self._list_entries())
+            else:
+                self._size += size
+
+            if self._size > self.max_size:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Removes the least recently used files until the cache fits.
+
+        The directory is scanned again to account for files that were
+        added or evicted by other processes.
+        """
+        entries = sorted(self._list_entries())
+        total_size = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+            evicted += 1
+
+        self._size = total_size
+        if evicted:
+            self._record("evictions", evicted)
+
+    def _record(self, key: str, count: int = 1) -> None:
+        """Increments a cache statistics counter.
+
+        Args:
+            key: The name of the counter.
+            count: The value by which to increment the counter.
+        """
+        with self._stats_lock:
+            self._pending_stats[key] += count
+            flush = (
+                time.monotonic() - self._last_stats_flush
+                >= STATS_FLUSH_INTERVAL
+            )
+        if flush:
+            self.flush_stats()
+
+    def flush_stats(self) -> None:
+        """Appends the counters of this process to the statistics file.
+
+        Each flush appends a single line, which is atomic for files opened in
+        append mode, so concurrent processes don't overwrite each other's
+        counts.
+        """
+        with self._stats_lock:
+            self._last_stats_flush = time.monotonic()
+            pending_stats = self._pending_stats
+            self._pending_stats = dict.fromkeys(_STATS_KEYS, 0)
+        if not any(pending_stats.values()):
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, STATS_FILENAME), "a") as f:
+            f.write(json.dumps(pending_stats) + "\n")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Returns the hit, miss and eviction counters of the cache.
+
+        Returns:
+            The counters of the cache since it was last cleared.
+        """
+        with self._stats_lock:
+            stats = dict(self._pending_stats)
+        try:
+            with open(os.path.join(self.directory, STATS_FILENAME)) as f:
+                for line in f:
+                    try:
+                        flushed_stats = json.loads(line)
+                    except ValueError:
+                        # Line that is still being written
+                        continue
+                    for key in _STATS_KEYS:
+                        stats[key] += int(flushed_stats.get(key, 0))
+        except OSError:
+            pass
+        return stats
+
+    def get_size(self) -> Tuple[int, int]:
+        """Returns the number of cached files and their total size.
+
+        Returns:
+            The number of cached files and their total size in bytes.
+        """
+        entries = self._list_entries()
+        return len(entries), sum(size for _, size, _ in entries)
+
+    def clear(self) -> None:
+        """Removes all cached files and resets the statistics."""
+        with self._stats_lock:
+            self._pending_stats = dict.fromkeys(_STATS_KEYS, 0)
+        self._size = None
+        if os.path.exists(self.directory):
+            shutil.rmtree(self.directory)
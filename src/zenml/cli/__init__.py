@@ -242,6 +242,23 @@ artifact store into the CLI with the following command:
 zenml artifact-store delete ARTIFACT_STORE_NAME
 ```
 
+If a remote artifact store was registered with `--deduplicate=True`, identical
+files are only stored once. Blobs that are no longer referenced by any artifact
+can be removed from the active artifact store with:
+
+```bash
+zenml artifact gc [--dry-run]
+```
+
+Remote artifact stores registered with `--local_cache_size_mb=<SIZE>` keep
+the files they read in a local cache. To see how much space the cache uses
+and how often files were served from it, or to remove all cached files, type:
+
+```bash
+zenml artifact cache describe
+zenml artifact cache clear
+```
+
 Customizing your Orchestrator
 -----------------------------
 
@@ -804,6 +821,7 @@ zenml model-deployer logs MODEL_DEPLOYER_NAME
 
 """
 
+from zenml.cli.artifact import *  # noqa
 from zenml.cli.base import *  # noqa
 from zenml.cli.config import *  # noqa
 from zenml.cli.example import *  # noqa
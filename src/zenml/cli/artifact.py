@@ -0,0 +1,134 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Functionality to manage the artifacts in the active artifact store."""
+
+import click
+
+from zenml.cli import utils as cli_utils
+from zenml.cli.cli import TagGroup, cli
+from zenml.console import console
+from zenml.enums import CliCategories
+from zenml.repository import Repository
+from zenml.utils import string_utils
+
+
+# Artifacts
+@cli.group(cls=TagGroup, tag=CliCategories.MANAGEMENT_TOOLS)
+def artifact() -> None:
+    """Manage the artifacts stored in the active artifact store."""
+
+
+@artifact.command(
+    "gc", help="Remove deduplicated blobs that are no longer referenced."
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Only show how much space would be freed without removing anything.",
+)
+@click.option("--yes", "-y", is_flag=True, required=False)
+def collect_garbage(dry_run: bool = False, yes: bool = False) -> None:
+    """Remove unreferenced blobs from the active artifact store.
+
+    Args:
+        dry_run: If `True`, only report the unreferenced blobs.
+        yes: Blobs will be removed without prompting for confirmation.
+    """
+    from zenml.artifact_stores.content_addressed_storage import (
+        ContentAddressedStorage,
+    )
+
+    cli_utils.print_active_profile()
+    cli_utils.print_active_stack()
+    artifact_store = Repository().active_stack.artifact_store
+    if not artifact_store.deduplicate:
+        cli_utils.warning(
+            f"Deduplication is not enabled for artifact store "
+            f"'{artifact_store.name}'. Only blobs written while it was "
+            f"enabled will be removed."
+        )
+
+    if not dry_run and not yes:
+        confirmation = cli_utils.confirmation(
+            f"This will permanently remove all blobs in artifact store "
+            f"'{artifact_store.name}' that are not referenced by any "
+            f"artifact. Make sure no pipelines are running on this artifact "
+            f"store.\nAre you sure you want to proceed?"
+        )
+        if not confirmation:
+            cli_utils.declare("Garbage collection canceled.")
+            return
+
+    with console.status("Collecting unreferenced blobs...\n"):
+        storage = ContentAddressedStorage(artifact_store)
+        num_blobs, num_bytes = storage.collect_garbage(dry_run=dry_run)
+
+    size = string_utils.get_human_readable_filesize(num_bytes)
+    if dry_run:
+        cli_utils.declare(
+            f"Found {num_blobs} unreferenced blobs ({size}) that would be "
+            f"removed."
+        )
+    else:
+        cli_utils.declare(f"Removed {num_blobs} unreferenced blobs ({size}).")
+
+
+@artifact.group(
+    "cache", help="Inspect and clear the local cache of remote artifacts."
+)
+def cache() -> None:
+    """Inspect and clear the local cache of remote artifacts."""
+
+
+@cache.command("describe", help="Show the size and hit rate of the cache.")
+def describe_cache() -> None:
+    """Show the size and hit/miss statistics of the local artifact cache."""
+    from zenml.artifact_stores.local_artifact_cache import LocalArtifactCache
+
+    local_cache = LocalArtifactCache()
+    num_files, num_bytes = local_cache.get_size()
+    stats = local_cache.get_stats()
+    requests = stats["hits"] + stats["misses"]
+    hit_rate = stats["hits"] / requests if requests else 0.0
+
+    cli_utils.declare(f"Cache directory: {local_cache.directory}")
+    cli_utils.declare(
+        f"Cached files: {num_files} "
+        f"({string_utils.get_human_readable_filesize(num_bytes)})"
+    )
+    cli_utils.declare(
+        f"Hits: {stats['hits']}, misses: {stats['misses']} "
+        f"(hit rate: {hit_rate:.1%}), evictions: {stats['evictions']}"
+    )
+
+
+@cache.command("clear", help="Remove all files from the cache.")
+@click.option("--yes", "-y", is_flag=True, required=False)
+def clear_cache(yes: bool = False) -> None:
+    """Remove all files from the local artifact cache.
+
+    Args:
+        yes: The cache will be cleared without prompting for confirmation.
+    """
+    from zenml.artifact_stores.local_artifact_cache import LocalArtifactCache
+
+    if not yes and not cli_utils.confirmation(
+        "This will remove all locally cached artifact files. Are you sure "
+        "you want to proceed?"
+    ):
+        cli_utils.declare("Clearing the artifact cache canceled.")
+        return
+
+    LocalArtifactCache().clear()
+    cli_utils.declare("Cleared the local artifact cache.")
@@ -16,10 +16,11 @@
 import os.path
 import textwrap
 import types
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import click
 
+from zenml.cli import utils as cli_utils
 from zenml.cli.cli import TagGroup, cli
 from zenml.config.config_keys import (
     PipelineConfigurationKeys,
@@ -31,6 +32,9 @@ from zenml.exceptions import PipelineConfigurationError
 from zenml.logger import get_logger
 from zenml.utils import source_utils, yaml_utils
 
+if TYPE_CHECKING:
+    from zenml.post_execution import StepView
+
 logger = get_logger(__name__)
 
 
@@ -216,3 +220,179 @@ def run_pipeline(python_file: str, config_path: str) -> None:
             "Finished setting up pipeline '%s' from CLI", pipeline_name
         )
         pipeline_instance.run()
+
+
+def _compare_values(
+    kind: str, values: Dict[str, Any], previous_values: Dict[str, Any]
+) -> List[str]:
+    """Describes the differences between two dictionaries.
+
+    Args:
+        kind: What the values are, used in the descriptions.
+        values: The current values.
+        previous_values: The previous values.
+
+    Returns:
+        A description of each key whose value differs.
+    """
+    differences = []
+    for key in sorted({*values, *previous_values}):
+        if key not in previous_values:
+            differences.append(f"{kind} '{key}' was added.")
+        elif key not in values:
+            differences.append(f"{kind} '{key}' was removed.")
+        elif values[key] != previous_values[key]:
+            differences.append(f"{kind} '{key}' changed.")
+    return differences
+
+
+def get_cache_miss_reasons(
+    step: "StepView", previous_step: "StepView"
+) -> List[str]:
+    """Explains why a step didn't reuse the outputs of a previous execution.
+
+    Args:
+        step: The step that wasn't cached.
+        previous_step: The previous execution of the step.
+
+    Returns:
+        Descriptions of the differences between the step executions that
+        prevented caching.
+    """
+    from zenml.steps.utils import PARAM_CODE_HASHES, PARAM_DATA_FINGERPRINT
+
+    if "disable_cache" in step.internal_parameters:
+        return ["Caching is disabled for the step."]
+
+    reasons = []
+    for key in sorted({*step.parameters, *previous_step.parameters}):
+        value = step.parameters.get(key)
+        previous_value = previous_step.parameters.get(key)
+        if value != previous_value:
+            reasons.append(
+                f"Parameter '{key}' changed from `{previous_value}` to "
+                f"`{value}`."
+            )
+
+    code_hashes = step.internal_parameters.get(PARAM_CODE_HASHES)
+    previous_code_hashes = previous_step.internal_parameters.get(
+        PARAM_CODE_HASHES
+    )
+    if code_hashes is not None and previous_code_hashes is not None:
+        reasons += _compare_values("Code of", code_hashes, previous_code_hashes)
+    else:
+        reasons += _compare_values(
+            "Source hash",
+            {
+                k: v
+                for k, v in step.internal_parameters.items()
+                if k.endswith("_source")
+            },
+            {
+                k: v
+                for k, v in previous_step.internal_parameters.items()
+                if k.endswith("_source")
+            },
+        )
+
+    fingerprint = step.internal_parameters.get(PARAM_DATA_FINGERPRINT)
+    previous_fingerprint = previous_step.internal_parameters.get(
+        PARAM_DATA_FINGERPRINT
+    )
+    if fingerprint != previous_fingerprint:
+        reasons.append(
+            f"Input data fingerprint changed from `{previous_fingerprint}` "
+            f"to `{fingerprint}`."
+        )
+
+    reasons += _compare_values(
+        "Input",
+        {name: artifact.id for name, artifact in step.inputs.items()},
+        {name: artifact.id for name, artifact in previous_step.inputs.items()},
+    )
+    return reasons
+
+
+@pipeline.command(
+    "explain-cache", help="Explain why a step of a pipeline run wasn't cached."
+)
+@click.argument("pipeline_name", type=str)
+@click.argument("step_name", type=str)
+@click.option(
+    "--run",
+    "run_name",
+    type=str,
+    help="Name of the run. Defaults to the latest run of the pipeline.",
+)
+@click.option(
+    "--previous-run",
+    "previous_run_name",
+    type=str,
+    help="Name of the run to compare with. Defaults to the run before.",
+)
+def explain_cache(
+    pipeline_name: str,
+    step_name: str,
+    run_name: Optional[str] = None,
+    previous_run_name: Optional[str] = None,
+) -> None:
+    """Explains why a step of a pipeline run wasn't cached.
+
+    Compares the parameters, code hashes and inputs of the step with the
+    step of a previous run.
+
+    Args:
+        pipeline_name: Name of the pipeline.
+        step_name: Name of the step in the pipeline.
+        run_name: Name of the run. Defaults to the latest run.
+        previous_run_name: Name of the run to compare with. Defaults to the
+            run before `run_name`.
+    """
+    from zenml.repository import Repository
+
+    pipeline_view = Repository().get_pipeline(pipeline_name)
+    if not pipeline_view:
+        cli_utils.error(f"No pipeline with name '{pipeline_name}' found.")
+
+    run_names = pipeline_view.get_run_names()
+    run_name = run_name or (run_names[-1] if run_names else None)
+    if run_name not in run_names:
+        cli_utils.error(f"No run '{run_name}' of '{pipeline_name}' found.")
+    if not previous_run_name:
+        index = run_names.index(run_name)
+        if index == 0:
+            cli_utils.error(f"Run '{run_name}' has no previous run.")
+        previous_run_name = run_names[index - 1]
+    elif previous_run_name not in run_names:
+        cli_utils.error(
+            f"No run '{previous_run_name}' of '{pipeline_name}' found."
+        )
+
+    try:
+        step = pipeline_view.get_run(run_name).get_step(step_name)
+        previous_step = pipeline_view.get_run(previous_run_name).get_step(
+            step_name
+        )
+    except KeyError as e:
+        cli_utils.error(str(e))
+
+    if step.is_cached:
+        cli_utils.declare(f"Step '{step_name}' of run '{run_name}' was cached.")
+        return
+
+    reasons = get_cache_miss_reasons(step, previous_step)
+    if not reasons:
+        cli_utils.declare(
+            f"Step '{step_name}' of run '{run_name}' has the same parameters, "
+            f"code and inputs as in run '{previous_run_name}'. It might not "
+            f"have been cached because the step of the previous run failed "
+            f"or ran on a different stack."
+        )
+        return
+
+    cli_utils.declare(
+        f"Step '{step_name}' of run '{run_name}' wasn't cached because it "
+        f"differs from run '{previous_run_name}':"
+    )
+    for reason in reasons:
+        cli_utils.declare(f"  - {reason}")
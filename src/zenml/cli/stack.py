@@ -14,23 +14,20 @@
 """CLI for manipulating ZenML local and global config file."""
 
 import json
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import click
 
 import zenml
 from zenml.cli import utils as cli_utils
 from zenml.cli.cli import TagGroup, cli
-from zenml.cli.stack_components import (
-    _component_display_name,
-    _register_stack_component,
-)
+from zenml.cli.stack_components import _component_display_name
 from zenml.config.global_config import GlobalConfiguration
 from zenml.console import console
 from zenml.enums import CliCategories, StackComponentType
 from zenml.exceptions import ProvisioningError
 from zenml.repository import Repository
-from zenml.stack import Stack
+from zenml.stack import Stack, StackComponent
 from zenml.utils.analytics_utils import AnalyticsEvent, track_event
 from zenml.utils.yaml_utils import read_yaml, write_yaml
 
@@ -182,80 +179,37 @@ def register_stack(
     with console.status(f"Registering stack '{stack_name}'...\n"):
         repo = Repository()
 
-        stack_components = {
-            StackComponentType.METADATA_STORE: repo.get_stack_component(
-                StackComponentType.METADATA_STORE, name=metadata_store_name
-            ),
-            StackComponentType.ARTIFACT_STORE: repo.get_stack_component(
-                StackComponentType.ARTIFACT_STORE, name=artifact_store_name
-            ),
-            StackComponentType.ORCHESTRATOR: repo.get_stack_component(
-                StackComponentType.ORCHESTRATOR, name=orchestrator_name
-            ),
+        component_names = {
+            StackComponentType.METADATA_STORE: metadata_store_name,
+            StackComponentType.ARTIFACT_STORE: artifact_store_name,
+            StackComponentType.ORCHESTRATOR: orchestrator_name,
+            StackComponentType.CONTAINER_REGISTRY: container_registry_name,
+            StackComponentType.SECRETS_MANAGER: secrets_manager_name,
+            StackComponentType.STEP_OPERATOR: step_operator_name,
+            StackComponentType.FEATURE_STORE: feature_store_name,
+            StackComponentType.MODEL_DEPLOYER: model_deployer_name,
+            StackComponentType.EXPERIMENT_TRACKER: experiment_tracker_name,
+            StackComponentType.ALERTER: alerter_name,
+            StackComponentType.DATA_VALIDATOR: data_validator_name,
         }
-
-        if container_registry_name:
-            stack_components[
-                StackComponentType.CONTAINER_REGISTRY
-            ] = repo.get_stack_component(
-                StackComponentType.CONTAINER_REGISTRY,
-                name=container_registry_name,
-            )
-
-        if secrets_manager_name:
-            stack_components[
-                StackComponentType.SECRETS_MANAGER
-            ] = repo.get_stack_component(
-                StackComponentType.SECRETS_MANAGER,
-                name=secrets_manager_name,
-            )
-
-        if step_operator_name:
-            stack_components[
-                StackComponentType.STEP_OPERATOR
-            ] = repo.get_stack_component(
-                StackComponentType.STEP_OPERATOR,
-                name=step_operator_name,
-            )
-
-        if feature_store_name:
-            stack_components[
-                StackComponentType.FEATURE_STORE
-            ] = repo.get_stack_component(
-                StackComponentType.FEATURE_STORE,
-                name=feature_store_name,
-            )
-        if model_deployer_name:
-            stack_components[
-                StackComponentType.MODEL_DEPLOYER
-            ] = repo.get_stack_component(
-                StackComponentType.MODEL_DEPLOYER,
-                name=model_deployer_name,
-            )
-
-        if experiment_tracker_name:
-            stack_components[
-                StackComponentType.EXPERIMENT_TRACKER
-            ] = repo.get_stack_component(
-                StackComponentType.EXPERIMENT_TRACKER,
-                name=experiment_tracker_name,
-            )
-
-        if alerter_name:
-            stack_components[
-                StackComponentType.ALERTER
-            ] = repo.get_stack_component(
-                StackComponentType.ALERTER,
-                name=alerter_name,
-            )
-
-        if data_validator_name:
-            stack_components[
-                StackComponentType.DATA_VALIDATOR
-            ] = repo.get_stack_component(
-                StackComponentType.DATA_VALIDATOR,
-                name=data_validator_name,
+        requested_components = [
+            (component_type, name)
+            for component_type, name in component_names.items()
+            if name
+        ]
+        # fetch all components at once instead of one request per component
+        stack_components = {
+            component.TYPE: component
+            for component in repo.get_stack_components_by_names(
+                requested_components
             )
+        }
+        for component_type, name in requested_components:
+            if component_type not in stack_components:
+                raise KeyError(
+                    f"Unable to find stack component (type: "
+                    f"{component_type}) with name '{name}'."
+                )
 
         stack_ = Stack.from_components(
             name=stack_name, components=stack_components
@@ -931,20 +885,15 @@ def down_stack(force: bool = False, old_force: bool = False) -> None:
         stack_.suspend()
 
 
-def _get_component_as_dict(
-    component_type: StackComponentType, component_name: str
-) -> Dict[str, str]:
+def _get_component_as_dict(component: StackComponent) -> Dict[str, str]:
     """Return a dict representation of a component's key config values.
 
     Args:
-        component_type: The type of component to get.
-        component_name: The name of the component to get.
+        component: The component to convert.
 
     Returns:
         A dict representation of the component's key config values.
     """
-    repo = Repository()
-    component = repo.get_stack_component(component_type, name=component_name)
     component_dict = {
         key: value
         for key, value in json.loads(component.json()).items()
@@ -966,24 +915,17 @@ def export_stack(stack_name: str, filename: Optional[str]) -> None:
     """
     track_event(AnalyticsEvent.EXPORT_STACK)
 
-    # Get configuration of given stack
-    # TODO [ENG-893]: code duplicate with describe_stack()
-    repo = Repository()
-
-    stack_configurations = repo.stack_configurations
-    if len(stack_configurations) == 0:
-        cli_utils.error("No stacks registered.")
-
+    # fetch the stack including all its components at once
     try:
-        stack_configuration = stack_configurations[stack_name]
+        stack_ = Repository().get_stack(stack_name)
     except KeyError:
         cli_utils.error(f"Stack '{stack_name}' does not exist.")
 
     # create a dict of all components in the specified stack
-    component_data = {}
-    for component_type, component_name in stack_configuration.items():
-        component_dict = _get_component_as_dict(component_type, component_name)
-        component_data[str(component_type)] = component_dict
+    component_data = {
+        str(component_type): _get_component_as_dict(component)
+        for component_type, component in stack_.components.items()
+    }
 
     # write zenml version and stack dict to YAML
     yaml_data = {
@@ -998,17 +940,26 @@ def export_stack(stack_name: str, filename: Optional[str]) -> None:
 
 
 def _import_stack_component(
-    component_type: StackComponentType, component_config: Dict[str, str]
-) -> str:
+    component_type: StackComponentType,
+    component_config: Dict[str, str],
+    existing_components: Dict[Tuple[StackComponentType, str], StackComponent],
+) -> StackComponent:
     """Import a single stack component with given type/config.
 
+    The component isn't registered by this function. New components are
+    registered together with the stack instead.
+
     Args:
         component_type: The type of component to import.
         component_config: The config of the component to import.
+        existing_components: Registered components by type and name. Updated
+            with the components that are fetched by this function.
 
     Returns:
-        The name of the imported component.
+        The registered component if it is configured exactly like the
+        imported component, otherwise a new component.
     """
+    repo = Repository()
     component_type = StackComponentType(component_type)
     component_name = component_config.pop("name")
     component_flavor = component_config.pop("flavor")
@@ -1017,24 +968,28 @@ def _import_stack_component(
     while True:
         # check if component already exists
         try:
-            other_component = _get_component_as_dict(
+            other_component = existing_components[
                 component_type, component_name
-            )
+            ]
 
         # component didn't exist yet, so we create it.
         except KeyError:
             break
 
         # check whether other component has exactly same config as export
+        other_component_dict = _get_component_as_dict(other_component)
         other_is_same = True
         for key, value in component_config.items():
-            if key not in other_component or other_component[key] != value:
+            if (
+                key not in other_component_dict
+                or other_component_dict[key] != value
+            ):
                 other_is_same = False
                 break
 
         # component already exists and is correctly configured -> done
         if other_is_same:
-            return component_name
+            return other_component
 
         # component already exists but with different config -> rename
         display_name = _component_display_name(component_type)
@@ -1045,27 +1000,24 @@ def _import_stack_component(
             f"Please choose a different name.",
             type=str,
         )
+        for component in repo.get_stack_components_by_names(
+            [(component_type, component_name)]
+        ):
+            existing_components[component.TYPE, component.name] = component
 
-    _register_stack_component(
-        component_type=component_type,
-        component_name=component_name,
-        component_flavor=component_flavor,
-        **component_config,
+    flavor_class = repo.get_flavor(
+        name=component_flavor, component_type=component_type
     )
-    return component_name
+    return flavor_class(name=component_name, **component_config)
 
 
 @stack.command("import", help="Import a stack from YAML.")
 @click.argument("stack_name", type=str, required=True)
 @click.argument("filename", type=str, required=False)
-@click.pass_context
-def import_stack(
-    ctx: click.Context, stack_name: str, filename: Optional[str]
-) -> None:
+def import_stack(stack_name: str, filename: Optional[str]) -> None:
     """Import a stack from YAML.
 
     Args:
-        ctx: The click context.
         stack_name: The name of the stack to import.
         filename: The filename to import the stack from.
     """
@@ -1104,17 +1056,44 @@ def import_stack(
             type=str,
         )
 
+    # fetch all components with the same names as the imported ones at once
+    existing_components = {
+        (component.TYPE, component.name): component
+        for component in repo.get_stack_components_by_names(
+            [
+                (StackComponentType(component_type), component_config["name"])
+                for component_type, component_config in data[
+                    "components"
+                ].items()
+            ]
+        )
+    }
+
     # import stack components
-    component_names = {}
+    stack_components: Dict[StackComponentType, StackComponent] = {}
     for component_type, component_config in data["components"].items():
-        component_name = _import_stack_component(
+        component = _import_stack_component(
             component_type=component_type,
             component_config=component_config,
+            existing_components=existing_components,
         )
-        component_names[component_type + "_name"] = component_name
+        stack_components[component.TYPE] = component
+
+    # register new stack, this registers all new components in the same call
+    cli_utils.print_active_profile()
+    with console.status(f"Registering stack '{stack_name}'...\n"):
+        stack_ = Stack.from_components(
+            name=stack_name, components=stack_components
+        )
+        repo.register_stack(stack_)
+        cli_utils.declare(f"Stack '{stack_name}' successfully registered!")
 
-    # register new stack
-    ctx.invoke(register_stack, stack_name=stack_name, **component_names)
+    for component in stack_components.values():
+        if (
+            component.TYPE,
+            component.name,
+        ) not in existing_components and component.post_registration_message:
+            cli_utils.declare(component.post_registration_message)
 
 
 @stack.command("copy", help="Copy a stack to a new stack name.")
@@ -14,6 +14,7 @@
 """ZenML constants."""
 
 import os
+import tempfile
 from typing import Optional
 
 from zenml import __version__
@@ -72,6 +73,21 @@ ENV_ZENML_ACTIVATED_STACK = "ZENML_ACTIVATED_STACK"
 ENV_ZENML_PROFILE_NAME = "ZENML_PROFILE_NAME"
 ENV_ZENML_SUPPRESS_LOGS = "ZENML_SUPPRESS_LOGS"
 ENV_ZENML_ENABLE_REPO_INIT_WARNINGS = "ZENML_ENABLE_REPO_INIT_WARNINGS"
+ENV_ZENML_PANDAS_COMPRESSION = "ZENML_PANDAS_COMPRESSION"
+ENV_ZENML_PANDAS_COMPRESSION_LEVEL = "ZENML_PANDAS_COMPRESSION_LEVEL"
+ENV_ZENML_PANDAS_ROW_GROUP_SIZE = "ZENML_PANDAS_ROW_GROUP_SIZE"
+ENV_ZENML_PANDAS_USE_DICTIONARY = "ZENML_PANDAS_USE_DICTIONARY"
+ENV_ZENML_COPY_MAX_WORKERS = "ZENML_COPY_MAX_WORKERS"
+ENV_ZENML_REST_STORE_TIMEOUT = "ZENML_REST_STORE_TIMEOUT"
+ENV_ZENML_REST_STORE_MAX_RETRIES = "ZENML_REST_STORE_MAX_RETRIES"
+ENV_ZENML_REST_STORE_POOL_SIZE = "ZENML_REST_STORE_POOL_SIZE"
+ENV_ZENML_REST_STORE_COMPRESSION = "ZENML_REST_STORE_COMPRESSION"
+ENV_ZENML_STORE_CACHE_TTL = "ZENML_STORE_CACHE_TTL"
+ENV_ZENML_CONFIG_REVALIDATION_INTERVAL = "ZENML_CONFIG_REVALIDATION_INTERVAL"
+ENV_ZENML_SERVER_THREAD_POOL_SIZE = "ZENML_SERVER_THREAD_POOL_SIZE"
+ENV_ZENML_SERVER_MAX_REQUESTS = "ZENML_SERVER_MAX_REQUESTS"
+ENV_ZENML_DOCKER_REUSE_IMAGES = "ZENML_DOCKER_REUSE_IMAGES"
+ENV_ZENML_SOURCE_ARCHIVE_CACHE_DIR = "ZENML_SOURCE_ARCHIVE_CACHE_DIR"
 
 # Logging variables
 IS_DEBUG_ENV: bool = handle_bool_env_var(ENV_ZENML_DEBUG, default=False)
@@ -119,6 +135,40 @@ VALID_OPERATING_SYSTEMS = ["Windows", "Darwin", "Linux"]
 
 # Path utilities constants
 REMOTE_FS_PREFIX = ["gs://", "hdfs://", "s3://", "az://", "abfs://"]
+COPY_MAX_WORKERS: int = handle_int_env_var(ENV_ZENML_COPY_MAX_WORKERS, 8)
+
+# Configuration files
+CONFIG_REVALIDATION_INTERVAL: int = handle_int_env_var(
+    ENV_ZENML_CONFIG_REVALIDATION_INTERVAL, 1
+)
+
+# Zen stores
+# Overrides the default cache TTL of the zen store implementations if set
+ZEN_STORE_CACHE_TTL: Optional[int] = (
+    handle_int_env_var(ENV_ZENML_STORE_CACHE_TTL)
+    if ENV_ZENML_STORE_CACHE_TTL in os.environ
+    else None
+)
+REST_STORE_ETAG_CACHE_SIZE = 256
+REST_STORE_TIMEOUT: int = handle_int_env_var(ENV_ZENML_REST_STORE_TIMEOUT, 30)
+REST_STORE_MAX_RETRIES: int = handle_int_env_var(
+    ENV_ZENML_REST_STORE_MAX_RETRIES, 3
+)
+REST_STORE_RETRY_BACKOFF_FACTOR = 0.5
+REST_STORE_POOL_SIZE: int = handle_int_env_var(
+    ENV_ZENML_REST_STORE_POOL_SIZE, 10
+)
+REST_STORE_COMPRESSION: bool = handle_bool_env_var(
+    ENV_ZENML_REST_STORE_COMPRESSION, True
+)
+
+# ZenServer
+ZEN_SERVER_THREAD_POOL_SIZE: int = handle_int_env_var(
+    ENV_ZENML_SERVER_THREAD_POOL_SIZE, 40
+)
+ZEN_SERVER_MAX_REQUESTS: int = handle_int_env_var(
+    ENV_ZENML_SERVER_MAX_REQUESTS, 200
+)
 
 # Segment
 SEGMENT_KEY_DEV = "mDBYI0m7GcCj59EZ4f9d016L1T3rh8J5"
@@ -147,6 +197,15 @@ ENABLE_RICH_TRACEBACK = handle_bool_env_var(
     ENV_ZENML_ENABLE_RICH_TRACEBACK, True
 )
 
+# Docker
+DOCKER_REUSE_IMAGES: bool = handle_bool_env_var(
+    ENV_ZENML_DOCKER_REUSE_IMAGES, True
+)
+SOURCE_ARCHIVE_CACHE_DIR = os.getenv(
+    ENV_ZENML_SOURCE_ARCHIVE_CACHE_DIR,
+    os.path.join(tempfile.gettempdir(), "zenml_source_archives"),
+)
+
 # Services
 DEFAULT_SERVICE_START_STOP_TIMEOUT = 10
 DEFAULT_LOCAL_SERVICE_IP_ADDRESS = "127.0.0.1"
@@ -165,6 +224,7 @@ ROLES = "/roles"
 FLAVORS = "/flavors"
 ROLE_ASSIGNMENTS = "/role_assignments"
 PIPELINE_RUNS = "/pipeline_runs"
+PIPELINE_RUN_SUMMARIES = "/pipeline_run_summaries"
 
 # mandatory stack component attributes
 MANDATORY_COMPONENT_ATTRIBUTES = ["name", "uuid"]
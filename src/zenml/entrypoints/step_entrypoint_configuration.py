@@ -17,6 +17,7 @@ import argparse
 import importlib
 import json
 import logging
+import os
 import sys
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, NoReturn, Optional, Set, Type
@@ -34,7 +35,7 @@ from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.repository import Repository
 from zenml.steps import BaseStep
 from zenml.steps import utils as step_utils
-from zenml.utils import source_utils, string_utils
+from zenml.utils import source_archive_utils, source_utils, string_utils
 
 DEFAULT_SINGLE_STEP_CONTAINER_ENTRYPOINT_COMMAND = [
     "python",
@@ -48,6 +49,8 @@ MAIN_MODULE_SOURCE_OPTION = "main_module_source"
 STEP_SOURCE_OPTION = "step_source"
 INPUT_ARTIFACT_SOURCES_OPTION = "input_artifact_sources"
 MATERIALIZER_SOURCES_OPTION = "materializer_sources"
+# Optional ZenML entrypoint options
+SOURCE_ARCHIVE_OPTION = "source_archive"
 
 
 class StepEntrypointConfiguration(ABC):
@@ -79,6 +82,14 @@ class StepEntrypointConfiguration(ABC):
         You'll be able to access the argument values from `self.entrypoint_args`
         inside your `StepEntrypointConfiguration` subclass.
 
+    Running steps with code from a source archive:
+        If the orchestrator uploaded the source code to the artifact store
+        using `zenml.utils.source_archive_utils.upload_source_archive(...)`,
+        pass the archive URI as `source_archive` to
+        `get_entrypoint_arguments(...)`. The entrypoint will download and
+        extract the archive and import all user code from it instead of the
+        code inside the docker image.
+
     Running custom code inside the entrypoint:
         If you need to run custom code in the entrypoint, you can overwrite
         the `setup(...)` and `post_run(...)` methods which allow you to run
@@ -296,6 +307,7 @@ class StepEntrypointConfiguration(ABC):
         cls,
         step: BaseStep,
         pb2_pipeline: Pb2Pipeline,
+        source_archive: Optional[str] = None,
         **kwargs: Any,
     ) -> List[str]:
         """Gets all arguments that the entrypoint command should be called with.
@@ -315,6 +327,8 @@ class StepEntrypointConfiguration(ABC):
                 returned by this method.
             pb2_pipeline: The protobuf representation of the pipeline to which
                 the `step` belongs.
+            source_archive: Optional URI of a source archive in the artifact
+                store from which the user code should be imported.
             **kwargs: Custom options that will be passed to
                 `get_custom_entrypoint_arguments()`.
 
@@ -392,6 +406,8 @@ class StepEntrypointConfiguration(ABC):
             f"--{MATERIALIZER_SOURCES_OPTION}",
             string_utils.b64_encode(json.dumps(materializer_sources)),
         ]
+        if source_archive:
+            zenml_arguments += [f"--{SOURCE_ARCHIVE_OPTION}", source_archive]
 
         custom_arguments = cls.get_custom_entrypoint_arguments(
             step=step, **kwargs
@@ -444,6 +460,7 @@ class StepEntrypointConfiguration(ABC):
                 # class to use
                 continue
             parser.add_argument(f"--{option_name}", required=True)
+        parser.add_argument(f"--{SOURCE_ARCHIVE_OPTION}", required=False)
 
         result, _ = parser.parse_known_args(arguments)
         return vars(result)
@@ -453,6 +470,7 @@ class StepEntrypointConfiguration(ABC):
         step: BaseStep,
         input_artifact_sources: Dict[str, str],
         materializer_sources: Dict[str, str],
+        execution_parameter_names: Set[str],
     ) -> None:
         """Creates an executor class for the given step.
 
@@ -462,6 +480,8 @@ class StepEntrypointConfiguration(ABC):
                 source strings of the artifact class to use for that input.
             materializer_sources: Dictionary mapping step output names to a
                 source string of the materializer class to use for that output.
+            execution_parameter_names: Names of the execution parameters of
+                the step in the compiled pipeline.
 
         Raises:
             TypeError: If the step does not have a valid input or output
@@ -484,11 +504,6 @@ class StepEntrypointConfiguration(ABC):
             for key, value in step.OUTPUT_SIGNATURE.items()
         }
 
-        execution_parameters = {
-            **step.PARAM_SPEC,
-            **step._internal_execution_parameters,
-        }
-
         materializers = {}
         for output_name, source in materializer_sources.items():
             materializer_class = source_utils.load_source_path_class(source)
@@ -505,7 +520,7 @@ class StepEntrypointConfiguration(ABC):
             step_module=step.__module__,
             input_spec=input_spec,
             output_spec=output_spec,
-            execution_parameter_names=set(execution_parameters),
+            execution_parameter_names=execution_parameter_names,
             step_function=step.entrypoint,
             materializers=materializers,
         )
@@ -566,6 +581,18 @@ class StepEntrypointConfiguration(ABC):
         # and stack component flavors are registered.
         integration_registry.activate_integrations()
 
+        # If the user code was shipped as source archive, import it from the
+        # extracted archive instead of the docker image. This needs to happen
+        # after the integrations are activated so the filesystem of the
+        # artifact store is registered.
+        source_archive = self.entrypoint_args.get(SOURCE_ARCHIVE_OPTION)
+        if source_archive:
+            source_root = source_archive_utils.download_source_archive(
+                source_archive
+            )
+            os.chdir(source_root)
+            sys.path.insert(0, source_root)
+
         # Import the main module that was executed to run the pipeline to which
         # the step getting executed belongs. Even if the step class is not
         # defined in this module, we need to import it in case the user
@@ -614,24 +641,27 @@ class StepEntrypointConfiguration(ABC):
         # Create the executor class that is responsible for running the step
         # function. This method call dynamically creates an executor class
         # which will later be used when `orchestrator.run_step(...)` is running
-        # the step.
+        # the step. The execution parameters are taken from the compiled
+        # pipeline instead of being computed again, as some of them (e.g.
+        # the input data fingerprint) are only evaluated at compile time.
+        orchestrator = Repository().active_stack.orchestrator
+        pipeline_node = orchestrator._get_node_with_step_name(
+            step_name=step_name, pb2_pipeline=pb2_pipeline
+        )
         self._create_executor_class(
             step=step,
             input_artifact_sources=input_artifact_sources,
             materializer_sources=materializer_sources,
+            execution_parameter_names=set(pipeline_node.parameters.parameters),
         )
 
         # Execute the actual step code.
         run_name = self.get_run_name(pipeline_name=pipeline_name)
-        orchestrator = Repository().active_stack.orchestrator
         execution_info = orchestrator.run_step(
             step=step, run_name=run_name, pb2_pipeline=pb2_pipeline
         )
 
         # Allow subclasses to run custom code after the step finished executing.
-        pipeline_node = orchestrator._get_node_with_step_name(
-            step_name=step_name, pb2_pipeline=pb2_pipeline
-        )
         self.post_run(
             pipeline_name=pipeline_name,
             step_name=step_name,
@@ -56,7 +56,6 @@ from zenml.logger import get_logger
 from zenml.orchestrators.base_orchestrator import BaseOrchestrator
 from zenml.repository import Repository
 from zenml.stack.stack_validator import StackValidator
-from zenml.utils.docker_utils import get_image_digest
 from zenml.utils.io_utils import get_global_config_directory
 from zenml.utils.source_utils import get_source_root_path
 
@@ -284,14 +283,18 @@ class VertexOrchestrator(BaseOrchestrator, GoogleCredentialsMixin):
             requirements,
         )
 
-        docker_utils.build_docker_image(
+        image_digest = docker_utils.build_and_push_docker_image(
             build_context_path=get_source_root_path(),
             image_name=image_name,
+            container_registry=container_registry,
             dockerignore_path=pipeline.dockerignore_file,
             requirements=requirements,
             base_image=self.custom_docker_base_image_name,
         )
-        container_registry.push_image(image_name)
+
+        # Store the docker image digest in the runtime configuration so it gets
+        # tracked in the ZenStore
+        runtime_configuration["docker_image"] = image_digest
 
     def prepare_or_run_pipeline(
         self,
@@ -359,10 +362,9 @@ class VertexOrchestrator(BaseOrchestrator, GoogleCredentialsMixin):
         else:
             self._pipeline_root = self.pipeline_root
 
-        # Build the Docker image that will be used to run the steps of the
+        # Get the Docker image that will be used to run the steps of the
         # pipeline.
-        image_name = self.get_docker_image_name(pipeline.name)
-        image_name = get_image_digest(image_name) or image_name
+        image_name = runtime_configuration["docker_image"]
 
         def _construct_kfp_pipeline() -> None:
             """Create a `ContainerOp` for each step.
@@ -150,15 +150,14 @@ class VertexStepOperator(BaseStepOperator, GoogleCredentialsMixin):
         registry_uri = container_registry.uri.rstrip("/")
         image_name = f"{registry_uri}/zenml-vertex:{pipeline_name}"
 
-        docker_utils.build_docker_image(
+        return docker_utils.build_and_push_docker_image(
             build_context_path=get_source_root_path(),
             image_name=image_name,
+            container_registry=container_registry,
             entrypoint=" ".join(entrypoint_command),
             requirements=set(requirements),
             base_image=self.base_image,
         )
-        container_registry.push_image(image_name)
-        return docker_utils.get_image_digest(image_name) or image_name
 
     def launch(
         self,
@@ -332,20 +332,18 @@ class GitHubActionsOrchestrator(BaseOrchestrator):
             "Github actions docker image requirements: %s", requirements
         )
 
-        docker_utils.build_docker_image(
+        assert stack.container_registry  # should never happen due to validation
+        image_digest = docker_utils.build_and_push_docker_image(
             build_context_path=source_utils.get_source_root_path(),
             image_name=image_name,
+            container_registry=stack.container_registry,
             dockerignore_path=pipeline.dockerignore_file,
             requirements=requirements,
             base_image=self.custom_docker_base_image_name,
         )
 
-        assert stack.container_registry  # should never happen due to validation
-        stack.container_registry.push_image(image_name)
-
         # Store the docker image digest in the runtime configuration so it gets
         # tracked in the ZenStore
-        image_digest = docker_utils.get_image_digest(image_name) or image_name
         runtime_configuration["docker_image"] = image_digest
 
     def prepare_or_run_pipeline(
@@ -441,8 +439,7 @@ class GitHubActionsOrchestrator(BaseOrchestrator):
             )
             workflow_dict["on"] = {"push": {"paths": [workflow_path_in_repo]}}
 
-        image_name = self.get_docker_image_name(pipeline.name)
-        image_name = docker_utils.get_image_digest(image_name) or image_name
+        image_name = runtime_configuration["docker_image"]
 
         # Prepare the step that writes an environment file which will get
         # passed to the docker image
@@ -33,6 +33,7 @@
 import os
 import re
 import sys
+import tempfile
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple
 from uuid import UUID
 
@@ -47,6 +48,9 @@ from pydantic import root_validator
 from tfx.proto.orchestration.pipeline_pb2 import Pipeline as Pb2Pipeline
 
 from zenml.artifact_stores import LocalArtifactStore
+from zenml.entrypoints.step_entrypoint_configuration import (
+    SOURCE_ARCHIVE_OPTION,
+)
 from zenml.enums import StackComponentType
 from zenml.environment import Environment
 from zenml.exceptions import ProvisioningError
@@ -68,7 +72,6 @@ from zenml.orchestrators import BaseOrchestrator
 from zenml.repository import Repository
 from zenml.stack import StackValidator
 from zenml.utils import io_utils, networking_utils
-from zenml.utils.docker_utils import get_image_digest
 from zenml.utils.source_utils import get_source_root_path
 
 if TYPE_CHECKING:
@@ -114,6 +117,10 @@ class KubeflowOrchestrator(BaseOrchestrator):
             be skipped.
         skip_ui_daemon_provisioning: If `True`, provisioning the KFP UI daemon
             will be skipped.
+        use_source_archive: If `True`, the source code is uploaded to the
+            artifact store as an archive and the docker image only contains
+            the requirements. Code changes then don't require building a new
+            image.
     """
 
     custom_docker_base_image_name: Optional[str] = None
@@ -124,6 +131,7 @@ class KubeflowOrchestrator(BaseOrchestrator):
     skip_local_validations: bool = False
     skip_cluster_provisioning: bool = False
     skip_ui_daemon_provisioning: bool = False
+    use_source_archive: bool = False
 
     # Class Configuration
     FLAVOR: ClassVar[str] = KUBEFLOW_ORCHESTRATOR_FLAVOR
@@ -402,7 +410,7 @@ class KubeflowOrchestrator(BaseOrchestrator):
             stack: The stack to be deployed.
             runtime_configuration: The runtime configuration to be used.
         """
-        from zenml.utils import docker_utils
+        from zenml.utils import docker_utils, source_archive_utils
 
         image_name = self.get_docker_image_name(pipeline.name)
 
@@ -410,23 +418,37 @@ class KubeflowOrchestrator(BaseOrchestrator):
 
         logger.debug("Kubeflow docker container requirements: %s", requirements)
 
-        docker_utils.build_docker_image(
-            build_context_path=get_source_root_path(),
-            image_name=image_name,
-            dockerignore_path=pipeline.dockerignore_file,
-            requirements=requirements,
-            base_image=self.custom_docker_base_image_name,
-            environment_vars=self._get_environment_vars_from_secrets(
-                pipeline.secrets
-            ),
-        )
-
         assert stack.container_registry  # should never happen due to validation
-        stack.container_registry.push_image(image_name)
+        with tempfile.TemporaryDirectory() as empty_build_context_path:
+            build_context_path = get_source_root_path()
+            dockerignore_path = pipeline.dockerignore_file
+            if self.use_source_archive:
+                runtime_configuration[
+                    SOURCE_ARCHIVE_OPTION
+                ] = source_archive_utils.upload_source_archive(
+                    artifact_store_path=stack.artifact_store.path,
+                    source_root=build_context_path,
+                    dockerignore_path=dockerignore_path,
+                )
+                # The image doesn't contain the source code, so it only needs
+                # to be rebuilt if the requirements or the stack change
+                build_context_path = empty_build_context_path
+                dockerignore_path = None
+
+            image_digest = docker_utils.build_and_push_docker_image(
+                build_context_path=build_context_path,
+                image_name=image_name,
+                container_registry=stack.container_registry,
+                dockerignore_path=dockerignore_path,
+                requirements=requirements,
+                base_image=self.custom_docker_base_image_name,
+                environment_vars=self._get_environment_vars_from_secrets(
+                    pipeline.secrets
+                ),
+            )
 
         # Store the docker image digest in the runtime configuration so it gets
         # tracked in the ZenStore
-        image_digest = docker_utils.get_image_digest(image_name) or image_name
         runtime_configuration["docker_image"] = image_digest
 
     @staticmethod
@@ -596,8 +618,7 @@ class KubeflowOrchestrator(BaseOrchestrator):
                 "orchestrator."
             )
 
-        image_name = self.get_docker_image_name(pipeline.name)
-        image_name = get_image_digest(image_name) or image_name
+        image_name = runtime_configuration["docker_image"]
 
         # Create a callable for future compilation into a dsl.Pipeline.
         def _construct_kfp_pipeline() -> None:
@@ -630,6 +651,9 @@ class KubeflowOrchestrator(BaseOrchestrator):
                     KubeflowEntrypointConfiguration.get_entrypoint_arguments(
                         step=step,
                         pb2_pipeline=pb2_pipeline,
+                        source_archive=runtime_configuration.get(
+                            SOURCE_ARCHIVE_OPTION
+                        ),
                         **{METADATA_UI_PATH_OPTION: metadata_ui_path},
                     )
                 )
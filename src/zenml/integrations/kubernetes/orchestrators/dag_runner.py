@@ -14,9 +14,10 @@
 """DAG (Directed Acyclic Graph) Runners."""
 
 import threading
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from zenml.logger import get_logger
 
@@ -47,12 +48,26 @@ def reverse_dag(dag: Dict[str, List[str]]) -> Dict[str, List[str]]:
     return reversed_dag
 
 
+DEFAULT_RESOURCE_CLASS = "default"
+
+
 class NodeStatus(Enum):
     """Status of the execution of a node."""
 
     WAITING = "Waiting"
     RUNNING = "Running"
     COMPLETED = "Completed"
+    FAILED = "Failed"
+    SKIPPED = "Skipped"
+
+
+class FailurePolicy(Enum):
+    """Policy that defines what happens when running a node fails."""
+
+    # Don't start any new nodes once a node failed.
+    FAIL_FAST = "fail_fast"
+    # Keep running all nodes that don't depend on the failed node.
+    CONTINUE = "continue"
 
 
 class ThreadedDagRunner:
@@ -62,11 +77,21 @@ class ThreadedDagRunner:
     well as a custom `run_fn` as input, then calls `run_fn(node)` for each
     string node in the DAG.
 
-    Steps that can be executed in parallel will be started in separate threads.
+    Nodes that can be executed in parallel are run in a thread pool. A node is
+    ready to run once the counter of its pending upstream nodes drops to
+    zero. Ready nodes are queued by their resource class and started as long
+    as neither the overall parallelism limit nor the limit of their resource
+    class is reached.
     """
 
     def __init__(
-        self, dag: Dict[str, List[str]], run_fn: Callable[[str], Any]
+        self,
+        dag: Dict[str, List[str]],
+        run_fn: Callable[[str], Any],
+        max_parallelism: Optional[int] = None,
+        resource_classes: Optional[Dict[str, str]] = None,
+        resource_class_limits: Optional[Dict[str, int]] = None,
+        failure_policy: FailurePolicy = FailurePolicy.FAIL_FAST,
     ) -> None:
         """Define attributes and initialize all nodes in waiting state.
 
@@ -75,119 +100,182 @@ class ThreadedDagRunner:
                 E.g.: [(1->2), (1->3), (2->4), (3->4)] should be represented as
                 `dag={2: [1], 3: [1], 4: [2, 3]}`
             run_fn: A function `run_fn(node)` that runs a single node
+            max_parallelism: Maximum number of nodes that run at the same
+                time. If not set, all ready nodes are run in parallel.
+            resource_classes: Resource class of each node. Nodes without a
+                resource class are assigned to the default resource class.
+            resource_class_limits: Maximum number of nodes of each resource
+                class that run at the same time. Resource classes without a
+                limit are only limited by `max_parallelism`.
+            failure_policy: What to do when running a node fails.
+
+        Raises:
+            ValueError: If a parallelism limit is not positive.
         """
+        if max_parallelism is not None and max_parallelism < 1:
+            raise ValueError(
+                f"Maximum parallelism must be positive, got {max_parallelism}."
+            )
+        for resource_class, limit in (resource_class_limits or {}).items():
+            if limit < 1:
+                raise ValueError(
+                    f"Limit of resource class `{resource_class}` must be "
+                    f"positive, got {limit}."
+                )
+
         self.dag = dag
         self.reversed_dag = reverse_dag(dag)
         self.run_fn = run_fn
         self.nodes = dag.keys()
         self.node_states = {node: NodeStatus.WAITING for node in self.nodes}
-        self._lock = threading.Lock()
+        self.max_parallelism = max_parallelism
+        self.resource_classes = resource_classes or {}
+        self.resource_class_limits = resource_class_limits or {}
+        self.failure_policy = failure_policy
+
+        self._condition = threading.Condition()
+        self._pending_upstream_nodes = {
+            node: len(upstream_nodes) for node, upstream_nodes in dag.items()
+        }
+        self._ready_nodes: Dict[str, Deque[str]] = defaultdict(deque)
+        self._running_nodes: Dict[str, int] = defaultdict(int)
+        self._failed_nodes: List[str] = []
+
+    def _get_resource_class(self, node: str) -> str:
+        """Gets the resource class of a node.
 
-    def _can_run(self, node: str) -> bool:
-        """Determine whether a node is ready to be run.
+        Args:
+            node: The node.
+
+        Returns:
+            The resource class of the node.
+        """
+        return self.resource_classes.get(node, DEFAULT_RESOURCE_CLASS)
 
-        This is the case if the node has not run yet and all of its upstream
-        node have already completed.
+    def _can_start(self, resource_class: str) -> bool:
+        """Checks whether another node of a resource class can be started.
 
         Args:
-            node: The node.
+            resource_class: The resource class.
 
         Returns:
-            True if the node can run else False.
+            True if neither the overall parallelism limit nor the limit of the
+            resource class is reached.
         """
-        # Check that node has not run yet.
-        if not self.node_states[node] == NodeStatus.WAITING:
+        if self.failure_policy == FailurePolicy.FAIL_FAST and (
+            self._failed_nodes
+        ):
             return False
 
-        # Check that all upstream nodes of this node have already completed.
-        for upstream_node in self.dag[node]:
-            if not self.node_states[upstream_node] == NodeStatus.COMPLETED:
-                return False
+        running = sum(self._running_nodes.values())
+        if self.max_parallelism is not None and (
+            running >= self.max_parallelism
+        ):
+            return False
 
-        return True
+        limit = self.resource_class_limits.get(resource_class)
+        return limit is None or self._running_nodes[resource_class] < limit
 
-    def _run_node(self, node: str) -> None:
-        """Run a single node.
+    def _start_ready_nodes(self, executor: ThreadPoolExecutor) -> None:
+        """Starts ready nodes until a parallelism limit is reached.
 
-        Calls the user-defined run_fn, then calls `self._finish_node`.
+        Must be called while holding `self._condition`.
 
         Args:
-            node: The node.
+            executor: The executor in which to run the nodes.
         """
-        self.run_fn(node)
-        self._finish_node(node)
+        for resource_class, ready_nodes in self._ready_nodes.items():
+            while ready_nodes and self._can_start(resource_class):
+                node = ready_nodes.popleft()
+                self.node_states[node] = NodeStatus.RUNNING
+                self._running_nodes[resource_class] += 1
+                executor.submit(self._run_node, node)
 
-    def _run_node_in_thread(self, node: str) -> threading.Thread:
-        """Run a single node in a separate thread.
+    def _run_node(self, node: str) -> None:
+        """Run a single node.
 
-        First updates the node status to running.
-        Then calls self._run_node() in a new thread and returns the thread.
+        Calls the user-defined run_fn, then calls `self._finish_node`.
 
         Args:
             node: The node.
-
-        Returns:
-            The thread in which the node was run.
         """
-        # Update node status to running.
-        assert self.node_states[node] == NodeStatus.WAITING
-        with self._lock:
-            self.node_states[node] = NodeStatus.RUNNING
-
-        # Run node in new thread.
-        thread = threading.Thread(target=self._run_node, args=(node,))
-        thread.start()
-        return thread
-
-    def _finish_node(self, node: str) -> None:
+        try:
+            self.run_fn(node)
+        except Exception:
+            logger.exception(f"Node `{node}` failed.")
+            self._finish_node(node, failed=True)
+        else:
+            self._finish_node(node)
+
+    def _finish_node(self, node: str, failed: bool = False) -> None:
         """Finish a node run.
 
-        First updates the node status to completed.
-        Then starts all other nodes that can now be run and waits for them.
+        Updates the node status and, if the node completed successfully,
+        queues all downstream nodes that have no more pending upstream nodes.
 
         Args:
             node: The node.
+            failed: Whether running the node failed.
         """
-        # Update node status to completed.
-        assert self.node_states[node] == NodeStatus.RUNNING
-        with self._lock:
-            self.node_states[node] = NodeStatus.COMPLETED
-
-        # Run downstream nodes.
-        threads = []
-        for downstram_node in self.reversed_dag[node]:
-            if self._can_run(downstram_node):
-                thread = self._run_node_in_thread(downstram_node)
-                threads.append(thread)
-
-        # Wait for all downstream nodes to complete.
-        for thread in threads:
-            thread.join()
+        with self._condition:
+            assert self.node_states[node] == NodeStatus.RUNNING
+            self._running_nodes[self._get_resource_class(node)] -= 1
+
+            if failed:
+                self.node_states[node] = NodeStatus.FAILED
+                self._failed_nodes.append(node)
+            else:
+                self.node_states[node] = NodeStatus.COMPLETED
+                for downstream_node in self.reversed_dag[node]:
+                    self._pending_upstream_nodes[downstream_node] -= 1
+                    if self._pending_upstream_nodes[downstream_node] == 0:
+                        self._ready_nodes[
+                            self._get_resource_class(downstream_node)
+                        ].append(downstream_node)
+
+            self._condition.notify()
 
     def run(self) -> None:
         """Call `self.run_fn` on all nodes in `self.dag`.
 
         The order of execution is determined using topological sort.
-        Each node is run in a separate thread to enable parallelism.
+        Nodes are run in a thread pool to enable parallelism.
+
+        Raises:
+            RuntimeError: If running any of the nodes failed.
         """
-        # Run all nodes that can be started immediately.
-        # These will, in turn, start other nodes once all of their respective
-        # upstream nodes have completed.
-        threads = []
+        # Queue all nodes that can be started immediately.
         for node in self.nodes:
-            if self._can_run(node):
-                thread = self._run_node_in_thread(node)
-                threads.append(thread)
-
-        # Wait till all nodes have completed.
-        for thread in threads:
-            thread.join()
+            if self._pending_upstream_nodes[node] == 0:
+                self._ready_nodes[self._get_resource_class(node)].append(node)
+
+        max_workers = self.max_parallelism or max(len(self.nodes), 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            with self._condition:
+                while True:
+                    self._start_ready_nodes(executor)
+                    if not any(self._running_nodes.values()):
+                        # Nothing is running and nothing more can be started.
+                        break
+                    self._condition.wait()
 
         # Make sure all nodes were run, otherwise print a warning.
         for node in self.nodes:
-            if self.node_states[node] == NodeStatus.WAITING:
+            if self.node_states[node] != NodeStatus.WAITING:
+                continue
+            if self._failed_nodes:
+                self.node_states[node] = NodeStatus.SKIPPED
+                logger.warning(
+                    f"Node `{node}` was skipped because other nodes failed."
+                )
+            else:
                 upstream_nodes = self.dag[node]
                 logger.warning(
                     f"Node `{node}` was never run, because it was still"
                     f" waiting for the following nodes: `{upstream_nodes}`."
                 )
+
+        if self._failed_nodes:
+            raise RuntimeError(
+                f"Failed to run the following nodes: `{self._failed_nodes}`."
+            )
@@ -34,11 +34,13 @@ Adjusted from https://github.com/tensorflow/tfx/blob/master/tfx/utils/kube_utils
 import datetime
 import enum
 import re
+import threading
 import time
-from typing import Any, Callable, Optional, TypeVar, cast
+from typing import Any, Callable, Dict, Optional, TypeVar, cast
 
 from kubernetes import client as k8s_client
 from kubernetes import config as k8s_config
+from kubernetes import watch as k8s_watch
 from kubernetes.client.rest import ApiException
 
 from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
@@ -54,6 +56,13 @@ from zenml.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Server-side timeout of a single pod watch request in seconds, after which
+# the watch is transparently restarted
+POD_WATCH_TIMEOUT = 300
+# Interval in seconds in which threads waiting for pods check whether the
+# watch failed or they timed out
+POD_WATCH_WAKEUP_INTERVAL = 1.0
+
 
 class PodPhase(enum.Enum):
     """Phase of the Kubernetes pod.
@@ -252,6 +261,254 @@ def wait_pod(
             backoff_interval *= 2
 
 
+class PodWatcher:
+    """Shared watch of Kubernetes pods that notifies threads waiting for pods.
+
+    Instead of polling each pod individually, a single watch stream of all
+    pods in a namespace (optionally filtered by a label selector) is opened
+    in a background thread. Every pod event updates the cached state of the
+    pod and wakes up all threads waiting for a pod to reach some condition.
+
+    If the watch can't be established or breaks, e.g. because the service
+    account isn't allowed to watch pods, all waiting threads fall back to
+    polling their pods via `wait_pod(...)`.
+    """
+
+    def __init__(
+        self,
+        core_api: k8s_client.CoreV1Api,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        watch_factory: Callable[[], Any] = k8s_watch.Watch,
+    ) -> None:
+        """Initializes the pod watcher.
+
+        Args:
+            core_api: Client of `CoreV1Api` of Kubernetes API.
+            namespace: The namespace of the pods to watch.
+            label_selector: Optional label selector to only watch some pods
+                of the namespace, e.g. `run=<RUN_NAME>`.
+            watch_factory: Function that creates a new Kubernetes watch.
+                Defaults to `kubernetes.watch.Watch`.
+        """
+        self._core_api = core_api
+        self._namespace = namespace
+        self._label_selector = label_selector
+        self._watch_factory = watch_factory
+
+        self._pods: Dict[str, k8s_client.V1Pod] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._watch: Optional[Any] = None
+        self._stopped = False
+        self._failed = False
+
+    def __enter__(self) -> "PodWatcher":
+        """Starts the pod watcher.
+
+        Returns:
+            The started pod watcher.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stops the pod watcher.
+
+        Args:
+            *args: The exception information, if any.
+        """
+        self.stop()
+
+    def start(self) -> None:
+        """Starts watching pods in a background thread."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops watching pods."""
+        with self._condition:
+            self._stopped = True
+            if self._watch:
+                self._watch.stop()
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        """Streams pod events until the watcher is stopped."""
+        resource_version: Optional[str] = None
+        while not self._stopped:
+            try:
+                resource_version = self._stream_events(resource_version)
+            except ApiException as e:
+                if e.status != 410:
+                    self._fail(e)
+                    return
+                # The resource version is too old, restart the watch with a
+                # fresh list of all pods.
+                resource_version = None
+            except Exception as e:
+                self._fail(e)
+                return
+
+    def _stream_events(self, resource_version: Optional[str]) -> Optional[str]:
+        """Streams pod events of a single watch request.
+
+        Args:
+            resource_version: The resource version from which to start
+                watching, or `None` to start with a list of all pods.
+
+        Raises:
+            RuntimeError: If the watch reported an error.
+
+        Returns:
+            The resource version from which to continue watching.
+        """
+        with self._condition:
+            self._watch = self._watch_factory()
+        kwargs: Dict[str, Any] = {
+            "namespace": self._namespace,
+            "timeout_seconds": POD_WATCH_TIMEOUT,
+        }
+        if self._label_selector:
+            kwargs["label_selector"] = self._label_selector
+        if resource_version:
+            kwargs["resource_version"] = resource_version
+
+        for event in self._watch.stream(
+            self._core_api.list_namespaced_pod, **kwargs
+        ):
+            if event["type"] == "ERROR":
+                if event["raw_object"].get("code") == 410:
+                    # Same as a `410` API exception in older clients
+                    return None
+                raise RuntimeError(
+                    f"Error while watching pods: {event['raw_object']}"
+                )
+
+            pod = event["object"]
+            resource_version = pod.metadata.resource_version
+            with self._condition:
+                self._pods[pod.metadata.name] = pod
+                self._condition.notify_all()
+
+        return resource_version
+
+    def _fail(self, error: Exception) -> None:
+        """Marks the watch as failed so waiting threads fall back to polling.
+
+        Args:
+            error: The error that broke the watch.
+        """
+        if not self._stopped:
+            logger.warning(
+                f"Watching pods in namespace `{self._namespace}` failed, "
+                f"falling back to polling: {error}"
+            )
+        with self._condition:
+            self._failed = True
+            self._condition.notify_all()
+
+    def _wait_for(
+        self,
+        pod_name: str,
+        exit_condition_lambda: Callable[[k8s_client.V1Pod], bool],
+        deadline: Optional[float],
+    ) -> k8s_client.V1Pod:
+        """Waits until a pod meets a condition.
+
+        Args:
+            pod_name: The name of the pod.
+            exit_condition_lambda: Function which returns True once the pod
+                meets the condition.
+            deadline: Monotonic time after which to stop waiting, or `None`
+                to wait for an unlimited duration.
+
+        Raises:
+            RuntimeError: If the pod failed or the function timed out.
+
+        Returns:
+            The pod object which meets the condition.
+        """
+        with self._condition:
+            while not self._failed and not self._stopped:
+                pod = self._pods.get(pod_name)
+                if pod is not None:
+                    if pod_failed(pod):
+                        raise RuntimeError(
+                            f"Pod `{self._namespace}:{pod_name}` failed."
+                        )
+                    if exit_condition_lambda(pod):
+                        return pod
+
+                wait_timeout = POD_WATCH_WAKEUP_INTERVAL
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise RuntimeError(
+                            f"Waiting for pod `{self._namespace}:{pod_name}` "
+                            f"timed out."
+                        )
+                    wait_timeout = min(wait_timeout, remaining)
+                self._condition.wait(timeout=wait_timeout)
+
+        timeout_sec = 0
+        if deadline is not None:
+            timeout_sec = max(int(deadline - time.monotonic()), 1)
+        return wait_pod(
+            core_api=self._core_api,
+            pod_name=pod_name,
+            namespace=self._namespace,
+            exit_condition_lambda=exit_condition_lambda,
+            timeout_sec=timeout_sec,
+        )
+
+    def _stream_logs(self, pod_name: str) -> None:
+        """Streams the logs of a pod to `zenml.logger.info()`.
+
+        Blocks until the log stream is closed, i.e. the pod terminated.
+
+        Args:
+            pod_name: The name of the pod.
+        """
+        try:
+            for line in self._watch_factory().stream(
+                self._core_api.read_namespaced_pod_log,
+                name=pod_name,
+                namespace=self._namespace,
+            ):
+                logger.info(line)
+        except Exception as e:
+            logger.warning(f"Failed to stream logs of pod `{pod_name}`: {e}")
+
+    def wait(
+        self,
+        pod_name: str,
+        exit_condition_lambda: Callable[[k8s_client.V1Pod], bool],
+        timeout_sec: int = 0,
+        stream_logs: bool = False,
+    ) -> k8s_client.V1Pod:
+        """Waits for a pod to meet an exit condition.
+
+        Args:
+            pod_name: The name of the pod.
+            exit_condition_lambda: A lambda which will be called whenever the
+                pod changes. The function returns True to exit.
+            timeout_sec: Timeout in seconds to wait for pod to reach exit
+                condition, or 0 to wait for an unlimited duration.
+                Defaults to unlimited.
+            stream_logs: Whether to stream the pod logs to
+                `zenml.logger.info()`. Defaults to False.
+
+        Returns:
+            The pod object which meets the exit condition.
+        """
+        deadline = time.monotonic() + timeout_sec if timeout_sec else None
+        if stream_logs:
+            self._wait_for(pod_name, pod_is_not_pending, deadline)
+            self._stream_logs(pod_name)
+        return self._wait_for(pod_name, exit_condition_lambda, deadline)
+
+
 FuncT = TypeVar("FuncT", bound=Callable[..., Any])
 
 
@@ -30,12 +30,18 @@
 # inspired by the Kubernetes dag runner implementation of tfx
 """Kubernetes-native orchestrator."""
 
+import json
+import tempfile
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple
 
 from kubernetes import client as k8s_client
 from kubernetes import config as k8s_config
+from pydantic import validator
 from tfx.proto.orchestration.pipeline_pb2 import Pipeline as Pb2Pipeline
 
+from zenml.entrypoints.step_entrypoint_configuration import (
+    SOURCE_ARCHIVE_OPTION,
+)
 from zenml.enums import StackComponentType
 from zenml.environment import Environment
 from zenml.integrations.kubernetes import KUBERNETES_ORCHESTRATOR_FLAVOR
@@ -49,9 +55,9 @@ from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
 )
 from zenml.logger import get_logger
 from zenml.orchestrators import BaseOrchestrator
+from zenml.orchestrators import utils as orchestrator_utils
 from zenml.repository import Repository
 from zenml.stack import StackValidator
-from zenml.utils.docker_utils import get_image_digest
 from zenml.utils.source_utils import get_source_root_path
 
 if TYPE_CHECKING:
@@ -85,6 +91,21 @@ class KubernetesOrchestrator(BaseOrchestrator):
             block until all steps finished running on Kubernetes.
         skip_config_loading: If `True`, don't load the Kubernetes context and
             clients. This is only useful for unit testing.
+        max_parallelism: Maximum number of step pods that run at the same
+            time. If not set, all steps whose upstream steps have completed
+            are started immediately.
+        step_resource_classes: Resource class of each step, e.g.
+            `{"trainer": "gpu"}`. Steps without a resource class are
+            assigned to the `default` resource class.
+        resource_class_limits: Maximum number of step pods of each resource
+            class that run at the same time, e.g. `{"gpu": 2}`.
+        fail_fast: If `True`, no new step pods are started once a step
+            failed. Otherwise, all steps that don't depend on a failed step
+            are still run.
+        use_source_archive: If `True`, the source code is uploaded to the
+            artifact store as an archive and the Docker image only contains
+            the requirements. Code changes then don't require building a new
+            image.
     """
 
     custom_docker_base_image_name: Optional[str] = None
@@ -92,12 +113,60 @@ class KubernetesOrchestrator(BaseOrchestrator):
     kubernetes_namespace: str = "zenml"
     synchronous: bool = False
     skip_config_loading: bool = False
+    max_parallelism: Optional[int] = None
+    step_resource_classes: Dict[str, str] = {}
+    resource_class_limits: Dict[str, int] = {}
+    fail_fast: bool = True
+    use_source_archive: bool = False
     _k8s_core_api: k8s_client.CoreV1Api = None
     _k8s_batch_api: k8s_client.BatchV1beta1Api = None
     _k8s_rbac_api: k8s_client.RbacAuthorizationV1Api = None
 
     FLAVOR: ClassVar[str] = KUBERNETES_ORCHESTRATOR_FLAVOR
 
+    ensure_positive_max_parallelism = validator(
+        "max_parallelism", allow_reuse=True
+    )(orchestrator_utils.ensure_positive_max_parallelism)
+
+    @validator("step_resource_classes", "resource_class_limits", pre=True)
+    def parse_json_mappings(cls, value: Any) -> Any:
+        """Parses mappings that were passed as JSON strings, e.g. via the CLI.
+
+        Args:
+            value: The configured mapping or JSON string.
+
+        Returns:
+            The parsed mapping.
+        """
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+
+    @validator("resource_class_limits")
+    def ensure_positive_resource_class_limits(
+        cls, value: Dict[str, int]
+    ) -> Dict[str, int]:
+        """Validates that all resource class limits are positive integers.
+
+        Args:
+            value: The configured resource class limits.
+
+        Returns:
+            The validated resource class limits.
+
+        Raises:
+            ValueError: If any resource class limit is smaller than 1.
+        """
+        for resource_class, limit in value.items():
+            if limit < 1:
+                raise ValueError(
+                    f"Invalid limit {limit} for resource class "
+                    f"`{resource_class}`: The Kubernetes orchestrator needs "
+                    f"to be able to run at least one step of each resource "
+                    f"class at a time."
+                )
+        return value
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the Pydantic object the Kubernetes clients.
 
@@ -250,7 +319,7 @@ class KubernetesOrchestrator(BaseOrchestrator):
             stack: A ZenML stack.
             runtime_configuration: The runtime configuration of the pipeline.
         """
-        from zenml.utils import docker_utils
+        from zenml.utils import docker_utils, source_archive_utils
 
         image_name = self.get_docker_image_name(pipeline.name)
 
@@ -258,20 +327,34 @@ class KubernetesOrchestrator(BaseOrchestrator):
 
         logger.debug("Kubernetes container requirements: %s", requirements)
 
-        docker_utils.build_docker_image(
-            build_context_path=get_source_root_path(),
-            image_name=image_name,
-            dockerignore_path=pipeline.dockerignore_file,
-            requirements=requirements,
-            base_image=self.custom_docker_base_image_name,
-        )
-
         assert stack.container_registry  # should never happen due to validation
-        stack.container_registry.push_image(image_name)
+        with tempfile.TemporaryDirectory() as empty_build_context_path:
+            build_context_path = get_source_root_path()
+            dockerignore_path = pipeline.dockerignore_file
+            if self.use_source_archive:
+                runtime_configuration[
+                    SOURCE_ARCHIVE_OPTION
+                ] = source_archive_utils.upload_source_archive(
+                    artifact_store_path=stack.artifact_store.path,
+                    source_root=build_context_path,
+                    dockerignore_path=dockerignore_path,
+                )
+                # The image doesn't contain the source code, so it only needs
+                # to be rebuilt if the requirements or the stack change
+                build_context_path = empty_build_context_path
+                dockerignore_path = None
+
+            image_digest = docker_utils.build_and_push_docker_image(
+                build_context_path=build_context_path,
+                image_name=image_name,
+                container_registry=stack.container_registry,
+                dockerignore_path=dockerignore_path,
+                requirements=requirements,
+                base_image=self.custom_docker_base_image_name,
+            )
 
         # Store the Docker image digest in the runtime configuration so it gets
         # tracked in the ZenStore
-        image_digest = docker_utils.get_image_digest(image_name) or image_name
         runtime_configuration["docker_image"] = image_digest
 
     def prepare_or_run_pipeline(
@@ -312,8 +395,7 @@ class KubernetesOrchestrator(BaseOrchestrator):
         pod_name = kube_utils.sanitize_pod_name(run_name)
 
         # Get Docker image name (for all pods).
-        image_name = self.get_docker_image_name(pipeline.name)
-        image_name = get_image_digest(image_name) or image_name
+        image_name = runtime_configuration["docker_image"]
 
         # Get pipeline DAG as dict {"step": ["upstream_step_1", ...], ...}
         pipeline_dag: Dict[str, List[str]] = {
@@ -334,6 +416,11 @@ class KubernetesOrchestrator(BaseOrchestrator):
             pb2_pipeline=pb2_pipeline,
             sorted_steps=sorted_steps,
             pipeline_dag=pipeline_dag,
+            max_parallelism=self.max_parallelism,
+            resource_classes=self.step_resource_classes,
+            resource_class_limits=self.resource_class_limits,
+            fail_fast=self.fail_fast,
+            source_archive=runtime_configuration.get(SOURCE_ARCHIVE_OPTION),
         )
 
         # Authorize pod to run Kubernetes commands inside the cluster.
@@ -22,6 +22,7 @@ from kubernetes import client as k8s_client
 
 from zenml.integrations.kubernetes.orchestrators import kube_utils
 from zenml.integrations.kubernetes.orchestrators.dag_runner import (
+    FailurePolicy,
     ThreadedDagRunner,
 )
 from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
@@ -135,16 +136,33 @@ def main() -> None:
 
         # Wait for pod to finish.
         logger.info(f"Waiting for pod of step `{step_name}` to start...")
-        kube_utils.wait_pod(
-            core_api=core_api,
+        pod_watcher.wait(
             pod_name=pod_name,
-            namespace=args.kubernetes_namespace,
             exit_condition_lambda=kube_utils.pod_is_done,
             stream_logs=True,
         )
         logger.info(f"Pod of step `{step_name}` completed.")
 
-    ThreadedDagRunner(dag=pipeline_dag, run_fn=run_step_on_kubernetes).run()
+    failure_policy = (
+        FailurePolicy.FAIL_FAST
+        if pipeline_config.get("fail_fast", True)
+        else FailurePolicy.CONTINUE
+    )
+    # Watch all pods of this run in a single stream instead of polling each
+    # step pod individually.
+    with kube_utils.PodWatcher(
+        core_api=core_api,
+        namespace=args.kubernetes_namespace,
+        label_selector=f"run={run_name}",
+    ) as pod_watcher:
+        ThreadedDagRunner(
+            dag=pipeline_dag,
+            run_fn=run_step_on_kubernetes,
+            max_parallelism=pipeline_config.get("max_parallelism"),
+            resource_classes=pipeline_config.get("resource_classes"),
+            resource_class_limits=pipeline_config.get("resource_class_limits"),
+            failure_policy=failure_policy,
+        ).run()
 
     logger.info("Orchestration pod completed.")
 
@@ -14,7 +14,7 @@
 """Entrypoint configuration for the Kubernetes master/orchestrator pod."""
 
 import json
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from tfx.proto.orchestration.pipeline_pb2 import Pipeline as Pb2Pipeline
 
@@ -111,6 +111,11 @@ class KubernetesOrchestratorEntrypointConfiguration:
         pb2_pipeline: Pb2Pipeline,
         sorted_steps: List[BaseStep],
         pipeline_dag: Dict[str, List[str]],
+        max_parallelism: Optional[int] = None,
+        resource_classes: Optional[Dict[str, str]] = None,
+        resource_class_limits: Optional[Dict[str, int]] = None,
+        fail_fast: bool = True,
+        source_archive: Optional[str] = None,
     ) -> List[str]:
         """Gets all arguments that the entrypoint command should be called with.
 
@@ -122,6 +127,15 @@ class KubernetesOrchestratorEntrypointConfiguration:
             pb2_pipeline: ZenML pipeline in TFX pb2 format.
             sorted_steps: List of steps in execution order.
             pipeline_dag: For each step, list of steps that need to run before.
+            max_parallelism: Maximum number of step pods that run at the same
+                time.
+            resource_classes: Resource class of each step.
+            resource_class_limits: Maximum number of step pods of each
+                resource class that run at the same time.
+            fail_fast: Whether to stop starting new step pods once a step
+                failed.
+            source_archive: Optional URI of a source archive from which the
+                step pods import the user code.
 
         Returns:
             List of entrypoint arguments.
@@ -140,6 +154,7 @@ class KubernetesOrchestratorEntrypointConfiguration:
                 KubernetesStepEntrypointConfiguration.get_entrypoint_arguments(
                     step=step,
                     pb2_pipeline=pb2_pipeline,
+                    source_archive=source_archive,
                     **{RUN_NAME_OPTION: run_name},
                 )
             )
@@ -165,6 +180,10 @@ class KubernetesOrchestratorEntrypointConfiguration:
             "fixed_step_args": fixed_step_args,
             "step_specific_args": step_specific_args,
             "pipeline_dag": pipeline_dag,
+            "max_parallelism": max_parallelism,
+            "resource_classes": resource_classes or {},
+            "resource_class_limits": resource_class_limits or {},
+            "fail_fast": fail_fast,
         }
         pipeline_config_json = json.dumps(pipeline_config)
 
@@ -197,7 +197,7 @@ def get_step(pipeline_name: str, step_name: str) -> StepView:
     if pipeline is None:
         raise RuntimeError(f"No pipeline with name `{pipeline_name}` was found")
 
-    last_run = pipeline.runs[-1]
+    last_run = pipeline.get_runs(limit=1)[-1]
     step = last_run.get_step(name=step_name)
     if step is None:
         raise RuntimeError(
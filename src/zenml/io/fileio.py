@@ -34,8 +34,8 @@ sys.modules["tfx.dsl.io.plugins.tensorflow_gfile"] = ModuleType(
     "Oops, Aria walked over my keyboard."
 )
 
+from tfx.dsl.io import filesystem_registry  # noqa
 from tfx.dsl.io.fileio import (  # noqa
-    copy,
     exists,
     glob,
     isdir,
@@ -49,6 +49,7 @@ from tfx.dsl.io.fileio import (  # noqa
     stat,
     walk,
 )
+from tfx.dsl.io.filesystem import PathType  # noqa
 
 __all__ = [
     "copy",
@@ -65,3 +66,59 @@ __all__ = [
     "stat",
     "walk",
 ]
+
+# Size of the chunks in which files are streamed between filesystems. For
+# remote filesystems based on `fsspec` (s3fs, gcsfs, adlfs), every chunk is
+# uploaded as a separate part of a multipart upload.
+COPY_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def copy(src: PathType, dst: PathType, overwrite: bool = False) -> int:
+    """Copy a file from the source to the destination.
+
+    Copies within a single filesystem are delegated to that filesystem, which
+    allows e.g. server-side copies in object stores. Copies between different
+    filesystems are streamed in chunks instead of loading the entire file into
+    memory. If such a copy fails or is interrupted, the partially written
+    destination file is removed.
+
+    Args:
+        src: The path of the file to copy.
+        dst: The path to copy the file to.
+        overwrite: Whether to overwrite the destination file if it exists.
+
+    Returns:
+        The number of bytes that were streamed through this process, which is
+        zero if the copy was handled by the filesystem itself.
+
+    Raises:
+        OSError: If the destination file exists and `overwrite` is `False`.
+    """
+    registry = filesystem_registry.DEFAULT_FILESYSTEM_REGISTRY
+    source_filesystem = registry.get_filesystem_for_path(src)
+    destination_filesystem = registry.get_filesystem_for_path(dst)
+    if source_filesystem is destination_filesystem:
+        source_filesystem.copy(src, dst, overwrite=overwrite)
+        return 0
+
+    if not overwrite and exists(dst):
+        raise OSError(
+            f"Destination file {dst!r} already exists and argument "
+            f"`overwrite` is false."
+        )
+
+    num_bytes = 0
+    try:
+        with open(src, mode="rb") as source_file:
+            with open(dst, mode="wb") as destination_file:
+                while True:
+                    chunk = source_file.read(COPY_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    destination_file.write(chunk)
+                    num_bytes += len(chunk)
+    except BaseException:
+        if exists(dst):
+            remove(dst)
+        raise
+    return num_bytes
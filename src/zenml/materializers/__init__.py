@@ -22,11 +22,17 @@ extended by building on the `BaseMaterializer` class.
 from zenml.materializers.built_in_materializer import BuiltInMaterializer
 from zenml.materializers.numpy_materializer import NumpyMaterializer
 from zenml.materializers.pandas_materializer import PandasMaterializer
+from zenml.materializers.partitioned_dataframe_materializer import (
+    PartitionedDataFrame,
+    PartitionedDataFrameMaterializer,
+)
 from zenml.materializers.service_materializer import ServiceMaterializer
 
 __all__ = [
     "BuiltInMaterializer",
     "NumpyMaterializer",
     "PandasMaterializer",
+    "PartitionedDataFrame",
+    "PartitionedDataFrameMaterializer",
     "ServiceMaterializer",
 ]
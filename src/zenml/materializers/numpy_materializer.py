@@ -22,25 +22,37 @@ import pyarrow.parquet as pq
 
 from zenml.artifacts import DataArtifact
 from zenml.io import fileio
+from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import yaml_utils
+from zenml.utils import io_utils, yaml_utils
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
+logger = get_logger(__name__)
+
+NUMPY_FILENAME = "data.npy"
+
+# Files of the legacy parquet format, kept to load artifacts written by
+# previous ZenML versions and arrays which can't be stored without pickling.
 DATA_FILENAME = "data.parquet"
 SHAPE_FILENAME = "shape.json"
 DATA_VAR = "data_var"
 
 
 class NumpyMaterializer(BaseMaterializer):
-    """Materializer to read data to and from pandas."""
+    """Materializer to read data to and from numpy arrays.
+
+    Arrays are stored in the native `.npy` format which preserves the dtype,
+    shape and byte order of the array. Arrays in local artifact stores are
+    memory-mapped on load so their data is only paged in when accessed.
+    """
 
     ASSOCIATED_TYPES = (np.ndarray,)
     ASSOCIATED_ARTIFACT_TYPES = (DataArtifact,)
 
     def handle_input(self, data_type: Type[Any]) -> "NDArray[Any]":
-        """Reads numpy array from parquet file.
+        """Reads a numpy array from a `.npy` or parquet file.
 
         Args:
             data_type: The type of the data to read.
@@ -49,6 +61,51 @@ class NumpyMaterializer(BaseMaterializer):
             The numpy array.
         """
         super().handle_input(data_type)
+        numpy_file = os.path.join(self.artifact.uri, NUMPY_FILENAME)
+        if not fileio.exists(numpy_file):
+            return self._read_parquet()
+
+        if not io_utils.is_remote(numpy_file):
+            from zenml.artifact_stores import content_addressed_storage
+
+            # Copy-on-write memory map: Data is loaded lazily and in-place
+            # modifications in a step never touch the stored artifact.
+            return np.load(
+                content_addressed_storage.resolve_path(numpy_file),
+                mmap_mode="c",
+                allow_pickle=False,
+            )
+
+        with fileio.open(numpy_file, "rb") as f:
+            return np.load(f, allow_pickle=False)
+
+    def handle_return(self, arr: "NDArray[Any]") -> None:
+        """Writes a np.ndarray to the artifact store.
+
+        Args:
+            arr: The numpy array to write.
+        """
+        super().handle_return(arr)
+        if arr.dtype.hasobject:
+            # The `.npy` format can only store object arrays by pickling them,
+            # so we fall back to parquet for those.
+            logger.debug(
+                "Storing numpy array with object dtype in parquet format."
+            )
+            self._write_parquet(arr)
+            return
+
+        with fileio.open(
+            os.path.join(self.artifact.uri, NUMPY_FILENAME), "wb"
+        ) as f:
+            np.save(f, arr, allow_pickle=False)
+
+    def _read_parquet(self) -> "NDArray[Any]":
+        """Reads a numpy array from a parquet file.
+
+        Returns:
+            The numpy array.
+        """
         shape_dict = yaml_utils.read_json(
             os.path.join(self.artifact.uri, SHAPE_FILENAME)
         )
@@ -61,13 +118,12 @@ class NumpyMaterializer(BaseMaterializer):
         vals = getattr(data.to_pandas(), DATA_VAR).values
         return np.reshape(vals, shape_tuple)
 
-    def handle_return(self, arr: "NDArray[Any]") -> None:
-        """Writes a np.ndarray to the artifact store as a parquet file.
+    def _write_parquet(self, arr: "NDArray[Any]") -> None:
+        """Writes a numpy array to a parquet file.
 
         Args:
             arr: The numpy array to write.
         """
-        super().handle_return(arr)
         yaml_utils.write_json(
             os.path.join(self.artifact.uri, SHAPE_FILENAME),
             {str(i): x for i, x in enumerate(arr.shape)},
@@ -14,21 +14,79 @@
 """Materializer for Pandas."""
 
 import os
-import tempfile
-from typing import Any, Type, Union
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from zenml.artifacts import DataArtifact, SchemaArtifact, StatisticsArtifact
+from zenml.constants import (
+    ENV_ZENML_PANDAS_COMPRESSION,
+    ENV_ZENML_PANDAS_COMPRESSION_LEVEL,
+    ENV_ZENML_PANDAS_ROW_GROUP_SIZE,
+    ENV_ZENML_PANDAS_USE_DICTIONARY,
+    handle_bool_env_var,
+    handle_int_env_var,
+)
 from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.utils import yaml_utils
 
-DEFAULT_FILENAME = "df.parquet.gzip"
-COMPRESSION_TYPE = "gzip"
+DEFAULT_FILENAME = "df.parquet"
+METADATA_FILENAME = "parquet_metadata.json"
+DEFAULT_COMPRESSION = "snappy"
+SUPPORTED_COMPRESSIONS = ("snappy", "zstd", "lz4", "gzip", "brotli", "none")
+COMPRESSIONS_WITH_LEVELS = ("zstd", "lz4", "gzip", "brotli")
+
+# Artifacts written by previous ZenML versions don't have a metadata file and
+# are always stored as a single gzip-compressed parquet file.
+LEGACY_FILENAME = "df.parquet.gzip"
+
+# A filter in disjunctive normal form as accepted by `pyarrow.parquet`, e.g.
+# `[("year", ">=", 2020), ("country", "in", ["DE", "FR"])]`.
+ParquetFilters = Union[
+    List[Tuple[str, str, Any]], List[List[Tuple[str, str, Any]]]
+]
 
 
 class PandasMaterializer(BaseMaterializer):
-    """Materializer to read data to and from pandas."""
+    """Materializer to read data to and from pandas.
+
+    Data is streamed directly from and to the artifact store. To only read
+    parts of a large dataframe, specify the input of a step as `DataArtifact`
+    and load it using `PandasMaterializer(artifact).read_dataframe(...)`
+    with a column projection and/or row filters.
+
+    The parquet writer options can be configured for all steps using the
+    `ZENML_PANDAS_*` environment variables or for individual steps by
+    subclassing this materializer, overwriting the class variables and passing
+    the subclass to `step.with_return_materializers(...)`:
+
+    ```python
+    class ZstdPandasMaterializer(PandasMaterializer):
+        COMPRESSION = "zstd"
+        COMPRESSION_LEVEL = 9
+    ```
+
+    The options used to write an artifact are stored next to it, so any
+    subclass of this materializer can read it.
+    """
+
+    COMPRESSION: ClassVar[Optional[str]] = None
+    COMPRESSION_LEVEL: ClassVar[Optional[int]] = None
+    ROW_GROUP_SIZE: ClassVar[Optional[int]] = None
+    USE_DICTIONARY: ClassVar[Optional[bool]] = None
 
     ASSOCIATED_TYPES = (pd.DataFrame, pd.Series)
     ASSOCIATED_ARTIFACT_TYPES = (
@@ -49,20 +107,7 @@ class PandasMaterializer(BaseMaterializer):
             The pandas dataframe or series.
         """
         super().handle_input(data_type)
-        filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
-
-        # Create a temporary folder
-        temp_dir = tempfile.mkdtemp(prefix="zenml-temp-")
-        temp_file = os.path.join(str(temp_dir), DEFAULT_FILENAME)
-
-        # Copy from artifact store to temporary file
-        fileio.copy(filepath, temp_file)
-
-        # Load the model from the temporary file
-        df = pd.read_parquet(temp_file)
-
-        # Cleanup and return
-        fileio.rmtree(temp_dir)
+        df = self.read_dataframe()
 
         if issubclass(data_type, pd.Series):
             # Taking the first column if its a series as the assumption
@@ -72,6 +117,45 @@ class PandasMaterializer(BaseMaterializer):
 
         return df
 
+    def read_dataframe(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[ParquetFilters] = None,
+    ) -> pd.DataFrame:
+        """Reads (parts of) the dataframe stored in the artifact.
+
+        The parquet file is read through a file handle of the artifact store,
+        so for remote artifact stores only the parquet footer and the column
+        chunks of the requested columns and matching row groups are
+        downloaded.
+
+        Args:
+            columns: Optional names of the columns to read. If not given, all
+                columns are read.
+            filters: Optional row filters in the format accepted by
+                `pyarrow.parquet.read_table`. Row groups whose statistics
+                don't match the filters are skipped entirely.
+
+        Returns:
+            The pandas dataframe.
+        """
+        metadata_path = os.path.join(self.artifact.uri, METADATA_FILENAME)
+        if fileio.exists(metadata_path):
+            filename = yaml_utils.read_json(metadata_path)["filename"]
+        else:
+            filename = LEGACY_FILENAME
+
+        # The compression codec is stored in the parquet file itself, so
+        # there is no need to pass any write options for reading.
+        filepath = os.path.join(self.artifact.uri, filename)
+        with fileio.open(filepath, "rb") as f:
+            table = pq.read_table(
+                pa.PythonFile(f, mode="r"),
+                columns=list(columns) if columns is not None else None,
+                filters=filters,
+            )
+        return table.to_pandas()
+
     def handle_return(self, df: Union[pd.DataFrame, pd.Series]) -> None:
         """Writes a pandas dataframe or series to the specified filename.
 
@@ -84,13 +168,86 @@ class PandasMaterializer(BaseMaterializer):
         if isinstance(df, pd.Series):
             df = df.to_frame(name="series")
 
-        # Create a temporary file to store the model
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".gzip", delete=False
-        ) as f:
-            df.to_parquet(f.name, compression=COMPRESSION_TYPE)
-            fileio.copy(f.name, filepath)
+        options = self.get_write_options()
+        table = pa.Table.from_pandas(df)
+        with fileio.open(filepath, "wb") as f:
+            pq.write_table(
+                table,
+                pa.PythonFile(f, mode="w"),
+                compression=options["compression"],
+                compression_level=options["compression_level"],
+                row_group_size=options["row_group_size"],
+                use_dictionary=options["use_dictionary"],
+            )
+
+        yaml_utils.write_json(
+            os.path.join(self.artifact.uri, METADATA_FILENAME),
+            {"filename": DEFAULT_FILENAME, **options},
+        )
+
+    @classmethod
+    def get_write_options(cls) -> Dict[str, Any]:
+        """Resolves the options used for writing parquet files.
+
+        Options set as class variables take precedence over the ones set
+        using environment variables.
 
-        # Close and remove the temporary file
-        f.close()
-        fileio.remove(f.name)
+        Returns:
+            The compression codec, compression level, row group size and
+            whether to use dictionary encoding.
+
+        Raises:
+            ValueError: If the configured compression codec is not supported
+                or a compression level is configured for a codec that doesn't
+                support compression levels.
+        """
+        compression = (
+            cls.COMPRESSION
+            or os.getenv(ENV_ZENML_PANDAS_COMPRESSION)
+            or DEFAULT_COMPRESSION
+        ).lower()
+        if compression not in SUPPORTED_COMPRESSIONS:
+            raise ValueError(
+                f"Unsupported parquet compression codec '{compression}'. "
+                f"Supported codecs: {', '.join(SUPPORTED_COMPRESSIONS)}."
+            )
+
+        compression_level = cls.COMPRESSION_LEVEL
+        if compression_level is None and os.getenv(
+            ENV_ZENML_PANDAS_COMPRESSION_LEVEL
+        ):
+            # Level 0 is a valid compression level for some codecs, so it
+            # can't be used to signal that no level is configured
+            compression_level = handle_int_env_var(
+                ENV_ZENML_PANDAS_COMPRESSION_LEVEL
+            )
+        if (
+            compression_level is not None
+            and compression not in COMPRESSIONS_WITH_LEVELS
+        ):
+            raise ValueError(
+                f"Parquet compression codec '{compression}' doesn't support "
+                f"setting a compression level, but compression level "
+                f"{compression_level} is configured. Compression levels are "
+                f"only supported for the codecs: "
+                f"{', '.join(COMPRESSIONS_WITH_LEVELS)}."
+            )
+
+        row_group_size = cls.ROW_GROUP_SIZE
+        if row_group_size is None:
+            row_group_size = (
+                handle_int_env_var(ENV_ZENML_PANDAS_ROW_GROUP_SIZE) or None
+            )
+
+        use_dictionary = cls.USE_DICTIONARY
+        if use_dictionary is None:
+            use_dictionary = handle_bool_env_var(
+                ENV_ZENML_PANDAS_USE_DICTIONARY, default=True
+            )
+
+        return {
+            "compression": compression,
+            "compression_level": compression_level,
+            "row_group_size": row_group_size,
+            "use_dictionary": use_dictionary,
+        }
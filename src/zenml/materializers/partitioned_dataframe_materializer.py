@@ -0,0 +1,405 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Materializer for dataframes that are too large to fit into memory."""
+
+import base64
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Type
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from packaging import version
+
+from zenml.artifacts import DataArtifact
+from zenml.io import fileio
+from zenml.logger import get_logger
+from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.materializers.pandas_materializer import PandasMaterializer
+from zenml.utils import yaml_utils
+
+logger = get_logger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+PARTITION_FILENAME_TEMPLATE = "part-{:05d}.parquet"
+DEFAULT_BATCH_SIZE = 65536
+
+# Older pyarrow versions only promote columns that only contain null values
+# when unifying schemas
+_SUPPORTS_TYPE_PROMOTION = version.parse(pa.__version__) >= version.parse(
+    "14.0.0"
+)
+
+
+class PartitionedDataFrame:
+    """A dataframe that is stored as multiple parquet files.
+
+    Steps that produce large datasets can return a `PartitionedDataFrame`
+    created from an iterable of dataframes, e.g. a generator. Each dataframe
+    is written as a separate partition as soon as it is produced, so only a
+    single partition needs to be held in memory:
+
+    ```python
+    @step
+    def producer() -> PartitionedDataFrame:
+        return PartitionedDataFrame(
+            pd.read_csv(path, chunksize=100_000)
+        )
+
+    @step
+    def consumer(data: PartitionedDataFrame) -> int:
+        return sum(len(batch) for batch in data.iter_batches())
+    ```
+    """
+
+    def __init__(
+        self,
+        partitions: Optional[Iterable[pd.DataFrame]] = None,
+        uri: Optional[str] = None,
+    ) -> None:
+        """Initializes a partitioned dataframe.
+
+        Args:
+            partitions: Iterable of dataframes that make up the partitioned
+                dataframe. Can only be iterated once.
+            uri: URI of a directory in which the partitions are stored. This
+                is set by the materializer when reading the dataframe from
+                the artifact store.
+
+        Raises:
+            ValueError: If not exactly one of `partitions` and `uri` is given.
+        """
+        if (partitions is None) == (uri is None):
+            raise ValueError(
+                "A partitioned dataframe needs to be created either from an "
+                "iterable of dataframes or from an artifact URI."
+            )
+        self._partitions = partitions
+        self._uri = uri
+        self._manifest: Optional[Dict[str, Any]] = None
+
+    @property
+    def manifest(self) -> Optional[Dict[str, Any]]:
+        """The manifest of a partitioned dataframe in the artifact store.
+
+        Returns:
+            The manifest or `None` if the dataframe was not read from the
+            artifact store.
+        """
+        if self._uri and self._manifest is None:
+            self._manifest = yaml_utils.read_json(
+                os.path.join(self._uri, MANIFEST_FILENAME)
+            )
+        return self._manifest
+
+    @property
+    def schema(self) -> Optional[pa.Schema]:
+        """Arrow schema that all partitions in the artifact store are read with.
+
+        Returns:
+            The schema or `None` if the dataframe was not read from the
+            artifact store, has no partitions or was written without a schema.
+        """
+        manifest = self.manifest
+        if not manifest or not manifest.get("schema"):
+            return None
+        return pa.ipc.read_schema(
+            pa.py_buffer(base64.b64decode(manifest["schema"]))
+        )
+
+    @property
+    def num_rows(self) -> Optional[int]:
+        """Total number of rows of all partitions.
+
+        Returns:
+            The number of rows or `None` if the partitions weren't written to
+            the artifact store yet.
+        """
+        manifest = self.manifest
+        return manifest["num_rows"] if manifest else None
+
+    def iter_partitions(self) -> Iterator[pd.DataFrame]:
+        """Iterates over all partitions.
+
+        Yields:
+            The partitions as dataframes.
+        """
+        if self._partitions is not None:
+            yield from self._partitions
+            return
+
+        for batch in self._iter_record_batches(columns=None, batch_size=None):
+            yield batch.to_pandas()
+
+    def iter_batches(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Iterates over the dataframe in batches of bounded size.
+
+        Args:
+            batch_size: Maximum number of rows per batch.
+            columns: Optional names of the columns to read.
+
+        Yields:
+            The batches as dataframes.
+        """
+        if self._partitions is not None:
+            for partition in self._partitions:
+                if columns is not None:
+                    partition = partition[list(columns)]
+                for start in range(0, len(partition), batch_size):
+                    yield partition.iloc[start : start + batch_size]
+            return
+
+        for batch in self._iter_record_batches(
+            columns=columns, batch_size=batch_size
+        ):
+            yield batch.to_pandas()
+
+    def to_pandas(
+        self, columns: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """Loads the entire partitioned dataframe into memory.
+
+        Args:
+            columns: Optional names of the columns to read.
+
+        Returns:
+            The concatenated dataframe. If there are no partitions, an empty
+            dataframe with the columns of the stored schema.
+        """
+        batches = list(self.iter_batches(columns=columns))
+        if batches:
+            return pd.concat(batches, ignore_index=True)
+
+        schema = self.schema
+        if schema is None:
+            manifest_columns = self.manifest["columns"] if self.manifest else []
+            return pd.DataFrame(
+                columns=list(
+                    columns if columns is not None else manifest_columns
+                )
+            )
+        df = schema.empty_table().to_pandas()
+        return df[list(columns)] if columns is not None else df
+
+    def _iter_record_batches(
+        self,
+        columns: Optional[Sequence[str]],
+        batch_size: Optional[int],
+    ) -> Iterator[pa.RecordBatch]:
+        """Scans the partitions stored in the artifact store.
+
+        Args:
+            columns: Optional names of the columns to read.
+            batch_size: Maximum number of rows per batch. If `None`, each
+                partition is read as a single batch.
+
+        Yields:
+            Record batches read from the partition files.
+        """
+        assert self._uri and self.manifest
+        schema = self.schema
+        column_list = list(columns) if columns is not None else None
+        for partition in self.manifest["partitions"]:
+            path = os.path.join(self._uri, partition["filename"])
+            with fileio.open(path, "rb") as f:
+                parquet_file = pq.ParquetFile(pa.PythonFile(f, mode="r"))
+                if batch_size is None:
+                    table = parquet_file.read(columns=column_list)
+                    batches: Iterable[pa.RecordBatch] = table.to_batches(
+                        max_chunksize=max(table.num_rows, 1)
+                    )
+                else:
+                    batches = parquet_file.iter_batches(
+                        batch_size=batch_size, columns=column_list
+                    )
+                for batch in batches:
+                    yield _cast_record_batch(batch, schema)
+
+
+def _cast_record_batch(
+    batch: pa.RecordBatch, schema: Optional[pa.Schema]
+) -> pa.RecordBatch:
+    """Casts a record batch to the types of a schema.
+
+    Partitions in which a column only contains null values are stored with
+    the `null` type, so they're cast to the type of the other partitions.
+
+    Args:
+        batch: The record batch to cast.
+        schema: The schema of the partitioned dataframe. Columns that aren't
+            part of the schema are not cast.
+
+    Returns:
+        The cast record batch.
+    """
+    if schema is None:
+        return batch
+
+    fields = [
+        schema.field(name) if name in schema.names else batch.schema.field(name)
+        for name in batch.schema.names
+    ]
+    if all(
+        field.type == batch.schema.field(index).type
+        for index, field in enumerate(fields)
+    ):
+        return batch
+    return pa.RecordBatch.from_arrays(
+        [
+            batch.column(index).cast(field.type)
+            for index, field in enumerate(fields)
+        ],
+        schema=pa.schema(fields, metadata=batch.schema.metadata),
+    )
+
+
+def _promote_integer_fields(
+    schema: pa.Schema, other_schema: pa.Schema
+) -> pa.Schema:
+    """Promotes integer fields to the floating point type of another schema.
+
+    Args:
+        schema: The schema whose fields to promote.
+        other_schema: A schema with the same column names.
+
+    Returns:
+        The schema in which all integer fields that are floating point fields
+        in the other schema have the floating point type.
+    """
+    for index, field in enumerate(schema):
+        other_type = other_schema.field(index).type
+        if pa.types.is_integer(field.type) and pa.types.is_floating(other_type):
+            schema = schema.set(index, field.with_type(other_type))
+    return schema
+
+
+def _unify_schemas(
+    schema: pa.Schema, partition_schema: pa.Schema, index: int
+) -> pa.Schema:
+    """Unifies the schema of a partition with the schema of all previous ones.
+
+    Args:
+        schema: The unified schema of all previous partitions.
+        partition_schema: The schema of the partition.
+        index: The index of the partition.
+
+    Returns:
+        The unified schema. Columns that only contained null values so far
+        get the type of the column in the new partition and integer columns
+        are promoted to floating point columns if any partition contains
+        floating point values.
+
+    Raises:
+        ValueError: If the partition has different columns or column types
+            that can't be unified.
+    """
+    if partition_schema.names != schema.names:
+        raise ValueError(
+            f"Partition {index} has the columns {partition_schema.names} "
+            f"which do not match the columns of the previous partitions: "
+            f"{schema.names}"
+        )
+    try:
+        if _SUPPORTS_TYPE_PROMOTION:
+            return pa.unify_schemas(
+                [schema, partition_schema], promote_options="permissive"
+            )
+        return pa.unify_schemas(
+            [
+                _promote_integer_fields(schema, partition_schema),
+                _promote_integer_fields(partition_schema, schema),
+            ]
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        raise ValueError(
+            f"Partition {index} has the schema {partition_schema} which "
+            f"does not match the schema of the previous partitions: {schema}"
+        )
+
+
+class PartitionedDataFrameMaterializer(BaseMaterializer):
+    """Materializer to read and write partitioned dataframes.
+
+    Each partition is stored as a parquet file using the same write options
+    as the `PandasMaterializer`. A manifest listing all partitions is written
+    once all partitions have been stored.
+    """
+
+    ASSOCIATED_TYPES = (PartitionedDataFrame,)
+    ASSOCIATED_ARTIFACT_TYPES = (DataArtifact,)
+
+    def handle_input(self, data_type: Type[Any]) -> PartitionedDataFrame:
+        """Reads a partitioned dataframe lazily from the artifact store.
+
+        Args:
+            data_type: The type of the data to read.
+
+        Returns:
+            The partitioned dataframe. Partitions are only loaded once they're
+            iterated over.
+        """
+        super().handle_input(data_type)
+        return PartitionedDataFrame(uri=self.artifact.uri)
+
+    def handle_return(self, data: PartitionedDataFrame) -> None:
+        """Writes all partitions of a dataframe to the artifact store.
+
+        Args:
+            data: The partitioned dataframe to write.
+        """
+        super().handle_return(data)
+        options = PandasMaterializer.get_write_options()
+
+        schema: Optional[pa.Schema] = None
+        partitions: List[Dict[str, Any]] = []
+        for index, df in enumerate(data.iter_partitions()):
+            table = pa.Table.from_pandas(df)
+            if schema is None:
+                schema = table.schema
+            else:
+                schema = _unify_schemas(schema, table.schema, index)
+
+            filename = PARTITION_FILENAME_TEMPLATE.format(index)
+            with fileio.open(
+                os.path.join(self.artifact.uri, filename), "wb"
+            ) as f:
+                pq.write_table(
+                    table,
+                    pa.PythonFile(f, mode="w"),
+                    compression=options["compression"],
+                    compression_level=options["compression_level"],
+                    row_group_size=options["row_group_size"],
+                    use_dictionary=options["use_dictionary"],
+                )
+            partitions.append({"filename": filename, "num_rows": len(df)})
+            logger.debug("Wrote partition %d with %d rows.", index, len(df))
+
+        yaml_utils.write_json(
+            os.path.join(self.artifact.uri, MANIFEST_FILENAME),
+            {
+                "partitions": partitions,
+                "num_rows": sum(p["num_rows"] for p in partitions),
+                "columns": schema.names if schema else [],
+                "schema": (
+                    base64.b64encode(schema.serialize().to_pybytes()).decode()
+                    if schema
+                    else None
+                ),
+                **options,
+            },
+        )
@@ -13,12 +13,15 @@
 #  permissions and limitations under the License.
 """Base implementation of a metadata store."""
 
+import itertools
 import json
 from abc import ABC, abstractmethod
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
+from datetime import datetime
 from json import JSONDecodeError
-from typing import ClassVar, Dict, List, Optional, Tuple, Union
+from typing import ClassVar, Dict, Iterator, List, Optional, Set, Tuple, Union
 
+from ml_metadata import errors as mlmd_errors
 from ml_metadata import proto
 from ml_metadata.metadata_store import metadata_store
 from ml_metadata.proto import metadata_store_pb2
@@ -47,6 +50,15 @@ from zenml.steps.utils import (
 
 logger = get_logger(__name__)
 
+# Number of pipeline run contexts which are queried at once when iterating
+# over the runs of a pipeline
+RUNS_PAGE_SIZE = 100
+
+# Context marking that all pipeline runs created before ZenML started linking
+# runs to their pipeline as parent context have been linked
+MIGRATION_CONTEXT_TYPE_NAME = "zenml_migration"
+RUN_PARENTS_MIGRATION_NAME = "pipeline_run_parent_contexts"
+
 
 class BaseMetadataStore(StackComponent, ABC):
     """Base class for all ZenML metadata stores."""
@@ -56,6 +68,10 @@ class BaseMetadataStore(StackComponent, ABC):
 
     upgrade_migration_enabled: bool = True
     _store: Optional[metadata_store.MetadataStore] = None
+    _execution_type_names: Dict[int, str] = {}
+    _artifact_type_names: Dict[int, str] = {}
+    _linked_run_ids: Set[int] = set()
+    _legacy_runs_linked: bool = False
 
     @property
     def store(self) -> metadata_store.MetadataStore:
@@ -73,6 +89,15 @@ class BaseMetadataStore(StackComponent, ABC):
             )
         return self._store
 
+    def reset_connection(self) -> None:
+        """Closes the connection to the metadata store.
+
+        The next access to the `store` property opens a new connection. This
+        is required in forked processes, which must not share the connection
+        of their parent process.
+        """
+        self._store = None
+
     @abstractmethod
     def get_tfx_metadata_config(
         self,
@@ -98,36 +123,331 @@ class BaseMetadataStore(StackComponent, ABC):
             type_.id: type_.name for type_ in self.store.get_execution_types()
         }
 
-    def _check_if_executions_belong_to_pipeline(
-        self,
-        executions: List[proto.Execution],
-        pipeline: PipelineView,
-    ) -> bool:
-        """Returns `True` if the executions are associated with the pipeline context.
+    def _is_run_of_pipeline(self, run_id: int, pipeline: PipelineView) -> bool:
+        """Checks whether a pipeline run belongs to the given pipeline.
 
         Args:
-            executions: List of executions.
+            run_id: The context id of the pipeline run.
             pipeline: Pipeline to check.
 
         Returns:
-            `True` if the executions are associated with the pipeline context.
+            `True` if the run has executions which are associated with the
+            pipeline context.
+        """
+        executions = self.store.get_executions(
+            list_options=metadata_store.ListOptions(
+                limit=1,
+                filter_query=f"contexts_a.id = {run_id} AND "
+                f"contexts_b.id = {pipeline._id}",  # noqa
+            )
+        )
+        return bool(executions)
+
+    def _link_run_to_pipeline(self, run_id: int, pipeline_id: int) -> None:
+        """Sets the pipeline context as parent of a pipeline run context.
+
+        Args:
+            run_id: The context id of the pipeline run.
+            pipeline_id: The context id of the pipeline.
+        """
+        try:
+            self.store.put_parent_contexts(
+                [
+                    metadata_store_pb2.ParentContext(
+                        child_id=run_id, parent_id=pipeline_id
+                    )
+                ]
+            )
+        except mlmd_errors.AlreadyExistsError:
+            pass
+        self._linked_run_ids.add(run_id)
+
+    def link_pipeline_run(self, pipeline_name: str, run_name: str) -> None:
+        """Links a pipeline run to its pipeline.
+
+        Runs are linked by setting the pipeline context as parent context of
+        the run context, which allows querying the runs of a pipeline
+        without checking the executions of each run. This needs to be called
+        once the first step of a run was launched and is a no-op for runs
+        that were already linked by this metadata store instance.
+
+        Args:
+            pipeline_name: The name of the pipeline.
+            run_name: The name of the pipeline run.
+        """
+        run = self.store.get_context_by_type_and_name(
+            PIPELINE_RUN_CONTEXT_TYPE_NAME, run_name
+        )
+        if not run or run.id in self._linked_run_ids:
+            return
+        pipeline = self.store.get_context_by_type_and_name(
+            PIPELINE_CONTEXT_TYPE_NAME, pipeline_name
+        )
+        if not pipeline:
+            return
+
+        try:
+            self._link_run_to_pipeline(run.id, pipeline.id)
+        except mlmd_errors.UnimplementedError:
+            # Metadata store servers of old MLMD versions don't support
+            # parent contexts. Runs are then matched by their executions.
+            logger.debug("Metadata store doesn't support parent contexts.")
+
+    def _link_legacy_pipeline_runs(self) -> None:
+        """Links all runs that were created before runs got linked.
+
+        This is only done once per metadata store. Afterwards, a migration
+        context is stored to mark that all runs are linked.
+        """
+        if self._legacy_runs_linked:
+            return
+        if self.store.get_context_by_type_and_name(
+            MIGRATION_CONTEXT_TYPE_NAME, RUN_PARENTS_MIGRATION_NAME
+        ):
+            self._legacy_runs_linked = True
+            return
+
+        logger.info("Linking existing pipeline runs to their pipelines.")
+        pipeline_ids = {
+            context.id
+            for context in self.store.get_contexts_by_type(
+                PIPELINE_CONTEXT_TYPE_NAME
+            )
+        }
+        for run in self.store.get_contexts_by_type(
+            PIPELINE_RUN_CONTEXT_TYPE_NAME
+        ):
+            if self.store.get_parent_contexts_by_context(run.id):
+                continue
+            executions = self.store.get_executions(
+                list_options=metadata_store.ListOptions(
+                    limit=1, filter_query=f"contexts_a.id = {run.id}"
+                )
+            )
+            if not executions:
+                continue
+            for context in self.store.get_contexts_by_execution(
+                executions[0].id
+            ):
+                if context.id in pipeline_ids:
+                    self._link_run_to_pipeline(run.id, context.id)
+
+        type_id = self.store.put_context_type(
+            proto.ContextType(name=MIGRATION_CONTEXT_TYPE_NAME)
+        )
+        try:
+            self.store.put_contexts(
+                [
+                    proto.Context(
+                        type_id=type_id, name=RUN_PARENTS_MIGRATION_NAME
+                    )
+                ]
+            )
+        except mlmd_errors.AlreadyExistsError:
+            # Migrated concurrently by another process
+            pass
+        self._legacy_runs_linked = True
+
+    def _get_execution_type_name(self, type_id: int) -> str:
+        """Gets the name of an execution type.
+
+        Execution types are cached and only refetched if an unknown type id
+        is requested.
+
+        Args:
+            type_id: The id of the execution type.
+
+        Returns:
+            The name of the execution type.
         """
+        if type_id not in self._execution_type_names:
+            self._execution_type_names = self.step_type_mapping
+        return self._execution_type_names[type_id]
+
+    def _get_artifact_type_name(self, type_id: int) -> str:
+        """Gets the name of an artifact type.
+
+        Artifact types are cached and only refetched if an unknown type id
+        is requested.
+
+        Args:
+            type_id: The id of the artifact type.
+
+        Returns:
+            The name of the artifact type.
+        """
+        if type_id not in self._artifact_type_names:
+            self._artifact_type_names = {
+                type_.id: type_.name
+                for type_ in self.store.get_artifact_types()
+            }
+        return self._artifact_type_names[type_id]
+
+    def _get_producer_execution_ids(
+        self, events: List[proto.Event]
+    ) -> Dict[Tuple[int, int], int]:
+        """Resolves the executions that produced the inputs of executions.
+
+        For each input artifact, the producer is the most recent execution
+        that had this artifact as an output before the input event happened.
+        The output events of all input artifacts are fetched in a single
+        query.
+
+        Args:
+            events: Events of the executions for which to resolve the
+                producers of their inputs.
+
+        Returns:
+            A dictionary mapping `(execution_id, artifact_id)` pairs of input
+            events to the id of the execution that produced the artifact.
+        """
+        input_events = [event for event in events if event.type == event.INPUT]
+        if not input_events:
+            return {}
+
+        output_events: Dict[int, List[proto.Event]] = defaultdict(list)
+        for event in self.store.get_events_by_artifact_ids(
+            list({event.artifact_id for event in input_events})
+        ):
+            if event.type == event.OUTPUT:
+                output_events[event.artifact_id].append(event)
+
+        producer_ids: Dict[Tuple[int, int], int] = {}
+        for input_event in input_events:
+            # The producer should NOT be the execution we are querying and
+            # the output event should be BEFORE the time of the input event.
+            candidates = [
+                event
+                for event in output_events[input_event.artifact_id]
+                if event.execution_id != input_event.execution_id
+                and event.milliseconds_since_epoch
+                < input_event.milliseconds_since_epoch
+            ]
+            if not candidates:
+                continue
+
+            # sort by time and take the latest one
+            candidates.sort(
+                key=lambda x: x.milliseconds_since_epoch  # type: ignore[no-any-return] # noqa
+            )
+            producer_ids[
+                (input_event.execution_id, input_event.artifact_id)
+            ] = candidates[-1].execution_id
+
+        return producer_ids
+
+    def _get_artifact_views(
+        self,
+        events: List[proto.Event],
+        producer_ids: Dict[Tuple[int, int], int],
+    ) -> Dict[int, Tuple[Dict[str, ArtifactView], Dict[str, ArtifactView]]]:
+        """Creates the input and output artifacts of executions.
+
+        Args:
+            events: Events of the executions.
+            producer_ids: Producers of the input artifacts as returned by
+                `_get_producer_execution_ids(...)`.
+
+        Returns:
+            A dictionary mapping execution ids to a tuple (inputs, outputs)
+            of dictionaries mapping artifact names to artifacts.
+        """
+        artifact_views: Dict[
+            int, Tuple[Dict[str, ArtifactView], Dict[str, ArtifactView]]
+        ] = defaultdict(lambda: ({}, {}))
+        if not events:
+            return artifact_views
+
+        artifacts = {
+            artifact.id: artifact
+            for artifact in self.store.get_artifacts_by_id(
+                list({event.artifact_id for event in events})
+            )
+        }
+
+        for event_proto in events:
+            artifact_proto = artifacts[event_proto.artifact_id]
+            artifact_name = event_proto.path.steps[0].key
+
+            materializer = artifact_proto.properties[
+                MATERIALIZER_PROPERTY_KEY
+            ].string_value
+
+            data_type = artifact_proto.properties[
+                DATATYPE_PROPERTY_KEY
+            ].string_value
+
+            # In the case that this is an input event, the parent step is the
+            # step that produced the artifact.
+            parent_step_id = producer_ids.get(
+                (event_proto.execution_id, event_proto.artifact_id),
+                event_proto.execution_id,
+            )
+
+            artifact = ArtifactView(
+                id_=event_proto.artifact_id,
+                type_=self._get_artifact_type_name(artifact_proto.type_id),
+                uri=artifact_proto.uri,
+                materializer=materializer,
+                data_type=data_type,
+                metadata_store=self,
+                parent_step_id=parent_step_id,
+            )
+
+            inputs, outputs = artifact_views[event_proto.execution_id]
+            if event_proto.type == event_proto.INPUT:
+                inputs[artifact_name] = artifact
+            elif event_proto.type == event_proto.OUTPUT:
+                outputs[artifact_name] = artifact
+
+        return artifact_views
+
+    def _get_step_views_from_executions(
+        self, executions: List[proto.Execution]
+    ) -> List[StepView]:
+        """Gets StepViews including their artifacts from executions.
+
+        The events, producers and artifacts of all executions are fetched in
+        a constant number of queries, independent of the number of executions.
+
+        Args:
+            executions: List of proto.Execution objects from mlmd store.
+
+        Returns:
+            `StepView`s derived from the executions, in the same order.
+        """
+        if not executions:
+            return []
+
+        events = self.store.get_events_by_execution_ids(
+            [execution.id for execution in executions]
+        )
+        producer_ids = self._get_producer_execution_ids(events)
+        artifact_views = self._get_artifact_views(events, producer_ids)
+
+        parents_step_ids: Dict[int, Set[int]] = defaultdict(set)
+        for (execution_id, _), producer_id in producer_ids.items():
+            parents_step_ids[execution_id].add(producer_id)
+
+        steps = []
         for execution in executions:
-            associated_contexts = self.store.get_contexts_by_execution(
-                execution.id
+            step = self._get_step_view_from_execution(
+                execution,
+                parents_step_ids=list(parents_step_ids[execution.id]),
             )
-            for context in associated_contexts:
-                if context.id == pipeline._id:  # noqa
-                    return True
-        return False
+            step._inputs, step._outputs = artifact_views[execution.id]
+            steps.append(step)
+
+        return steps
 
     def _get_step_view_from_execution(
-        self, execution: proto.Execution
+        self, execution: proto.Execution, parents_step_ids: List[int]
     ) -> StepView:
         """Get original StepView from an execution.
 
         Args:
             execution: proto.Execution object from mlmd store.
+            parents_step_ids: The execution ids of the parents of the step.
 
         Returns:
             Original `StepView` derived from the proto.Execution.
@@ -135,7 +455,9 @@ class BaseMetadataStore(StackComponent, ABC):
         Raises:
             KeyError: If the execution is not associated with a step.
         """
-        impl_name = self.step_type_mapping[execution.type_id].split(".")[-1]
+        impl_name = self._get_execution_type_name(execution.type_id).split(".")[
+            -1
+        ]
 
         step_name_property = execution.custom_properties.get(
             INTERNAL_EXECUTION_PARAMETER_PREFIX + PARAM_PIPELINE_PARAMETER_NAME,
@@ -152,63 +474,29 @@ class BaseMetadataStore(StackComponent, ABC):
             )
 
         step_parameters = {}
+        internal_parameters = {}
         for k, v in execution.custom_properties.items():
-            if not k.startswith(INTERNAL_EXECUTION_PARAMETER_PREFIX):
-                try:
-                    step_parameters[k] = json.loads(v.string_value)
-                except JSONDecodeError:
-                    # this means there is a property in there that is neither
-                    # an internal one or one created by zenml. Therefore, we can
-                    # ignore it
-                    pass
-
-        # TODO [ENG-222]: This is a lot of querying to the metadata store. We
-        #  should refactor and make it nicer. Probably it makes more sense
-        #  to first get `executions_ids_for_current_run` and then filter on
-        #  `event.execution_id in execution_ids_for_current_run`.
-        # Core logic here is that we get the event of this particular execution
-        # id that gives us the artifacts of this execution. We then go through
-        # all `input` artifacts of this execution and get all events related to
-        # that artifact. This in turn gives us other events for which this
-        # artifact was an `output` artifact. Then we simply need to sort by
-        # time to get the most recent execution (i.e. step) that produced that
-        # particular artifact.
-        events_for_execution = self.store.get_events_by_execution_ids(
-            [execution.id]
-        )
-
-        parents_step_ids = set()
-        for current_event in events_for_execution:
-            if current_event.type == current_event.INPUT:
-                # this means the artifact is an input artifact
-                events_for_input_artifact = [
-                    e
-                    for e in self.store.get_events_by_artifact_ids(
-                        [current_event.artifact_id]
-                    )
-                    # should be output type and should NOT be the same id as
-                    # the execution we are querying and it should be BEFORE
-                    # the time of the current event.
-                    if e.type == e.OUTPUT
-                    and e.execution_id != current_event.execution_id
-                    and e.milliseconds_since_epoch
-                    < current_event.milliseconds_since_epoch
-                ]
-
-                # sort by time
-                events_for_input_artifact.sort(
-                    key=lambda x: x.milliseconds_since_epoch  # type: ignore[no-any-return] # noqa
-                )
-                # take the latest one and add execution to the parents.
-                parents_step_ids.add(events_for_input_artifact[-1].execution_id)
+            try:
+                value = json.loads(v.string_value)
+            except JSONDecodeError:
+                # this means there is a property in there that is neither
+                # an internal one or one created by zenml. Therefore, we can
+                # ignore it
+                continue
+            if k.startswith(INTERNAL_EXECUTION_PARAMETER_PREFIX):
+                name = k[len(INTERNAL_EXECUTION_PARAMETER_PREFIX) :]
+                internal_parameters[name] = value
+            else:
+                step_parameters[k] = value
 
         return StepView(
             id_=execution.id,
-            parents_step_ids=list(parents_step_ids),
+            parents_step_ids=parents_step_ids,
             entrypoint_name=impl_name,
             name=step_name,
             parameters=step_parameters,
             metadata_store=self,
+            internal_parameters=internal_parameters,
         )
 
     def get_pipelines(self) -> List[PipelineView]:
@@ -254,34 +542,103 @@ class BaseMetadataStore(StackComponent, ABC):
             logger.info("No pipelines found for name '%s'", pipeline_name)
             return None
 
+    def iter_pipeline_runs(
+        self,
+        pipeline: PipelineView,
+        since: Optional[datetime] = None,
+        status: Optional[ExecutionStatus] = None,
+    ) -> Iterator[PipelineRunView]:
+        """Iterates over the runs of the given pipeline, latest run first.
+
+        The runs are queried lazily in pages ordered by their id, so only the
+        runs which are actually consumed are fetched from the metadata store.
+        Each page is fetched in a single query which filters the run contexts
+        by their parent pipeline context. The returned runs only fetch their
+        steps once they are accessed.
+
+        Args:
+            pipeline: The pipeline for which to get the runs.
+            since: If given, only runs created at or after this time are
+                returned. Naive datetimes are interpreted as local time.
+            status: If given, only runs with this status are returned.
+
+        Yields:
+            The runs of the pipeline, latest run first.
+        """
+        filters = [f"type = '{PIPELINE_RUN_CONTEXT_TYPE_NAME}'"]
+        try:
+            self._link_legacy_pipeline_runs()
+            filters.append(f"parent_contexts_a.id = {pipeline._id}")  # noqa
+            filter_by_parent = True
+        except mlmd_errors.UnimplementedError:
+            # Metadata store servers of old MLMD versions don't support
+            # parent contexts, so every run is checked separately
+            filter_by_parent = False
+        if since:
+            since_epoch = int(since.timestamp() * 1000)
+            filters.append(f"create_time_since_epoch >= {since_epoch}")
+
+        last_run_id: Optional[int] = None
+        while True:
+            page_filters = list(filters)
+            if last_run_id is not None:
+                page_filters.append(f"id < {last_run_id}")
+            contexts = self.store.get_contexts(
+                list_options=metadata_store.ListOptions(
+                    limit=RUNS_PAGE_SIZE,
+                    order_by=metadata_store.OrderByField.ID,
+                    is_asc=False,
+                    filter_query=" AND ".join(page_filters),
+                )
+            )
+
+            for context in contexts:
+                if not filter_by_parent and not self._is_run_of_pipeline(
+                    context.id, pipeline
+                ):
+                    continue
+                run = PipelineRunView(
+                    id_=context.id,
+                    name=context.name,
+                    metadata_store=self,
+                )
+                if status and self.get_pipeline_run_status(run) != status:
+                    continue
+                yield run
+
+            if len(contexts) < RUNS_PAGE_SIZE:
+                return
+            last_run_id = contexts[-1].id
+
     def get_pipeline_runs(
-        self, pipeline: PipelineView
+        self,
+        pipeline: PipelineView,
+        limit: Optional[int] = None,
+        since: Optional[datetime] = None,
+        status: Optional[ExecutionStatus] = None,
     ) -> Dict[str, PipelineRunView]:
-        """Gets all runs for the given pipeline.
+        """Gets the runs for the given pipeline.
 
         Args:
             pipeline: a Pipeline object for which you want the runs.
+            limit: If given, only the latest `limit` runs are returned.
+            since: If given, only runs created at or after this time are
+                returned.
+            status: If given, only runs with this status are returned.
 
         Returns:
-            A dictionary of pipeline run names to PipelineRunView.
+            A dictionary of pipeline run names to PipelineRunView, in
+            chronological order.
         """
-        all_pipeline_runs = self.store.get_contexts_by_type(
-            PIPELINE_RUN_CONTEXT_TYPE_NAME
+        latest_runs = list(
+            itertools.islice(
+                self.iter_pipeline_runs(pipeline, since=since, status=status),
+                limit,
+            )
+        )
+        runs: Dict[str, PipelineRunView] = OrderedDict(
+            (run.name, run) for run in reversed(latest_runs)
         )
-        runs: Dict[str, PipelineRunView] = OrderedDict()
-
-        for run in all_pipeline_runs:
-            executions = self.store.get_executions_by_context(run.id)
-            if self._check_if_executions_belong_to_pipeline(
-                executions, pipeline
-            ):
-                run_view = PipelineRunView(
-                    id_=run.id,
-                    name=run.name,
-                    executions=executions,
-                    metadata_store=self,
-                )
-                runs[run.name] = run_view
 
         logger.debug(
             "Fetched %d pipeline runs for pipeline named '%s'.",
@@ -311,19 +668,67 @@ class BaseMetadataStore(StackComponent, ABC):
             # No context found for the given run name
             return None
 
-        executions = self.store.get_executions_by_context(run.id)
-        if self._check_if_executions_belong_to_pipeline(executions, pipeline):
+        if self._is_run_of_pipeline(run.id, pipeline):
             logger.debug("Fetched pipeline run with name '%s'", run_name)
             return PipelineRunView(
                 id_=run.id,
                 name=run.name,
-                executions=executions,
                 metadata_store=self,
             )
 
         logger.info("No pipeline run found for name '%s'", run_name)
         return None
 
+    def _get_pipeline_run_executions(
+        self, pipeline_run: PipelineRunView
+    ) -> List[proto.Execution]:
+        """Gets the executions of a pipeline run, fetching them if necessary.
+
+        Args:
+            pipeline_run: The pipeline run to get the executions for.
+
+        Returns:
+            The executions of the pipeline run in reverse chronological order.
+        """
+        if pipeline_run._executions is None:  # noqa
+            pipeline_run._executions = self.store.get_executions_by_context(
+                pipeline_run._id  # noqa
+            )
+        return pipeline_run._executions  # noqa
+
+    def get_pipeline_run_status(
+        self, pipeline_run: PipelineRunView
+    ) -> ExecutionStatus:
+        """Gets the execution status of a pipeline run.
+
+        The executions of the run are refetched in a single query to get
+        their latest state.
+
+        Args:
+            pipeline_run: The pipeline run to get the status for.
+
+        Returns:
+            The status of the pipeline run.
+        """
+        pipeline_run._executions = self.store.get_executions_by_context(
+            pipeline_run._id  # noqa
+        )
+        step_statuses = [
+            self._get_execution_status(execution)
+            for execution in pipeline_run._executions  # noqa
+        ]
+
+        if any(status == ExecutionStatus.FAILED for status in step_statuses):
+            return ExecutionStatus.FAILED
+        elif all(
+            status == ExecutionStatus.COMPLETED
+            or status == ExecutionStatus.CACHED
+            for status in step_statuses
+        ):
+            return ExecutionStatus.COMPLETED
+        else:
+            return ExecutionStatus.RUNNING
+
     def get_pipeline_run_steps(
         self, pipeline_run: PipelineRunView
     ) -> Dict[str, StepView]:
@@ -338,8 +743,10 @@ class BaseMetadataStore(StackComponent, ABC):
         steps: Dict[str, StepView] = OrderedDict()
         # reverse the executions as they get returned in reverse chronological
         # order from the metadata store
-        for execution in reversed(pipeline_run._executions):  # noqa
-            step = self._get_step_view_from_execution(execution)
+        executions = list(
+            reversed(self._get_pipeline_run_executions(pipeline_run))
+        )
+        for step in self._get_step_views_from_executions(executions):
             steps[step.name] = step
 
         logger.debug(
@@ -360,7 +767,7 @@ class BaseMetadataStore(StackComponent, ABC):
             StepView: The `StepView` with the given ID.
         """
         execution = self.store.get_executions_by_id([step_id])[0]
-        return self._get_step_view_from_execution(execution)
+        return self._get_step_views_from_executions([execution])[0]
 
     def get_step_status(self, step: StepView) -> ExecutionStatus:
         """Gets the execution status of a single step.
@@ -371,14 +778,26 @@ class BaseMetadataStore(StackComponent, ABC):
         Returns:
             ExecutionStatus: The status of the step.
         """
-        proto = self.store.get_executions_by_id([step._id])[0]  # noqa
-        state = proto.last_known_state
+        execution = self.store.get_executions_by_id([step.id])[0]
+        return self._get_execution_status(execution)
+
+    @staticmethod
+    def _get_execution_status(execution: proto.Execution) -> ExecutionStatus:
+        """Converts the state of an execution to an execution status.
+
+        Args:
+            execution: The execution.
+
+        Returns:
+            The status of the execution.
+        """
+        state = execution.last_known_state
 
-        if state == proto.COMPLETE:
+        if state == execution.COMPLETE:
             return ExecutionStatus.COMPLETED
-        elif state == proto.RUNNING:
+        elif state == execution.RUNNING:
             return ExecutionStatus.RUNNING
-        elif state == proto.CACHED:
+        elif state == execution.CACHED:
             return ExecutionStatus.CACHED
         else:
             return ExecutionStatus.FAILED
@@ -396,58 +815,11 @@ class BaseMetadataStore(StackComponent, ABC):
             are both Dicts mapping artifact names
             to the input and output artifacts respectively.
         """
-        # maps artifact types to their string representation
-        artifact_type_mapping = {
-            type_.id: type_.name for type_ in self.store.get_artifact_types()
-        }
-
-        events = self.store.get_events_by_execution_ids([step._id])  # noqa
-        artifacts = self.store.get_artifacts_by_id(
-            [event.artifact_id for event in events]
-        )
-
-        inputs: Dict[str, ArtifactView] = {}
-        outputs: Dict[str, ArtifactView] = {}
-
-        # sort them according to artifact_id's so that the zip works.
-        events.sort(key=lambda x: x.artifact_id)
-        artifacts.sort(key=lambda x: x.id)
-
-        for event_proto, artifact_proto in zip(events, artifacts):
-            artifact_type = artifact_type_mapping[artifact_proto.type_id]
-            artifact_name = event_proto.path.steps[0].key
-
-            materializer = artifact_proto.properties[
-                MATERIALIZER_PROPERTY_KEY
-            ].string_value
-
-            data_type = artifact_proto.properties[
-                DATATYPE_PROPERTY_KEY
-            ].string_value
-
-            parent_step_id = step.id
-            if event_proto.type == event_proto.INPUT:
-                # In the case that this is an input event, we actually need
-                # to resolve it via its parents outputs.
-                for parent in step.parent_steps:
-                    for a in parent.outputs.values():
-                        if artifact_proto.id == a.id:
-                            parent_step_id = parent.id
-
-            artifact = ArtifactView(
-                id_=event_proto.artifact_id,
-                type_=artifact_type,
-                uri=artifact_proto.uri,
-                materializer=materializer,
-                data_type=data_type,
-                metadata_store=self,
-                parent_step_id=parent_step_id,
-            )
-
-            if event_proto.type == event_proto.INPUT:
-                inputs[artifact_name] = artifact
-            elif event_proto.type == event_proto.OUTPUT:
-                outputs[artifact_name] = artifact
+        events = self.store.get_events_by_execution_ids([step.id])
+        producer_ids = self._get_producer_execution_ids(events)
+        inputs, outputs = self._get_artifact_views(events, producer_ids)[
+            step.id
+        ]
 
         logger.debug(
             "Fetched %d inputs and %d outputs for step '%s'.",
@@ -475,4 +847,4 @@ class BaseMetadataStore(StackComponent, ABC):
             if event.type == event.OUTPUT
         )
         execution = self.store.get_executions_by_id(executions_ids)[0]
-        return self._get_step_view_from_execution(execution)
+        return self._get_step_views_from_executions([execution])[0]
@@ -313,7 +313,15 @@ class BaseOrchestrator(StackComponent, ABC):
         # This is where the step actually gets executed using the
         # component_launcher
         repo.active_stack.prepare_step_run()
-        execution_info = self._execute_step(component_launcher)
+        try:
+            execution_info = self._execute_step(component_launcher)
+        finally:
+            # The run context only exists once the first step was launched.
+            # Runs whose first step failed need to be linked as well, so they
+            # are still listed as runs of the pipeline.
+            metadata_store.link_pipeline_run(
+                pipeline_name=pb2_pipeline.pipeline_info.id, run_name=run_name
+            )
         repo.active_stack.cleanup_step_run()
 
         return execution_info
@@ -13,14 +13,28 @@
 #  permissions and limitations under the License.
 """Implementation of the ZenML local orchestrator."""
 
-from typing import TYPE_CHECKING, Any, ClassVar, List
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple
 
+from pydantic import validator
 from tfx.proto.orchestration.pipeline_pb2 import Pipeline as Pb2Pipeline
 
 from zenml.logger import get_logger
 from zenml.orchestrators import BaseOrchestrator
+from zenml.orchestrators import utils as orchestrator_utils
+from zenml.repository import Repository
 from zenml.stack import Stack
 from zenml.steps import BaseStep
+from zenml.utils import string_utils
 
 if TYPE_CHECKING:
     from zenml.pipelines import BasePipeline
@@ -28,16 +42,82 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# State of the current parallel run. It is set before the worker processes
+# get forked, so they inherit it without having to pickle any steps.
+_parallel_run_state: Optional[
+    Tuple["LocalOrchestrator", Dict[str, BaseStep], str, Pb2Pipeline]
+] = None
+
+
+def _can_fork_worker_processes() -> bool:
+    """Checks whether steps can run in forked worker processes.
+
+    Forking is also available on macOS, but system frameworks that many
+    libraries load there are not safe to use in forked processes.
+
+    Returns:
+        `True` if worker processes can be forked on this platform.
+    """
+    return (
+        sys.platform != "darwin"
+        and "fork" in multiprocessing.get_all_start_methods()
+    )
+
+
+def _run_step_in_worker_process(step_name: str) -> float:
+    """Runs a step of the current parallel run in a worker process.
+
+    Args:
+        step_name: The name of the step to run.
+
+    Returns:
+        The duration of the step in seconds.
+    """
+    assert _parallel_run_state, "No parallel run in progress."
+    orchestrator, steps_by_name, run_name, pb2_pipeline = _parallel_run_state
+    # The connection to the metadata store inherited from the parent process
+    # must not be used by multiple processes, so the metadata store opens a
+    # new one in this process.
+    Repository().active_stack.metadata_store.reset_connection()
+    start_time = time.time()
+    orchestrator.run_step(
+        step=steps_by_name[step_name],
+        run_name=run_name,
+        pb2_pipeline=pb2_pipeline,
+    )
+    return time.time() - start_time
+
 
 class LocalOrchestrator(BaseOrchestrator):
     """Orchestrator responsible for running pipelines locally.
 
-    This orchestrator does not allow for concurrent execution of steps and also
-    does not support running on a schedule.
+    By default, this orchestrator runs all steps sequentially. If `parallel`
+    is enabled, steps that don't depend on each other are executed
+    concurrently in forked worker processes. This orchestrator does not
+    support running on a schedule.
+
+    Attributes:
+        parallel: If `True`, every step whose upstream steps have all finished
+            is submitted to a pool of worker processes instead of waiting for
+            all previous steps in the sorted step list. Each worker process
+            has its own step environment and stack component state, just like
+            a sequential run. Only supported on platforms that can safely
+            fork processes, other platforms (including macOS) fall back to
+            running steps sequentially.
+        max_parallelism: Maximum number of steps that run at the same time
+            if `parallel` is enabled. Defaults to the number of CPUs of the
+            machine.
     """
 
+    parallel: bool = False
+    max_parallelism: Optional[int] = None
+
     FLAVOR: ClassVar[str] = "local"
 
+    ensure_positive_max_parallelism = validator(
+        "max_parallelism", allow_reuse=True
+    )(orchestrator_utils.ensure_positive_max_parallelism)
+
     def prepare_or_run_pipeline(
         self,
         sorted_steps: List[BaseStep],
@@ -46,7 +126,7 @@ class LocalOrchestrator(BaseOrchestrator):
         stack: "Stack",
         runtime_configuration: "RuntimeConfiguration",
     ) -> Any:
-        """This method iterates through all steps and executes them sequentially.
+        """This method iterates through all steps and executes them.
 
         Args:
             sorted_steps: A list of steps in the pipeline.
@@ -63,6 +143,20 @@ class LocalOrchestrator(BaseOrchestrator):
             )
         assert runtime_configuration.run_name, "Run name must be set"
 
+        if self.parallel and not _can_fork_worker_processes():
+            logger.warning(
+                "Running steps in parallel requires forking processes, which "
+                "is not supported or not safe on this platform. The steps "
+                "will be run sequentially."
+            )
+        elif self.parallel:
+            self._run_steps_in_parallel(
+                sorted_steps=sorted_steps,
+                run_name=runtime_configuration.run_name,
+                pb2_pipeline=pb2_pipeline,
+            )
+            return
+
         # Run each step
         for step in sorted_steps:
             self.run_step(
@@ -70,3 +164,147 @@ class LocalOrchestrator(BaseOrchestrator):
                 run_name=runtime_configuration.run_name,
                 pb2_pipeline=pb2_pipeline,
             )
+
+    def _run_steps_in_parallel(
+        self,
+        sorted_steps: List[BaseStep],
+        run_name: str,
+        pb2_pipeline: Pb2Pipeline,
+    ) -> None:
+        """Runs all steps of a pipeline as soon as their upstream steps finish.
+
+        Each step keeps a counter of upstream steps that haven't finished yet.
+        Whenever a step finishes, the counters of its downstream steps are
+        decremented and all steps whose counter reaches zero are submitted to
+        the process pool. If a step fails, no new steps are scheduled and the
+        exception is re-raised once all running steps have finished.
+
+        The steps run in forked processes because running a step modifies
+        process-wide state: the global `Environment` holds the environment of
+        the running step, stack components configure their clients in
+        `prepare_step_run()` and the run name gets substituted in the
+        protobuf pipeline.
+
+        Args:
+            sorted_steps: A list of steps in the pipeline.
+            run_name: The unique run name.
+            pb2_pipeline: The pipeline object in protobuf format.
+
+        Raises:
+            BaseException: The first exception raised by any of the steps.
+        """
+        global _parallel_run_state
+
+        steps_by_name = {step.name: step for step in sorted_steps}
+        upstream_steps = {
+            step.name: self.get_upstream_step_names(
+                step=step, pb2_pipeline=pb2_pipeline
+            )
+            for step in sorted_steps
+        }
+        downstream_steps: Dict[str, List[str]] = {
+            step.name: [] for step in sorted_steps
+        }
+        for step_name, upstream_step_names in upstream_steps.items():
+            for upstream_step_name in upstream_step_names:
+                downstream_steps[upstream_step_name].append(step_name)
+        remaining_upstream_steps = {
+            step_name: len(upstream_step_names)
+            for step_name, upstream_step_names in upstream_steps.items()
+        }
+
+        max_workers = self.max_parallelism or os.cpu_count() or 1
+        step_durations: Dict[str, float] = {}
+        failure: Optional[BaseException] = None
+        start_time = time.time()
+
+        def _submit(step_name: str) -> None:
+            running[
+                executor.submit(_run_step_in_worker_process, step_name)
+            ] = step_name
+
+        _parallel_run_state = (self, steps_by_name, run_name, pb2_pipeline)
+        running: Dict["Future[float]", str] = {}
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("fork"),
+            ) as executor:
+                for step in sorted_steps:
+                    if remaining_upstream_steps[step.name] == 0:
+                        _submit(step.name)
+
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        step_name = running.pop(future)
+                        exception = future.exception()
+                        if exception:
+                            logger.error(f"Step `{step_name}` failed.")
+                            failure = failure or exception
+                            continue
+
+                        step_durations[step_name] = future.result()
+                        if failure:
+                            # Don't schedule any new steps after a failure,
+                            # only wait for the ones that are already running.
+                            continue
+
+                        for name in downstream_steps[step_name]:
+                            remaining_upstream_steps[name] -= 1
+                            if remaining_upstream_steps[name] == 0:
+                                _submit(name)
+        finally:
+            _parallel_run_state = None
+
+        if failure:
+            raise failure
+
+        self._log_parallel_run_summary(
+            sorted_steps=sorted_steps,
+            upstream_steps=upstream_steps,
+            step_durations=step_durations,
+            wall_time=time.time() - start_time,
+        )
+
+    @staticmethod
+    def _log_parallel_run_summary(
+        sorted_steps: List[BaseStep],
+        upstream_steps: Dict[str, List[str]],
+        step_durations: Dict[str, float],
+        wall_time: float,
+    ) -> None:
+        """Logs the speedup of a parallel run compared to a sequential one.
+
+        Args:
+            sorted_steps: A list of steps in the pipeline in topological order.
+            upstream_steps: Names of the direct upstream steps for each step.
+            step_durations: Duration of each step in seconds.
+            wall_time: Total duration of the pipeline run in seconds.
+        """
+        # Longest accumulated step duration of any path ending in a step.
+        # This is the lower bound for the run time with unlimited parallelism.
+        path_durations: Dict[str, float] = {}
+        for step in sorted_steps:
+            path_durations[step.name] = step_durations[step.name] + max(
+                (path_durations[name] for name in upstream_steps[step.name]),
+                default=0.0,
+            )
+
+        sequential_time = sum(step_durations.values())
+        critical_path_time = max(path_durations.values(), default=0.0)
+        speedup = sequential_time / wall_time if wall_time > 0 else 1.0
+        max_speedup = (
+            sequential_time / critical_path_time
+            if critical_path_time > 0
+            else 1.0
+        )
+        logger.info(
+            "Parallel run finished in %s (sequential step time: %s, critical "
+            "path: %s). Speedup: %.2fx of a possible %.2fx.",
+            string_utils.get_human_readable_time(wall_time),
+            string_utils.get_human_readable_time(sequential_time),
+            string_utils.get_human_readable_time(critical_path_time),
+            speedup,
+            max_speedup,
+        )
@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Utility functions for the orchestrator."""
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import tfx.orchestration.pipeline as tfx_pipeline
 from tfx.orchestration.portable import data_types
@@ -96,3 +96,36 @@ def get_cache_status(
         return True
     else:
         return False
+
+
+def ensure_positive_max_parallelism(
+    cls: Any, value: Optional[int]
+) -> Optional[int]:
+    """Validates that the maximum parallelism of an orchestrator is positive.
+
+    This can be used as a pydantic validator by orchestrators that limit the
+    number of steps that run at the same time:
+
+    ```python
+    ensure_positive_max_parallelism = validator(
+        "max_parallelism", allow_reuse=True
+    )(orchestrator_utils.ensure_positive_max_parallelism)
+    ```
+
+    Args:
+        cls: The orchestrator class.
+        value: The configured maximum parallelism.
+
+    Returns:
+        The validated maximum parallelism.
+
+    Raises:
+        ValueError: If the maximum parallelism is smaller than 1.
+    """
+    if value is not None and value < 1:
+        raise ValueError(
+            f"Invalid `max_parallelism` value {value}: The {cls.FLAVOR} "
+            f"orchestrator needs to be able to run at least one step at a "
+            f"time."
+        )
+    return value
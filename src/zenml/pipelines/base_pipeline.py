@@ -404,13 +404,17 @@ class BasePipeline(metaclass=BasePipelineMeta):
                     f"{available_step_operators}."
                 )
 
-    def _reset_step_flags(self) -> None:
-        """Reset the `_has_been_called` flag at the beginning of a pipeline run.
+    def _reset_step_flags(self, scheduled: bool = False) -> None:
+        """Reset the flags of all steps at the beginning of a pipeline run.
 
         This ensures a pipeline instance can be called more than once.
+
+        Args:
+            scheduled: Whether the pipeline is run on a schedule.
         """
         for step in self.steps.values():
             step._has_been_called = False
+            step._is_scheduled = scheduled
 
     def run(
         self,
@@ -483,7 +487,7 @@ class BasePipeline(metaclass=BasePipelineMeta):
             },
         )
 
-        self._reset_step_flags()
+        self._reset_step_flags(scheduled=bool(schedule))
         self.validate_stack(stack)
 
         return stack.deploy_pipeline(
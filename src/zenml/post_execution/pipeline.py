@@ -13,9 +13,10 @@
 #  permissions and limitations under the License.
 """Implementation of the post-execution pipeline."""
 
-from typing import TYPE_CHECKING, Any, List, Optional
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional
 
-from zenml.enums import StackComponentType
+from zenml.enums import ExecutionStatus, StackComponentType
 from zenml.logger import get_logger
 from zenml.zen_stores.models.pipeline_models import PipelineRunWrapper
 
@@ -65,20 +66,71 @@ class PipelineView:
         """Returns all stored runs of this pipeline.
 
         The runs are returned in chronological order, so the latest
-        run will be the last element in this list.
+        run will be the last element in this list. For pipelines with many
+        runs, use `get_runs(...)` or `iter_runs(...)` to only fetch the
+        runs you need.
 
         Returns:
             A list of all stored runs of this pipeline.
         """
+        return self.get_runs()
+
+    def get_runs(
+        self,
+        limit: Optional[int] = None,
+        since: Optional[datetime] = None,
+        status: Optional[ExecutionStatus] = None,
+    ) -> List["PipelineRunView"]:
+        """Returns the latest stored runs of this pipeline.
+
+        The runs are returned in chronological order, so the latest
+        run will be the last element in this list.
+
+        Args:
+            limit: If given, only the latest `limit` runs are returned.
+            since: If given, only runs created at or after this time are
+                returned.
+            status: If given, only runs with this status are returned.
+
+        Returns:
+            A list of the stored runs of this pipeline.
+        """
         # Do not cache runs as new runs might appear during this objects
         # lifecycle
-        runs = list(self._metadata_store.get_pipeline_runs(self).values())
+        runs = list(
+            self._metadata_store.get_pipeline_runs(
+                self, limit=limit, since=since, status=status
+            ).values()
+        )
 
         for run in runs:
-            run._run_wrapper = self._get_zenstore_run(run_name=run.name)
+            run._pipeline = self
 
         return runs
 
+    def iter_runs(
+        self,
+        since: Optional[datetime] = None,
+        status: Optional[ExecutionStatus] = None,
+    ) -> Iterator["PipelineRunView"]:
+        """Iterates over the stored runs of this pipeline, latest run first.
+
+        Runs are fetched lazily from the metadata store while iterating.
+
+        Args:
+            since: If given, only runs created at or after this time are
+                returned.
+            status: If given, only runs with this status are returned.
+
+        Yields:
+            The stored runs of this pipeline in reverse chronological order.
+        """
+        for run in self._metadata_store.iter_pipeline_runs(
+            self, since=since, status=status
+        ):
+            run._pipeline = self
+            yield run
+
     def get_run_names(self) -> List[str]:
         """Returns a list of all run names.
 
@@ -111,7 +163,7 @@ class PipelineView:
                 f"names: `{self.get_run_names()}`"
             )
 
-        run._run_wrapper = self._get_zenstore_run(run_name=name)
+        run._pipeline = self
         return run
 
     def get_run_for_completed_step(self, step_name: str) -> "PipelineRunView":
@@ -129,7 +181,7 @@ class PipelineView:
         """
         orig_pipeline_run = None
 
-        for run in reversed(self.runs):
+        for run in self.iter_runs():
             try:
                 step = run.get_step(step_name)
                 if step.is_completed:
@@ -26,6 +26,7 @@ from zenml.zen_stores.models.pipeline_models import PipelineRunWrapper
 
 if TYPE_CHECKING:
     from zenml.metadata_stores import BaseMetadataStore
+    from zenml.post_execution.pipeline import PipelineView
 
 logger = get_logger(__name__)
 
@@ -41,8 +42,8 @@ class PipelineRunView:
         self,
         id_: int,
         name: str,
-        executions: List[proto.Execution],
         metadata_store: "BaseMetadataStore",
+        executions: Optional[List[proto.Execution]] = None,
     ):
         """Initializes a post-execution pipeline run object.
 
@@ -52,9 +53,10 @@ class PipelineRunView:
         Args:
             id_: The context id of this pipeline run.
             name: The name of this pipeline run.
-            executions: All executions associated with this pipeline run.
             metadata_store: The metadata store which should be used to fetch
                 additional information related to this pipeline run.
+            executions: All executions associated with this pipeline run. If
+                not given, they will be fetched once they're needed.
         """
         self._id = id_
         self._name = name
@@ -64,8 +66,11 @@ class PipelineRunView:
         self._steps: Dict[str, StepView] = OrderedDict()
 
         # This might be set from the parent pipeline view in case this run
-        # is also tracked in the ZenStore
+        # is also tracked in the ZenStore. The run wrapper is then fetched
+        # from the ZenStore once it is needed.
+        self._pipeline: Optional["PipelineView"] = None
         self._run_wrapper: Optional[PipelineRunWrapper] = None
+        self._run_wrapper_fetched = False
 
     @property
     def name(self) -> str:
@@ -83,6 +88,7 @@ class PipelineRunView:
         Returns:
             The version of ZenML that this pipeline run was performed with.
         """
+        self._ensure_run_wrapper_fetched()
         if self._run_wrapper:
             return self._run_wrapper.zenml_version
         return None
@@ -97,6 +103,7 @@ class PipelineRunView:
         Returns:
             The git commit SHA that this pipeline run was performed on.
         """
+        self._ensure_run_wrapper_fetched()
         if self._run_wrapper:
             return self._run_wrapper.git_sha
         return None
@@ -110,6 +117,7 @@ class PipelineRunView:
         Returns:
             The runtime configuration that was used for this pipeline run.
         """
+        self._ensure_run_wrapper_fetched()
         if self._run_wrapper:
             return RuntimeConfiguration(
                 **self._run_wrapper.runtime_configuration
@@ -124,18 +132,7 @@ class PipelineRunView:
         Returns:
             The current status of the pipeline run.
         """
-        step_statuses = (step.status for step in self.steps)
-
-        if any(status == ExecutionStatus.FAILED for status in step_statuses):
-            return ExecutionStatus.FAILED
-        elif all(
-            status == ExecutionStatus.COMPLETED
-            or status == ExecutionStatus.CACHED
-            for status in step_statuses
-        ):
-            return ExecutionStatus.COMPLETED
-        else:
-            return ExecutionStatus.RUNNING
+        return self._metadata_store.get_pipeline_run_status(self)
 
     @property
     def steps(self) -> List[StepView]:
@@ -186,6 +183,7 @@ class PipelineRunView:
 
         self._steps = self._metadata_store.get_pipeline_run_steps(self)
 
+        self._ensure_run_wrapper_fetched()
         if self._run_wrapper:
             # If we have the run wrapper from the ZenStore, pass on the step
             # wrapper so users can access additional information about the step.
@@ -193,6 +191,16 @@ class PipelineRunView:
                 if step_wrapper.name in self._steps:
                     self._steps[step_wrapper.name]._step_wrapper = step_wrapper
 
+    def _ensure_run_wrapper_fetched(self) -> None:
+        """Fetches the run wrapper of this pipeline run from the ZenStore."""
+        if self._run_wrapper_fetched or not self._pipeline:
+            return
+
+        self._run_wrapper = self._pipeline._get_zenstore_run(
+            run_name=self._name
+        )
+        self._run_wrapper_fetched = True
+
     def __repr__(self) -> str:
         """Returns a string representation of this pipeline run.
 
@@ -37,6 +37,7 @@ class StepView:
         name: str,
         parameters: Dict[str, Any],
         metadata_store: "BaseMetadataStore",
+        internal_parameters: Optional[Dict[str, Any]] = None,
     ):
         """Initializes a post-execution step object.
 
@@ -51,12 +52,15 @@ class StepView:
             parameters: Parameters that were used to run this step.
             metadata_store: The metadata store which should be used to fetch
                 additional information related to this step.
+            internal_parameters: Parameters that ZenML used to run this step,
+                e.g. the hashes of the step code.
         """
         self._id = id_
         self._parents_step_ids = parents_step_ids
         self._entrypoint_name = entrypoint_name
         self._name = name
         self._parameters = parameters
+        self._internal_parameters = internal_parameters or {}
         self._metadata_store = metadata_store
 
         self._inputs: Dict[str, ArtifactView] = {}
@@ -163,6 +167,19 @@ class StepView:
         """
         return self._parameters
 
+    @property
+    def internal_parameters(self) -> Dict[str, Any]:
+        """The internal ZenML parameters used to run this step.
+
+        These include the hashes of the step code that determine whether
+        the step is cached, see `zenml.utils.code_hash_utils`.
+
+        Returns:
+            The internal parameters used to run this step, without the
+            `zenml-` prefix.
+        """
+        return self._internal_parameters
+
     @property
     def status(self) -> ExecutionStatus:
         """Returns the current status of the step.
@@ -18,7 +18,17 @@ import random
 from abc import ABCMeta
 from collections import defaultdict
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+)
 from uuid import UUID
 
 from pydantic import BaseModel, ValidationError
@@ -958,6 +968,23 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
             component_type=component_type,
         ).to_component()
 
+    def get_stack_components_by_names(
+        self, components: Sequence[Tuple[StackComponentType, str]]
+    ) -> List[StackComponent]:
+        """Fetches multiple registered stack components at once.
+
+        Args:
+            components: Types and names of the components to fetch.
+
+        Returns:
+            The registered stack components, in the order they were
+            requested. Components that don't exist are omitted.
+        """
+        return [
+            c.to_component()
+            for c in self.zen_store.get_stack_components_by_names(components)
+        ]
+
     def register_stack_component(
         self,
         component: StackComponent,
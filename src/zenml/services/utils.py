@@ -57,7 +57,7 @@ def load_last_service_from_step(
     if pipeline is None:
         raise KeyError(f"No pipeline with name `{pipeline_name}` was found")
 
-    for run in reversed(pipeline.runs):
+    for run in pipeline.iter_runs():
         step = run.get_step(name=step_name)
         for artifact_view in step.outputs.values():
             # filter out anything but service artifacts
@@ -16,7 +16,7 @@
 import importlib
 import logging
 import sys
-from typing import Dict, Type, cast
+from typing import Dict, Set, Type, cast
 
 import click
 from tfx.dsl.components.base.base_executor import BaseExecutor
@@ -40,6 +40,7 @@ from zenml.utils import source_utils, yaml_utils
 def create_executor_class(
     step_source_path: str,
     input_artifact_type_mapping: Dict[str, str],
+    execution_parameter_names: Set[str],
 ) -> Type[_FunctionExecutor]:
     """Creates an executor class for a given step.
 
@@ -47,6 +48,8 @@ def create_executor_class(
         step_source_path: Import path of the step to run.
         input_artifact_type_mapping: A dictionary mapping input names to
             a string representation of their artifact classes.
+        execution_parameter_names: Names of the execution parameters of the
+            step in the compiled pipeline.
 
     Returns:
         A class of an executor instance.
@@ -68,17 +71,12 @@ def create_executor_class(
     for key, value in step_class.OUTPUT_SIGNATURE.items():
         output_spec[key] = type_registry.get_artifact_type(value)[0]
 
-    execution_parameters = {
-        **step_instance.PARAM_SPEC,
-        **step_instance._internal_execution_parameters,
-    }
-
     component_class = generate_component_class(
         step_name=step_instance.name,
         step_module=step_class.__module__,
         input_spec=input_spec,
         output_spec=output_spec,
-        execution_parameter_names=set(execution_parameters),
+        execution_parameter_names=execution_parameter_names,
         step_function=step_instance.entrypoint,
         materializers=materializers,
     )
@@ -162,13 +160,15 @@ def main(
     input_artifact_type_mapping = yaml_utils.read_json(
         input_artifact_types_path
     )
+    # the execution parameters were computed when the pipeline was compiled
+    execution_info = load_execution_info(execution_info_path)
     executor_class = create_executor_class(
         step_source_path=step_source_path,
         input_artifact_type_mapping=input_artifact_type_mapping,
+        execution_parameter_names=set(execution_info.exec_properties),
     )
 
     stack = Repository().active_stack
-    execution_info = load_execution_info(execution_info_path)
     executor = configure_executor(executor_class, execution_info=execution_info)
 
     stack.prepare_step_run()
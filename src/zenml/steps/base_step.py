@@ -55,8 +55,10 @@ from zenml.steps.step_output import Output
 from zenml.steps.utils import (
     INSTANCE_CONFIGURATION,
     INTERNAL_EXECUTION_PARAMETER_PREFIX,
+    PARAM_CODE_HASHES,
     PARAM_CREATED_BY_FUNCTIONAL_API,
     PARAM_CUSTOM_STEP_OPERATOR,
+    PARAM_DATA_FINGERPRINT,
     PARAM_ENABLE_CACHE,
     PARAM_PIPELINE_PARAMETER_NAME,
     SINGLE_RETURN_OUT_NAME,
@@ -64,7 +66,7 @@ from zenml.steps.utils import (
     generate_component_class,
     resolve_type_annotation,
 )
-from zenml.utils.source_utils import get_hashed_source
+from zenml.utils import code_hash_utils
 
 logger = get_logger(__name__)
 
@@ -292,6 +294,7 @@ class BaseStep(metaclass=BaseStepMeta):
         self._explicit_materializers: Dict[str, Type[BaseMaterializer]] = {}
         self._component: Optional[_ZenMLSimpleComponent] = None
         self._has_been_called = False
+        self._is_scheduled = False
 
         self._verify_init_arguments(*args, **kwargs)
         self._verify_output_spec()
@@ -369,10 +372,40 @@ class BaseStep(metaclass=BaseStepMeta):
 
         return materializers
 
+    def _has_data_fingerprint(self) -> bool:
+        """Checks whether this step fingerprints the external data it reads.
+
+        Returns:
+            `True` if the config of this step implements
+            `BaseStepConfig.fingerprint()`, `False` otherwise.
+        """
+        return bool(
+            self.CONFIG_CLASS
+            and self.CONFIG_CLASS.fingerprint is not BaseStepConfig.fingerprint
+        )
+
+    def _get_data_fingerprint(self) -> Optional[str]:
+        """Computes the fingerprint of the external data read by this step.
+
+        Returns:
+            The fingerprint returned by `BaseStepConfig.fingerprint()`, or
+            `None` if the config of this step doesn't implement it.
+        """
+        if not self.CONFIG_CLASS or not self._has_data_fingerprint():
+            return None
+
+        fingerprint = self.CONFIG_CLASS(**self.PARAM_SPEC).fingerprint()
+        return None if fingerprint is None else str(fingerprint)
+
     @property
     def _internal_execution_parameters(self) -> Dict[str, Any]:
         """Internal ZenML execution parameters for this step.
 
+        These are only computed when the pipeline is compiled. Entrypoints
+        that run the compiled step take the parameters from the compiled
+        pipeline instead, as evaluating the input data fingerprint again
+        could lead to a different set of parameters.
+
         Returns:
             A dictionary containing the ZenML internal execution parameters
         """
@@ -381,9 +414,35 @@ class BaseStep(metaclass=BaseStepMeta):
             PARAM_CUSTOM_STEP_OPERATOR: self.custom_step_operator,
         }
 
-        if self.enable_cache:
+        enable_cache = self.enable_cache
+        data_fingerprint = None
+        if enable_cache and self._is_scheduled and self._has_data_fingerprint():
+            # The pipeline is compiled once for all scheduled runs, so the
+            # fingerprint wouldn't change when the data changes
+            logger.warning(
+                "Step '%s': Input data fingerprints can't be computed for "
+                "each run of a scheduled pipeline, disabling caching.",
+                self.name,
+            )
+            enable_cache = False
+        elif enable_cache:
+            try:
+                data_fingerprint = self._get_data_fingerprint()
+            except Exception as e:
+                # Without a fingerprint, the step might reuse outputs that
+                # were computed from outdated data
+                logger.warning(
+                    "Step '%s': Failed to compute the fingerprint of the "
+                    "input data, disabling caching: %s",
+                    self.name,
+                    e,
+                )
+                enable_cache = False
+
+        if enable_cache:
             # Caching is enabled so we compute a hash of the step function code
-            # and materializers to catch changes in the step behavior
+            # and materializers, including all first-party code they depend
+            # on, to catch changes in the step behavior
 
             # If the step was defined using the functional api, only track
             # changes to the entrypoint function. Otherwise track changes to
@@ -393,11 +452,25 @@ class BaseStep(metaclass=BaseStepMeta):
                 if self._created_by_functional_api()
                 else self.__class__
             )
-            parameters["step_source"] = get_hashed_source(source_object)
+            parameters["step_source"] = code_hash_utils.get_code_hash(
+                source_object
+            )
+            code_hashes = code_hash_utils.get_code_hashes(source_object)
 
             for name, materializer in self.get_materializers().items():
                 key = f"{name}_materializer_source"
-                parameters[key] = get_hashed_source(materializer)
+                parameters[key] = code_hash_utils.get_code_hash(materializer)
+                code_hashes.update(
+                    code_hash_utils.get_code_hashes(materializer)
+                )
+
+            # The hashes of the individual functions and classes are already
+            # covered by the hashes above, but allow explaining which code
+            # changed if a step wasn't cached
+            parameters[PARAM_CODE_HASHES] = code_hashes
+
+            if data_fingerprint is not None:
+                parameters[PARAM_DATA_FINGERPRINT] = data_fingerprint
         else:
             # Add a random string to the execution properties to disable caching
             random_string = f"{random.getrandbits(128):032x}"
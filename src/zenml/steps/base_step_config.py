@@ -13,8 +13,33 @@
 #  permissions and limitations under the License.
 """Base step config."""
 
+from typing import Optional
+
 from pydantic import BaseModel
 
 
 class BaseStepConfig(BaseModel):
     """Base configuration class to pass execution params into a step."""
+
+    def fingerprint(self) -> Optional[str]:
+        """Computes a version of the external data that the step reads.
+
+        Steps are cached based on their code, parameters and input artifacts,
+        so they don't rerun if data they read from an external source (e.g.
+        a file or table whose location is passed as a parameter) changes.
+        Override this method to cheaply compute a version of that data,
+        e.g. from file modification times or a table's row count, which is
+        then included in the cache key of the step. The functions in
+        `zenml.utils.fingerprint_utils` help to compute common fingerprints.
+
+        The fingerprint is computed once when the pipeline is compiled, so the
+        data needs to be accessible from where the pipeline is run. Scheduled
+        pipelines are compiled once for all their runs, which would freeze
+        the fingerprint, so caching is disabled for steps with a fingerprint
+        when a pipeline is run on a schedule.
+
+        Returns:
+            A string that changes whenever the data changes, or `None` if
+            the step doesn't read external data.
+        """
+        return None
@@ -81,6 +81,8 @@ PARAM_ENABLE_CACHE: str = "enable_cache"
 PARAM_PIPELINE_PARAMETER_NAME: str = "pipeline_parameter_name"
 PARAM_CREATED_BY_FUNCTIONAL_API: str = "created_by_functional_api"
 PARAM_CUSTOM_STEP_OPERATOR: str = "custom_step_operator"
+PARAM_CODE_HASHES: str = "code_hashes"
+PARAM_DATA_FINGERPRINT: str = "data_fingerprint"
 INTERNAL_EXECUTION_PARAMETER_PREFIX: str = "zenml-"
 INSTANCE_CONFIGURATION: str = "INSTANCE_CONFIGURATION"
 OUTPUT_SPEC: str = "OUTPUT_SPEC"
@@ -0,0 +1,370 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions to hash code for step cache keys.
+
+The hash of a function or class covers its normalized abstract syntax tree,
+so comments, docstrings and formatting don't change it, and the hashes of
+all first-party functions, classes, modules and constants it references,
+directly or transitively. First-party code is code inside the source root
+that isn't part of an installed package.
+
+Hashes are memoized for the lifetime of the process, so code is expected not
+to change while a process is running.
+"""
+
+import ast
+import functools
+import hashlib
+import inspect
+import json
+import pathlib
+import sys
+import sysconfig
+import textwrap
+import types
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from zenml.logger import get_logger
+from zenml.utils import source_utils
+
+logger = get_logger(__name__)
+
+CONSTANT_TYPES = (bool, int, float, str, bytes, type(None))
+
+
+def _strip_docstrings(tree: ast.AST) -> None:
+    """Removes all docstrings from an abstract syntax tree.
+
+    Args:
+        tree: The tree to modify in place.
+    """
+    for node in ast.walk(tree):
+        if (
+            isinstance(
+                node,
+                (
+                    ast.Module,
+                    ast.ClassDef,
+                    ast.FunctionDef,
+                    ast.AsyncFunctionDef,
+                ),
+            )
+            and ast.get_docstring(node, clean=False) is not None
+        ):
+            node.body = node.body[1:] or [ast.Pass()]
+
+
+def _parse(source: str) -> Optional[ast.AST]:
+    """Parses source code into an abstract syntax tree without docstrings.
+
+    Args:
+        source: The source code.
+
+    Returns:
+        The tree, or `None` if the source code can't be parsed on its own,
+        e.g. because it's a lambda in the middle of an expression.
+    """
+    try:
+        tree = ast.parse(textwrap.dedent(source))
+    except SyntaxError:
+        return None
+    _strip_docstrings(tree)
+    return tree
+
+
+class _ReferencedNamesVisitor(ast.NodeVisitor):
+    """Collects the outermost dotted names that are read in a tree.
+
+    Attribute chains like `module.function` are collected as a whole and not
+    descended into, so their inner names like `module` aren't collected on
+    their own.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the visitor."""
+        self.names: List[List[str]] = []
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        """Collects the dotted name of an attribute chain.
+
+        Args:
+            node: The outermost attribute of the chain.
+        """
+        parts: List[str] = []
+        value: ast.AST = node
+        while isinstance(value, ast.Attribute):
+            parts.insert(0, value.attr)
+            value = value.value
+        if isinstance(value, ast.Name):
+            self.visit_Name(value, parts)
+        else:
+            # e.g. `function().attribute`
+            self.visit(value)
+
+    def visit_Name(self, node: ast.Name, parts: Sequence[str] = ()) -> None:
+        """Collects a name if it is read.
+
+        Args:
+            node: The name.
+            parts: The attributes that are accessed on the name.
+        """
+        if isinstance(node.ctx, ast.Load):
+            self.names.append([node.id, *parts])
+
+
+def _get_referenced_names(tree: ast.AST) -> Iterator[List[str]]:
+    """Gets all dotted names that are read in an abstract syntax tree.
+
+    Args:
+        tree: The tree.
+
+    Yields:
+        The parts of each name, e.g. `["module", "function"]` for
+        `module.function(...)`.
+    """
+    visitor = _ReferencedNamesVisitor()
+    visitor.visit(tree)
+    yield from visitor.names
+
+
+@functools.lru_cache(maxsize=None)
+def _get_first_party_root() -> Optional[pathlib.Path]:
+    """Gets the directory that contains first-party code.
+
+    Returns:
+        The source root, or `None` if it can't be determined.
+    """
+    try:
+        return pathlib.Path(source_utils.get_source_root_path()).resolve()
+    except RuntimeError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _is_first_party_module(module: types.ModuleType) -> bool:
+    """Checks whether a module contains first-party code.
+
+    Args:
+        module: The module to check.
+
+    Returns:
+        `True` if the module is part of the source root and not of the
+        standard library or an installed package, `False` otherwise.
+    """
+    if module.__name__ == "__main__":
+        return True
+    file_path = getattr(module, "__file__", None)
+    root = _get_first_party_root()
+    if not file_path or not root:
+        return False
+
+    path = pathlib.Path(file_path).resolve()
+    standard_library = pathlib.Path(sysconfig.get_paths()["stdlib"]).resolve()
+    return (
+        root in path.parents
+        and standard_library not in path.parents
+        and not source_utils.is_third_party_module(file_path)
+    )
+
+
+def _get_key(value: Any) -> str:
+    """Gets the key under which the hash of an object is stored.
+
+    Args:
+        value: A module, class or function.
+
+    Returns:
+        The qualified name of the object.
+    """
+    if isinstance(value, types.ModuleType):
+        return value.__name__
+    return f"{value.__module__}.{value.__qualname__}"
+
+
+def _resolve(
+    parts: List[str], namespace: Dict[str, Any]
+) -> Tuple[Optional[str], Any]:
+    """Resolves a dotted name to the object it refers to.
+
+    Attributes of modules are resolved as far as possible, so
+    `module.function` resolves to the function instead of the module.
+
+    Args:
+        parts: The parts of the dotted name.
+        namespace: The namespace in which the name is looked up.
+
+    Returns:
+        The resolved name and object, or `(None, None)` if the name isn't
+        defined in the namespace.
+    """
+    if parts[0] not in namespace:
+        return None, None
+    name, value = parts[0], namespace[parts[0]]
+    for part in parts[1:]:
+        if not isinstance(value, types.ModuleType) or not hasattr(value, part):
+            break
+        name, value = f"{name}.{part}", getattr(value, part)
+    return name, value
+
+
+def _get_namespace(value: Any) -> Dict[str, Any]:
+    """Gets the namespace in which the names used by an object are resolved.
+
+    Args:
+        value: A class or function.
+
+    Returns:
+        The global and nonlocal variables of a function, or the globals of
+        the module of a class.
+    """
+    if inspect.isfunction(value):
+        namespace = dict(value.__globals__)
+        if value.__closure__:
+            namespace.update(inspect.getclosurevars(value).nonlocals)
+        return namespace
+    module = sys.modules.get(value.__module__)
+    return dict(vars(module)) if module else {}
+
+
+@functools.lru_cache(maxsize=None)
+def _hash_object(value: Any) -> Tuple[str, Tuple[Any, ...]]:
+    """Hashes the source code of an object and finds its dependencies.
+
+    Args:
+        value: A module, class or function.
+
+    Returns:
+        The hash of the normalized source code and the first-party objects
+        and constants it references. Constants are returned as tuples of
+        their qualified name and value.
+
+    Raises:
+        TypeError: If the source code of the object is not available.
+    """
+    try:
+        source = source_utils.get_source(value)
+    except (TypeError, OSError):
+        raise TypeError(
+            f"Unable to compute the hash of source code of object: {value}."
+        )
+
+    tree = _parse(source)
+    if tree is None:
+        return hashlib.sha256(source.encode("utf-8")).hexdigest(), ()
+    code_hash = hashlib.sha256(
+        ast.dump(tree, annotate_fields=False).encode("utf-8")
+    ).hexdigest()
+
+    # Modules are hashed as a whole, so their references don't need to be
+    # followed
+    if isinstance(value, types.ModuleType):
+        return code_hash, ()
+
+    namespace = _get_namespace(value)
+    dependencies: List[Any] = []
+    for parts in _get_referenced_names(tree):
+        name, reference = _resolve(parts, namespace)
+        if name is None or reference is value:
+            continue
+        if isinstance(reference, CONSTANT_TYPES):
+            # nonlocal constants are specific to the function, globals are
+            # shared by all code of the module
+            if (
+                inspect.isfunction(value)
+                and parts[0] in value.__code__.co_freevars
+            ):
+                owner = _get_key(value)
+            else:
+                owner = value.__module__
+            dependencies.append((f"{owner}.{name}", reference))
+            continue
+        reference = (
+            inspect.unwrap(reference) if callable(reference) else reference
+        )
+        if not (
+            isinstance(reference, types.ModuleType)
+            or inspect.isclass(reference)
+            or inspect.isfunction(reference)
+        ):
+            continue
+        module = inspect.getmodule(reference)
+        if module and _is_first_party_module(module):
+            dependencies.append(reference)
+    return code_hash, tuple(dependencies)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_code_hashes(value: Any) -> Tuple[Tuple[str, str], ...]:
+    """Hashes an object and all first-party code it depends on.
+
+    Args:
+        value: A class or function.
+
+    Returns:
+        Sorted pairs of qualified names and hashes.
+    """
+    hashes: Dict[str, str] = {}
+    stack = [inspect.unwrap(value)]
+    while stack:
+        current = stack.pop()
+        key = _get_key(current)
+        if key in hashes:
+            continue
+        try:
+            hashes[key], dependencies = _hash_object(current)
+        except TypeError:
+            if current is value:
+                raise
+            # e.g. classes that were created dynamically
+            logger.debug("Unable to hash source code of '%s'.", key)
+            continue
+
+        for dependency in dependencies:
+            if isinstance(dependency, tuple):
+                name, constant = dependency
+                hashes[name] = hashlib.sha256(
+                    repr(constant).encode("utf-8")
+                ).hexdigest()
+            else:
+                stack.append(dependency)
+    return tuple(sorted(hashes.items()))
+
+
+def get_code_hashes(value: Any) -> Dict[str, str]:
+    """Hashes a class or function and all first-party code it depends on.
+
+    Args:
+        value: A class or function.
+
+    Returns:
+        The hash of each class, function, module and constant the object
+        depends on, including the object itself, by qualified name.
+    """
+    return dict(_get_code_hashes(value))
+
+
+def get_code_hash(value: Any) -> str:
+    """Computes a hash of a class or function and the code it depends on.
+
+    Args:
+        value: A class or function.
+
+    Returns:
+        A hash that changes if the object or any first-party code it depends
+        on changes, but not if only comments, docstrings or formatting
+        change.
+    """
+    return hashlib.sha256(
+        json.dumps(_get_code_hashes(value)).encode("utf-8")
+    ).hexdigest()
@@ -13,24 +13,43 @@
 #  permissions and limitations under the License.
 """Utility functions relating to Docker."""
 
+import hashlib
 import json
 import os
-from typing import AbstractSet, Any, Dict, Iterable, List, Optional, cast
+import tempfile
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 import pkg_resources
 from docker.client import DockerClient
+from docker.errors import APIError
 from docker.utils import build as docker_build_utils
 
 import zenml
 from zenml.config.global_config import GlobalConfiguration
-from zenml.constants import ENV_ZENML_CONFIG_PATH
+from zenml.constants import DOCKER_REUSE_IMAGES, ENV_ZENML_CONFIG_PATH
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.utils import string_utils
 from zenml.utils.io_utils import read_file_contents_as_string
 
+if TYPE_CHECKING:
+    from zenml.container_registries import BaseContainerRegistry
+
 DEFAULT_BASE_IMAGE = f"zenmldocker/zenml:{zenml.__version__}"
 CONTAINER_ZENML_CONFIG_DIR = ".zenconfig"
+BUILD_HASH_LENGTH = 16
+DEPENDENCY_IMAGE_TAG_PREFIX = "deps-"
 
 logger = get_logger(__name__)
 
@@ -81,18 +100,17 @@ def generate_dockerfile_contents(
     """
     lines = [f"FROM {base_image}", "WORKDIR /app"]
 
-    # TODO [ENG-781]: Make secrets invisible in the Dockerfile or use a different approach.
-    if environment_vars:
-        for key, value in environment_vars.items():
-            lines.append(f"ENV {key.upper()}={value}")
+    # The environment variables may configure the requirements installation,
+    # e.g. with a `PIP_INDEX_URL`, so they need to be set before it
+    lines.extend(_get_environment_var_commands(environment_vars))
 
+    # Install the requirements before the build context, so the layer with
+    # the installed requirements can be reused from the build cache as long
+    # as the requirements don't change
     if requirements:
-        # Quote the requirements to avoid problems with special characters
-        requirements = {f"'{r}'" for r in requirements}
-        lines.append(
-            f"RUN pip install --no-cache {' '.join(sorted(requirements))}"
-        )
+        lines.append(_get_requirements_install_command(requirements))
 
+    # The build context changes most frequently, so it's copied last
     lines.append("COPY . .")
     lines.append("RUN chmod -R a+rw .")
     lines.append(
@@ -105,25 +123,81 @@ def generate_dockerfile_contents(
     return "\n".join(lines)
 
 
-def create_custom_build_context(
-    build_context_path: str,
-    dockerfile_contents: str,
-    dockerignore_path: Optional[str] = None,
-) -> Any:
-    """Creates a docker build context.
+def generate_dependency_dockerfile_contents(
+    base_image: str,
+    requirements: AbstractSet[str],
+    environment_vars: Optional[Dict[str, str]] = None,
+) -> str:
+    """Generates a Dockerfile that only installs requirements.
 
     Args:
-        build_context_path: Path to a directory that will be sent to the
+        base_image: The image to use as base for the dockerfile.
+        requirements: The pip requirements to install.
+        environment_vars: Optional dict of environment variables to set
+            before installing the requirements.
+
+    Returns:
+        Content of a dockerfile.
+    """
+    return "\n".join(
+        [
+            f"FROM {base_image}",
+            "WORKDIR /app",
+            *_get_environment_var_commands(environment_vars),
+            _get_requirements_install_command(requirements),
+        ]
+    )
+
+
+def _get_environment_var_commands(
+    environment_vars: Optional[Dict[str, str]]
+) -> List[str]:
+    """Gets the Dockerfile commands that set environment variables.
+
+    Args:
+        environment_vars: Optional dict of environment variables to set.
+
+    Returns:
+        The Dockerfile commands.
+    """
+    # TODO [ENG-781]: Make secrets invisible in the Dockerfile or use a different approach.
+    return [
+        f"ENV {key.upper()}={value}"
+        for key, value in (environment_vars or {}).items()
+    ]
+
+
+def _get_requirements_install_command(requirements: AbstractSet[str]) -> str:
+    """Gets the Dockerfile command that installs pip requirements.
+
+    The requirements are sorted so that the command, and therefore the cache
+    key of the resulting layer, only changes if the requirements change.
+
+    Args:
+        requirements: The pip requirements to install.
+
+    Returns:
+        The Dockerfile command.
+    """
+    # Quote the requirements to avoid problems with special characters
+    quoted_requirements = sorted(f"'{r}'" for r in requirements)
+    return f"RUN pip install --no-cache {' '.join(quoted_requirements)}"
+
+
+def _get_exclude_patterns(
+    build_context_path: str, dockerignore_path: Optional[str] = None
+) -> List[str]:
+    """Gets the patterns of files to exclude from a docker build context.
+
+    Args:
+        build_context_path: Path to the directory that will be sent to the
             docker daemon as build context.
-        dockerfile_contents: File contents of the Dockerfile to use for the
-            build.
         dockerignore_path: Optional path to a dockerignore file. If no value is
             given, the .dockerignore in the root of the build context will be
-            used if it exists. Otherwise, all files inside `build_context_path`
-            are included in the build context.
+            used if it exists.
 
     Returns:
-        Docker build context that can be passed when building a docker image.
+        The exclude patterns.
     """
     exclude_patterns = []
     default_dockerignore_path = os.path.join(
@@ -151,6 +225,110 @@ def create_custom_build_context(
         "Exclude patterns for creating docker build context: %s",
         exclude_patterns,
     )
+    return exclude_patterns
+
+
+def get_build_context_files(
+    build_context_path: str, dockerignore_path: Optional[str] = None
+) -> List[str]:
+    """Gets the files of a directory that are part of a docker build context.
+
+    The ZenML configuration that gets copied into the build context is never
+    included.
+
+    Args:
+        build_context_path: Path to the directory that will be sent to the
+            docker daemon as build context.
+        dockerignore_path: Optional path to a dockerignore file. If no value is
+            given, the .dockerignore in the root of the build context will be
+            used if it exists.
+
+    Returns:
+        Sorted paths of the files and directories relative to the build
+        context.
+    """
+    exclude_patterns = _get_exclude_patterns(
+        build_context_path, dockerignore_path=dockerignore_path
+    )
+    exclude_patterns.append(CONTAINER_ZENML_CONFIG_DIR)
+    return sorted(
+        docker_build_utils.exclude_paths(
+            build_context_path, patterns=exclude_patterns
+        )
+    )
+
+
+def compute_build_hash(
+    build_context_path: str,
+    dockerfile_contents: str,
+    dockerignore_path: Optional[str] = None,
+    additional_inputs: Sequence[str] = (),
+) -> str:
+    """Computes a hash of everything that goes into a docker image build.
+
+    The hash covers the Dockerfile, which includes the base image and the
+    requirements to install, and the path, permissions and contents of all
+    files in the build context that aren't excluded by the dockerignore file.
+    The ZenML configuration copied into the build context is not part of the
+    hash, pass the relevant parts of it as `additional_inputs` instead.
+
+    Args:
+        build_context_path: Path to the directory that will be sent to the
+            docker daemon as build context.
+        dockerfile_contents: File contents of the Dockerfile to use for the
+            build.
+        dockerignore_path: Optional path to a dockerignore file. If no value is
+            given, the .dockerignore in the root of the build context will be
+            used if it exists.
+        additional_inputs: Additional values that end up in the image.
+
+    Returns:
+        Hex digest of the build inputs.
+    """
+    files = get_build_context_files(
+        build_context_path, dockerignore_path=dockerignore_path
+    )
+
+    build_hash = hashlib.sha256()
+    build_hash.update(dockerfile_contents.encode())
+    for value in additional_inputs:
+        build_hash.update(b"\0" + value.encode())
+    for path in files:
+        full_path = os.path.join(build_context_path, path)
+        mode = os.lstat(full_path).st_mode
+        build_hash.update(f"\0{path}\0{mode:o}\0".encode())
+        if os.path.islink(full_path):
+            build_hash.update(os.readlink(full_path).encode())
+        elif os.path.isfile(full_path):
+            with open(full_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    build_hash.update(chunk)
+    return build_hash.hexdigest()
+
+
+def create_custom_build_context(
+    build_context_path: str,
+    dockerfile_contents: str,
+    dockerignore_path: Optional[str] = None,
+) -> Any:
+    """Creates a docker build context.
+
+    Args:
+        build_context_path: Path to a directory that will be sent to the
+            docker daemon as build context.
+        dockerfile_contents: File contents of the Dockerfile to use for the
+            build.
+        dockerignore_path: Optional path to a dockerignore file. If no value is
+            given, the .dockerignore in the root of the build context will be
+            used if it exists. Otherwise, all files inside `build_context_path`
+            are included in the build context.
+
+    Returns:
+        Docker build context that can be passed when building a docker image.
+    """
+    exclude_patterns = _get_exclude_patterns(
+        build_context_path, dockerignore_path=dockerignore_path
+    )
     no_ignores_found = not exclude_patterns
 
     files = docker_build_utils.exclude_paths(
@@ -195,6 +373,150 @@ def get_current_environment_requirements() -> Dict[str, str]:
     }
 
 
+def _get_requirements(
+    requirements: Optional[AbstractSet[str]] = None,
+    use_local_requirements: bool = False,
+) -> Optional[AbstractSet[str]]:
+    """Gets the pip requirements to install in a docker image.
+
+    Args:
+        requirements: Optional list of pip requirements to install.
+        use_local_requirements: If `True` and no `requirements` are given,
+            then the packages installed in the environment of the current
+            python processed will be installed in the docker image.
+
+    Returns:
+        The requirements to install.
+    """
+    if not requirements and use_local_requirements:
+        local_requirements = get_current_environment_requirements()
+        requirements = {
+            f"{package}=={version}"
+            for package, version in local_requirements.items()
+            if package != "zenml"  # exclude ZenML
+        }
+        logger.info(
+            "Using requirements from local environment to build "
+            "docker image: %s",
+            requirements,
+        )
+    return requirements
+
+
+def _get_dockerfile_contents(
+    entrypoint: Optional[str] = None,
+    dockerfile_path: Optional[str] = None,
+    requirements: Optional[AbstractSet[str]] = None,
+    environment_vars: Optional[Dict[str, str]] = None,
+    use_local_requirements: bool = False,
+    base_image: Optional[str] = None,
+) -> str:
+    """Reads or generates the Dockerfile for a docker image build.
+
+    Args:
+        entrypoint: Optional entrypoint command that gets executed when running
+            a container of the built image.
+        dockerfile_path: Optional path to a dockerfile. If no value is given,
+            a dockerfile will be generated.
+        requirements: Optional list of pip requirements to install. This
+            will only be used if no value is given for `dockerfile_path`.
+        environment_vars: Optional dict of key value pairs that need to be
+            embedded as environment variables in the image.
+        use_local_requirements: If `True` and no values are given for
+            `dockerfile_path` and `requirements`, then the packages installed
+            in the environment of the current python processed will be
+            installed in the docker image.
+        base_image: The image to use as base for the docker image.
+
+    Returns:
+        Content of the Dockerfile.
+    """
+    requirements = _get_requirements(
+        requirements, use_local_requirements=use_local_requirements
+    )
+
+    if dockerfile_path:
+        return read_file_contents_as_string(dockerfile_path)
+    else:
+        return generate_dockerfile_contents(
+            base_image=base_image or DEFAULT_BASE_IMAGE,
+            entrypoint=entrypoint,
+            requirements=requirements,
+            environment_vars=environment_vars,
+        )
+
+
+def _copy_active_configuration(build_context_path: str) -> str:
+    """Copies the active configuration into the build context.
+
+    Saves a copy of the current global configuration with the active profile
+    and the active stack configuration into the build context, to have the
+    active profile and active stack accessible from within the container.
+
+    Args:
+        build_context_path: Path to the directory that will be sent to the
+            docker daemon as build context.
+
+    Returns:
+        Path of the copied configuration, which needs to be removed once the
+        image is built.
+    """
+    config_path = os.path.join(build_context_path, CONTAINER_ZENML_CONFIG_DIR)
+    GlobalConfiguration().copy_active_configuration(
+        config_path,
+        load_config_path=f"/app/{CONTAINER_ZENML_CONFIG_DIR}",
+    )
+    return config_path
+
+
+def _build_image(
+    build_context_path: str,
+    image_name: str,
+    dockerfile_contents: str,
+    dockerignore_path: Optional[str] = None,
+    base_image: Optional[str] = None,
+) -> None:
+    """Builds a docker image from a prepared build context.
+
+    Args:
+        build_context_path: Path to a directory that will be sent to the
+            docker daemon as build context.
+        image_name: The name to use for the created docker image.
+        dockerfile_contents: File contents of the Dockerfile to use for the
+            build.
+        dockerignore_path: Optional path to a dockerignore file.
+        base_image: The custom image used as base for the docker image.
+    """
+    build_context = create_custom_build_context(
+        build_context_path=build_context_path,
+        dockerfile_contents=dockerfile_contents,
+        dockerignore_path=dockerignore_path,
+    )
+    # If a custom base image is provided, make sure to always pull the
+    # latest version of that image (if it isn't a locally built image).
+    # If no base image is provided, we use the static default ZenML image so
+    # there is no need to constantly pull
+    pull_base_image = False
+    if base_image:
+        pull_base_image = not is_local_image(base_image)
+
+    logger.info(
+        "Building docker image '%s', this might take a while...",
+        image_name,
+    )
+
+    docker_client = DockerClient.from_env()
+    # We use the client api directly here, so we can stream the logs
+    output_stream = docker_client.images.client.api.build(
+        fileobj=build_context,
+        custom_context=True,
+        tag=image_name,
+        pull=pull_base_image,
+        rm=False,  # don't remove intermediate containers
+    )
+    _process_stream(output_stream)
+
+
 def build_docker_image(
     build_context_path: str,
     image_name: str,
@@ -230,74 +552,272 @@ def build_docker_image(
             installed in the docker image.
         base_image: The image to use as base for the docker image.
     """
-    config_path = os.path.join(build_context_path, CONTAINER_ZENML_CONFIG_DIR)
+    config_path = _copy_active_configuration(build_context_path)
     try:
-
-        # Save a copy of the current global configuration with the
-        # active profile and the active stack configuration into the build
-        # context, to have the active profile and active stack accessible from
-        # within the container.
-        GlobalConfiguration().copy_active_configuration(
-            config_path,
-            load_config_path=f"/app/{CONTAINER_ZENML_CONFIG_DIR}",
+        dockerfile_contents = _get_dockerfile_contents(
+            entrypoint=entrypoint,
+            dockerfile_path=dockerfile_path,
+            requirements=requirements,
+            environment_vars=environment_vars,
+            use_local_requirements=use_local_requirements,
+            base_image=base_image,
+        )
+        _build_image(
+            build_context_path=build_context_path,
+            image_name=image_name,
+            dockerfile_contents=dockerfile_contents,
+            dockerignore_path=dockerignore_path,
+            base_image=base_image,
         )
+    finally:
+        # Clean up the temporary build files
+        fileio.rmtree(config_path)
 
-        if not requirements and use_local_requirements:
-            local_requirements = get_current_environment_requirements()
-            requirements = {
-                f"{package}=={version}"
-                for package, version in local_requirements.items()
-                if package != "zenml"  # exclude ZenML
-            }
-            logger.info(
-                "Using requirements from local environment to build "
-                "docker image: %s",
-                requirements,
-            )
+    logger.info("Finished building docker image.")
+
+
+def build_and_push_docker_image(
+    build_context_path: str,
+    image_name: str,
+    container_registry: "BaseContainerRegistry",
+    entrypoint: Optional[str] = None,
+    dockerfile_path: Optional[str] = None,
+    dockerignore_path: Optional[str] = None,
+    requirements: Optional[AbstractSet[str]] = None,
+    environment_vars: Optional[Dict[str, str]] = None,
+    use_local_requirements: bool = False,
+    base_image: Optional[str] = None,
+) -> str:
+    """Builds a docker image and pushes it, unless it was pushed before.
+
+    The tag of the image gets suffixed with a hash of the Dockerfile, the
+    build context and the active stack (see `compute_build_hash`). If an
+    image with this tag already exists in the container registry, the image
+    is reused and neither built nor pushed again. Set
+    `ZENML_DOCKER_REUSE_IMAGES=false` to always build and push the image.
+
+    If the image is generated with requirements, the requirements are
+    installed in a separate dependency image (see
+    `build_and_push_dependency_image`) which the image is built on top of.
+    Code changes then only rebuild and push the layer with the build context.
+
+    Args:
+        build_context_path: Path to a directory that will be sent to the
+            docker daemon as build context.
+        image_name: The name to use for the created docker image. The build
+            hash is appended to its tag.
+        container_registry: The container registry to push the image to.
+        entrypoint: Optional entrypoint command that gets executed when running
+            a container of the built image.
+        dockerfile_path: Optional path to a dockerfile. If no value is given,
+            a temporary dockerfile will be created.
+        dockerignore_path: Optional path to a dockerignore file. If no value is
+            given, the .dockerignore in the root of the build context will be
+            used if it exists. Otherwise, all files inside `build_context_path`
+            are included in the build context.
+        requirements: Optional list of pip requirements to install. This
+            will only be used if no value is given for `dockerfile_path`.
+        environment_vars: Optional dict of key value pairs that need to be
+            embedded as environment variables in the image.
+        use_local_requirements: If `True` and no values are given for
+            `dockerfile_path` and `requirements`, then the packages installed
+            in the environment of the current python processed will be
+            installed in the docker image.
+        base_image: The image to use as base for the docker image.
+
+    Returns:
+        The digest of the pushed image if available, otherwise its name.
+    """
+    from zenml.repository import Repository
 
-        if dockerfile_path:
-            dockerfile_contents = read_file_contents_as_string(dockerfile_path)
-        else:
-            dockerfile_contents = generate_dockerfile_contents(
-                base_image=base_image or DEFAULT_BASE_IMAGE,
-                entrypoint=entrypoint,
+    if not dockerfile_path:
+        requirements = _get_requirements(
+            requirements, use_local_requirements=use_local_requirements
+        )
+        if requirements:
+            base_image = build_and_push_dependency_image(
+                image_name=image_name,
+                container_registry=container_registry,
                 requirements=requirements,
+                base_image=base_image,
                 environment_vars=environment_vars,
             )
+            requirements = None
+
+    dockerfile_contents = _get_dockerfile_contents(
+        entrypoint=entrypoint,
+        dockerfile_path=dockerfile_path,
+        requirements=requirements,
+        environment_vars=environment_vars,
+        use_local_requirements=False,
+        base_image=base_image,
+    )
+    repo = Repository()
+    build_hash = compute_build_hash(
+        build_context_path=build_context_path,
+        dockerfile_contents=dockerfile_contents,
+        dockerignore_path=dockerignore_path,
+        additional_inputs=[
+            # the active stack gets copied into the image
+            repo.zen_store.get_stack(repo.active_stack_name).json()
+        ],
+    )
+    image_name = tag_with_build_hash(image_name, build_hash)
 
-        build_context = create_custom_build_context(
-            build_context_path=build_context_path,
-            dockerfile_contents=dockerfile_contents,
-            dockerignore_path=dockerignore_path,
-        )
-        # If a custom base image is provided, make sure to always pull the
-        # latest version of that image (if it isn't a locally built image).
-        # If no base image is provided, we use the static default ZenML image so
-        # there is no need to constantly pull
-        pull_base_image = False
-        if base_image:
-            pull_base_image = not is_local_image(base_image)
-
+    if DOCKER_REUSE_IMAGES:
+        registry_digest = get_registry_digest(image_name)
+        if registry_digest:
+            logger.info(
+                "Reusing docker image '%s' as neither the build context, "
+                "the Dockerfile nor the active stack changed since it was "
+                "pushed.",
+                image_name,
+            )
+            return registry_digest
         logger.info(
-            "Building docker image '%s', this might take a while...",
+            "No docker image '%s' found in the container registry.",
             image_name,
         )
 
-        docker_client = DockerClient.from_env()
-        # We use the client api directly here, so we can stream the logs
-        output_stream = docker_client.images.client.api.build(
-            fileobj=build_context,
-            custom_context=True,
-            tag=image_name,
-            pull=pull_base_image,
-            rm=False,  # don't remove intermediate containers
+    config_path = _copy_active_configuration(build_context_path)
+    try:
+        _build_image(
+            build_context_path=build_context_path,
+            image_name=image_name,
+            dockerfile_contents=dockerfile_contents,
+            dockerignore_path=dockerignore_path,
+            base_image=base_image,
         )
-        _process_stream(output_stream)
     finally:
         # Clean up the temporary build files
         fileio.rmtree(config_path)
 
     logger.info("Finished building docker image.")
+    container_registry.push_image(image_name)
+    return get_image_digest(image_name) or image_name
+
+
+def build_and_push_dependency_image(
+    image_name: str,
+    container_registry: "BaseContainerRegistry",
+    requirements: AbstractSet[str],
+    base_image: Optional[str] = None,
+    environment_vars: Optional[Dict[str, str]] = None,
+) -> str:
+    """Builds and pushes an image that only installs requirements.
+
+    The dependency image is pushed to the repository of `image_name` and
+    tagged with a hash of its Dockerfile, which contains the base image, the
+    environment variables and the requirements. It therefore gets reused by
+    all images of this repository that install the same requirements with
+    the same environment on the same base image. If an image with this tag
+    already exists in the container registry, it is neither built nor pushed
+    again.
+
+    Args:
+        image_name: Name of the image that will be built on top of the
+            dependency image.
+        container_registry: The container registry to push the image to.
+        requirements: The pip requirements to install.
+        base_image: The image to use as base for the dependency image.
+        environment_vars: Optional dict of key value pairs that are set as
+            environment variables before installing the requirements.
+
+    Returns:
+        The digest of the pushed dependency image if available, otherwise its
+        name.
+    """
+    base_image = base_image or DEFAULT_BASE_IMAGE
+    dockerfile_contents = generate_dependency_dockerfile_contents(
+        base_image=base_image,
+        requirements=requirements,
+        environment_vars=environment_vars,
+    )
+    requirements_hash = hashlib.sha256(dockerfile_contents.encode())
+    repository, _ = _split_tag(image_name)
+    dependency_image_name = (
+        f"{repository}:{DEPENDENCY_IMAGE_TAG_PREFIX}"
+        f"{requirements_hash.hexdigest()[:BUILD_HASH_LENGTH]}"
+    )
+
+    if DOCKER_REUSE_IMAGES:
+        registry_digest = get_registry_digest(dependency_image_name)
+        if registry_digest:
+            logger.info(
+                "Reusing docker image '%s' with the installed requirements.",
+                dependency_image_name,
+            )
+            return registry_digest
+
+    # The requirements are installed without any build context, so code
+    # changes never invalidate the dependency image
+    with tempfile.TemporaryDirectory() as build_context_path:
+        _build_image(
+            build_context_path=build_context_path,
+            image_name=dependency_image_name,
+            dockerfile_contents=dockerfile_contents,
+            base_image=base_image,
+        )
+    container_registry.push_image(dependency_image_name)
+    return get_image_digest(dependency_image_name) or dependency_image_name
+
+
+def _split_tag(image_name: str) -> Tuple[str, Optional[str]]:
+    """Splits an image name into its repository and its tag.
+
+    Args:
+        image_name: The image name, with or without a tag.
+
+    Returns:
+        The repository and the tag, or `None` if the image name has no tag.
+    """
+    repository, _, tag = image_name.rpartition(":")
+    if repository and "/" not in tag:
+        return repository, tag
+    return image_name, None
+
+
+def tag_with_build_hash(image_name: str, build_hash: str) -> str:
+    """Appends a build hash to the tag of an image name.
+
+    Args:
+        image_name: The image name, with or without a tag.
+        build_hash: The build hash.
+
+    Returns:
+        The image name with the build hash appended to its tag, or used as
+        its tag if the image name has no tag.
+    """
+    build_hash = build_hash[:BUILD_HASH_LENGTH]
+    repository, tag = _split_tag(image_name)
+    if tag:
+        return f"{repository}:{tag}-{build_hash}"
+    return f"{repository}:{build_hash}"
+
+
+def get_registry_digest(image_name: str) -> Optional[str]:
+    """Gets the digest of an image in a container registry.
+
+    Args:
+        image_name: Name of the image including the tag.
+
+    Returns:
+        The repo digest of the image if it exists in the registry, `None`
+        otherwise.
+    """
+    docker_client = DockerClient.from_env()
+    try:
+        registry_data = docker_client.images.get_registry_data(image_name)
+    except APIError as error:
+        # the image doesn't exist or the registry can't be accessed
+        logger.debug(
+            "Failed to get registry data of docker image '%s': %s",
+            image_name,
+            error,
+        )
+        return None
+    repository, _ = _split_tag(image_name)
+    return f"{repository}@{registry_data.id}"
 
 
 def push_docker_image(image_name: str) -> None:
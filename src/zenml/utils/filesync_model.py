@@ -15,16 +15,23 @@
 
 import json
 import os
-from typing import Any, Optional
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
 
 from pydantic import BaseModel
 
+from zenml.constants import CONFIG_REVALIDATION_INTERVAL
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.utils import yaml_utils
 
 logger = get_logger(__name__)
 
+# Number of times each configuration file was written by this process. Used to
+# reload a model right away if another model in this process wrote its file.
+_config_file_generations: Dict[str, int] = {}
+
 
 class FileSyncModel(BaseModel):
     """Pydantic model synchronized with a configuration file.
@@ -35,10 +42,20 @@ class FileSyncModel(BaseModel):
     This class overrides the __setattr__ and __getattr__ magic methods to
     ensure that the FileSyncModel instance acts as an in-memory cache of the
     information stored in the associated configuration file.
+
+    Changes written by other models in the same process are picked up on the
+    next attribute access. Changes written by other processes are picked up
+    at most `ZENML_CONFIG_REVALIDATION_INTERVAL` seconds after the model last
+    checked the configuration file. Use `batch_writes` to write multiple
+    changes to the configuration file at once.
     """
 
     _config_file: str
     _config_file_timestamp: Optional[float]
+    _config_file_generation: int
+    _config_file_checked: Optional[float]
+    _batch_depth: int
+    _write_pending: bool
 
     def __init__(self, config_file: str, **kwargs: Any) -> None:
         """Create a FileSyncModel instance synchronized with a configuration file on disk.
@@ -56,6 +73,10 @@ class FileSyncModel(BaseModel):
 
         self._config_file = config_file
         self._config_file_timestamp = None
+        self._config_file_generation = 0
+        self._config_file_checked = None
+        self._batch_depth = 0
+        self._write_pending = False
 
         config_dict.update(kwargs)
         super(FileSyncModel, self).__init__(**config_dict)
@@ -86,17 +107,67 @@ class FileSyncModel(BaseModel):
             attribute value.
         """
         if not key.startswith("_") and key in self.__dict__:
-            self.load_config()
+            self._revalidate_config()
         return super(FileSyncModel, self).__getattribute__(key)
 
+    @contextmanager
+    def batch_writes(self) -> Iterator[None]:
+        """Writes all changes made inside the context to the file at once.
+
+        Attribute assignments and calls to `write_config` inside the context
+        only update the model in memory. The configuration file is written
+        when the outermost context exits.
+
+        Yields:
+            None.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._write_pending:
+                self.write_config()
+
     def write_config(self) -> None:
         """Writes the model to the configuration file."""
+        if self._batch_depth:
+            self._write_pending = True
+            return
+
         config_dict = json.loads(self.json())
         yaml_utils.write_yaml(self._config_file, config_dict)
         self._config_file_timestamp = os.path.getmtime(self._config_file)
+        self._write_pending = False
+
+        generation = _config_file_generations.get(self._config_file, 0) + 1
+        _config_file_generations[self._config_file] = generation
+        self._config_file_generation = generation
+        self._config_file_checked = time.monotonic()
+
+    def _revalidate_config(self) -> None:
+        """Reloads the model if the configuration file might have changed."""
+        if self._write_pending:
+            # don't overwrite changes that weren't written yet
+            return
+
+        now = time.monotonic()
+        if (
+            self._config_file_generation
+            == _config_file_generations.get(self._config_file, 0)
+            and self._config_file_checked is not None
+            and now - self._config_file_checked < CONFIG_REVALIDATION_INTERVAL
+        ):
+            return
+
+        self.load_config()
+        self._config_file_checked = now
 
     def load_config(self) -> None:
         """Loads the model from the configuration file on disk."""
+        self._config_file_generation = _config_file_generations.get(
+            self._config_file, 0
+        )
         if not fileio.exists(self._config_file):
             return
 
@@ -0,0 +1,123 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions to fingerprint external data read by steps.
+
+Fingerprints are returned by `BaseStepConfig.fingerprint()` and become part
+of the cache key of a step, so the step reruns whenever they change. They
+are meant to be cheap: instead of hashing the data itself, they hash
+metadata like file sizes and modification times.
+
+```python
+from zenml.steps import BaseStepConfig
+from zenml.utils import fingerprint_utils
+
+class TrainerConfig(BaseStepConfig):
+    data_path: str
+    table: str
+
+    def fingerprint(self) -> Optional[str]:
+        row_count, last_update = query_table_stats(self.table)
+        return fingerprint_utils.fingerprint_values(
+            fingerprint_utils.fingerprint_paths(self.data_path),
+            row_count,
+            last_update,
+        )
+```
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List
+
+from zenml.io import fileio
+
+# Keys of the stat info of remote filesystems (s3fs, gcsfs, adlfs) that
+# change whenever the contents of a file change
+REMOTE_STAT_KEYS = (
+    "size",
+    "ETag",
+    "etag",
+    "md5Hash",
+    "generation",
+    "LastModified",
+    "last_modified",
+    "updated",
+    "mtime",
+)
+
+
+def fingerprint_values(*values: Any) -> str:
+    """Computes a fingerprint of arbitrary values.
+
+    Args:
+        *values: JSON serializable values, e.g. the row count and latest
+            timestamp of a table. Other values are converted to strings.
+
+    Returns:
+        The fingerprint of the values.
+    """
+    return hashlib.sha256(
+        json.dumps(values, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _get_file_info(path: str) -> Dict[str, Any]:
+    """Gets the metadata of a file that changes with its contents.
+
+    Args:
+        path: Path of the file.
+
+    Returns:
+        The size and modification time of a local file, or the size,
+        modification time and ETag of a file on a remote filesystem.
+    """
+    stat = fileio.stat(path)
+    if isinstance(stat, os.stat_result):
+        return {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+    return {key: stat[key] for key in REMOTE_STAT_KEYS if key in stat}
+
+
+def fingerprint_paths(*paths: str) -> str:
+    """Computes a fingerprint of files and directories.
+
+    Only the metadata of the files is read, so this is fast even for large
+    files and works on every filesystem supported by the artifact stores.
+
+    Args:
+        *paths: Paths of files or directories. Directories are fingerprinted
+            including all files they contain.
+
+    Returns:
+        The fingerprint of the files.
+
+    Raises:
+        FileNotFoundError: If a path doesn't exist.
+    """
+    files: List[Any] = []
+    for path in paths:
+        path = str(path)
+        if not fileio.exists(path):
+            raise FileNotFoundError(
+                f"Unable to fingerprint '{path}': No such file or directory."
+            )
+        if not fileio.isdir(path):
+            files.append((path, _get_file_info(path)))
+            continue
+
+        for directory, _, file_names in fileio.walk(path):
+            for file_name in file_names:
+                file_path = os.path.join(str(directory), str(file_name))
+                files.append((file_path, _get_file_info(file_path)))
+    return fingerprint_values(sorted(files, key=lambda file: file[0]))
@@ -15,13 +15,22 @@
 
 import fnmatch
 import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional
 
 import click
 from tfx.dsl.io.filesystem import PathType
 
-from zenml.constants import APP_NAME, ENV_ZENML_CONFIG_PATH, REMOTE_FS_PREFIX
+from zenml.constants import (
+    APP_NAME,
+    COPY_MAX_WORKERS,
+    ENV_ZENML_CONFIG_PATH,
+    REMOTE_FS_PREFIX,
+)
 from zenml.io.fileio import (
     copy,
     exists,
@@ -32,6 +41,13 @@ from zenml.io.fileio import (
     open,
     walk,
 )
+from zenml.logger import get_logger
+from zenml.utils.string_utils import (
+    get_human_readable_filesize,
+    get_human_readable_time,
+)
+
+logger = get_logger(__name__)
 
 
 def get_global_config_directory() -> str:
@@ -57,6 +73,34 @@ def write_file_contents_as_string(file_path: str, content: str) -> None:
         f.write(content)
 
 
+def write_file_contents_atomically(file_path: str, content: str) -> None:
+    """Writes contents of a local file atomically.
+
+    The contents are written to a temporary file next to the target file,
+    which then replaces the target file. Readers therefore never see a
+    partially written file, even if the writing process crashes.
+
+    Args:
+        file_path: Path to the local file.
+        content: Contents of the file.
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    file_descriptor, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(file_path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, "w") as f:
+            f.write(content)
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path)
+        else:
+            os.chmod(temp_path, 0o644)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
 def read_file_contents_as_string(file_path: str) -> str:
     """Reads contents of file.
 
@@ -156,31 +200,148 @@ def resolve_relative_path(path: str) -> str:
 
 
 def copy_dir(
-    source_dir: str, destination_dir: str, overwrite: bool = False
+    source_dir: str,
+    destination_dir: str,
+    overwrite: bool = False,
+    max_workers: Optional[int] = None,
 ) -> None:
     """Copies dir from source to destination.
 
+    The files are copied concurrently using a bounded thread pool. If copying
+    any file fails or the copy is interrupted, no new file copies are started
+    and partially written files are removed, but files that were already
+    copied completely are kept.
+
     Args:
         source_dir: Path to copy from.
         destination_dir: Path to copy to.
         overwrite: Boolean. If false, function throws an error before overwrite.
+        max_workers: Maximum number of files to copy at the same time. Defaults
+            to the value of the `ZENML_COPY_MAX_WORKERS` environment variable
+            or 8 if it is not set.
     """
-    for source_file in listdir(source_dir):
-        source_path = os.path.join(source_dir, convert_to_str(source_file))
-        destination_path = os.path.join(
-            destination_dir, convert_to_str(source_file)
+    file_pairs = []
+    for source_root, dirs, files in walk(source_dir):
+        source_root = convert_to_str(source_root)
+        relative_root = os.path.relpath(source_root, source_dir)
+        destination_root = (
+            destination_dir
+            if relative_root == os.curdir
+            else os.path.join(destination_dir, relative_root)
         )
-        if isdir(source_path):
-            if source_path == destination_dir:
-                # if the destination is a subdirectory of the source, we skip
-                # copying it to avoid an infinite loop.
-                return
-            copy_dir(source_path, destination_path, overwrite)
-        else:
-            create_dir_recursive_if_not_exists(
-                str(Path(destination_path).parent)
+        # If the destination is a subdirectory of the source, we skip copying
+        # it to avoid an infinite loop.
+        dirs[:] = [
+            d
+            for d in dirs
+            if os.path.join(source_root, convert_to_str(d)) != destination_dir
+        ]
+        create_dir_recursive_if_not_exists(destination_root)
+        for file in files:
+            file = convert_to_str(file)
+            file_pairs.append(
+                (
+                    os.path.join(source_root, file),
+                    os.path.join(destination_root, file),
+                )
             )
-            copy(str(source_path), str(destination_path), overwrite)
+
+    progress = _CopyProgress(source_dir, destination_dir, len(file_pairs))
+    max_workers = max_workers or COPY_MAX_WORKERS
+    if max_workers == 1 or len(file_pairs) <= 1:
+        for source_path, destination_path in file_pairs:
+            progress.update(copy(source_path, destination_path, overwrite))
+        progress.finish()
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(copy, source_path, destination_path, overwrite)
+            for source_path, destination_path in file_pairs
+        ]
+        try:
+            for future in as_completed(futures):
+                progress.update(future.result())
+        except BaseException:
+            # Don't start any new copies, the running ones will finish or
+            # clean up after themselves before the executor shuts down.
+            for future in futures:
+                future.cancel()
+            raise
+    progress.finish()
+
+
+class _CopyProgress:
+    """Tracks and logs the progress of copying multiple files."""
+
+    LOG_INTERVAL = 10.0
+
+    def __init__(
+        self, source_dir: str, destination_dir: str, total_files: int
+    ) -> None:
+        """Initializes the progress tracker.
+
+        Args:
+            source_dir: Path of the directory that is copied.
+            destination_dir: Path of the directory to copy to.
+            total_files: Total number of files to copy.
+        """
+        self.description = f"`{source_dir}` to `{destination_dir}`"
+        self.total_files = total_files
+        self.copied_files = 0
+        self.streamed_bytes = 0
+        self.start_time = time.time()
+        self.last_log_time = self.start_time
+
+    def update(self, num_bytes: int) -> None:
+        """Records a copied file and logs the progress periodically.
+
+        Args:
+            num_bytes: Number of bytes that were streamed to copy the file.
+        """
+        self.copied_files += 1
+        self.streamed_bytes += num_bytes
+        now = time.time()
+        if now - self.last_log_time >= self.LOG_INTERVAL:
+            self.last_log_time = now
+            logger.info(
+                "Copying %s: %d/%d files (%s).",
+                self.description,
+                self.copied_files,
+                self.total_files,
+                self._get_throughput(now),
+            )
+
+    def finish(self) -> None:
+        """Logs the throughput of the finished copy."""
+        now = time.time()
+        # Only show the summary for copies that were long enough to
+        # already log their progress.
+        log = (
+            logger.info
+            if self.last_log_time > self.start_time
+            else logger.debug
+        )
+        log(
+            "Copied %d files from %s in %s (%s).",
+            self.copied_files,
+            self.description,
+            get_human_readable_time(now - self.start_time),
+            self._get_throughput(now),
+        )
+
+    def _get_throughput(self, now: float) -> str:
+        """Returns a human-readable throughput of the copy.
+
+        Args:
+            now: The current time.
+
+        Returns:
+            The streamed bytes per second.
+        """
+        duration = max(now - self.start_time, 1e-6)
+        bytes_per_second = int(self.streamed_bytes / duration)
+        return f"{get_human_readable_filesize(bytes_per_second)}/s"
 
 
 def get_grandparent(dir_path: str) -> str:
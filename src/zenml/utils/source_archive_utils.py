@@ -0,0 +1,195 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions to ship source code as archives in the artifact store.
+
+Instead of building a new docker image for each code change, orchestrators
+can upload an archive of the source root to the artifact store and run the
+steps in an image that only contains the dependencies. The step entrypoint
+downloads and extracts the archive before importing any user code.
+
+Archives are content-addressed: their name is the hash of their contents, so
+unchanged code is neither uploaded nor downloaded again.
+"""
+
+import gzip
+import hashlib
+import os
+import shutil
+import tarfile
+import tempfile
+from typing import Optional
+
+from zenml.constants import SOURCE_ARCHIVE_CACHE_DIR
+from zenml.io import fileio
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+SOURCE_ARCHIVES_DIRECTORY = "source_archives"
+SOURCE_ARCHIVE_EXTENSION = ".tar.gz"
+
+
+def _reset_tar_info(tar_info: tarfile.TarInfo) -> tarfile.TarInfo:
+    """Removes metadata that would make archives of the same files differ.
+
+    Args:
+        tar_info: The tar info of a file that gets added to an archive.
+
+    Returns:
+        The tar info without modification time and owner.
+    """
+    tar_info.mtime = 0
+    tar_info.uid = tar_info.gid = 0
+    tar_info.uname = tar_info.gname = ""
+    return tar_info
+
+
+def create_source_archive(
+    source_root: str,
+    archive_path: str,
+    dockerignore_path: Optional[str] = None,
+) -> str:
+    """Creates a compressed archive of a source root.
+
+    The archive contains the same files that would be part of a docker
+    build context of the source root. Archives of the same files are byte
+    for byte identical.
+
+    Args:
+        source_root: The directory to archive.
+        archive_path: Path of the archive to create.
+        dockerignore_path: Optional path to a dockerignore file. If no value is
+            given, the .dockerignore in the source root will be used if it
+            exists.
+
+    Returns:
+        The hex digest of the archive.
+    """
+    from zenml.utils import docker_utils
+
+    files = docker_utils.get_build_context_files(
+        source_root, dockerignore_path=dockerignore_path
+    )
+    with open(archive_path, "wb") as f:
+        with gzip.GzipFile(
+            filename="", fileobj=f, mode="wb", mtime=0
+        ) as gzip_file:
+            with tarfile.open(fileobj=gzip_file, mode="w") as tar:
+                for path in files:
+                    tar.add(
+                        os.path.join(source_root, path),
+                        arcname=path,
+                        recursive=False,
+                        filter=_reset_tar_info,
+                    )
+
+    archive_hash = hashlib.sha256()
+    with open(archive_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            archive_hash.update(chunk)
+    return archive_hash.hexdigest()
+
+
+def upload_source_archive(
+    artifact_store_path: str,
+    source_root: str,
+    dockerignore_path: Optional[str] = None,
+) -> str:
+    """Uploads an archive of a source root to the artifact store.
+
+    If an archive with the same contents was uploaded before, it is reused.
+
+    Args:
+        artifact_store_path: Root path of the artifact store.
+        source_root: The directory to archive.
+        dockerignore_path: Optional path to a dockerignore file. If no value is
+            given, the .dockerignore in the source root will be used if it
+            exists.
+
+    Returns:
+        URI of the uploaded archive.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        archive_path = os.path.join(temp_dir, "source.tar.gz")
+        archive_hash = create_source_archive(
+            source_root, archive_path, dockerignore_path=dockerignore_path
+        )
+        archive_directory = os.path.join(
+            artifact_store_path, SOURCE_ARCHIVES_DIRECTORY
+        )
+        archive_uri = os.path.join(
+            archive_directory, archive_hash + SOURCE_ARCHIVE_EXTENSION
+        )
+        if fileio.exists(archive_uri):
+            logger.info("Reusing source archive '%s'.", archive_uri)
+            return archive_uri
+
+        logger.info("Uploading source archive to '%s'.", archive_uri)
+        fileio.makedirs(archive_directory)
+        fileio.copy(archive_path, archive_uri, overwrite=True)
+    return archive_uri
+
+
+def download_source_archive(archive_uri: str) -> str:
+    """Downloads and extracts a source archive, unless it was extracted before.
+
+    Archives are extracted to `ZENML_SOURCE_ARCHIVE_CACHE_DIR`, which can be
+    mounted from the host to share extracted archives between containers
+    running on the same node.
+
+    Args:
+        archive_uri: URI of the archive in the artifact store.
+
+    Returns:
+        Path of the directory with the extracted source root.
+
+    Raises:
+        ValueError: If the archive contains paths outside of the source root.
+        OSError: If the extracted archive can't be moved to the cache.
+    """
+    archive_name = os.path.basename(archive_uri)
+    source_root = os.path.join(
+        SOURCE_ARCHIVE_CACHE_DIR, archive_name[: -len(SOURCE_ARCHIVE_EXTENSION)]
+    )
+    if os.path.isdir(source_root):
+        logger.info("Using cached source archive '%s'.", archive_uri)
+        return source_root
+
+    logger.info("Downloading source archive '%s'.", archive_uri)
+    os.makedirs(SOURCE_ARCHIVE_CACHE_DIR, exist_ok=True)
+    temp_dir = tempfile.mkdtemp(dir=SOURCE_ARCHIVE_CACHE_DIR)
+    try:
+        archive_path = os.path.join(temp_dir, archive_name)
+        fileio.copy(archive_uri, archive_path)
+        extract_path = os.path.join(temp_dir, "source")
+        with tarfile.open(archive_path, mode="r:gz") as tar:
+            for member in tar.getmembers():
+                if os.path.isabs(member.name) or ".." in member.name.split("/"):
+                    raise ValueError(
+                        f"Source archive '{archive_uri}' contains the invalid "
+                        f"path '{member.name}'."
+                    )
+            tar.extractall(extract_path)
+
+        # Other processes on the same node might extract the same archive
+        # concurrently, so the extracted directory is only moved in place
+        # once it's complete
+        try:
+            os.rename(extract_path, source_root)
+        except OSError:
+            if not os.path.isdir(source_root):
+                raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return source_root
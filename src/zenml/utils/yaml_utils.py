@@ -39,13 +39,15 @@ def write_yaml(
     Raises:
         FileNotFoundError: if directory does not exist.
     """
-    if not io_utils.is_remote(file_path):
-        dir_ = str(Path(file_path).parent)
-        if not fileio.isdir(dir_):
-            raise FileNotFoundError(f"Directory {dir_} does not exist.")
-    io_utils.write_file_contents_as_string(
-        file_path, yaml.dump(contents, sort_keys=sort_keys)
-    )
+    content = yaml.dump(contents, sort_keys=sort_keys)
+    if io_utils.is_remote(file_path):
+        io_utils.write_file_contents_as_string(file_path, content)
+        return
+
+    dir_ = str(Path(file_path).parent)
+    if not fileio.isdir(dir_):
+        raise FileNotFoundError(f"Directory {dir_} does not exist.")
+    io_utils.write_file_contents_atomically(file_path, content)
 
 
 def append_yaml(file_path: str, contents: Dict[Any, Any]) -> None:
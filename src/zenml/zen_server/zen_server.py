@@ -24,6 +24,7 @@ from zenml.constants import (
     DEFAULT_LOCAL_SERVICE_IP_ADDRESS,
     ENV_ZENML_PROFILE_NAME,
     ZEN_SERVER_ENTRYPOINT,
+    ZEN_SERVER_MAX_REQUESTS,
 )
 from zenml.enums import StoreType
 from zenml.logger import get_logger
@@ -186,6 +187,10 @@ class ZenServer(LocalDaemonService):
                 host=self.config.ip_address,
                 port=self.endpoint.status.port,
                 log_level="info",
+                # respond with `503 Service Unavailable` to requests beyond
+                # this limit without processing them, so the REST zen store
+                # retries them regardless of their method
+                limit_concurrency=ZEN_SERVER_MAX_REQUESTS,
             )
         except KeyboardInterrupt:
             logger.info("ZenServer stopped. Resuming normal execution.")
@@ -13,10 +13,23 @@
 #  permissions and limitations under the License.
 """Zen Server API."""
 
+import hashlib
 import os
-from typing import Any, Dict, List, Optional
-
-from fastapi import APIRouter, Depends, FastAPI, HTTPException, status
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import UUID
+
+import anyio
+from fastapi import (
+    APIRouter,
+    Depends,
+    FastAPI,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from pydantic import BaseModel
 
@@ -26,6 +39,7 @@ from zenml.config.profile_config import ProfileConfiguration
 from zenml.constants import (
     ENV_ZENML_PROFILE_NAME,
     FLAVORS,
+    PIPELINE_RUN_SUMMARIES,
     PIPELINE_RUNS,
     PROJECTS,
     ROLE_ASSIGNMENTS,
@@ -36,6 +50,7 @@ from zenml.constants import (
     STACKS_EMPTY,
     TEAMS,
     USERS,
+    ZEN_SERVER_THREAD_POOL_SIZE,
 )
 from zenml.enums import StackComponentType, StoreType
 from zenml.exceptions import (
@@ -56,7 +71,10 @@ from zenml.zen_stores.models import (
     Team,
     User,
 )
-from zenml.zen_stores.models.pipeline_models import PipelineRunWrapper
+from zenml.zen_stores.models.pipeline_models import (
+    PipelineRunSummary,
+    PipelineRunWrapper,
+)
 
 profile_name = os.environ.get(ENV_ZENML_PROFILE_NAME)
 
@@ -121,11 +139,69 @@ def authorize(credentials: HTTPBasicCredentials = Depends(security)) -> None:
         )
 
 
+async def add_etag(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Adds an ETag to successful GET responses.
+
+    If the client already has the current version of the response, i.e. its
+    `If-None-Match` header matches the ETag, the body isn't sent again.
+
+    Args:
+        request: The incoming request.
+        call_next: Function that computes the response of the request.
+
+    Returns:
+        The response, or an empty `304 Not Modified` response.
+    """
+    response = await call_next(request)
+    if request.method != "GET" or response.status_code != 200:
+        return response
+
+    body_iterator = response.body_iterator  # type: ignore[attr-defined]
+    body = b"".join([chunk async for chunk in body_iterator])
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    if request.headers.get("If-None-Match") == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    headers = dict(response.headers)
+    headers["ETag"] = etag
+    return Response(
+        content=body,
+        status_code=response.status_code,
+        headers=headers,
+        media_type=response.media_type,
+    )
+
+
 app = FastAPI(title="ZenML", version=zenml.__version__)
+app.middleware("http")(add_etag)
+# compress larger responses (e.g. lists of stacks) for clients that accept it,
+# this has to be added after the ETag middleware so ETags are computed on the
+# uncompressed response
+app.add_middleware(GZipMiddleware, minimum_size=1000)
 authed = APIRouter(
     dependencies=[Depends(authorize)], responses={401: error_response}
 )
 
+
+@app.on_event("startup")
+async def configure_thread_pool() -> None:
+    """Configures the thread pool in which the zen store is called.
+
+    All endpoints that access the zen store are synchronous functions, which
+    FastAPI runs in a thread pool so they don't block the event loop. The
+    file-based local zen store isn't thread-safe, so requests to it are
+    handled one at a time.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    if zen_store.type == StoreType.SQL:
+        limiter.total_tokens = ZEN_SERVER_THREAD_POOL_SIZE
+    else:
+        limiter.total_tokens = 1
+
+
 # to run this file locally, execute:
 # uvicorn zenml.zen_server.zen_server_api:app --reload
 
@@ -188,7 +264,7 @@ async def health() -> str:
 
 
 @authed.get(STACKS_EMPTY, response_model=bool)
-async def stacks_empty() -> bool:
+def stacks_empty() -> bool:
     """Returns whether stacks are registered or not.
 
     Returns:
@@ -202,7 +278,7 @@ async def stacks_empty() -> bool:
     response_model=Dict[StackComponentType, str],
     responses={404: error_response},
 )
-async def get_stack_configuration(name: str) -> Dict[StackComponentType, str]:
+def get_stack_configuration(name: str) -> Dict[StackComponentType, str]:
     """Returns the configuration for the requested stack.
 
     Args:
@@ -224,7 +300,7 @@ async def get_stack_configuration(name: str) -> Dict[StackComponentType, str]:
     STACK_CONFIGURATIONS,
     response_model=Dict[str, Dict[StackComponentType, str]],
 )
-async def stack_configurations() -> Dict[str, Dict[StackComponentType, str]]:
+def stack_configurations() -> Dict[str, Dict[StackComponentType, str]]:
     """Returns configurations for all stacks.
 
     Returns:
@@ -234,7 +310,7 @@ async def stack_configurations() -> Dict[str, Dict[StackComponentType, str]]:
 
 
 @authed.post(STACK_COMPONENTS, responses={409: error_response})
-async def register_stack_component(
+def register_stack_component(
     component: ComponentWrapper,
 ) -> None:
     """Registers a stack component.
@@ -252,7 +328,7 @@ async def register_stack_component(
 
 
 @authed.delete(STACKS + "/{name}", responses={404: error_response})
-async def deregister_stack(name: str) -> None:
+def deregister_stack(name: str) -> None:
     """Deregisters a stack.
 
     Args:
@@ -268,7 +344,7 @@ async def deregister_stack(name: str) -> None:
 
 
 @authed.get(STACKS, response_model=List[StackWrapper])
-async def stacks() -> List[StackWrapper]:
+def stacks() -> List[StackWrapper]:
     """Returns all stacks.
 
     Returns:
@@ -282,7 +358,7 @@ async def stacks() -> List[StackWrapper]:
     response_model=StackWrapper,
     responses={404: error_response},
 )
-async def get_stack(name: str) -> StackWrapper:
+def get_stack(name: str) -> StackWrapper:
     """Returns the requested stack.
 
     Args:
@@ -304,7 +380,7 @@ async def get_stack(name: str) -> StackWrapper:
     STACKS,
     responses={409: error_response},
 )
-async def register_stack(stack: StackWrapper) -> None:
+def register_stack(stack: StackWrapper) -> None:
     """Registers a stack.
 
     Args:
@@ -323,7 +399,7 @@ async def register_stack(stack: StackWrapper) -> None:
     STACKS + "/{name}",
     responses={404: error_response},
 )
-async def update_stack(stack: StackWrapper, name: str) -> None:
+def update_stack(stack: StackWrapper, name: str) -> None:
     """Updates a stack.
 
     Args:
@@ -344,7 +420,7 @@ async def update_stack(stack: StackWrapper, name: str) -> None:
     response_model=Dict[str, str],
     responses={404: error_response},
 )
-async def update_stack_component(
+def update_stack_component(
     name: str,
     component_type: StackComponentType,
     component: ComponentWrapper,
@@ -373,7 +449,7 @@ async def update_stack_component(
     response_model=ComponentWrapper,
     responses={404: error_response},
 )
-async def get_stack_component(
+def get_stack_component(
     component_type: StackComponentType, name: str
 ) -> ComponentWrapper:
     """Returns the requested stack component.
@@ -394,11 +470,44 @@ async def get_stack_component(
         raise not_found(error) from error
 
 
+@authed.get(
+    STACK_COMPONENTS,
+    response_model=List[ComponentWrapper],
+    responses={422: error_response},
+)
+def get_stack_components_by_names(request: Request) -> List[ComponentWrapper]:
+    """Returns multiple stack components at once.
+
+    The components are passed as query parameters mapping the component type
+    to the component name, e.g. `?orchestrator=default&artifact_store=s3`.
+    Each type may be passed multiple times.
+
+    Args:
+        request: The incoming request.
+
+    Returns:
+        The requested components that exist.
+
+    Raises:
+        HTTPException: If a query parameter isn't a stack component type.
+    """
+    try:
+        components = [
+            (StackComponentType(component_type), name)
+            for component_type, name in request.query_params.multi_items()
+        ]
+    except ValueError as error:
+        raise HTTPException(
+            status_code=422, detail=error_detail(error)
+        ) from error
+    return zen_store.get_stack_components_by_names(components)
+
+
 @authed.get(
     STACK_COMPONENTS + "/{component_type}",
     response_model=List[ComponentWrapper],
 )
-async def get_stack_components(
+def get_stack_components(
     component_type: StackComponentType,
 ) -> List[ComponentWrapper]:
     """Returns all stack components for the requested type.
@@ -416,7 +525,7 @@ async def get_stack_components(
     STACK_COMPONENTS + "/{component_type}/{name}",
     responses={404: error_response, 409: error_response},
 )
-async def deregister_stack_component(
+def deregister_stack_component(
     component_type: StackComponentType, name: str
 ) -> None:
     """Deregisters a stack component.
@@ -441,7 +550,7 @@ async def deregister_stack_component(
 
 
 @authed.get(USERS, response_model=List[User])
-async def users() -> List[User]:
+def users() -> List[User]:
     """Returns all users.
 
     Returns:
@@ -451,7 +560,7 @@ async def users() -> List[User]:
 
 
 @authed.get(USERS + "/{name}", responses={404: error_response})
-async def get_user(name: str) -> User:
+def get_user(name: str) -> User:
     """Gets a specific user.
 
     Args:
@@ -474,7 +583,7 @@ async def get_user(name: str) -> User:
     response_model=User,
     responses={409: error_response},
 )
-async def create_user(user: User) -> User:
+def create_user(user: User) -> User:
     """Creates a user.
 
     # noqa: DAR401
@@ -492,7 +601,7 @@ async def create_user(user: User) -> User:
 
 
 @authed.delete(USERS + "/{name}", responses={404: error_response})
-async def delete_user(name: str) -> None:
+def delete_user(name: str) -> None:
     """Deletes a user.
 
     Args:
@@ -512,7 +621,7 @@ async def delete_user(name: str) -> None:
     response_model=List[Team],
     responses={404: error_response},
 )
-async def teams_for_user(name: str) -> List[Team]:
+def teams_for_user(name: str) -> List[Team]:
     """Returns all teams for a user.
 
     Args:
@@ -535,7 +644,7 @@ async def teams_for_user(name: str) -> List[Team]:
     response_model=List[RoleAssignment],
     responses={404: error_response},
 )
-async def role_assignments_for_user(
+def role_assignments_for_user(
     name: str, project_name: Optional[str] = None
 ) -> List[RoleAssignment]:
     """Returns all role assignments for a user.
@@ -559,7 +668,7 @@ async def role_assignments_for_user(
 
 
 @authed.get(TEAMS, response_model=List[Team])
-async def teams() -> List[Team]:
+def teams() -> List[Team]:
     """Returns all teams.
 
     Returns:
@@ -569,7 +678,7 @@ async def teams() -> List[Team]:
 
 
 @authed.get(TEAMS + "/{name}", responses={404: error_response})
-async def get_team(name: str) -> Team:
+def get_team(name: str) -> Team:
     """Gets a specific team.
 
     Args:
@@ -592,7 +701,7 @@ async def get_team(name: str) -> Team:
     response_model=Team,
     responses={409: error_response},
 )
-async def create_team(team: Team) -> Team:
+def create_team(team: Team) -> Team:
     """Creates a team.
 
     Args:
@@ -611,7 +720,7 @@ async def create_team(team: Team) -> Team:
 
 
 @authed.delete(TEAMS + "/{name}", responses={404: error_response})
-async def delete_team(name: str) -> None:
+def delete_team(name: str) -> None:
     """Deletes a team.
 
     Args:
@@ -631,7 +740,7 @@ async def delete_team(name: str) -> None:
     response_model=List[User],
     responses={404: error_response},
 )
-async def users_for_team(name: str) -> List[User]:
+def users_for_team(name: str) -> List[User]:
     """Returns all users for a team.
 
     Args:
@@ -650,7 +759,7 @@ async def users_for_team(name: str) -> List[User]:
 
 
 @authed.post(TEAMS + "/{name}/users", responses={404: error_response})
-async def add_user_to_team(name: str, user: User) -> None:
+def add_user_to_team(name: str, user: User) -> None:
     """Adds a user to a team.
 
     Args:
@@ -669,7 +778,7 @@ async def add_user_to_team(name: str, user: User) -> None:
 @authed.delete(
     TEAMS + "/{team_name}/users/{user_name}", responses={404: error_response}
 )
-async def remove_user_from_team(team_name: str, user_name: str) -> None:
+def remove_user_from_team(team_name: str, user_name: str) -> None:
     """Removes a user from a team.
 
     Args:
@@ -692,7 +801,7 @@ async def remove_user_from_team(team_name: str, user_name: str) -> None:
     response_model=List[RoleAssignment],
     responses={404: error_response},
 )
-async def role_assignments_for_team(
+def role_assignments_for_team(
     name: str, project_name: Optional[str] = None
 ) -> List[RoleAssignment]:
     """Gets all role assignments for a team.
@@ -716,7 +825,7 @@ async def role_assignments_for_team(
 
 
 @authed.get(PROJECTS, response_model=List[Project])
-async def projects() -> List[Project]:
+def projects() -> List[Project]:
     """Returns all projects.
 
     Returns:
@@ -730,7 +839,7 @@ async def projects() -> List[Project]:
     response_model=Project,
     responses={404: error_response},
 )
-async def get_project(project_name: str) -> Project:
+def get_project(project_name: str) -> Project:
     """Get a project for given name.
 
     # noqa: DAR401
@@ -752,7 +861,7 @@ async def get_project(project_name: str) -> Project:
     response_model=Project,
     responses={409: error_response},
 )
-async def create_project(project: Project) -> Project:
+def create_project(project: Project) -> Project:
     """Creates a project.
 
     # noqa: DAR401
@@ -772,7 +881,7 @@ async def create_project(project: Project) -> Project:
 
 
 @authed.delete(PROJECTS + "/{name}", responses={404: error_response})
-async def delete_project(name: str) -> None:
+def delete_project(name: str) -> None:
     """Deletes a project.
 
     Args:
@@ -788,7 +897,7 @@ async def delete_project(name: str) -> None:
 
 
 @authed.get(ROLES, response_model=List[Role])
-async def roles() -> List[Role]:
+def roles() -> List[Role]:
     """Returns all roles.
 
     Returns:
@@ -798,7 +907,7 @@ async def roles() -> List[Role]:
 
 
 @authed.get(ROLES + "/{name}", responses={404: error_response})
-async def get_role(name: str) -> Role:
+def get_role(name: str) -> Role:
     """Gets a specific role.
 
     Args:
@@ -821,7 +930,7 @@ async def get_role(name: str) -> Role:
     response_model=Role,
     responses={409: error_response},
 )
-async def create_role(role: Role) -> Role:
+def create_role(role: Role) -> Role:
     """Creates a role.
 
     # noqa: DAR401
@@ -839,7 +948,7 @@ async def create_role(role: Role) -> Role:
 
 
 @authed.delete(ROLES + "/{name}", responses={404: error_response})
-async def delete_role(name: str) -> None:
+def delete_role(name: str) -> None:
     """Deletes a role.
 
     Args:
@@ -855,7 +964,7 @@ async def delete_role(name: str) -> None:
 
 
 @authed.get(ROLE_ASSIGNMENTS, response_model=List[RoleAssignment])
-async def role_assignments() -> List[RoleAssignment]:
+def role_assignments() -> List[RoleAssignment]:
     """Returns all role assignments.
 
     Returns:
@@ -868,7 +977,7 @@ async def role_assignments() -> List[RoleAssignment]:
     ROLE_ASSIGNMENTS,
     responses={404: error_response},
 )
-async def assign_role(data: Dict[str, Any]) -> None:
+def assign_role(data: Dict[str, Any]) -> None:
     """Assigns a role.
 
     Args:
@@ -894,7 +1003,7 @@ async def assign_role(data: Dict[str, Any]) -> None:
 
 
 @authed.delete(ROLE_ASSIGNMENTS, responses={404: error_response})
-async def revoke_role(data: Dict[str, Any]) -> None:
+def revoke_role(data: Dict[str, Any]) -> None:
     """Revokes a role.
 
     Args:
@@ -920,23 +1029,93 @@ async def revoke_role(data: Dict[str, Any]) -> None:
 
 
 @authed.get(
-    PIPELINE_RUNS + "/{pipeline_name}", response_model=List[PipelineRunWrapper]
+    PIPELINE_RUNS + "/{pipeline_name}",
+    response_model=List[PipelineRunWrapper],
+    responses={404: error_response},
 )
-async def pipeline_runs(
-    pipeline_name: str, project_name: Optional[str] = None
+def pipeline_runs(
+    pipeline_name: str,
+    project_name: Optional[str] = None,
+    user_id: Optional[UUID] = None,
+    since: Optional[datetime] = None,
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+    descending: bool = False,
 ) -> List[PipelineRunWrapper]:
-    """Returns all runs for a pipeline.
+    """Returns the runs for a pipeline, ordered by their creation time.
 
     Args:
         pipeline_name: Name of the pipeline.
         project_name: Name of the project.
+        user_id: Id of the user who created the runs.
+        since: Time since which the runs were created.
+        after: Name of the run after which to return runs.
+        limit: Maximum number of runs to return.
+        descending: Whether to return the most recent runs first.
 
     Returns:
-        All runs for a pipeline.
+        The runs for a pipeline.
+
+    Raises:
+        not_found: when the `after` run doesn't exist.
     """
-    return zen_store.get_pipeline_runs(
-        pipeline_name=pipeline_name, project_name=project_name
-    )
+    try:
+        return zen_store.get_pipeline_runs(
+            pipeline_name=pipeline_name,
+            project_name=project_name,
+            user_id=user_id,
+            since=since,
+            after=after,
+            limit=limit,
+            descending=descending,
+        )
+    except KeyError as error:
+        raise not_found(error) from error
+
+
+@authed.get(
+    PIPELINE_RUN_SUMMARIES + "/{pipeline_name}",
+    response_model=List[PipelineRunSummary],
+    responses={404: error_response},
+)
+def pipeline_run_summaries(
+    pipeline_name: str,
+    project_name: Optional[str] = None,
+    user_id: Optional[UUID] = None,
+    since: Optional[datetime] = None,
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+    descending: bool = False,
+) -> List[PipelineRunSummary]:
+    """Returns summaries of the runs for a pipeline.
+
+    Args:
+        pipeline_name: Name of the pipeline.
+        project_name: Name of the project.
+        user_id: Id of the user who created the runs.
+        since: Time since which the runs were created.
+        after: Name of the run after which to return runs.
+        limit: Maximum number of runs to return.
+        descending: Whether to return the most recent runs first.
+
+    Returns:
+        Summaries of the runs for a pipeline, ordered by their creation time.
+
+    Raises:
+        not_found: when the `after` run doesn't exist.
+    """
+    try:
+        return zen_store.get_pipeline_run_summaries(
+            pipeline_name=pipeline_name,
+            project_name=project_name,
+            user_id=user_id,
+            since=since,
+            after=after,
+            limit=limit,
+            descending=descending,
+        )
+    except KeyError as error:
+        raise not_found(error) from error
 
 
 @authed.get(
@@ -944,7 +1123,7 @@ async def pipeline_runs(
     response_model=PipelineRunWrapper,
     responses={404: error_response},
 )
-async def pipeline_run(
+def pipeline_run(
     pipeline_name: str, run_name: str, project_name: Optional[str] = None
 ) -> PipelineRunWrapper:
     """Returns a single pipeline run.
@@ -974,7 +1153,7 @@ async def pipeline_run(
     PIPELINE_RUNS,
     responses={409: error_response},
 )
-async def register_pipeline_run(pipeline_run: PipelineRunWrapper) -> None:
+def register_pipeline_run(pipeline_run: PipelineRunWrapper) -> None:
     """Registers a pipeline run.
 
     # noqa: DAR401
@@ -992,7 +1171,7 @@ async def register_pipeline_run(pipeline_run: PipelineRunWrapper) -> None:
 
 
 @authed.get(FLAVORS, response_model=List[FlavorWrapper])
-async def flavors() -> List[FlavorWrapper]:
+def flavors() -> List[FlavorWrapper]:
     """Get all flavors.
 
     Returns:
@@ -1006,7 +1185,7 @@ async def flavors() -> List[FlavorWrapper]:
     response_model=FlavorWrapper,
     responses={409: error_response},
 )
-async def create_flavor(flavor: FlavorWrapper) -> FlavorWrapper:
+def create_flavor(flavor: FlavorWrapper) -> FlavorWrapper:
     """Creates a flavor.
 
     # noqa: DAR401
@@ -1028,7 +1207,7 @@ async def create_flavor(flavor: FlavorWrapper) -> FlavorWrapper:
 
 
 @authed.get(FLAVORS + "/{component_type}", responses={404: error_response})
-async def get_flavor_by_type(
+def get_flavor_by_type(
     component_type: StackComponentType,
 ) -> List[FlavorWrapper]:
     """Returns all flavors of a given type.
@@ -1051,7 +1230,7 @@ async def get_flavor_by_type(
 @authed.get(
     FLAVORS + "/{component_type}/{name}", responses={404: error_response}
 )
-async def get_flavor_by_type_and_name(
+def get_flavor_by_type_and_name(
     component_type: StackComponentType, name: str
 ) -> FlavorWrapper:
     """Returns a flavor of a given type and name.
@@ -14,12 +14,28 @@
 """Base Zen Store implementation."""
 
 import base64
+import time
 from abc import ABC, abstractmethod
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from uuid import UUID
 
 import yaml
+from pydantic import BaseModel
 
+from zenml.constants import ZEN_STORE_CACHE_TTL
 from zenml.enums import StackComponentType, StoreType
 from zenml.exceptions import StackComponentExistsError, StackExistsError
 from zenml.logger import get_logger
@@ -35,16 +51,25 @@ from zenml.zen_stores.models import (
     Team,
     User,
 )
-from zenml.zen_stores.models.pipeline_models import PipelineRunWrapper
+from zenml.zen_stores.models.pipeline_models import (
+    PipelineRunSummary,
+    PipelineRunWrapper,
+)
 
 logger = get_logger(__name__)
 
 DEFAULT_USERNAME = "default"
 
+T = TypeVar("T", bound=BaseModel)
+
 
 class BaseZenStore(ABC):
     """Base class for accessing data in ZenML Repository and new Service."""
 
+    # Local and SQL zen stores are cheap to query and may be modified by other
+    # processes at any time, so they don't cache entities by default
+    DEFAULT_CACHE_TTL: ClassVar[int] = 0
+
     def initialize(
         self,
         url: str,
@@ -71,6 +96,7 @@ class BaseZenStore(ABC):
             The initialized concrete store instance.
         """
         self._track_analytics = track_analytics
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
         if not skip_default_registrations:
             if self.stacks_empty:
                 logger.info("Registering default stack...")
@@ -655,16 +681,80 @@ class BaseZenStore(ABC):
 
     @abstractmethod
     def get_pipeline_runs(
-        self, pipeline_name: str, project_name: Optional[str] = None
+        self,
+        pipeline_name: str,
+        project_name: Optional[str] = None,
+        user_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
     ) -> List[PipelineRunWrapper]:
         """Gets pipeline runs.
 
+        Runs are ordered by their creation time, oldest first unless
+        `descending` is set. To fetch the runs page by page, pass the name of
+        the last run of the previous page as `after`. The latest `N` runs are
+        returned with `descending=True, limit=N`.
+
         Args:
             pipeline_name: Name of the pipeline for which to get runs.
             project_name: Optional name of the project from which to get the
                 pipeline runs.
+            user_id: Optional id of the user who created the pipeline runs.
+            since: Optional time since which the pipeline runs were created.
+            after: Optional name of a pipeline run. If given, only runs
+                that follow this run in the requested order are returned.
+            limit: Optional maximum number of runs to return.
+            descending: If `True`, the most recent runs are returned first.
+
+        Raises:
+            KeyError: If `after` is given but no pipeline run with this name
+                exists.
         """
 
+    def get_pipeline_run_summaries(
+        self,
+        pipeline_name: str,
+        project_name: Optional[str] = None,
+        user_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
+    ) -> List[PipelineRunSummary]:
+        """Gets summaries of pipeline runs.
+
+        Summaries don't include the pipeline, stack and runtime configuration
+        of the runs, which makes them much cheaper to fetch.
+
+        Args:
+            pipeline_name: Name of the pipeline for which to get runs.
+            project_name: Optional name of the project from which to get the
+                pipeline runs.
+            user_id: Optional id of the user who created the pipeline runs.
+            since: Optional time since which the pipeline runs were created.
+            after: Optional name of a pipeline run. If given, only runs
+                that follow this run in the requested order are returned.
+            limit: Optional maximum number of runs to return.
+            descending: If `True`, the most recent runs are returned first.
+
+        Returns:
+            Summaries of the pipeline runs, ordered by their creation time.
+        """
+        return [
+            PipelineRunSummary.from_pipeline_run_wrapper(run)
+            for run in self.get_pipeline_runs(
+                pipeline_name=pipeline_name,
+                project_name=project_name,
+                user_id=user_id,
+                since=since,
+                after=after,
+                limit=limit,
+                descending=descending,
+            )
+        ]
+
     @abstractmethod
     def register_pipeline_run(
         self,
@@ -727,7 +817,7 @@ class BaseZenStore(ABC):
         """
 
     @abstractmethod
-    def get_flavor_by_name_and_type(
+    def _get_flavor_by_name_and_type(
         self,
         flavor_name: str,
         component_type: StackComponentType,
@@ -763,13 +853,15 @@ class BaseZenStore(ABC):
     def get_stack(self, name: str) -> StackWrapper:
         """Fetch a stack by name.
 
+        Stacks are cached for `cache_ttl` seconds.
+
         Args:
             name: The name of the stack to retrieve.
 
         Returns:
             StackWrapper instance if the stack exists.
         """
-        return self._stack_from_dict(name, self.get_stack_configuration(name))
+        return self._get_cached(("stack", name), lambda: self._get_stack(name))
 
     def _register_stack(self, stack: StackWrapper) -> None:
         """Register a stack and its components.
@@ -782,6 +874,8 @@ class BaseZenStore(ABC):
 
         Raises:
             StackExistsError: If a stack with the same name already exists.
+            StackComponentExistsError: If a different component with the same
+                type and name as one of the stack's components exists.
         """
         try:
             self.get_stack(stack.name)
@@ -793,38 +887,19 @@ class BaseZenStore(ABC):
                 f"existing stack with this name."
             )
 
-        def __check_component(
-            component: ComponentWrapper,
-        ) -> Tuple[StackComponentType, str]:
-            """Try to register a stack component, if it doesn't exist.
-
-            Args:
-                component: StackComponentWrapper to register.
-
-            Returns:
-                The type and name of the component.
-
-            Raises:
-                StackComponentExistsError: If a component with same name exists.
-            """
-            try:
-                existing_component = self.get_stack_component(
-                    component_type=component.type, name=component.name
+        existing_components = self._get_existing_components(stack)
+        for component in stack.components:
+            existing_component = existing_components.get(
+                (component.type, component.name)
+            )
+            if existing_component and existing_component.uuid != component.uuid:
+                raise StackComponentExistsError(
+                    f"Unable to register one of the stacks components: "
+                    f"A component of type '{component.type}' and name "
+                    f"'{component.name}' already exists."
                 )
-                if existing_component.uuid != component.uuid:
-                    raise StackComponentExistsError(
-                        f"Unable to register one of the stacks components: "
-                        f"A component of type '{component.type}' and name "
-                        f"'{component.name}' already exists."
-                    )
-            except KeyError:
-                self._register_stack_component(component)
-            return component.type, component.name
 
-        stack_configuration = {
-            typ: name for typ, name in map(__check_component, stack.components)
-        }
-        self._save_stack(stack.name, stack_configuration)
+        self._save_stack_with_components(stack, existing_components)
         logger.info("Registered stack with name '%s'.", stack.name)
 
     def _update_stack(self, name: str, stack: StackWrapper) -> None:
@@ -859,29 +934,9 @@ class BaseZenStore(ABC):
         except KeyError:
             pass
 
-        def __check_component(
-            component: ComponentWrapper,
-        ) -> Tuple[StackComponentType, str]:
-            """Try to register a stack component, if it doesn't exist.
-
-            Args:
-                component: StackComponentWrapper to register.
-
-            Returns:
-                The type and name of the component.
-            """
-            try:
-                _ = self.get_stack_component(
-                    component_type=component.type, name=component.name
-                )
-            except KeyError:
-                self._register_stack_component(component)
-            return component.type, component.name
-
-        stack_configuration = {
-            typ: name for typ, name in map(__check_component, stack.components)
-        }
-        self._save_stack(stack.name, stack_configuration)
+        self._save_stack_with_components(
+            stack, self._get_existing_components(stack)
+        )
 
         logger.info("Updated stack with name '%s'.", name)
         if name != stack.name:
@@ -892,6 +947,59 @@ class BaseZenStore(ABC):
     ) -> ComponentWrapper:
         """Get a registered stack component.
 
+        Stack components are cached for `cache_ttl` seconds.
+
+        Args:
+            component_type: The type of the component.
+            name: The name of the component.
+
+        Returns:
+            The component.
+        """
+        return self._get_cached(
+            ("stack_component", component_type, name),
+            lambda: self._get_stack_component(component_type, name=name),
+        )
+
+    def get_flavor_by_name_and_type(
+        self,
+        flavor_name: str,
+        component_type: StackComponentType,
+    ) -> FlavorWrapper:
+        """Fetch a flavor by a given name and type.
+
+        Flavors are cached for `cache_ttl` seconds.
+
+        Args:
+            flavor_name: The name of the flavor.
+            component_type: Optional, the type of the component.
+
+        Returns:
+            Flavor instance if it exists
+        """
+        return self._get_cached(
+            ("flavor", component_type, flavor_name),
+            lambda: self._get_flavor_by_name_and_type(
+                flavor_name=flavor_name, component_type=component_type
+            ),
+        )
+
+    def _get_stack(self, name: str) -> StackWrapper:
+        """Fetch a stack by name, bypassing the cache.
+
+        Args:
+            name: The name of the stack to retrieve.
+
+        Returns:
+            StackWrapper instance if the stack exists.
+        """
+        return self._stack_from_dict(name, self.get_stack_configuration(name))
+
+    def _get_stack_component(
+        self, component_type: StackComponentType, name: str
+    ) -> ComponentWrapper:
+        """Get a registered stack component, bypassing the cache.
+
         Args:
             component_type: The type of the component.
             name: The name of the component.
@@ -902,13 +1010,8 @@ class BaseZenStore(ABC):
         flavor, config = self._get_component_flavor_and_config(
             component_type, name=name
         )
-        uuid = yaml.safe_load(base64.b64decode(config).decode())["uuid"]
-        return ComponentWrapper(
-            type=component_type,
-            flavor=flavor,
-            name=name,
-            uuid=uuid,
-            config=config,
+        return self._component_wrapper_from_config(
+            component_type, name=name, flavor=flavor, config=config
         )
 
     def get_stack_components(
@@ -927,6 +1030,28 @@ class BaseZenStore(ABC):
             for name in self._get_stack_component_names(component_type)
         ]
 
+    def get_stack_components_by_names(
+        self, components: Sequence[Tuple[StackComponentType, str]]
+    ) -> List[ComponentWrapper]:
+        """Fetches multiple registered stack components at once.
+
+        Args:
+            components: Types and names of the components to fetch.
+
+        Returns:
+            The components that exist, in the order they were requested.
+            Components that don't exist are omitted.
+        """
+        existing_components = []
+        for component_type, name in components:
+            try:
+                existing_components.append(
+                    self.get_stack_component(component_type, name=name)
+                )
+            except KeyError:
+                pass
+        return existing_components
+
     def deregister_stack_component(
         self, component_type: StackComponentType, name: str
     ) -> None:
@@ -947,7 +1072,10 @@ class BaseZenStore(ABC):
                     f"{component_type}, name: {name}) that is part of a "
                     f"registered stack (stack name: '{stack_name}')."
                 )
-        self._delete_stack_component(component_type, name=name)
+        try:
+            self._delete_stack_component(component_type, name=name)
+        finally:
+            self._invalidate_cache()
 
     def register_default_stack(self) -> None:
         """Populates the store with the default Stack.
@@ -957,7 +1085,10 @@ class BaseZenStore(ABC):
         """
         stack = Stack.default_local_stack()
         sw = StackWrapper.from_stack(stack)
-        self._register_stack(sw)
+        try:
+            self._register_stack(sw)
+        finally:
+            self._invalidate_cache()
         metadata = {c.type.value: c.flavor for c in sw.components}
         metadata["store_type"] = self.type.value
         self._track_event(
@@ -993,6 +1124,142 @@ class BaseZenStore(ABC):
             return track_event(event, metadata)
         return False
 
+    def _get_existing_components(
+        self, stack: StackWrapper
+    ) -> Dict[Tuple[StackComponentType, str], ComponentWrapper]:
+        """Fetches the registered components of a stack in a single call.
+
+        Args:
+            stack: The stack whose components to fetch.
+
+        Returns:
+            Dictionary mapping the type and name of all registered components
+            of the stack to the component.
+        """
+        return {
+            (component.type, component.name): component
+            for component in self.get_stack_components_by_names(
+                [
+                    (component.type, component.name)
+                    for component in stack.components
+                ]
+            )
+        }
+
+    def _save_stack_with_components(
+        self,
+        stack: StackWrapper,
+        existing_components: Dict[
+            Tuple[StackComponentType, str], ComponentWrapper
+        ],
+    ) -> None:
+        """Registers the missing components of a stack and saves the stack.
+
+        If saving the stack or registering any of its components fails, the
+        components that were registered by this method are deleted again.
+
+        Args:
+            stack: The stack to save.
+            existing_components: The components of the stack which are
+                already registered.
+
+        Raises:
+            Exception: If registering a component or saving the stack failed.
+        """
+        registered_components: List[ComponentWrapper] = []
+        try:
+            for component in stack.components:
+                if (component.type, component.name) not in existing_components:
+                    self._register_stack_component(component)
+                    registered_components.append(component)
+            self._save_stack(
+                stack.name,
+                {
+                    component.type: component.name
+                    for component in stack.components
+                },
+            )
+        except Exception:
+            for component in registered_components:
+                try:
+                    self._delete_stack_component(
+                        component.type, name=component.name
+                    )
+                except KeyError:
+                    pass
+            raise
+
+    @property
+    def cache_ttl(self) -> int:
+        """Seconds for which stacks, components and flavors are cached.
+
+        Returns:
+            The value of the `ZENML_STORE_CACHE_TTL` environment variable if
+            set, the default cache TTL of the store implementation otherwise.
+            A value of 0 disables the cache.
+        """
+        if ZEN_STORE_CACHE_TTL is None:
+            return self.DEFAULT_CACHE_TTL
+        return ZEN_STORE_CACHE_TTL
+
+    def _get_cached(self, key: Tuple[Any, ...], fetch: Callable[[], T]) -> T:
+        """Fetch an entity from the cache or the store.
+
+        Entities stay cached for `cache_ttl` seconds or until this store
+        writes any stack, stack component or flavor. Missing entities are not
+        cached, so entities registered by other processes show up right away.
+
+        Args:
+            key: The cache key of the entity.
+            fetch: Function that fetches the entity from the store.
+
+        Returns:
+            A copy of the cached entity.
+        """
+        cache_ttl = self.cache_ttl
+        if cache_ttl <= 0:
+            return fetch()
+
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is None or now - cached[0] > cache_ttl:
+            cached = (now, fetch())
+            self._cache[key] = cached
+
+        # callers may modify the entity, so never hand out the cached instance
+        return cached[1].copy(deep=True)  # type: ignore[no-any-return]
+
+    def _invalidate_cache(self) -> None:
+        """Invalidates all cached entities."""
+        self._cache.clear()
+
+    @staticmethod
+    def _component_wrapper_from_config(
+        component_type: StackComponentType,
+        name: str,
+        flavor: str,
+        config: bytes,
+    ) -> ComponentWrapper:
+        """Build a ComponentWrapper from a stored flavor and configuration.
+
+        Args:
+            component_type: The type of the component.
+            name: The name of the component.
+            flavor: The flavor of the component.
+            config: The base64-encoded yaml configuration of the component.
+
+        Returns:
+            A ComponentWrapper instance.
+        """
+        uuid = yaml.safe_load(base64.b64decode(config).decode())["uuid"]
+        return ComponentWrapper(
+            type=component_type,
+            flavor=flavor,
+            name=name,
+            uuid=uuid,
+            config=config,
+        )
+
     def _stack_from_dict(
         self, name: str, stack_configuration: Dict[StackComponentType, str]
     ) -> StackWrapper:
@@ -1037,7 +1304,10 @@ class BaseZenStore(ABC):
             AnalyticsEvent.REGISTERED_STACK_COMPONENT,
             metadata=analytics_metadata,
         )
-        return self._register_stack_component(component)
+        try:
+            return self._register_stack_component(component)
+        finally:
+            self._invalidate_cache()
 
     def update_stack_component(
         self,
@@ -1063,7 +1333,10 @@ class BaseZenStore(ABC):
             AnalyticsEvent.UPDATED_STACK_COMPONENT,
             metadata=analytics_metadata,
         )
-        return self._update_stack_component(name, component_type, component)
+        try:
+            return self._update_stack_component(name, component_type, component)
+        finally:
+            self._invalidate_cache()
 
     def deregister_stack(self, name: str) -> None:
         """Delete a stack from storage.
@@ -1075,7 +1348,10 @@ class BaseZenStore(ABC):
             None.
         """
         # No tracking events, here for consistency
-        return self._deregister_stack(name)
+        try:
+            return self._deregister_stack(name)
+        finally:
+            self._invalidate_cache()
 
     def create_user(self, user_name: str) -> User:
         """Creates a new user.
@@ -1247,7 +1523,10 @@ class BaseZenStore(ABC):
             AnalyticsEvent.CREATED_FLAVOR,
             metadata=analytics_metadata,
         )
-        return self._create_flavor(source, name, stack_component_type)
+        try:
+            return self._create_flavor(source, name, stack_component_type)
+        finally:
+            self._invalidate_cache()
 
     def register_stack(self, stack: StackWrapper) -> None:
         """Register a stack and its components.
@@ -1264,7 +1543,10 @@ class BaseZenStore(ABC):
         metadata = {c.type.value: c.flavor for c in stack.components}
         metadata["store_type"] = self.type.value
         track_event(AnalyticsEvent.REGISTERED_STACK, metadata=metadata)
-        return self._register_stack(stack)
+        try:
+            return self._register_stack(stack)
+        finally:
+            self._invalidate_cache()
 
     def update_stack(self, name: str, stack: StackWrapper) -> None:
         """Update a stack and its components.
@@ -1282,4 +1564,7 @@ class BaseZenStore(ABC):
         metadata = {c.type.value: c.flavor for c in stack.components}
         metadata["store_type"] = self.type.value
         track_event(AnalyticsEvent.UPDATED_STACK, metadata=metadata)
-        return self._update_stack(name, stack)
+        try:
+            return self._update_stack(name, stack)
+        finally:
+            self._invalidate_cache()
@@ -17,6 +17,7 @@ import base64
 import itertools
 import os
 import re
+from datetime import datetime
 from pathlib import Path
 from typing import (
     Any,
@@ -43,12 +44,13 @@ from zenml.zen_stores.models import (
     Project,
     Role,
     RoleAssignment,
+    StackWrapper,
     Team,
     User,
     ZenStoreModel,
-    ZenStorePipelineModel,
 )
 from zenml.zen_stores.models.pipeline_models import PipelineRunWrapper
+from zenml.zen_stores.pipeline_run_log import PipelineRunLog
 
 logger = get_logger(__name__)
 
@@ -144,8 +146,9 @@ class LocalZenStore(BaseZenStore):
         else:
             self.__store = ZenStoreModel(str(self.root / "stacks.yaml"))
 
-        self.__pipeline_store = ZenStorePipelineModel(
-            str(self.root / "pipeline_runs.yaml")
+        self.__pipeline_store = PipelineRunLog(
+            log_file=str(self.root / "pipeline_runs.jsonl"),
+            legacy_file=str(self.root / "pipeline_runs.yaml"),
         )
 
         super().initialize(url, *args, **kwargs)
@@ -257,6 +260,31 @@ class LocalZenStore(BaseZenStore):
         """
         return self.__store.stacks.copy()
 
+    def _register_stack(self, stack: StackWrapper) -> None:
+        """Register a stack and its components.
+
+        The stack and all components registered along with it are written to
+        the configuration file at once.
+
+        Args:
+            stack: The stack to register.
+        """
+        with self.__store.batch_writes():
+            super()._register_stack(stack)
+
+    def _update_stack(self, name: str, stack: StackWrapper) -> None:
+        """Update a stack and its components.
+
+        The stack and all components registered along with it are written to
+        the configuration file at once.
+
+        Args:
+            name: The original name of the stack.
+            stack: The new stack to use in the update.
+        """
+        with self.__store.batch_writes():
+            super()._update_stack(name, stack)
+
     def _register_stack_component(
         self,
         component: ComponentWrapper,
@@ -961,23 +989,52 @@ class LocalZenStore(BaseZenStore):
         )
 
     def get_pipeline_runs(
-        self, pipeline_name: str, project_name: Optional[str] = None
+        self,
+        pipeline_name: str,
+        project_name: Optional[str] = None,
+        user_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
     ) -> List[PipelineRunWrapper]:
         """Gets pipeline runs.
 
+        Runs are ordered by their creation time, oldest first unless
+        `descending` is set. To fetch the runs page by page, pass the name of
+        the last run of the previous page as `after`. The latest `N` runs are
+        returned with `descending=True, limit=N`.
+
         Args:
             pipeline_name: Name of the pipeline for which to get runs.
             project_name: Optional name of the project from which to get the
                 pipeline runs.
+            user_id: Optional id of the user who created the pipeline runs.
+            since: Optional time since which the pipeline runs were created.
+            after: Optional name of a pipeline run. If given, only runs
+                that follow this run in the requested order are returned.
+            limit: Optional maximum number of runs to return.
+            descending: If `True`, the most recent runs are returned first.
 
         Returns:
             List of pipeline runs.
         """
-        runs = self.__pipeline_store.pipeline_runs[pipeline_name]
+        runs = sorted(
+            self.__pipeline_store.pipeline_runs[pipeline_name],
+            key=lambda run: (run.create_time, run.name),
+            reverse=descending,
+        )
+        if after is not None:
+            cursor = _get_unique_entity(entity_name=after, collection=runs)
+            runs = runs[runs.index(cursor) + 1 :]
         if project_name:
             runs = [run for run in runs if run.project_name == project_name]
+        if user_id:
+            runs = [run for run in runs if run.user_id == user_id]
+        if since:
+            runs = [run for run in runs if run.create_time >= since]
 
-        return runs
+        return runs[:limit]
 
     def register_pipeline_run(
         self,
@@ -1007,10 +1064,7 @@ class LocalZenStore(BaseZenStore):
                 "Please make sure your pipeline run names are unique."
             )
 
-        self.__pipeline_store.pipeline_runs[pipeline_run.pipeline.name].append(
-            pipeline_run
-        )
-        self.__pipeline_store.write_config()
+        self.__pipeline_store.append(pipeline_run)
 
     # Handling stack component flavors
 
@@ -1081,7 +1135,7 @@ class LocalZenStore(BaseZenStore):
             if f.type == component_type
         ]
 
-    def get_flavor_by_name_and_type(
+    def _get_flavor_by_name_and_type(
         self,
         flavor_name: str,
         component_type: StackComponentType,
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Pipeline models implementation."""
 
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 from uuid import UUID
 
@@ -135,6 +136,7 @@ class PipelineRunWrapper(BaseModel):
         runtime_configuration: Runtime configuration that was used for this run.
         user_id: Id of the user that ran this pipeline.
         project_name: Name of the project that this pipeline was run in.
+        create_time: Time at which this pipeline run was created.
     """
 
     name: str
@@ -147,3 +149,54 @@ class PipelineRunWrapper(BaseModel):
 
     user_id: UUID
     project_name: Optional[str]
+    create_time: datetime = Field(default_factory=datetime.now)
+
+
+class PipelineRunSummary(BaseModel):
+    """Pydantic object summarizing a pipeline run.
+
+    Contains all attributes of a `PipelineRunWrapper` except the pipeline,
+    stack and runtime configuration, which are expensive to load.
+
+    Attributes:
+        name: Pipeline run name.
+        zenml_version: Version of ZenML that this pipeline run was performed
+            with.
+        git_sha: Git commit SHA that this pipeline run was performed on.
+        pipeline_name: Name of the pipeline that this run is referring to.
+        user_id: Id of the user that ran this pipeline.
+        project_name: Name of the project that this pipeline was run in.
+        create_time: Time at which this pipeline run was created.
+    """
+
+    name: str
+    zenml_version: str
+    git_sha: Optional[str]
+
+    pipeline_name: str
+
+    user_id: UUID
+    project_name: Optional[str]
+    create_time: datetime
+
+    @classmethod
+    def from_pipeline_run_wrapper(
+        cls, wrapper: PipelineRunWrapper
+    ) -> "PipelineRunSummary":
+        """Creates a PipelineRunSummary from a PipelineRunWrapper.
+
+        Args:
+            wrapper: The PipelineRunWrapper to summarize.
+
+        Returns:
+            A PipelineRunSummary instance.
+        """
+        return cls(
+            name=wrapper.name,
+            zenml_version=wrapper.zenml_version,
+            git_sha=wrapper.git_sha,
+            pipeline_name=wrapper.pipeline.name,
+            user_id=wrapper.user_id,
+            project_name=wrapper.project_name,
+            create_time=wrapper.create_time,
+        )
@@ -0,0 +1,154 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Append-only log of pipeline runs."""
+
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import DefaultDict, List
+
+from pydantic import ValidationError
+
+from zenml.logger import get_logger
+from zenml.utils import io_utils
+from zenml.zen_stores.models import ZenStorePipelineModel
+from zenml.zen_stores.models.pipeline_models import PipelineRunWrapper
+
+logger = get_logger(__name__)
+
+
+class PipelineRunLog:
+    """Append-only log of pipeline runs, stored as JSON lines in a file.
+
+    Registering a run appends a single line to the file instead of rewriting
+    all previous runs, so the cost of a registration doesn't grow with the
+    number of runs. Runs appended by other processes are picked up by only
+    reading the part of the file that was appended since the last read.
+
+    Readers never modify the file. A partial line at the end of the file is
+    either still being written by another process, in which case it is read
+    once it's complete, or was left behind by a writer that crashed. Writers
+    terminate such a line before appending, so that it is discarded as a
+    corrupted run instead of corrupting the next run.
+    """
+
+    def __init__(self, log_file: str, legacy_file: str) -> None:
+        """Initializes the log.
+
+        If the log file doesn't exist yet but a YAML file with pipeline runs
+        of a previous ZenML version does, the runs are migrated to the log.
+        The YAML file is left untouched.
+
+        Args:
+            log_file: Path of the log file.
+            legacy_file: Path of the YAML file in which previous ZenML
+                versions stored the pipeline runs.
+        """
+        self._log_file = log_file
+        self._offset = 0
+        self._pipeline_runs: DefaultDict[
+            str, List[PipelineRunWrapper]
+        ] = defaultdict(list)
+
+        if not os.path.exists(log_file) and os.path.exists(legacy_file):
+            self._migrate(legacy_file)
+
+    @property
+    def pipeline_runs(self) -> DefaultDict[str, List[PipelineRunWrapper]]:
+        """Maps pipeline names to the runs of that pipeline.
+
+        Returns:
+            All runs in the log, grouped by pipeline name.
+        """
+        self._read()
+        return self._pipeline_runs
+
+    def append(self, pipeline_run: PipelineRunWrapper) -> None:
+        """Appends a pipeline run to the log.
+
+        The run is flushed to disk before this method returns.
+
+        Args:
+            pipeline_run: The pipeline run to append.
+        """
+        line = pipeline_run.json().encode("utf-8") + b"\n"
+        flags = (
+            os.O_RDWR | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        )
+        fd = os.open(self._log_file, flags, 0o644)
+        try:
+            if os.fstat(fd).st_size > 0:
+                os.lseek(fd, -1, os.SEEK_END)
+                if os.read(fd, 1) != b"\n":
+                    line = b"\n" + line
+            os.write(fd, line)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        self._read()
+
+    def _read(self) -> None:
+        """Reads all lines that were appended since the last read."""
+        if not os.path.exists(self._log_file):
+            return
+        if os.path.getsize(self._log_file) == self._offset:
+            return
+
+        with open(self._log_file, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+
+        # a partial line at the end might still be written, so only read
+        # complete lines and retry the rest on the next read
+        complete = data[: data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            if not line.strip():
+                continue
+            try:
+                run = PipelineRunWrapper.parse_raw(line)
+            except ValidationError:
+                logger.warning(
+                    "Skipping corrupted pipeline run in '%s'.", self._log_file
+                )
+                continue
+            self._pipeline_runs[run.pipeline.name].append(run)
+        self._offset += len(complete)
+
+    def _migrate(self, legacy_file: str) -> None:
+        """Migrates pipeline runs from a YAML file to the log.
+
+        Previous ZenML versions didn't record the creation time of runs, so
+        parsing them assigns the current time instead. The migrated runs get
+        the modification time of the YAML file, which is the time at which
+        the last of them was registered, and keep their registration order
+        through microsecond offsets.
+
+        Args:
+            legacy_file: Path of the YAML file with the pipeline runs.
+        """
+        logger.info(
+            "Migrating pipeline runs from '%s' to '%s'.",
+            legacy_file,
+            self._log_file,
+        )
+        legacy_store = ZenStorePipelineModel(legacy_file)
+        last_modified = datetime.fromtimestamp(os.path.getmtime(legacy_file))
+        lines = []
+        for runs in legacy_store.pipeline_runs.values():
+            for index, run in enumerate(runs):
+                run.create_time = last_modified - timedelta(
+                    microseconds=len(runs) - 1 - index
+                )
+                lines.append(run.json() + "\n")
+        io_utils.write_file_contents_atomically(self._log_file, "".join(lines))
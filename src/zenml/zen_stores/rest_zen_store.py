@@ -14,16 +14,39 @@
 """REST Zen Store implementation."""
 
 import re
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+from urllib.parse import urlencode
+from uuid import UUID
 
 import requests
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from zenml.constants import (
     FLAVORS,
+    PIPELINE_RUN_SUMMARIES,
     PIPELINE_RUNS,
     PROJECTS,
+    REST_STORE_COMPRESSION,
+    REST_STORE_ETAG_CACHE_SIZE,
+    REST_STORE_MAX_RETRIES,
+    REST_STORE_POOL_SIZE,
+    REST_STORE_RETRY_BACKOFF_FACTOR,
+    REST_STORE_TIMEOUT,
     ROLE_ASSIGNMENTS,
     ROLES,
     STACK_COMPONENTS,
@@ -52,17 +75,59 @@ from zenml.zen_stores.models import (
     Team,
     User,
 )
-from zenml.zen_stores.models.pipeline_models import PipelineRunWrapper
+from zenml.zen_stores.models.pipeline_models import (
+    PipelineRunSummary,
+    PipelineRunWrapper,
+)
 
 logger = get_logger(__name__)
 
 # type alias for possible json payloads (the Anys are recursive Json instances)
 Json = Union[Dict[str, Any], List[Any], str, int, float, bool, None]
 
+# Requests with these methods don't change the state of the server when they
+# are repeated, so they can be retried safely.
+IDEMPOTENT_HTTP_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+RETRY_STATUS_CODES = (502, 503, 504)
+# The ZenServer rejects requests beyond its concurrency limit with this status
+# code before processing them, so even non-idempotent requests can be retried.
+SERVER_BUSY_STATUS_CODE = 503
+
+
+class _ServerBusyRetry(Retry):
+    """Retry configuration that also retries rejected non-idempotent requests.
+
+    Idempotent requests are retried for all `RETRY_STATUS_CODES`. All other
+    requests are only retried if the ZenServer rejected them because too
+    many requests were in flight.
+    """
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        """Checks whether a request should be retried.
+
+        Args:
+            method: The HTTP method of the request.
+            status_code: The status code of the response.
+            has_retry_after: Whether the response has a `Retry-After` header.
+
+        Returns:
+            Whether the request should be retried.
+        """
+        if status_code == SERVER_BUSY_STATUS_CODE:
+            return True
+        return super().is_retry(  # type: ignore[no-any-return]
+            method, status_code, has_retry_after=has_retry_after
+        )
+
 
 class RestZenStore(BaseZenStore):
     """ZenStore implementation for accessing data from a REST API."""
 
+    # Every request is a network round trip, so cache entities for a while
+    DEFAULT_CACHE_TTL: ClassVar[int] = 10
+
     def initialize(
         self,
         url: str,
@@ -85,6 +150,8 @@ class RestZenStore(BaseZenStore):
         if not self.is_valid_url(url.strip("/")):
             raise ValueError("Invalid URL for REST store: {url}")
         self._url = url.strip("/")
+        self._session: Optional[requests.Session] = None
+        self._etag_cache: "OrderedDict[str, Tuple[str, Json]]" = OrderedDict()
         super().initialize(url, *args, **kwargs)
         return self
 
@@ -294,7 +361,7 @@ class RestZenStore(BaseZenStore):
             )
         return [StackWrapper.parse_obj(s) for s in body]
 
-    def get_stack(self, name: str) -> StackWrapper:
+    def _get_stack(self, name: str) -> StackWrapper:
         """Fetch a stack by name.
 
         Args:
@@ -330,7 +397,7 @@ class RestZenStore(BaseZenStore):
         if name != stack.name:
             self.deregister_stack(name)
 
-    def get_stack_component(
+    def _get_stack_component(
         self, component_type: StackComponentType, name: str
     ) -> ComponentWrapper:
         """Get a registered stack component.
@@ -367,6 +434,34 @@ class RestZenStore(BaseZenStore):
             )
         return [ComponentWrapper.parse_obj(c) for c in body]
 
+    def get_stack_components_by_names(
+        self, components: Sequence[Tuple[StackComponentType, str]]
+    ) -> List[ComponentWrapper]:
+        """Fetches multiple registered stack components in a single request.
+
+        Args:
+            components: Types and names of the components to fetch.
+
+        Returns:
+            The components that exist, in the order they were requested.
+            Components that don't exist are omitted.
+
+        Raises:
+            ValueError: If the API response is not a list of components.
+        """
+        if not components:
+            return []
+
+        query = urlencode(
+            [(str(component_type), name) for component_type, name in components]
+        )
+        body = self.get(f"{STACK_COMPONENTS}?{query}")
+        if not isinstance(body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(body)}"
+            )
+        return [ComponentWrapper.parse_obj(c) for c in body]
+
     def deregister_stack_component(
         self, component_type: StackComponentType, name: str
     ) -> None:
@@ -376,7 +471,10 @@ class RestZenStore(BaseZenStore):
             component_type: The type of the component to deregister.
             name: The name of the component to deregister.
         """
-        self.delete(f"{STACK_COMPONENTS}/{component_type}/{name}")
+        try:
+            self.delete(f"{STACK_COMPONENTS}/{component_type}/{name}")
+        finally:
+            self._invalidate_cache()
 
     # User, project and role management
 
@@ -636,13 +734,7 @@ class RestZenStore(BaseZenStore):
             "project_name": project_name,
             "is_user": is_user,
         }
-        self._handle_response(
-            requests.post(
-                self.url + ROLE_ASSIGNMENTS,
-                json=data,
-                auth=self._get_authentication(),
-            )
-        )
+        self._request("POST", ROLE_ASSIGNMENTS, json=data)
 
     def revoke_role(
         self,
@@ -666,13 +758,7 @@ class RestZenStore(BaseZenStore):
             "project_name": project_name,
             "is_user": is_user,
         }
-        self._handle_response(
-            requests.delete(
-                self.url + ROLE_ASSIGNMENTS,
-                json=data,
-                auth=self._get_authentication(),
-            )
-        )
+        self._request("DELETE", ROLE_ASSIGNMENTS, json=data)
 
     def get_users_for_team(self, team_name: str) -> List[User]:
         """Fetches all users of a team.
@@ -812,14 +898,32 @@ class RestZenStore(BaseZenStore):
         return PipelineRunWrapper.parse_obj(body)
 
     def get_pipeline_runs(
-        self, pipeline_name: str, project_name: Optional[str] = None
+        self,
+        pipeline_name: str,
+        project_name: Optional[str] = None,
+        user_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
     ) -> List[PipelineRunWrapper]:
         """Gets pipeline runs.
 
+        Runs are ordered by their creation time, oldest first unless
+        `descending` is set. To fetch the runs page by page, pass the name of
+        the last run of the previous page as `after`. The latest `N` runs are
+        returned with `descending=True, limit=N`.
+
         Args:
             pipeline_name: Name of the pipeline for which to get runs.
             project_name: Optional name of the project from which to get the
                 pipeline runs.
+            user_id: Optional id of the user who created the pipeline runs.
+            since: Optional time since which the pipeline runs were created.
+            after: Optional name of a pipeline run. If given, only runs
+                that follow this run in the requested order are returned.
+            limit: Optional maximum number of runs to return.
+            descending: If `True`, the most recent runs are returned first.
 
         Returns:
             List of pipeline runs.
@@ -827,17 +931,71 @@ class RestZenStore(BaseZenStore):
         Raises:
             ValueError: In case of a bad API response.
         """
-        path = f"{PIPELINE_RUNS}/{pipeline_name}"
-        if project_name:
-            path += f"?project_name={project_name}"
-
-        body = self.get(path)
+        body = self.get(
+            self._pipeline_runs_path(
+                PIPELINE_RUNS,
+                pipeline_name=pipeline_name,
+                project_name=project_name,
+                user_id=user_id,
+                since=since,
+                after=after,
+                limit=limit,
+                descending=descending,
+            )
+        )
         if not isinstance(body, list):
             raise ValueError(
                 f"Bad API Response. Expected list, got {type(body)}"
             )
         return [PipelineRunWrapper.parse_obj(dict_) for dict_ in body]
 
+    def get_pipeline_run_summaries(
+        self,
+        pipeline_name: str,
+        project_name: Optional[str] = None,
+        user_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
+    ) -> List[PipelineRunSummary]:
+        """Gets summaries of pipeline runs.
+
+        Args:
+            pipeline_name: Name of the pipeline for which to get runs.
+            project_name: Optional name of the project from which to get the
+                pipeline runs.
+            user_id: Optional id of the user who created the pipeline runs.
+            since: Optional time since which the pipeline runs were created.
+            after: Optional name of a pipeline run. If given, only runs
+                that follow this run in the requested order are returned.
+            limit: Optional maximum number of runs to return.
+            descending: If `True`, the most recent runs are returned first.
+
+        Returns:
+            Summaries of the pipeline runs, ordered by their creation time.
+
+        Raises:
+            ValueError: In case of a bad API response.
+        """
+        body = self.get(
+            self._pipeline_runs_path(
+                PIPELINE_RUN_SUMMARIES,
+                pipeline_name=pipeline_name,
+                project_name=project_name,
+                user_id=user_id,
+                since=since,
+                after=after,
+                limit=limit,
+                descending=descending,
+            )
+        )
+        if not isinstance(body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(body)}"
+            )
+        return [PipelineRunSummary.parse_obj(dict_) for dict_ in body]
+
     def register_pipeline_run(
         self,
         pipeline_run: PipelineRunWrapper,
@@ -973,7 +1131,7 @@ class RestZenStore(BaseZenStore):
             )
         return [FlavorWrapper.parse_obj(flavor_dict) for flavor_dict in body]
 
-    def get_flavor_by_name_and_type(
+    def _get_flavor_by_name_and_type(
         self,
         flavor_name: str,
         component_type: StackComponentType,
@@ -1017,6 +1175,48 @@ class RestZenStore(BaseZenStore):
             for typ, component_name in to_parse.items()
         }
 
+    @staticmethod
+    def _pipeline_runs_path(
+        endpoint: str,
+        pipeline_name: str,
+        project_name: Optional[str] = None,
+        user_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
+    ) -> str:
+        """Builds the path to query the runs of a pipeline.
+
+        Args:
+            endpoint: The pipeline runs endpoint.
+            pipeline_name: Name of the pipeline for which to get runs.
+            project_name: Optional name of the project from which to get the
+                pipeline runs.
+            user_id: Optional id of the user who created the pipeline runs.
+            since: Optional time since which the pipeline runs were created.
+            after: Optional name of a pipeline run. If given, only runs
+                that follow this run in the requested order are returned.
+            limit: Optional maximum number of runs to return.
+            descending: If `True`, the most recent runs are returned first.
+
+        Returns:
+            The path including all given query parameters.
+        """
+        params = {
+            "project_name": project_name,
+            "user_id": user_id,
+            "since": since.isoformat() if since else None,
+            "after": after,
+            "limit": limit,
+            "descending": descending or None,
+        }
+        query = urlencode(
+            {key: value for key, value in params.items() if value is not None}
+        )
+        path = f"{endpoint}/{pipeline_name}"
+        return f"{path}?{query}" if query else path
+
     def _handle_response(self, response: requests.Response) -> Json:
         """Handle API response, translating http status codes to Exception.
 
@@ -1100,6 +1300,77 @@ class RestZenStore(BaseZenStore):
 
         return Repository().active_user_name, ""
 
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session used for all requests to the ZenServer.
+
+        The session keeps connections to the server alive, so that they can
+        be reused across requests. Requests with idempotent methods are
+        retried with exponential backoff if the connection fails or the
+        server is temporarily unavailable.
+
+        Returns:
+            The HTTP session.
+        """
+        if self._session is None:
+            retries = _ServerBusyRetry(
+                total=REST_STORE_MAX_RETRIES,
+                backoff_factor=REST_STORE_RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=IDEMPOTENT_HTTP_METHODS,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=REST_STORE_POOL_SIZE,
+                pool_maxsize=REST_STORE_POOL_SIZE,
+                max_retries=retries,
+            )
+            self._session = requests.Session()
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+            if not REST_STORE_COMPRESSION:
+                self._session.headers["Accept-Encoding"] = "identity"
+        return self._session
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> Json:
+        """Make a request to the given endpoint path.
+
+        The responses of the most recent GET requests are kept together with
+        their ETag, so that the server only needs to send the response body
+        again if it changed.
+
+        Args:
+            method: The HTTP method of the request.
+            path: The path to the endpoint.
+            **kwargs: Additional keyword arguments to pass to the request.
+
+        Returns:
+            The response body.
+        """
+        cached = self._etag_cache.get(path) if method == "GET" else None
+        if cached:
+            self._etag_cache.move_to_end(path)
+            kwargs["headers"] = {"If-None-Match": cached[0]}
+
+        response = self.session.request(
+            method,
+            self.url + path,
+            auth=self._get_authentication(),
+            timeout=REST_STORE_TIMEOUT,
+            **kwargs,
+        )
+        if cached and response.status_code == 304:
+            return cached[1]
+
+        payload = self._handle_response(response)
+        etag = response.headers.get("ETag")
+        if method == "GET" and etag:
+            self._etag_cache[path] = (etag, payload)
+            self._etag_cache.move_to_end(path)
+            if len(self._etag_cache) > REST_STORE_ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        return payload
+
     def get(self, path: str) -> Json:
         """Make a GET request to the given endpoint path.
 
@@ -1109,9 +1380,7 @@ class RestZenStore(BaseZenStore):
         Returns:
             The response body.
         """
-        return self._handle_response(
-            requests.get(self.url + path, auth=self._get_authentication())
-        )
+        return self._request("GET", path)
 
     def delete(self, path: str) -> Json:
         """Make a DELETE request to the given endpoint path.
@@ -1122,9 +1391,7 @@ class RestZenStore(BaseZenStore):
         Returns:
             The response body.
         """
-        return self._handle_response(
-            requests.delete(self.url + path, auth=self._get_authentication())
-        )
+        return self._request("DELETE", path)
 
     def post(self, path: str, body: BaseModel) -> Json:
         """Make a POST request to the given endpoint path.
@@ -1136,12 +1403,7 @@ class RestZenStore(BaseZenStore):
         Returns:
             The response body.
         """
-        endpoint = self.url + path
-        return self._handle_response(
-            requests.post(
-                endpoint, data=body.json(), auth=self._get_authentication()
-            )
-        )
+        return self._request("POST", path, data=body.json())
 
     def put(self, path: str, body: BaseModel) -> Json:
         """Make a PUT request to the given endpoint path.
@@ -1153,9 +1415,4 @@ class RestZenStore(BaseZenStore):
         Returns:
             The response body.
         """
-        endpoint = self.url + path
-        return self._handle_response(
-            requests.put(
-                endpoint, data=body.json(), auth=self._get_authentication()
-            )
-        )
+        return self._request("PUT", path, data=body.json())
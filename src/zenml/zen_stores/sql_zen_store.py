@@ -17,9 +17,10 @@ import datetime as dt
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index, and_, desc, inspect, or_, text
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.exc import ArgumentError, NoResultFound
 from sqlmodel import Field, Session, SQLModel, create_engine, select
@@ -41,6 +42,7 @@ from zenml.zen_stores.models import (
     User,
 )
 from zenml.zen_stores.models.pipeline_models import (
+    PipelineRunSummary,
     PipelineRunWrapper,
     PipelineWrapper,
 )
@@ -164,6 +166,16 @@ class RoleAssignmentTable(RoleAssignment, SQLModel, table=True):
 class PipelineRunTable(SQLModel, table=True):
     """SQL Model for pipeline runs."""
 
+    # Runs of a pipeline are listed ordered by creation time and name
+    __table_args__ = (
+        Index(
+            "ix_pipelineruntable_pipeline_name_create_time",
+            "pipeline_name",
+            "create_time",
+            "name",
+        ),
+    )
+
     name: str = Field(primary_key=True)
     zenml_version: str
     git_sha: Optional[str]
@@ -173,10 +185,11 @@ class PipelineRunTable(SQLModel, table=True):
     stack: str
     runtime_configuration: str
 
-    user_id: UUID = Field(foreign_key="usertable.id")
+    user_id: UUID = Field(foreign_key="usertable.id", index=True)
     project_name: Optional[str] = Field(
-        default=None, foreign_key="projecttable.name"
+        default=None, foreign_key="projecttable.name", index=True
     )
+    create_time: dt.datetime = Field(default_factory=dt.datetime.now)
 
     @classmethod
     def from_pipeline_run_wrapper(
@@ -200,6 +213,7 @@ class PipelineRunTable(SQLModel, table=True):
             runtime_configuration=json.dumps(wrapper.runtime_configuration),
             user_id=wrapper.user_id,
             project_name=wrapper.project_name,
+            create_time=wrapper.create_time,
         )
 
     def to_pipeline_run_wrapper(self) -> PipelineRunWrapper:
@@ -217,6 +231,7 @@ class PipelineRunTable(SQLModel, table=True):
             runtime_configuration=json.loads(self.runtime_configuration),
             user_id=self.user_id,
             project_name=self.project_name,
+            create_time=self.create_time,
         )
 
 
@@ -260,6 +275,7 @@ class SqlZenStore(BaseZenStore):
         sql_kwargs.pop("skip_migration", False)
         self.engine = create_engine(url, *args, **sql_kwargs)
         SQLModel.metadata.create_all(self.engine)
+        self._migrate_pipeline_run_table()
         with Session(self.engine) as session:
             if not session.exec(select(ZenUser)).first():
                 session.add(ZenUser(id=1, name="LocalZenUser"))
@@ -379,34 +395,16 @@ class SqlZenStore(BaseZenStore):
             KeyError: If no stack exists for the given name.
         """
         logger.debug("Fetching stack with name '%s'.", name)
-        # first check that the stack exists
-        with Session(self.engine) as session:
-            maybe_stack = session.exec(
-                select(ZenStack).where(ZenStack.name == name)
-            ).first()
-        if maybe_stack is None:
+        stacks = self._get_stacks_with_components(name=name)
+        if name not in stacks:
             raise KeyError(
                 f"Unable to find stack with name '{name}'. Available names: "
                 f"{set(self.stack_names)}."
             )
-        # then get all components assigned to that stack
-        with Session(self.engine) as session:
-            definitions_and_components = session.exec(
-                select(ZenStackDefinition, ZenStackComponent)
-                .where(
-                    ZenStackDefinition.component_type
-                    == ZenStackComponent.component_type
-                )
-                .where(
-                    ZenStackDefinition.component_name == ZenStackComponent.name
-                )
-                .where(ZenStackDefinition.stack_name == name)
-            )
-            params = {
-                component.component_type: component.name
-                for _, component in definitions_and_components
-            }
-        return {StackComponentType(typ): name for typ, name in params.items()}
+        return {
+            StackComponentType(component.component_type): component.name
+            for component in stacks[name]
+        }
 
     @property
     def stack_configurations(self) -> Dict[str, Dict[StackComponentType, str]]:
@@ -415,7 +413,118 @@ class SqlZenStore(BaseZenStore):
         Returns:
             Dictionary mapping stack names to Dict[StackComponentType, str]
         """
-        return {n: self.get_stack_configuration(n) for n in self.stack_names}
+        return {
+            stack_name: {
+                StackComponentType(component.component_type): component.name
+                for component in components
+            }
+            for stack_name, components in (
+                self._get_stacks_with_components().items()
+            )
+        }
+
+    @property
+    def stacks(self) -> List[StackWrapper]:
+        """All stacks registered in this zen store.
+
+        Returns:
+            A list of all stacks registered in this zen store.
+        """
+        return [
+            self._stack_wrapper_from_components(stack_name, components)
+            for stack_name, components in (
+                self._get_stacks_with_components().items()
+            )
+        ]
+
+    def _get_stack(self, name: str) -> StackWrapper:
+        """Fetch a stack by name.
+
+        Args:
+            name: The name of the stack to retrieve.
+
+        Returns:
+            StackWrapper instance if the stack exists.
+
+        Raises:
+            KeyError: If no stack exists for the given name.
+        """
+        stacks = self._get_stacks_with_components(name=name)
+        if name not in stacks:
+            raise KeyError(
+                f"Unable to find stack with name '{name}'. Available names: "
+                f"{set(self.stack_names)}."
+            )
+        return self._stack_wrapper_from_components(name, stacks[name])
+
+    def get_stack_components(
+        self, component_type: StackComponentType
+    ) -> List[ComponentWrapper]:
+        """Fetches all registered stack components of the given type.
+
+        Args:
+            component_type: StackComponentType to list members of
+
+        Returns:
+            A list of StackComponentConfiguration instances.
+        """
+        with Session(self.engine) as session:
+            components = session.exec(
+                select(ZenStackComponent).where(
+                    ZenStackComponent.component_type == component_type
+                )
+            ).all()
+        return [
+            self._component_wrapper_from_config(
+                component_type,
+                name=component.name,
+                flavor=component.component_flavor,
+                config=component.configuration,
+            )
+            for component in components
+        ]
+
+    def get_stack_components_by_names(
+        self, components: Sequence[Tuple[StackComponentType, str]]
+    ) -> List[ComponentWrapper]:
+        """Fetches multiple registered stack components in a single query.
+
+        Args:
+            components: Types and names of the components to fetch.
+
+        Returns:
+            The components that exist, in the order they were requested.
+            Components that don't exist are omitted.
+        """
+        if not components:
+            return []
+
+        with Session(self.engine) as session:
+            rows = session.exec(
+                select(ZenStackComponent).where(
+                    or_(
+                        *(
+                            and_(
+                                ZenStackComponent.component_type
+                                == component_type,
+                                ZenStackComponent.name == name,
+                            )
+                            for component_type, name in components
+                        )
+                    )
+                )
+            ).all()
+        rows_by_key = {(row.component_type, row.name): row for row in rows}
+        return [
+            self._component_wrapper_from_config(
+                component_type,
+                name=name,
+                flavor=rows_by_key[component_type, name].component_flavor,
+                config=rows_by_key[component_type, name].configuration,
+            )
+            for component_type, name in components
+            if (component_type, name) in rows_by_key
+        ]
 
     def _register_stack_component(
         self,
@@ -1402,37 +1511,102 @@ class SqlZenStore(BaseZenStore):
                 raise KeyError from error
 
     def get_pipeline_runs(
-        self, pipeline_name: str, project_name: Optional[str] = None
+        self,
+        pipeline_name: str,
+        project_name: Optional[str] = None,
+        user_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
     ) -> List[PipelineRunWrapper]:
         """Gets pipeline runs.
 
+        Runs are ordered by their creation time, oldest first unless
+        `descending` is set. To fetch the runs page by page, pass the name of
+        the last run of the previous page as `after`. The latest `N` runs are
+        returned with `descending=True, limit=N`.
+
         Args:
             pipeline_name: Name of the pipeline for which to get runs.
             project_name: Optional name of the project from which to get the
                 pipeline runs.
+            user_id: Optional id of the user who created the pipeline runs.
+            since: Optional time since which the pipeline runs were created.
+            after: Optional name of a pipeline run. If given, only runs
+                that follow this run in the requested order are returned.
+            limit: Optional maximum number of runs to return.
+            descending: If `True`, the most recent runs are returned first.
 
         Returns:
             List of pipeline runs.
-
-        Raises:
-            KeyError: If no pipeline with the given name exists.
         """
         with Session(self.engine) as session:
-            try:
-                statement = select(PipelineRunTable).where(
-                    PipelineRunTable.pipeline_name == pipeline_name
-                )
+            statement = self._filter_pipeline_runs(
+                session,
+                select(PipelineRunTable),
+                pipeline_name=pipeline_name,
+                project_name=project_name,
+                user_id=user_id,
+                since=since,
+                after=after,
+                limit=limit,
+                descending=descending,
+            )
+            return [
+                run.to_pipeline_run_wrapper()
+                for run in session.exec(statement).all()
+            ]
 
-                if project_name:
-                    statement = statement.where(
-                        PipelineRunTable.project_name == project_name
-                    )
-                return [
-                    run.to_pipeline_run_wrapper()
-                    for run in session.exec(statement).all()
-                ]
-            except NoResultFound as error:
-                raise KeyError from error
+    def get_pipeline_run_summaries(
+        self,
+        pipeline_name: str,
+        project_name: Optional[str] = None,
+        user_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
+    ) -> List[PipelineRunSummary]:
+        """Gets summaries of pipeline runs.
+
+        Only the summarized columns are queried, the pipeline, stack and
+        runtime configuration of the runs are never loaded.
+
+        Args:
+            pipeline_name: Name of the pipeline for which to get runs.
+            project_name: Optional name of the project from which to get the
+                pipeline runs.
+            user_id: Optional id of the user who created the pipeline runs.
+            since: Optional time since which the pipeline runs were created.
+            after: Optional name of a pipeline run. If given, only runs
+                that follow this run in the requested order are returned.
+            limit: Optional maximum number of runs to return.
+            descending: If `True`, the most recent runs are returned first.
+
+        Returns:
+            Summaries of the pipeline runs, ordered by their creation time.
+        """
+        columns = [
+            getattr(PipelineRunTable, field)
+            for field in PipelineRunSummary.__fields__
+        ]
+        with Session(self.engine) as session:
+            statement = self._filter_pipeline_runs(
+                session,
+                select(*columns),
+                pipeline_name=pipeline_name,
+                project_name=project_name,
+                user_id=user_id,
+                since=since,
+                after=after,
+                limit=limit,
+                descending=descending,
+            )
+            return [
+                PipelineRunSummary.parse_obj(row._mapping)
+                for row in session.exec(statement).all()
+            ]
 
     def register_pipeline_run(
         self,
@@ -1546,7 +1720,7 @@ class SqlZenStore(BaseZenStore):
             for f in flavors
         ]
 
-    def get_flavor_by_name_and_type(
+    def _get_flavor_by_name_and_type(
         self,
         flavor_name: str,
         component_type: StackComponentType,
@@ -1593,6 +1767,188 @@ class SqlZenStore(BaseZenStore):
         with Session(self.engine) as session:
             return [s.name for s in session.exec(select(ZenStack))]
 
+    def _get_stacks_with_components(
+        self, name: Optional[str] = None
+    ) -> Dict[str, List[ZenStackComponent]]:
+        """Fetches stacks together with all their components.
+
+        Stacks, stack definitions and components are loaded in a single
+        query, independent of the number of stacks and components.
+
+        Args:
+            name: Optional name of a single stack to fetch.
+
+        Returns:
+            Dictionary mapping stack names to the components of the stack.
+        """
+        statement = (
+            select(ZenStack.name, ZenStackComponent)
+            .select_from(ZenStack)
+            .outerjoin(
+                ZenStackDefinition,
+                ZenStackDefinition.stack_name == ZenStack.name,
+            )
+            .outerjoin(
+                ZenStackComponent,
+                and_(
+                    ZenStackDefinition.component_type
+                    == ZenStackComponent.component_type,
+                    ZenStackDefinition.component_name == ZenStackComponent.name,
+                ),
+            )
+        )
+        if name is not None:
+            statement = statement.where(ZenStack.name == name)
+
+        stacks: Dict[str, List[ZenStackComponent]] = {}
+        with Session(self.engine) as session:
+            for stack_name, component in session.exec(statement):
+                components = stacks.setdefault(stack_name, [])
+                if component is not None:
+                    components.append(component)
+        return stacks
+
+    def _stack_wrapper_from_components(
+        self, name: str, components: List[ZenStackComponent]
+    ) -> StackWrapper:
+        """Build a StackWrapper from already fetched components.
+
+        Args:
+            name: The name of the stack.
+            components: The components of the stack.
+
+        Returns:
+            A StackWrapper instance.
+        """
+        return StackWrapper(
+            name=name,
+            components=[
+                self._component_wrapper_from_config(
+                    StackComponentType(component.component_type),
+                    name=component.name,
+                    flavor=component.component_flavor,
+                    config=component.configuration,
+                )
+                for component in components
+            ],
+        )
+
+    def _migrate_pipeline_run_table(self) -> None:
+        """Adds the creation time and indices to an existing run table.
+
+        Pipeline run tables created by previous versions of ZenML don't have
+        a creation time. Existing runs get the time of the migration, which
+        keeps them in the order of their names.
+        """
+        table = PipelineRunTable.__table__  # type: ignore[attr-defined]
+        columns = {
+            column["name"]
+            for column in inspect(self.engine).get_columns(table.name)
+        }
+        with self.engine.begin() as connection:
+            if "create_time" not in columns:
+                logger.debug("Adding creation time to pipeline run table.")
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {table.name} "
+                        "ADD COLUMN create_time DATETIME"
+                    )
+                )
+                connection.execute(
+                    table.update().values(create_time=dt.datetime.now())
+                )
+            for index in table.indexes:
+                index.create(bind=connection, checkfirst=True)
+
+    @staticmethod
+    def _filter_pipeline_runs(
+        session: Session,
+        statement: Union[Select, SelectOfScalar],
+        pipeline_name: str,
+        project_name: Optional[str] = None,
+        user_id: Optional[UUID] = None,
+        since: Optional[datetime] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
+    ) -> Union[Select, SelectOfScalar]:
+        """Filters, orders and limits a query of pipeline runs.
+
+        Pages are selected with a keyset on the creation time and name of the
+        runs, so that fetching a page only reads the rows of that page from
+        the pipeline name index. The index is scanned backwards if the most
+        recent runs are requested first.
+
+        Args:
+            session: The session in which to look up the `after` run.
+            statement: The query of pipeline runs.
+            pipeline_name: Name of the pipeline for which to get runs.
+            project_name: Optional name of the project from which to get the
+                pipeline runs.
+            user_id: Optional id of the user who created the pipeline runs.
+            since: Optional time since which the pipeline runs were created.
+            after: Optional name of a pipeline run. If given, only runs
+                that follow this run in the requested order are returned.
+            limit: Optional maximum number of runs to return.
+            descending: If `True`, the most recent runs are returned first.
+
+        Returns:
+            The filtered query.
+
+        Raises:
+            KeyError: If no pipeline run with the name `after` exists.
+        """
+        statement = statement.where(
+            PipelineRunTable.pipeline_name == pipeline_name
+        )
+        if project_name:
+            statement = statement.where(
+                PipelineRunTable.project_name == project_name
+            )
+        if user_id:
+            statement = statement.where(PipelineRunTable.user_id == user_id)
+        if since:
+            statement = statement.where(PipelineRunTable.create_time >= since)
+        if after is not None:
+            cursor = session.exec(
+                select(PipelineRunTable.create_time).where(
+                    PipelineRunTable.name == after
+                )
+            ).first()
+            if cursor is None:
+                raise KeyError(f"No pipeline run found with name '{after}'.")
+            if descending:
+                statement = statement.where(
+                    or_(
+                        PipelineRunTable.create_time < cursor,
+                        and_(
+                            PipelineRunTable.create_time == cursor,
+                            PipelineRunTable.name < after,
+                        ),
+                    )
+                )
+            else:
+                statement = statement.where(
+                    or_(
+                        PipelineRunTable.create_time > cursor,
+                        and_(
+                            PipelineRunTable.create_time == cursor,
+                            PipelineRunTable.name > after,
+                        ),
+                    )
+                )
+        if descending:
+            statement = statement.order_by(
+                desc(PipelineRunTable.create_time), desc(PipelineRunTable.name)
+            )
+        else:
+            statement = statement.order_by(
+                PipelineRunTable.create_time, PipelineRunTable.name
+            )
+        if limit is not None:
+            statement = statement.limit(limit)
+        return statement
+
     def _delete_query_results(self, query: Any) -> None:
         """Deletes all rows returned by the input query.
 
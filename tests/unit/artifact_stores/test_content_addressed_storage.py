@@ -0,0 +1,116 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+
+import pytest
+
+from zenml.artifact_stores import LocalArtifactStore
+from zenml.artifact_stores.content_addressed_storage import (
+    BLOB_DIRECTORY_NAME,
+    ContentAddressedStorage,
+    resolve_path,
+)
+
+
+@pytest.fixture
+def storage(tmp_path) -> ContentAddressedStorage:
+    """Content addressed storage on top of a local artifact store."""
+    artifact_store = LocalArtifactStore(name="", path=str(tmp_path))
+    return ContentAddressedStorage(artifact_store)
+
+
+def _count_blobs(root: str) -> int:
+    """Counts the blobs (excluding temporary files) in an artifact store."""
+    return sum(
+        len(files)
+        for directory, _, files in os.walk(
+            os.path.join(root, BLOB_DIRECTORY_NAME)
+        )
+        if os.path.basename(directory) != "tmp"
+    )
+
+
+def test_identical_files_are_stored_once(storage, tmp_path):
+    """Tests that identical contents are only stored in a single blob."""
+    for name in ["a", "b"]:
+        os.makedirs(tmp_path / name)
+        with storage.open(str(tmp_path / name / "data"), "wb") as f:
+            f.write(b"identical content")
+
+    with storage.open(str(tmp_path / "a" / "other"), "w") as f:
+        f.write("different content")
+
+    assert _count_blobs(str(tmp_path)) == 2
+    with storage.open(str(tmp_path / "b" / "data"), "rb") as f:
+        assert f.read() == b"identical content"
+    with storage.open(str(tmp_path / "a" / "other"), "r") as f:
+        assert f.read() == "different content"
+    assert resolve_path(str(tmp_path / "a" / "data")).startswith(
+        str(tmp_path / BLOB_DIRECTORY_NAME)
+    )
+
+
+def test_garbage_collection_removes_unreferenced_blobs(storage, tmp_path):
+    """Tests that blobs are only removed once no pointer references them."""
+    for name in ["a", "b"]:
+        os.makedirs(tmp_path / name)
+        with storage.open(str(tmp_path / name / "data"), "wb") as f:
+            f.write(name.encode())
+
+    os.remove(tmp_path / "a" / "data")
+    assert storage.collect_garbage(dry_run=True) == (1, 1)
+    assert _count_blobs(str(tmp_path)) == 2
+
+    assert storage.collect_garbage() == (1, 1)
+    assert _count_blobs(str(tmp_path)) == 1
+    with storage.open(str(tmp_path / "b" / "data"), "rb") as f:
+        assert f.read() == b"b"
+
+
+def test_failed_writes_are_discarded(storage, tmp_path):
+    """Tests that no blob or pointer is stored if writing a file fails."""
+    path = str(tmp_path / "data")
+    with pytest.raises(RuntimeError):
+        with storage.open(path, "wb") as f:
+            f.write(b"incomplete content")
+            raise RuntimeError()
+
+    assert not os.path.exists(path)
+    assert _count_blobs(str(tmp_path)) == 0
+    assert not os.listdir(tmp_path / BLOB_DIRECTORY_NAME / "tmp")
+
+
+def test_stat_returns_size_of_content(storage, tmp_path):
+    """Tests that the stat of a pointer file describes the blob."""
+    path = str(tmp_path / "data")
+    with storage.open(path, "wb") as f:
+        f.write(b"x" * 1000)
+
+    assert os.path.getsize(path) < 1000
+    assert storage.stat(path).st_size == 1000
+
+
+def test_remote_blobs_are_uploaded_once(storage, tmp_path, mocker):
+    """Tests that blobs of remote artifact stores are written directly to
+    their final path and only if they don't exist yet."""
+    storage.is_local = False
+    rename = mocker.spy(LocalArtifactStore, "rename")
+    for name in ["a", "b"]:
+        with storage.open(str(tmp_path / name), "wb") as f:
+            f.write(b"identical content")
+
+    rename.assert_not_called()
+    assert _count_blobs(str(tmp_path)) == 1
+    with storage.open(str(tmp_path / "b"), "rb") as f:
+        assert f.read() == b"identical content"
@@ -0,0 +1,168 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+
+from zenml.artifact_stores import LocalArtifactStore
+from zenml.artifact_stores.content_addressed_storage import (
+    ContentAddressedStorage,
+)
+from zenml.artifact_stores.local_artifact_cache import LocalArtifactCache
+
+
+class FakeRemoteArtifactStore:
+    """Artifact store that counts downloads and reports ETags like `s3fs`."""
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self.downloads = 0
+
+    def stat(self, path):
+        local_path = os.path.join(self.root, path.replace("s3://", ""))
+        stat = os.stat(local_path)
+        return {
+            "type": "file",
+            "size": stat.st_size,
+            "ETag": str(stat.st_mtime_ns),
+        }
+
+    def open(self, path, mode="r"):
+        self.downloads += 1
+        return open(os.path.join(self.root, path.replace("s3://", "")), mode)
+
+
+def test_local_artifact_cache_serves_repeated_reads_locally(tmp_path):
+    """Tests that files are only downloaded once and re-downloaded when they
+    change."""
+    remote_dir = tmp_path / "remote"
+    remote_dir.mkdir()
+    (remote_dir / "data").write_bytes(b"version 1")
+    artifact_store = FakeRemoteArtifactStore(str(remote_dir))
+    cache = LocalArtifactCache(
+        artifact_store=artifact_store,
+        max_size=1024,
+        directory=str(tmp_path / "cache"),
+    )
+
+    for _ in range(3):
+        with cache.open("s3://data", "rb") as f:
+            assert f.read() == b"version 1"
+    assert artifact_store.downloads == 1
+    assert cache.get_stats()["hits"] == 2
+    assert cache.get_stats()["misses"] == 1
+
+    (remote_dir / "data").write_bytes(b"version 2")
+    os.utime(remote_dir / "data", ns=(0, 1))
+    with cache.open("s3://data", "rb") as f:
+        assert f.read() == b"version 2"
+    assert artifact_store.downloads == 2
+
+
+def test_local_artifact_cache_evicts_least_recently_used_files(tmp_path):
+    """Tests that the cache never grows beyond its maximum size."""
+    remote_dir = tmp_path / "remote"
+    remote_dir.mkdir()
+    for name in ["a", "b", "c"]:
+        (remote_dir / name).write_bytes(b"x" * 10)
+    cache = LocalArtifactCache(
+        artifact_store=FakeRemoteArtifactStore(str(remote_dir)),
+        max_size=25,
+        directory=str(tmp_path / "cache"),
+    )
+
+    for name in ["a", "b", "c"]:
+        cache.open(f"s3://{name}", "rb").close()
+
+    num_files, num_bytes = cache.get_size()
+    assert num_files == 2
+    assert num_bytes == 20
+    assert cache.get_stats()["evictions"] == 1
+
+    cache.clear()
+    assert cache.get_size() == (0, 0)
+
+
+def test_local_artifact_cache_only_scans_directory_when_needed(
+    tmp_path, mocker
+):
+    """Tests that the cache directory is only scanned on the first download
+    and when files need to be evicted."""
+    remote_dir = tmp_path / "remote"
+    remote_dir.mkdir()
+    for name in ["a", "b", "c", "d"]:
+        (remote_dir / name).write_bytes(b"x" * 10)
+    cache = LocalArtifactCache(
+        artifact_store=FakeRemoteArtifactStore(str(remote_dir)),
+        max_size=35,
+        directory=str(tmp_path / "cache"),
+    )
+    list_entries = mocker.spy(cache, "_list_entries")
+
+    for name in ["a", "b", "c"]:
+        cache.open(f"s3://{name}", "rb").close()
+    assert list_entries.call_count == 1
+
+    cache.open("s3://d", "rb").close()
+    assert list_entries.call_count == 2
+    assert cache.get_size() == (3, 30)
+
+
+def test_local_artifact_cache_uses_size_of_deduplicated_files(tmp_path):
+    """Tests that the cache bounds the size of the files deduplicated files
+    point to instead of the size of the pointers."""
+    remote_dir = tmp_path / "remote"
+    remote_dir.mkdir()
+    storage = ContentAddressedStorage(
+        LocalArtifactStore(name="", path=str(remote_dir))
+    )
+    for name, size in [("small", 40), ("large", 200)]:
+        with storage.open(str(remote_dir / name), "wb") as f:
+            f.write(b"x" * size)
+    cache = LocalArtifactCache(
+        artifact_store=storage.artifact_store,
+        max_size=100,
+        directory=str(tmp_path / "cache"),
+        open_function=storage.open,
+        stat_function=storage.stat,
+    )
+
+    with cache.open(str(remote_dir / "large"), "rb") as f:
+        assert f.read() == b"x" * 200
+    assert cache.get_size() == (0, 0)
+
+    with cache.open(str(remote_dir / "small"), "rb") as f:
+        assert f.read() == b"x" * 40
+    assert cache.get_size() == (1, 40)
+
+
+def test_local_artifact_cache_stats_are_shared_between_caches(tmp_path):
+    """Tests that the counters of caches sharing a directory, e.g. in
+    different processes, add up once they're flushed."""
+    remote_dir = tmp_path / "remote"
+    remote_dir.mkdir()
+    (remote_dir / "data").write_bytes(b"data")
+    caches = [
+        LocalArtifactCache(
+            artifact_store=FakeRemoteArtifactStore(str(remote_dir)),
+            max_size=1024,
+            directory=str(tmp_path / "cache"),
+        )
+        for _ in range(2)
+    ]
+
+    for cache in caches:
+        cache.open("s3://data", "rb").close()
+        cache.flush_stats()
+
+    stats = LocalArtifactCache(directory=str(tmp_path / "cache")).get_stats()
+    assert stats == {"hits": 1, "misses": 1, "evictions": 0}
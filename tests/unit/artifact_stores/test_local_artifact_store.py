@@ -41,3 +41,10 @@ def test_local_artifact_store_only_supports_local_paths():
 
     artifact_store = LocalArtifactStore(name="", path="/local/path")
     assert artifact_store.path == "/local/path"
+
+
+def test_local_artifact_store_does_not_support_deduplication():
+    """Checks that deduplication can't be enabled for a local artifact store,
+    whose files are read directly from disk by many materializers."""
+    with pytest.raises(ArtifactStoreInterfaceError):
+        LocalArtifactStore(name="", path="/local/path", deduplicate=True)
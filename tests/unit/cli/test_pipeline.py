@@ -105,3 +105,41 @@ def test_pipeline_run_multifile(clean_repo: Repository, files_dir: str) -> None:
     for mod in sys.modules:
         if mod not in clean_sys_modules:
             del sys.modules[mod]
+
+
+def test_get_cache_miss_reasons(mocker) -> None:
+    """Test that the cache miss reasons list all differences between two
+    executions of a step."""
+    from zenml.cli.pipeline import get_cache_miss_reasons
+    from zenml.post_execution import StepView
+
+    def _step_view(parameters, code_hashes, input_id) -> StepView:
+        metadata_store = mocker.Mock()
+        metadata_store.get_step_artifacts.return_value = (
+            {"input": mocker.Mock(id=input_id)},
+            {"output": mocker.Mock()},
+        )
+        return StepView(
+            id_=1,
+            parents_step_ids=[],
+            entrypoint_name=STEP_NAME,
+            name=STEP_NAME,
+            parameters=parameters,
+            metadata_store=metadata_store,
+            internal_parameters={"code_hashes": code_hashes},
+        )
+
+    previous_step = _step_view(
+        {"a": 1, "b": 2}, {"module.step": "1", "module.helper": "1"}, 1
+    )
+
+    assert get_cache_miss_reasons(previous_step, previous_step) == []
+
+    step = _step_view(
+        {"a": 1, "b": 3}, {"module.step": "1", "module.helper": "2"}, 2
+    )
+    assert get_cache_miss_reasons(step, previous_step) == [
+        "Parameter 'b' changed from `2` to `3`.",
+        "Code of 'module.helper' changed.",
+        "Input 'input' changed.",
+    ]
@@ -12,10 +12,17 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import threading
+import time
+from collections import defaultdict
 from contextlib import ExitStack as does_not_raise
 from typing import Dict, List
 
+import pytest
+
 from zenml.integrations.kubernetes.orchestrators.dag_runner import (
+    FailurePolicy,
+    NodeStatus,
     ThreadedDagRunner,
     reverse_dag,
 )
@@ -71,3 +78,112 @@ def test_dag_runner_multi_path():  # 3->(2, 5)->1
 def test_dag_runner_cyclic():
     """Test that nothing happens for cyclic graphs, and no error is raised."""
     _test_runner({1: [2], 2: [1]}, correct_results=[0])
+
+
+class ConcurrencyTrackingRunFn:
+    """Function that records the peak number of concurrently running nodes
+    per resource class."""
+
+    def __init__(self, resource_classes: Dict[str, str]) -> None:
+        self.resource_classes = resource_classes
+        self.running = defaultdict(int)
+        self.peak = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def __call__(self, node) -> None:
+        keys = ("all", self.resource_classes.get(node, "default"))
+        with self._lock:
+            for key in keys:
+                self.running[key] += 1
+                self.peak[key] = max(self.peak[key], self.running[key])
+        time.sleep(0.01)
+        with self._lock:
+            for key in keys:
+                self.running[key] -= 1
+
+
+def _fan_out_dag(width: int) -> Dict[str, List[str]]:
+    """Creates a DAG `root->(step_0, ..., step_n)->sink`."""
+    dag = {"root": [], "sink": [f"step_{i}" for i in range(width)]}
+    dag.update({f"step_{i}": ["root"] for i in range(width)})
+    return dag
+
+
+def test_dag_runner_respects_parallelism_limits():
+    """Test that the DAG runner never runs more nodes in parallel than the
+    overall and the per resource class limits allow."""
+    dag = _fan_out_dag(width=20)
+    resource_classes = {f"step_{i}": "gpu" for i in range(0, 20, 2)}
+    run_fn = ConcurrencyTrackingRunFn(resource_classes)
+
+    runner = ThreadedDagRunner(
+        dag,
+        run_fn,
+        max_parallelism=4,
+        resource_classes=resource_classes,
+        resource_class_limits={"gpu": 1},
+    )
+    runner.run()
+
+    assert run_fn.peak["all"] == 4
+    assert run_fn.peak["gpu"] == 1
+    assert set(runner.node_states.values()) == {NodeStatus.COMPLETED}
+
+
+def test_dag_runner_rejects_invalid_parallelism_limits():
+    """Test that the DAG runner can't be created with non-positive limits."""
+    with pytest.raises(ValueError):
+        ThreadedDagRunner({}, MockRunFn(), max_parallelism=0)
+
+    with pytest.raises(ValueError):
+        ThreadedDagRunner({}, MockRunFn(), resource_class_limits={"gpu": 0})
+
+
+def _failing_run_fn(node) -> None:
+    """Run function that fails for node `a`."""
+    if node == "a":
+        raise RuntimeError("Step failed.")
+
+
+def test_dag_runner_fail_fast():
+    """Test that no new nodes are started once a node failed if the failure
+    policy is fail-fast."""
+    dag = {"a": [], "b": ["a"], "c": [], "d": ["c"]}
+    runner = ThreadedDagRunner(
+        dag,
+        _failing_run_fn,
+        max_parallelism=1,
+        failure_policy=FailurePolicy.FAIL_FAST,
+    )
+
+    with pytest.raises(RuntimeError):
+        runner.run()
+
+    assert runner.node_states == {
+        "a": NodeStatus.FAILED,
+        "b": NodeStatus.SKIPPED,
+        "c": NodeStatus.SKIPPED,
+        "d": NodeStatus.SKIPPED,
+    }
+
+
+def test_dag_runner_continue_on_failure():
+    """Test that all nodes which don't depend on a failed node are run if the
+    failure policy is continue."""
+    dag = {"a": [], "b": ["a"], "c": [], "d": ["c"]}
+    runner = ThreadedDagRunner(
+        dag,
+        _failing_run_fn,
+        max_parallelism=1,
+        failure_policy=FailurePolicy.CONTINUE,
+    )
+
+    with pytest.raises(RuntimeError):
+        runner.run()
+
+    assert runner.node_states == {
+        "a": NodeStatus.FAILED,
+        "b": NodeStatus.SKIPPED,
+        "c": NodeStatus.COMPLETED,
+        "d": NodeStatus.COMPLETED,
+    }
@@ -0,0 +1,202 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import queue
+import threading
+from typing import Dict, List
+
+import pytest
+from kubernetes import client as k8s_client
+from kubernetes.client.rest import ApiException
+
+from zenml.integrations.kubernetes.orchestrators import kube_utils
+
+
+def _pod(name: str, phase: str, resource_version: str = "1"):
+    """Creates a pod with the given name and phase."""
+    return k8s_client.V1Pod(
+        metadata=k8s_client.V1ObjectMeta(
+            name=name, resource_version=resource_version
+        ),
+        status=k8s_client.V1PodStatus(phase=phase),
+    )
+
+
+class FakeCoreApi:
+    """Fake Kubernetes core API which records all pod reads."""
+
+    def __init__(self) -> None:
+        self.pods: Dict[str, k8s_client.V1Pod] = {}
+        self.logs: Dict[str, List[str]] = {}
+        self.pod_reads = 0
+
+    def list_namespaced_pod(self, namespace, **kwargs):
+        raise NotImplementedError("Only used to identify the watched API.")
+
+    def read_namespaced_pod(self, name, namespace):
+        self.pod_reads += 1
+        return self.pods[name]
+
+    def read_namespaced_pod_log(self, name, namespace, **kwargs):
+        return "\n".join(self.logs.get(name, []))
+
+
+class FakeWatch:
+    """Fake Kubernetes watch that streams events pushed by the test."""
+
+    def __init__(self, core_api: FakeCoreApi, events: "queue.Queue") -> None:
+        self.core_api = core_api
+        self.events = events
+        self._stopped = threading.Event()
+
+    def stream(self, func, **kwargs):
+        if func == self.core_api.read_namespaced_pod_log:
+            yield from self.core_api.logs.get(kwargs["name"], [])
+            return
+
+        while not self._stopped.is_set():
+            try:
+                pod = self.events.get(timeout=0.01)
+            except queue.Empty:
+                continue
+            yield {"type": "MODIFIED", "object": pod}
+
+    def stop(self):
+        self._stopped.set()
+
+
+@pytest.fixture
+def core_api() -> FakeCoreApi:
+    """Fake Kubernetes core API."""
+    return FakeCoreApi()
+
+
+@pytest.fixture
+def events() -> "queue.Queue":
+    """Queue of pods which will be streamed as watch events."""
+    return queue.Queue()
+
+
+def test_pod_watcher_notifies_waiting_threads(core_api, events):
+    """Tests that waiting for pods uses the shared watch and doesn't poll
+    individual pods."""
+    with kube_utils.PodWatcher(
+        core_api=core_api,
+        namespace="zenml",
+        watch_factory=lambda: FakeWatch(core_api, events),
+    ) as pod_watcher:
+        results = {}
+
+        def _wait(pod_name: str) -> None:
+            results[pod_name] = pod_watcher.wait(
+                pod_name=pod_name,
+                exit_condition_lambda=kube_utils.pod_is_done,
+                timeout_sec=10,
+            )
+
+        threads = [
+            threading.Thread(target=_wait, args=(name,)) for name in "ab"
+        ]
+        for thread in threads:
+            thread.start()
+
+        events.put(_pod("a", "Running"))
+        events.put(_pod("b", "Succeeded"))
+        events.put(_pod("a", "Succeeded", resource_version="2"))
+        for thread in threads:
+            thread.join(timeout=5)
+
+    assert results["a"].metadata.resource_version == "2"
+    assert results["b"].status.phase == "Succeeded"
+    assert core_api.pod_reads == 0
+
+
+def test_pod_watcher_raises_if_pod_failed(core_api, events):
+    """Tests that waiting for a pod fails if the pod failed."""
+    events.put(_pod("a", "Failed"))
+    with kube_utils.PodWatcher(
+        core_api=core_api,
+        namespace="zenml",
+        watch_factory=lambda: FakeWatch(core_api, events),
+    ) as pod_watcher:
+        with pytest.raises(RuntimeError):
+            pod_watcher.wait(
+                pod_name="a",
+                exit_condition_lambda=kube_utils.pod_is_done,
+                timeout_sec=10,
+            )
+
+
+def test_pod_watcher_times_out(core_api, events):
+    """Tests that waiting for a pod times out."""
+    events.put(_pod("a", "Running"))
+    with kube_utils.PodWatcher(
+        core_api=core_api,
+        namespace="zenml",
+        watch_factory=lambda: FakeWatch(core_api, events),
+    ) as pod_watcher:
+        with pytest.raises(RuntimeError):
+            pod_watcher.wait(
+                pod_name="a",
+                exit_condition_lambda=kube_utils.pod_is_done,
+                timeout_sec=1,
+            )
+
+
+def test_pod_watcher_streams_logs(core_api, events, mocker):
+    """Tests that the logs of a pod are streamed once it started."""
+    core_api.logs["a"] = ["line 1", "line 2"]
+    events.put(_pod("a", "Running"))
+    events.put(_pod("a", "Succeeded", resource_version="2"))
+    mock_logger = mocker.patch.object(kube_utils, "logger")
+
+    with kube_utils.PodWatcher(
+        core_api=core_api,
+        namespace="zenml",
+        watch_factory=lambda: FakeWatch(core_api, events),
+    ) as pod_watcher:
+        pod_watcher.wait(
+            pod_name="a",
+            exit_condition_lambda=kube_utils.pod_is_done,
+            timeout_sec=10,
+            stream_logs=True,
+        )
+
+    mock_logger.info.assert_has_calls(
+        [mocker.call("line 1"), mocker.call("line 2")]
+    )
+
+
+def test_pod_watcher_falls_back_to_polling(core_api):
+    """Tests that waiting for a pod polls the pod if the watch fails."""
+
+    class ForbiddenWatch:
+        def stream(self, func, **kwargs):
+            raise ApiException(status=403)
+
+        def stop(self):
+            pass
+
+    core_api.pods["a"] = _pod("a", "Succeeded")
+    with kube_utils.PodWatcher(
+        core_api=core_api, namespace="zenml", watch_factory=ForbiddenWatch
+    ) as pod_watcher:
+        pod = pod_watcher.wait(
+            pod_name="a",
+            exit_condition_lambda=kube_utils.pod_is_done,
+            timeout_sec=10,
+        )
+
+    assert pod.status.phase == "Succeeded"
+    assert core_api.pod_reads == 1
@@ -75,3 +75,27 @@ def test_kubernetes_orchestrator_local_stack() -> None:
             artifact_store=local_artifact_store,
             container_registry=local_container_registry,
         ).validate()
+
+
+def test_kubernetes_orchestrator_scheduling_options() -> None:
+    """Test that the scheduling options of the Kubernetes orchestrator are
+    parsed and validated."""
+    orchestrator = KubernetesOrchestrator(
+        name="",
+        skip_config_loading=True,
+        max_parallelism=10,
+        step_resource_classes='{"trainer": "gpu"}',
+        resource_class_limits='{"gpu": 2}',
+    )
+    assert orchestrator.step_resource_classes == {"trainer": "gpu"}
+    assert orchestrator.resource_class_limits == {"gpu": 2}
+
+    with pytest.raises(ValueError):
+        KubernetesOrchestrator(
+            name="", skip_config_loading=True, max_parallelism=0
+        )
+
+    with pytest.raises(ValueError):
+        KubernetesOrchestrator(
+            name="", skip_config_loading=True, resource_class_limits={"gpu": 0}
+        )
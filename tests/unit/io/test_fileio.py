@@ -320,6 +320,26 @@ def test_copy_dir_copies_dir_from_source_to_destination(tmp_path) -> None:
     assert os.path.exists(os.path.join(tmp_path, "test_dir_copy/new_file.txt"))
 
 
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_copy_dir_copies_nested_directories(tmp_path, max_workers) -> None:
+    """Test that copy_dir copies all files of nested directories, also when
+    copying them concurrently"""
+    source_dir = os.path.join(tmp_path, "source")
+    relative_paths = ["a.txt", "sub/b.txt", "sub/sub/c.txt", "other/d.txt"]
+    for relative_path in relative_paths:
+        path = os.path.join(source_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(relative_path)
+
+    destination_dir = os.path.join(tmp_path, "destination")
+    io_utils.copy_dir(source_dir, destination_dir, max_workers=max_workers)
+
+    for relative_path in relative_paths:
+        with open(os.path.join(destination_dir, relative_path)) as f:
+            assert f.read() == relative_path
+
+
 def test_move_moves_a_file_from_source_to_destination(tmp_path) -> None:
     """Test that move moves a file from source to destination"""
     io_utils.create_file_if_not_exists(os.path.join(tmp_path, "new_file.txt"))
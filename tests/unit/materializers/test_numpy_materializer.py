@@ -0,0 +1,50 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+
+import numpy as np
+
+from zenml.artifacts import DataArtifact
+from zenml.materializers.numpy_materializer import (
+    DATA_FILENAME,
+    NUMPY_FILENAME,
+    NumpyMaterializer,
+)
+
+
+def test_numpy_materializer_preserves_dtype_and_shape(tmp_path):
+    """Tests that arrays are stored natively and loaded memory-mapped."""
+    arr = np.arange(24, dtype=">i4").reshape(2, 3, 4)
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    materializer = NumpyMaterializer(artifact=artifact)
+    materializer.handle_return(arr)
+
+    assert os.path.exists(os.path.join(tmp_path, NUMPY_FILENAME))
+    loaded = materializer.handle_input(np.ndarray)
+    assert isinstance(loaded, np.memmap)
+    assert loaded.dtype == arr.dtype
+    np.testing.assert_array_equal(loaded, arr)
+
+
+def test_numpy_materializer_reads_legacy_parquet_artifacts(tmp_path):
+    """Tests that arrays stored in the old parquet format can still be read."""
+    arr = np.array([["a", "b"], ["c", "d"]], dtype=object)
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    materializer = NumpyMaterializer(artifact=artifact)
+    materializer.handle_return(arr)
+
+    assert os.path.exists(os.path.join(tmp_path, DATA_FILENAME))
+    np.testing.assert_array_equal(materializer.handle_input(np.ndarray), arr)
@@ -0,0 +1,117 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+
+import pandas as pd
+import pytest
+
+from zenml.artifacts import DataArtifact
+from zenml.materializers.pandas_materializer import (
+    LEGACY_FILENAME,
+    METADATA_FILENAME,
+    PandasMaterializer,
+)
+from zenml.utils import yaml_utils
+
+
+def _get_materializer(uri: str) -> PandasMaterializer:
+    """Creates a pandas materializer for an artifact at the given URI."""
+    os.makedirs(uri, exist_ok=True)
+    artifact = DataArtifact()
+    artifact.uri = uri
+    return PandasMaterializer(artifact=artifact)
+
+
+def test_pandas_materializer_round_trip(tmp_path):
+    """Tests that dataframes and series are read back unchanged."""
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    materializer = _get_materializer(str(tmp_path / "df"))
+    materializer.handle_return(df)
+    pd.testing.assert_frame_equal(materializer.handle_input(pd.DataFrame), df)
+
+    series = pd.Series([1.0, 2.0, 3.0])
+    materializer = _get_materializer(str(tmp_path / "series"))
+    materializer.handle_return(series)
+    assert list(materializer.handle_input(pd.Series)) == list(series)
+
+
+def test_pandas_materializer_reads_column_projection_and_filters(tmp_path):
+    """Tests that only the requested columns and rows are read."""
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6], "c": [7, 8, 9]})
+    materializer = _get_materializer(str(tmp_path))
+    materializer.handle_return(df)
+
+    projected = materializer.read_dataframe(columns=["a", "c"])
+    assert list(projected.columns) == ["a", "c"]
+
+    filtered = materializer.read_dataframe(
+        columns=["b"], filters=[("a", ">=", 2)]
+    )
+    assert list(filtered["b"]) == [5, 6]
+
+
+def test_pandas_materializer_records_write_options(tmp_path):
+    """Tests that the write options are configurable and stored with the
+    artifact."""
+
+    class ZstdPandasMaterializer(PandasMaterializer):
+        COMPRESSION = "zstd"
+        COMPRESSION_LEVEL = 5
+
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    df = pd.DataFrame({"a": range(100)})
+    ZstdPandasMaterializer(artifact=artifact).handle_return(df)
+
+    metadata = yaml_utils.read_json(str(tmp_path / METADATA_FILENAME))
+    assert metadata["compression"] == "zstd"
+    assert metadata["compression_level"] == 5
+
+    # Any pandas materializer can read the artifact
+    loaded = PandasMaterializer(artifact=artifact).handle_input(pd.DataFrame)
+    pd.testing.assert_frame_equal(loaded, df)
+
+
+def test_pandas_materializer_reads_legacy_artifacts(tmp_path):
+    """Tests that artifacts without metadata file can still be read."""
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    df.to_parquet(str(tmp_path / LEGACY_FILENAME), compression="gzip")
+
+    materializer = _get_materializer(str(tmp_path))
+    pd.testing.assert_frame_equal(materializer.handle_input(pd.DataFrame), df)
+
+
+def test_pandas_materializer_rejects_unknown_compression():
+    """Tests that an unsupported compression codec raises an error."""
+
+    class InvalidPandasMaterializer(PandasMaterializer):
+        COMPRESSION = "zip"
+
+    with pytest.raises(ValueError):
+        InvalidPandasMaterializer.get_write_options()
+
+
+def test_pandas_materializer_compression_level_from_environment(monkeypatch):
+    """Tests that a compression level of zero set using an environment
+    variable is used and levels are rejected for codecs without levels."""
+    monkeypatch.setenv("ZENML_PANDAS_COMPRESSION", "zstd")
+    monkeypatch.setenv("ZENML_PANDAS_COMPRESSION_LEVEL", "0")
+    assert PandasMaterializer.get_write_options()["compression_level"] == 0
+
+    monkeypatch.setenv("ZENML_PANDAS_COMPRESSION", "snappy")
+    with pytest.raises(ValueError, match="compression level"):
+        PandasMaterializer.get_write_options()
+
+    monkeypatch.delenv("ZENML_PANDAS_COMPRESSION_LEVEL")
+    assert PandasMaterializer.get_write_options()["compression_level"] is None
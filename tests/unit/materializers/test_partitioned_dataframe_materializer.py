@@ -0,0 +1,135 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from zenml.artifacts import DataArtifact
+from zenml.materializers import (
+    PartitionedDataFrame,
+    PartitionedDataFrameMaterializer,
+)
+
+
+def _generate_partitions(num_partitions: int, rows: int):
+    """Generates dataframes with consecutive values in column `a`."""
+    for i in range(num_partitions):
+        yield pd.DataFrame(
+            {"a": range(i * rows, (i + 1) * rows), "b": ["x"] * rows}
+        )
+
+
+def test_partitioned_dataframe_round_trip(tmp_path):
+    """Tests that partitions are written incrementally and read in batches."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    materializer = PartitionedDataFrameMaterializer(artifact=artifact)
+    materializer.handle_return(
+        PartitionedDataFrame(_generate_partitions(num_partitions=3, rows=10))
+    )
+
+    data = materializer.handle_input(PartitionedDataFrame)
+    assert data.num_rows == 30
+    assert [len(p) for p in data.iter_partitions()] == [10, 10, 10]
+
+    batches = list(data.iter_batches(batch_size=4, columns=["a"]))
+    assert all(len(batch) <= 4 for batch in batches)
+    assert all(list(batch.columns) == ["a"] for batch in batches)
+    assert list(data.to_pandas()["a"]) == list(range(30))
+
+
+def test_partitioned_dataframe_rejects_mismatching_schemas(tmp_path):
+    """Tests that all partitions need to have the same schema."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    materializer = PartitionedDataFrameMaterializer(artifact=artifact)
+    partitions = [pd.DataFrame({"a": [1]}), pd.DataFrame({"b": ["x"]})]
+
+    with pytest.raises(ValueError):
+        materializer.handle_return(PartitionedDataFrame(partitions))
+
+
+def test_partitioned_dataframe_unifies_null_columns(tmp_path):
+    """Tests that partitions with all-null columns are read with the types
+    of the other partitions."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    materializer = PartitionedDataFrameMaterializer(artifact=artifact)
+    partitions = [
+        pd.DataFrame({"a": [None, None], "b": [1.0, 2.0]}),
+        pd.DataFrame({"a": ["x", "y"], "b": [None, None]}),
+    ]
+    materializer.handle_return(PartitionedDataFrame(partitions))
+
+    data = materializer.handle_input(PartitionedDataFrame)
+    assert not pa.types.is_null(data.schema.field("a").type)
+    assert pa.types.is_floating(data.schema.field("b").type)
+    df = data.to_pandas()
+    assert df["a"].isna().tolist() == [True, True, False, False]
+    assert list(df["a"][2:]) == ["x", "y"]
+    assert df["b"].dtype == "float64"
+
+
+def test_partitioned_dataframe_promotes_integer_columns(tmp_path):
+    """Tests that integer partitions followed by floating point partitions
+    are read as floating point columns."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    materializer = PartitionedDataFrameMaterializer(artifact=artifact)
+    partitions = [
+        pd.DataFrame({"a": [1, 2]}),
+        pd.DataFrame({"a": [0.5, 1.5]}),
+    ]
+    materializer.handle_return(PartitionedDataFrame(partitions))
+
+    data = materializer.handle_input(PartitionedDataFrame)
+    assert pa.types.is_floating(data.schema.field("a").type)
+    df = data.to_pandas()
+    assert df["a"].dtype == "float64"
+    assert list(df["a"]) == [1.0, 2.0, 0.5, 1.5]
+
+    partitions = [pd.DataFrame({"a": [1]}), pd.DataFrame({"a": ["x"]})]
+    with pytest.raises(ValueError):
+        materializer.handle_return(PartitionedDataFrame(partitions))
+
+
+def test_partitioned_dataframe_without_partitions(tmp_path):
+    """Tests that a partitioned dataframe without partitions is read as an
+    empty dataframe."""
+    artifact = DataArtifact()
+    artifact.uri = str(tmp_path)
+    materializer = PartitionedDataFrameMaterializer(artifact=artifact)
+    materializer.handle_return(PartitionedDataFrame([]))
+
+    data = materializer.handle_input(PartitionedDataFrame)
+    assert data.num_rows == 0
+    assert data.to_pandas().empty
+    assert PartitionedDataFrame([]).to_pandas().empty
+
+    materializer.handle_return(
+        PartitionedDataFrame([pd.DataFrame({"a": pd.Series([], dtype=int)})])
+    )
+    data = materializer.handle_input(PartitionedDataFrame)
+    df = data.to_pandas()
+    assert list(df.columns) == ["a"]
+    assert df["a"].dtype == "int64"
+
+
+def test_partitioned_dataframe_requires_exactly_one_source():
+    """Tests that a partitioned dataframe needs either partitions or a URI."""
+    with pytest.raises(ValueError):
+        PartitionedDataFrame()
+
+    with pytest.raises(ValueError):
+        PartitionedDataFrame([pd.DataFrame()], uri="/tmp")
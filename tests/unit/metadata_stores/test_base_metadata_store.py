@@ -11,3 +11,132 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+
+import pytest
+
+from zenml.enums import ExecutionStatus
+from zenml.pipelines import pipeline
+from zenml.repository import Repository
+from zenml.steps import step
+
+
+@step
+def _producer() -> int:
+    return 1
+
+
+@step
+def _failing_producer() -> int:
+    raise RuntimeError("producer failed")
+
+
+@step
+def _transformer(value: int) -> int:
+    return value + 1
+
+
+@step
+def _consumer(value: int) -> None:
+    pass
+
+
+@pipeline(enable_cache=False)
+def _chain_pipeline(producer, transformer, consumer):
+    consumer(transformer(producer()))
+
+
+@pipeline(enable_cache=False)
+def _single_step_pipeline(producer):
+    producer()
+
+
+def test_pipeline_run_steps_are_fetched_with_their_artifacts(
+    clean_repo: Repository, mocker
+):
+    """Tests that fetching the steps of a run also fetches all their inputs
+    and outputs in a constant number of queries and resolves the parents."""
+    _chain_pipeline(
+        producer=_producer(),
+        transformer=_transformer(),
+        consumer=_consumer(),
+    ).run()
+
+    metadata_store = clean_repo.active_stack.metadata_store
+    run = metadata_store.get_pipeline("_chain_pipeline").runs[-1]
+
+    spies = [
+        mocker.spy(metadata_store.store, method)
+        for method in (
+            "get_events_by_execution_ids",
+            "get_events_by_artifact_ids",
+            "get_artifacts_by_id",
+        )
+    ]
+    producer, transformer, consumer = run.steps
+    for spy in spies:
+        assert spy.call_count == 1
+
+    assert producer.parents_step_ids == []
+    assert transformer.parents_step_ids == [producer.id]
+    assert consumer.parents_step_ids == [transformer.id]
+
+    assert transformer.input == producer.output
+    assert transformer.input.parent_step_id == producer.id
+    assert consumer.input.parent_step_id == transformer.id
+    assert transformer.output.parent_step_id == transformer.id
+    assert transformer.input.read() == 1
+    assert consumer.input.read() == 2
+
+    # inputs and outputs were fetched together with the steps
+    for spy in spies:
+        assert spy.call_count == 1
+
+
+def test_pipeline_runs_are_filtered_by_parent_context(
+    clean_repo: Repository, mocker
+):
+    """Tests that the runs of a pipeline are fetched in a single query per
+    page without checking the executions of each run."""
+    for i in range(2):
+        _chain_pipeline(
+            producer=_producer(),
+            transformer=_transformer(),
+            consumer=_consumer(),
+        ).run(run_name=f"chain_run_{i}")
+    _single_step_pipeline(producer=_producer()).run(run_name="other_run")
+
+    metadata_store = clean_repo.active_stack.metadata_store
+    pipeline = metadata_store.get_pipeline("_chain_pipeline")
+    is_run_of_pipeline = mocker.spy(type(metadata_store), "_is_run_of_pipeline")
+    get_contexts = mocker.spy(metadata_store.store, "get_contexts")
+
+    runs = metadata_store.get_pipeline_runs(pipeline)
+    assert list(runs) == ["chain_run_0", "chain_run_1"]
+    assert get_contexts.call_count == 1
+    is_run_of_pipeline.assert_not_called()
+
+
+def test_runs_with_failed_first_step_are_linked_to_their_pipeline(
+    clean_repo: Repository,
+):
+    """Tests that a run whose first step failed is still listed as a run of
+    its pipeline."""
+    _single_step_pipeline(producer=_producer()).run(run_name="successful_run")
+    metadata_store = clean_repo.active_stack.metadata_store
+    # listing the runs links all existing runs once, afterwards runs are only
+    # found if they were linked when they were executed
+    pipeline = metadata_store.get_pipeline("_single_step_pipeline")
+    assert [run.name for run in pipeline.runs] == ["successful_run"]
+
+    with pytest.raises(Exception):
+        _single_step_pipeline(producer=_failing_producer()).run(
+            run_name="failed_run"
+        )
+
+    assert [run.name for run in pipeline.runs] == [
+        "successful_run",
+        "failed_run",
+    ]
+    assert [
+        run.name for run in pipeline.get_runs(status=ExecutionStatus.FAILED)
+    ] == ["failed_run"]
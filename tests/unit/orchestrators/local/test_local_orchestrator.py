@@ -11,7 +11,14 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
 from zenml.enums import StackComponentType
+from zenml.metadata_stores import BaseMetadataStore
 from zenml.orchestrators import LocalOrchestrator
 
 
@@ -21,3 +28,131 @@ def test_local_orchestrator_attributes():
     orchestrator = LocalOrchestrator(name="")
     assert orchestrator.TYPE == StackComponentType.ORCHESTRATOR
     assert orchestrator.FLAVOR == "local"
+
+
+def test_local_orchestrator_runs_sequentially_by_default():
+    """Tests that the local orchestrator only runs steps in parallel if
+    explicitly enabled."""
+    orchestrator = LocalOrchestrator(name="")
+    assert orchestrator.parallel is False
+    assert orchestrator.max_parallelism is None
+
+
+def test_local_orchestrator_rejects_invalid_max_parallelism():
+    """Tests that the local orchestrator fails to initialize with a maximum
+    parallelism smaller than one."""
+    with pytest.raises(ValueError):
+        LocalOrchestrator(name="", parallel=True, max_parallelism=0)
+
+    orchestrator = LocalOrchestrator(name="", parallel=True, max_parallelism=4)
+    assert orchestrator.max_parallelism == 4
+
+
+def _run_fan_out_pipeline(tmp_path, mocker, orchestrator, failing_step=None):
+    """Runs a fake pipeline in which three steps depend on a source step and
+    a sink step depends on those three.
+
+    Each step records its process and start and end time in a file."""
+    upstream_steps = {
+        "source": [],
+        "branch_1": ["source"],
+        "branch_2": ["source"],
+        "branch_3": ["source"],
+        "sink": ["branch_1", "branch_2", "branch_3"],
+    }
+    steps = [SimpleNamespace(name=name) for name in upstream_steps]
+
+    def _run_step(step, run_name, pb2_pipeline):
+        start_time = time.time()
+        if step.name.startswith("branch"):
+            time.sleep(0.5)
+        if step.name == failing_step:
+            raise RuntimeError(f"{step.name} failed")
+        (tmp_path / step.name).write_text(
+            f"{os.getpid()} {start_time} {time.time()}"
+        )
+
+    mocker.patch.object(LocalOrchestrator, "run_step", side_effect=_run_step)
+    mocker.patch.object(
+        LocalOrchestrator,
+        "get_upstream_step_names",
+        side_effect=lambda step, pb2_pipeline: upstream_steps[step.name],
+    )
+    orchestrator._run_steps_in_parallel(
+        sorted_steps=steps, run_name="run", pb2_pipeline=None
+    )
+
+
+def _read_step_runs(tmp_path):
+    """Reads the process and start and end time of all steps that ran."""
+    step_runs = {}
+    for path in tmp_path.iterdir():
+        pid, start_time, end_time = path.read_text().split()
+        step_runs[path.name] = (int(pid), float(start_time), float(end_time))
+    return step_runs
+
+
+def test_local_orchestrator_runs_independent_steps_in_parallel(
+    tmp_path, mocker
+):
+    """Tests that independent steps run concurrently in separate processes
+    and downstream steps only start once their upstream steps finished."""
+    orchestrator = LocalOrchestrator(name="", parallel=True, max_parallelism=3)
+    _run_fan_out_pipeline(tmp_path, mocker, orchestrator)
+
+    step_runs = _read_step_runs(tmp_path)
+    assert len(step_runs) == 5
+    assert all(pid != os.getpid() for pid, _, _ in step_runs.values())
+
+    branches = [step_runs[f"branch_{i}"] for i in range(1, 4)]
+    assert max(start for _, start, _ in branches) < min(
+        end for _, _, end in branches
+    )
+    assert all(start >= step_runs["source"][2] for _, start, _ in branches)
+    assert step_runs["sink"][1] >= max(end for _, _, end in branches)
+
+
+def test_local_orchestrator_respects_max_parallelism(tmp_path, mocker):
+    """Tests that no more than `max_parallelism` steps run at once."""
+    orchestrator = LocalOrchestrator(name="", parallel=True, max_parallelism=1)
+    _run_fan_out_pipeline(tmp_path, mocker, orchestrator)
+
+    intervals = sorted(
+        (start, end) for _, start, end in _read_step_runs(tmp_path).values()
+    )
+    assert len(intervals) == 5
+    for (_, end), (next_start, _) in zip(intervals, intervals[1:]):
+        assert next_start >= end
+
+
+def test_local_orchestrator_propagates_step_failures(tmp_path, mocker):
+    """Tests that a failing step fails the run after the running steps have
+    finished and that no downstream steps get scheduled."""
+    orchestrator = LocalOrchestrator(name="", parallel=True, max_parallelism=3)
+    with pytest.raises(RuntimeError, match="branch_1 failed"):
+        _run_fan_out_pipeline(
+            tmp_path, mocker, orchestrator, failing_step="branch_1"
+        )
+
+    assert set(_read_step_runs(tmp_path)) == {"source", "branch_2", "branch_3"}
+
+
+def test_local_orchestrator_workers_open_new_metadata_store_connections(
+    tmp_path, tmp_path_factory, mocker
+):
+    """Tests that worker processes don't use the metadata store connection
+    inherited from the parent process."""
+    reset_dir = tmp_path_factory.mktemp("metadata_store_resets")
+    mocker.patch.object(
+        BaseMetadataStore,
+        "reset_connection",
+        autospec=True,
+        side_effect=lambda _: (reset_dir / str(os.getpid())).touch(),
+    )
+    orchestrator = LocalOrchestrator(name="", parallel=True, max_parallelism=3)
+    _run_fan_out_pipeline(tmp_path, mocker, orchestrator)
+
+    step_pids = {pid for pid, _, _ in _read_step_runs(tmp_path).values()}
+    reset_pids = {int(path.name) for path in reset_dir.iterdir()}
+    assert step_pids <= reset_pids
+    assert os.getpid() not in reset_pids
@@ -11,3 +11,45 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+
+from datetime import datetime
+
+from zenml.enums import ExecutionStatus
+from zenml.metadata_stores import base_metadata_store
+from zenml.repository import Repository
+
+
+def test_pipeline_runs_can_be_limited_and_filtered(
+    clean_repo: Repository, one_step_pipeline, empty_step, mocker
+):
+    """Tests that the runs of a pipeline can be limited to the latest runs,
+    filtered by creation time and by status."""
+    mocker.patch.object(base_metadata_store, "RUNS_PAGE_SIZE", 2)
+    pipeline_instance = one_step_pipeline(empty_step())
+    for i in range(3):
+        pipeline_instance.run(run_name=f"run_{i}")
+    after_third_run = datetime.now()
+    pipeline_instance.run(run_name="run_3")
+
+    pipeline = clean_repo.get_pipeline(pipeline_instance.name)
+
+    assert [run.name for run in pipeline.runs] == [
+        "run_0",
+        "run_1",
+        "run_2",
+        "run_3",
+    ]
+    assert [run.name for run in pipeline.get_runs(limit=2)] == [
+        "run_2",
+        "run_3",
+    ]
+    assert [run.name for run in pipeline.get_runs(since=after_third_run)] == [
+        "run_3"
+    ]
+    assert len(pipeline.get_runs(status=ExecutionStatus.COMPLETED)) == 4
+    assert pipeline.get_runs(status=ExecutionStatus.FAILED) == []
+
+    latest_run = next(pipeline.iter_runs())
+    assert latest_run.name == "run_3"
+    assert latest_run.status == ExecutionStatus.COMPLETED
+    assert latest_run.get_step_names() == ["step_"]
@@ -518,6 +518,29 @@ def test_step_source_execution_parameter_changes_when_function_body_changes():
 
     @step
     def some_step() -> None:
+        print("this is new")
+
+    step_2 = some_step()
+
+    assert (
+        step_1._internal_execution_parameters["zenml-step_source"]
+        != step_2._internal_execution_parameters["zenml-step_source"]
+    )
+
+
+def test_step_source_execution_parameter_ignores_comments_and_docstrings():
+    """Tests that adding comments or docstrings to the step function doesn't
+    change the step source execution parameter."""
+
+    @step
+    def some_step() -> None:
+        pass
+
+    step_1 = some_step()
+
+    @step
+    def some_step() -> None:
+        """This is new."""
         # this is new
         pass
 
@@ -525,7 +548,7 @@ def test_step_source_execution_parameter_changes_when_function_body_changes():
 
     assert (
         step_1._internal_execution_parameters["zenml-step_source"]
-        != step_2._internal_execution_parameters["zenml-step_source"]
+        == step_2._internal_execution_parameters["zenml-step_source"]
     )
 
 
@@ -550,6 +573,51 @@ def test_materializer_source_execution_parameter_changes_when_materializer_chang
     )
 
 
+def test_data_fingerprint_execution_parameter_changes_when_data_changes(
+    tmp_path,
+):
+    """Tests that the fingerprint of the step config is part of the execution
+    parameters and caching gets disabled if it can't be computed or would
+    be the same for all runs of a scheduled pipeline."""
+    data_path = tmp_path / "data.csv"
+
+    class FingerprintConfig(BaseStepConfig):
+        path: str
+
+        def fingerprint(self) -> Optional[str]:
+            with open(self.path) as f:
+                return f.read()
+
+    @step
+    def some_step(config: FingerprintConfig) -> None:
+        pass
+
+    key = "zenml-data_fingerprint"
+    config = FingerprintConfig(path=str(data_path))
+
+    data_path.write_text("1,2,3")
+    step_1 = some_step(config)
+    assert step_1._internal_execution_parameters[key] == "1,2,3"
+
+    data_path.write_text("4,5,6")
+    step_2 = some_step(config)
+    assert step_2._internal_execution_parameters[key] == "4,5,6"
+
+    data_path.unlink()
+    parameters = some_step(config)._internal_execution_parameters
+    assert key not in parameters
+    assert "zenml-disable_cache" in parameters
+
+    # scheduled pipelines are compiled once, which would freeze the
+    # fingerprint for all runs
+    data_path.write_text("1,2,3")
+    scheduled_step = some_step(config)
+    scheduled_step._is_scheduled = True
+    parameters = scheduled_step._internal_execution_parameters
+    assert key not in parameters
+    assert "zenml-disable_cache" in parameters
+
+
 def test_call_step_with_args(int_step_output, step_with_two_int_inputs):
     """Test that a step can be called with args."""
     with does_not_raise():
@@ -0,0 +1,192 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import importlib
+import linecache
+import sys
+import textwrap
+import types
+
+from zenml.utils import code_hash_utils
+
+MODULE_NAME = "code_hash_test_module"
+
+MODULE_SOURCE = '''
+THRESHOLD = 1
+
+
+def helper(x):
+    return x + THRESHOLD
+
+
+def step_function(x):
+    """Docstring."""
+    return helper(x)
+'''
+
+
+HELPER_MODULE_NAME = "code_hash_test_helpers"
+
+HELPER_MODULE_SOURCE = """
+def used_helper(x):
+    return x
+
+
+def unused_helper(x):
+    return x
+
+
+def make_adder(value):
+    def add(x):
+        return x + value
+
+    return add
+
+
+def make_subtractor(value):
+    def subtract(x):
+        return x - value
+
+    return subtract
+"""
+
+STEP_MODULE_SOURCE = f"""
+import {HELPER_MODULE_NAME} as helpers
+
+add = helpers.make_adder(1)
+subtract = helpers.make_subtractor(2)
+
+
+def step_function(x):
+    return subtract(add(helpers.used_helper(x)))
+"""
+
+
+def _load_module(
+    path, source: str, module_name: str = MODULE_NAME
+) -> types.ModuleType:
+    """Writes and (re)imports a test module."""
+    (path / f"{module_name}.py").write_text(textwrap.dedent(source))
+    linecache.clearcache()
+    importlib.invalidate_caches()
+    if module_name in sys.modules:
+        return importlib.reload(sys.modules[module_name])
+    return importlib.import_module(module_name)
+
+
+def test_code_hash_covers_first_party_dependencies(
+    tmp_path, mocker, monkeypatch
+):
+    """Tests that the code hash changes with the code of referenced
+    functions and constants, but not with comments or docstrings."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    mocker.patch.object(
+        code_hash_utils, "_get_first_party_root", return_value=tmp_path
+    )
+
+    try:
+        module = _load_module(tmp_path, MODULE_SOURCE)
+        code_hashes = code_hash_utils.get_code_hashes(module.step_function)
+        assert set(code_hashes) == {
+            f"{MODULE_NAME}.step_function",
+            f"{MODULE_NAME}.helper",
+            f"{MODULE_NAME}.THRESHOLD",
+        }
+        code_hash = code_hash_utils.get_code_hash(module.step_function)
+
+        module = _load_module(
+            tmp_path,
+            MODULE_SOURCE.replace('"""Docstring."""', "# comment").replace(
+                "x + THRESHOLD", "x   +   THRESHOLD  # comment"
+            ),
+        )
+        assert code_hash_utils.get_code_hash(module.step_function) == code_hash
+
+        module = _load_module(
+            tmp_path, MODULE_SOURCE.replace("x + THRESHOLD", "x - THRESHOLD")
+        )
+        new_code_hashes = code_hash_utils.get_code_hashes(module.step_function)
+        assert code_hash_utils.get_code_hash(module.step_function) != code_hash
+        assert {
+            key
+            for key, value in new_code_hashes.items()
+            if code_hashes[key] != value
+        } == {f"{MODULE_NAME}.helper"}
+
+        module = _load_module(
+            tmp_path, MODULE_SOURCE.replace("THRESHOLD = 1", "THRESHOLD = 2")
+        )
+        assert code_hash_utils.get_code_hash(module.step_function) != code_hash
+    finally:
+        sys.modules.pop(MODULE_NAME, None)
+
+
+def test_code_hash_only_covers_referenced_module_attributes(
+    tmp_path, mocker, monkeypatch
+):
+    """Tests that functions referenced as module attributes are hashed
+    without their module, and that constants of closures don't collide."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    mocker.patch.object(
+        code_hash_utils, "_get_first_party_root", return_value=tmp_path
+    )
+
+    try:
+        _load_module(tmp_path, HELPER_MODULE_SOURCE, HELPER_MODULE_NAME)
+        module = _load_module(tmp_path, STEP_MODULE_SOURCE)
+        code_hashes = code_hash_utils.get_code_hashes(module.step_function)
+        add_key = f"{HELPER_MODULE_NAME}.make_adder.<locals>.add"
+        subtract_key = f"{HELPER_MODULE_NAME}.make_subtractor.<locals>.subtract"
+        assert set(code_hashes) == {
+            f"{MODULE_NAME}.step_function",
+            f"{HELPER_MODULE_NAME}.used_helper",
+            add_key,
+            f"{add_key}.value",
+            subtract_key,
+            f"{subtract_key}.value",
+        }
+        code_hash = code_hash_utils.get_code_hash(module.step_function)
+
+        _load_module(
+            tmp_path,
+            HELPER_MODULE_SOURCE.replace(
+                "def unused_helper(x):\n    return x",
+                "def unused_helper(x):\n    return -x",
+            ),
+            HELPER_MODULE_NAME,
+        )
+        module = _load_module(tmp_path, STEP_MODULE_SOURCE)
+        assert code_hash_utils.get_code_hash(module.step_function) == code_hash
+
+        module = _load_module(
+            tmp_path,
+            STEP_MODULE_SOURCE.replace("make_adder(1)", "make_adder(2)"),
+        )
+        assert code_hash_utils.get_code_hash(module.step_function) != code_hash
+    finally:
+        sys.modules.pop(MODULE_NAME, None)
+        sys.modules.pop(HELPER_MODULE_NAME, None)
+
+
+def test_code_hash_ignores_third_party_code():
+    """Tests that referenced code of installed packages isn't hashed."""
+
+    def some_function():
+        return textwrap.dedent("")
+
+    assert list(code_hash_utils.get_code_hashes(some_function)) == [
+        f"{__name__}.{some_function.__qualname__}"
+    ]
@@ -0,0 +1,178 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+
+from zenml.utils import docker_utils
+
+
+def _write(path: str, contents: str) -> None:
+    """Writes a file, creating its parent directories."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(contents)
+
+
+def test_build_hash_only_changes_with_build_inputs(tmp_path):
+    """Tests that the build hash changes with the Dockerfile and included
+    files, but not with excluded files or the copied ZenML config."""
+    context = str(tmp_path)
+    _write(os.path.join(context, "step.py"), "print('step')")
+    _write(os.path.join(context, ".dockerignore"), "data/")
+
+    def _hash(dockerfile: str = "FROM zenml") -> str:
+        return docker_utils.compute_build_hash(context, dockerfile)
+
+    build_hash = _hash()
+    assert _hash() == build_hash
+    assert _hash("FROM other") != build_hash
+
+    _write(os.path.join(context, "data", "large.csv"), "1,2,3")
+    _write(
+        os.path.join(context, docker_utils.CONTAINER_ZENML_CONFIG_DIR, "c"),
+        "config",
+    )
+    assert _hash() == build_hash
+
+    _write(os.path.join(context, "step.py"), "print('changed')")
+    assert _hash() != build_hash
+
+
+def test_tag_with_build_hash():
+    """Tests that the build hash gets appended to the image tag."""
+    build_hash = "0123456789abcdef0123"
+    assert (
+        docker_utils.tag_with_build_hash("registry:5000/image:tag", build_hash)
+        == "registry:5000/image:tag-0123456789abcdef"
+    )
+    assert (
+        docker_utils.tag_with_build_hash("registry:5000/image", build_hash)
+        == "registry:5000/image:0123456789abcdef"
+    )
+
+
+def test_build_and_push_reuses_pushed_image(tmp_path, mocker):
+    """Tests that an image that already exists in the registry is neither
+    built nor pushed again."""
+    container_registry = mocker.Mock()
+    build_image = mocker.patch.object(docker_utils, "_build_image")
+    mocker.patch.object(
+        docker_utils, "get_image_digest", return_value="image@sha256:new"
+    )
+    get_registry_digest = mocker.patch.object(
+        docker_utils, "get_registry_digest", return_value="image@sha256:old"
+    )
+
+    image = docker_utils.build_and_push_docker_image(
+        build_context_path=str(tmp_path),
+        image_name="image:tag",
+        container_registry=container_registry,
+    )
+    assert image == "image@sha256:old"
+    build_image.assert_not_called()
+    container_registry.push_image.assert_not_called()
+
+    get_registry_digest.return_value = None
+    image = docker_utils.build_and_push_docker_image(
+        build_context_path=str(tmp_path),
+        image_name="image:tag",
+        container_registry=container_registry,
+    )
+    assert image == "image@sha256:new"
+    build_image.assert_called_once()
+    container_registry.push_image.assert_called_once()
+    assert not os.path.exists(
+        os.path.join(tmp_path, docker_utils.CONTAINER_ZENML_CONFIG_DIR)
+    )
+
+
+def test_generated_dockerfile_copies_build_context_last():
+    """Tests that the generated Dockerfile sets environment variables before
+    installing the requirements and copies the build context last."""
+    lines = docker_utils.generate_dockerfile_contents(
+        base_image="base",
+        requirements={"b", "a"},
+        environment_vars={"key": "value"},
+    ).split("\n")
+
+    assert lines[2] == "ENV KEY=value"
+    assert lines[3] == "RUN pip install --no-cache 'a' 'b'"
+    assert lines.index("COPY . .") > 3
+
+
+def test_build_and_push_installs_requirements_in_dependency_image(
+    tmp_path, mocker
+):
+    """Tests that requirements are installed in a dependency image which is
+    shared by all images of a repository with the same requirements."""
+    container_registry = mocker.Mock()
+    build_image = mocker.patch.object(docker_utils, "_build_image")
+    mocker.patch.object(
+        docker_utils, "get_image_digest", side_effect=lambda name: name
+    )
+    pushed_images = set()
+    container_registry.push_image.side_effect = pushed_images.add
+    mocker.patch.object(
+        docker_utils,
+        "get_registry_digest",
+        side_effect=lambda name: name if name in pushed_images else None,
+    )
+
+    for pipeline_name in ("pipeline_1", "pipeline_2"):
+        docker_utils.build_and_push_docker_image(
+            build_context_path=str(tmp_path),
+            image_name=f"registry/image:{pipeline_name}",
+            container_registry=container_registry,
+            requirements={"a"},
+        )
+
+    built_images = [
+        call.kwargs["image_name"] for call in build_image.call_args_list
+    ]
+    dependency_image = built_images[0]
+    assert dependency_image.startswith(
+        f"registry/image:{docker_utils.DEPENDENCY_IMAGE_TAG_PREFIX}"
+    )
+    assert len(built_images) == 3
+    assert built_images.count(dependency_image) == 1
+    for call in build_image.call_args_list[1:]:
+        dockerfile = call.kwargs["dockerfile_contents"]
+        assert dockerfile.startswith(f"FROM {dependency_image}")
+        assert "pip install" not in dockerfile
+
+
+def test_dependency_image_includes_environment_variables(tmp_path, mocker):
+    """Tests that the environment variables are set in the dependency image
+    before installing the requirements and are part of its tag."""
+    container_registry = mocker.Mock()
+    build_image = mocker.patch.object(docker_utils, "_build_image")
+    mocker.patch.object(docker_utils, "get_image_digest", return_value=None)
+    mocker.patch.object(docker_utils, "get_registry_digest", return_value=None)
+
+    images = [
+        docker_utils.build_and_push_dependency_image(
+            image_name="registry/image:tag",
+            container_registry=container_registry,
+            requirements={"a"},
+            environment_vars={"pip_index_url": index_url},
+        )
+        for index_url in ("https://index_1", "https://index_2")
+    ]
+
+    assert images[0] != images[1]
+    dockerfile = build_image.call_args.kwargs["dockerfile_contents"]
+    assert dockerfile.split("\n")[2:] == [
+        "ENV PIP_INDEX_URL=https://index_2",
+        "RUN pip install --no-cache 'a'",
+    ]
@@ -0,0 +1,64 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+
+from zenml.utils import filesync_model, yaml_utils
+from zenml.utils.filesync_model import FileSyncModel
+
+
+class SyncedModel(FileSyncModel):
+    """File sync model used for testing."""
+
+    a: int = 0
+    b: int = 0
+
+
+def test_file_sync_model_revalidates_within_interval(tmp_path, mocker):
+    """Tests that the configuration file is only checked once per interval
+    unless it was written in the same process."""
+    config_file = str(tmp_path / "config.yaml")
+    model = SyncedModel(config_file)
+    getmtime = mocker.spy(os.path, "getmtime")
+
+    for _ in range(100):
+        _ = model.a
+    assert getmtime.call_count == 0
+
+    # writes by another model in the same process are picked up right away
+    other_model = SyncedModel(config_file)
+    other_model.a = 1
+    assert model.a == 1
+
+    # writes by other processes are picked up after the interval
+    yaml_utils.write_yaml(config_file, {"a": 2, "b": 0})
+    mocker.patch.object(filesync_model, "CONFIG_REVALIDATION_INTERVAL", 0)
+    assert model.a == 2
+
+
+def test_file_sync_model_batches_writes(tmp_path, mocker):
+    """Tests that changes inside `batch_writes` are written once."""
+    config_file = str(tmp_path / "config.yaml")
+    model = SyncedModel(config_file)
+    write_yaml = mocker.spy(yaml_utils, "write_yaml")
+
+    with model.batch_writes():
+        model.a = 1
+        with model.batch_writes():
+            model.b = 2
+        model.write_config()
+        assert write_yaml.call_count == 0
+
+    assert write_yaml.call_count == 1
+    assert yaml_utils.read_yaml(config_file) == {"a": 1, "b": 2}
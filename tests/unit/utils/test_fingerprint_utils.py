@@ -0,0 +1,52 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+
+import pytest
+
+from zenml.utils import fingerprint_utils
+
+
+def test_fingerprint_paths_changes_with_files(tmp_path):
+    """Tests that the fingerprint of a directory changes when files are
+    modified, added or removed."""
+    (tmp_path / "a.csv").write_text("1,2,3")
+    fingerprint = fingerprint_utils.fingerprint_paths(str(tmp_path))
+    assert fingerprint_utils.fingerprint_paths(str(tmp_path)) == fingerprint
+
+    os.utime(tmp_path / "a.csv", ns=(0, 0))
+    touched_fingerprint = fingerprint_utils.fingerprint_paths(str(tmp_path))
+    assert touched_fingerprint != fingerprint
+
+    (tmp_path / "b.csv").write_text("4,5,6")
+    assert (
+        fingerprint_utils.fingerprint_paths(str(tmp_path))
+        != touched_fingerprint
+    )
+
+    with pytest.raises(FileNotFoundError):
+        fingerprint_utils.fingerprint_paths(str(tmp_path / "missing.csv"))
+
+
+def test_fingerprint_values():
+    """Tests that value fingerprints are deterministic and support values
+    that aren't JSON serializable."""
+    assert fingerprint_utils.fingerprint_values(
+        100, {"b": 1, "a": 2}
+    ) == fingerprint_utils.fingerprint_values(100, {"a": 2, "b": 1})
+    assert fingerprint_utils.fingerprint_values(
+        100
+    ) != fingerprint_utils.fingerprint_values(101)
+    fingerprint_utils.fingerprint_values(object)
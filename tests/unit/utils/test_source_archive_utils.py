@@ -0,0 +1,71 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+import time
+
+from zenml.io import fileio
+from zenml.utils import source_archive_utils
+
+
+def test_source_archive_round_trip(tmp_path, mocker):
+    """Tests that source archives are content-addressed and extracted once."""
+    source_root = tmp_path / "source"
+    (source_root / "steps").mkdir(parents=True)
+    (source_root / "steps" / "trainer.py").write_text("print('train')")
+    (source_root / "data.csv").write_text("1,2,3")
+    (source_root / ".dockerignore").write_text("data.csv")
+    artifact_store_path = str(tmp_path / "artifact_store")
+    mocker.patch.object(
+        source_archive_utils,
+        "SOURCE_ARCHIVE_CACHE_DIR",
+        str(tmp_path / "cache"),
+    )
+
+    archive_uri = source_archive_utils.upload_source_archive(
+        artifact_store_path=artifact_store_path, source_root=str(source_root)
+    )
+
+    # touching files doesn't change the archive
+    time.sleep(0.01)
+    os.utime(source_root / "steps" / "trainer.py")
+    copy = mocker.spy(fileio, "copy")
+    assert (
+        source_archive_utils.upload_source_archive(
+            artifact_store_path=artifact_store_path,
+            source_root=str(source_root),
+        )
+        == archive_uri
+    )
+    copy.assert_not_called()
+
+    extracted_root = source_archive_utils.download_source_archive(archive_uri)
+    with open(os.path.join(extracted_root, "steps", "trainer.py")) as f:
+        assert f.read() == "print('train')"
+    assert not os.path.exists(os.path.join(extracted_root, "data.csv"))
+
+    assert (
+        source_archive_utils.download_source_archive(archive_uri)
+        == extracted_root
+    )
+    copy.assert_called_once()
+
+    (source_root / "steps" / "trainer.py").write_text("print('changed')")
+    assert (
+        source_archive_utils.upload_source_archive(
+            artifact_store_path=artifact_store_path,
+            source_root=str(source_root),
+        )
+        != archive_uri
+    )
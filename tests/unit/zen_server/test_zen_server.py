@@ -12,6 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 import platform
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import requests
@@ -115,3 +116,21 @@ def test_server_up_down():
     finally:
         zen_server.stop(timeout=10)
     assert zen_server.check_status()[0] == ServiceState.INACTIVE
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows",
+    reason="ZenServer not supported as daemon on Windows.",
+)
+def test_server_handles_concurrent_requests(running_zen_server: ZenServer):
+    """Test that concurrent requests are all answered correctly."""
+    endpoint = running_zen_server.endpoint.status.uri.strip("/")
+
+    def _get_stacks(_: int) -> requests.Response:
+        return requests.get(endpoint + STACKS, auth=(DEFAULT_USERNAME, ""))
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        responses = list(executor.map(_get_stacks, range(64)))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert len({response.text for response in responses}) == 1
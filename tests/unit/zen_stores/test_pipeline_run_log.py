@@ -0,0 +1,123 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+from datetime import datetime
+from uuid import uuid4
+
+from zenml.zen_stores.models import StackWrapper, ZenStorePipelineModel
+from zenml.zen_stores.models.pipeline_models import (
+    PipelineRunWrapper,
+    PipelineWrapper,
+)
+from zenml.zen_stores.pipeline_run_log import PipelineRunLog
+
+
+def _run(name: str, pipeline_name: str = "pipeline") -> PipelineRunWrapper:
+    """Creates a pipeline run with the given name."""
+    return PipelineRunWrapper(
+        name=name,
+        pipeline=PipelineWrapper(name=pipeline_name, steps=[]),
+        stack=StackWrapper(name="stack", components=[]),
+        runtime_configuration={},
+        user_id=uuid4(),
+    )
+
+
+def test_pipeline_run_log_appends_and_reloads_runs(tmp_path):
+    """Tests that appended runs are visible to other instances of the log."""
+    log_file = str(tmp_path / "pipeline_runs.jsonl")
+    legacy_file = str(tmp_path / "pipeline_runs.yaml")
+    log = PipelineRunLog(log_file=log_file, legacy_file=legacy_file)
+    other_log = PipelineRunLog(log_file=log_file, legacy_file=legacy_file)
+
+    log.append(_run("run_1"))
+    log.append(_run("run_2", pipeline_name="other_pipeline"))
+    assert [run.name for run in log.pipeline_runs["pipeline"]] == ["run_1"]
+
+    other_log.append(_run("run_3"))
+    assert [run.name for run in log.pipeline_runs["pipeline"]] == [
+        "run_1",
+        "run_3",
+    ]
+    assert [run.name for run in other_log.pipeline_runs["other_pipeline"]] == [
+        "run_2"
+    ]
+
+    with open(log_file) as f:
+        assert len(f.readlines()) == 3
+
+
+def test_pipeline_run_log_reads_lines_once_they_are_complete(tmp_path):
+    """Tests that reading the log doesn't touch a run that is still being
+    written by another process."""
+    log_file = str(tmp_path / "pipeline_runs.jsonl")
+    legacy_file = str(tmp_path / "pipeline_runs.yaml")
+    line = _run("run_1").json() + "\n"
+    with open(log_file, "w") as f:
+        f.write(line[:20])
+
+    log = PipelineRunLog(log_file=log_file, legacy_file=legacy_file)
+    assert not log.pipeline_runs["pipeline"]
+    assert os.path.getsize(log_file) == 20
+
+    with open(log_file, "a") as f:
+        f.write(line[20:])
+    assert [run.name for run in log.pipeline_runs["pipeline"]] == ["run_1"]
+
+
+def test_pipeline_run_log_discards_partial_lines(tmp_path):
+    """Tests that a partially written run of a crashed writer is discarded
+    and doesn't corrupt the next appended run."""
+    log_file = str(tmp_path / "pipeline_runs.jsonl")
+    legacy_file = str(tmp_path / "pipeline_runs.yaml")
+    PipelineRunLog(log_file=log_file, legacy_file=legacy_file).append(
+        _run("run_1")
+    )
+    with open(log_file, "a") as f:
+        f.write(_run("run_2").json()[:20])
+
+    log = PipelineRunLog(log_file=log_file, legacy_file=legacy_file)
+    assert [run.name for run in log.pipeline_runs["pipeline"]] == ["run_1"]
+
+    log.append(_run("run_3"))
+    reloaded_log = PipelineRunLog(log_file=log_file, legacy_file=legacy_file)
+    assert [run.name for run in reloaded_log.pipeline_runs["pipeline"]] == [
+        "run_1",
+        "run_3",
+    ]
+
+
+def test_pipeline_run_log_migrates_yaml_file(tmp_path):
+    """Tests that runs from a YAML file of a previous version are migrated."""
+    log_file = str(tmp_path / "pipeline_runs.jsonl")
+    legacy_file = str(tmp_path / "pipeline_runs.yaml")
+    legacy_store = ZenStorePipelineModel(legacy_file)
+    legacy_store.pipeline_runs["pipeline"].extend(
+        [_run("run_2"), _run("run_1")]
+    )
+    legacy_store.write_config()
+    os.utime(legacy_file, (1_600_000_000, 1_600_000_000))
+
+    log = PipelineRunLog(log_file=log_file, legacy_file=legacy_file)
+    runs = log.pipeline_runs["pipeline"]
+    assert [run.name for run in runs] == ["run_2", "run_1"]
+    assert os.path.exists(log_file)
+    assert os.path.exists(legacy_file)
+
+    # legacy runs get fixed creation times in their registration order
+    assert runs[0].create_time < runs[1].create_time
+    assert runs[1].create_time == datetime.fromtimestamp(1_600_000_000)
+    reloaded_log = PipelineRunLog(log_file=log_file, legacy_file=legacy_file)
+    assert reloaded_log.pipeline_runs["pipeline"] == runs
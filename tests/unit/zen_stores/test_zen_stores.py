@@ -16,11 +16,13 @@ import platform
 import shutil
 import time
 from contextlib import ExitStack as does_not_raise
+from datetime import datetime, timedelta
 from multiprocessing import Process
 
 import pytest
 import requests
 import uvicorn
+from sqlalchemy import event
 
 from zenml.config.global_config import GlobalConfiguration
 from zenml.config.profile_config import ProfileConfiguration
@@ -30,6 +32,10 @@ from zenml.constants import (
     ENV_ZENML_CONFIG_PATH,
     ENV_ZENML_PROFILE_NAME,
     REPOSITORY_DIRECTORY_NAME,
+    REST_STORE_TIMEOUT,
+    STACKS,
+    STACKS_EMPTY,
+    USERS,
     ZEN_SERVER_ENTRYPOINT,
 )
 from zenml.enums import StackComponentType, StoreType
@@ -57,6 +63,7 @@ from zenml.zen_stores import (
 from zenml.zen_stores.base_zen_store import DEFAULT_USERNAME
 from zenml.zen_stores.models import ComponentWrapper, StackWrapper
 from zenml.zen_stores.models.pipeline_models import (
+    PipelineRunSummary,
     PipelineRunWrapper,
     PipelineWrapper,
 )
@@ -257,6 +264,139 @@ def test_register_deregister_components(fresh_zen_store):
     )
 
 
+def test_sql_zen_store_loads_stacks_in_single_query(tmp_path):
+    """Test that listing stacks doesn't query each stack or component."""
+    zen_store = SqlZenStore().initialize(f"sqlite:///{tmp_path / 'store.db'}")
+    default_stack = zen_store.get_stack("default")
+    for index in range(5):
+        zen_store.register_stack(
+            StackWrapper(
+                name=f"stack_{index}", components=default_stack.components
+            )
+        )
+    zen_store.register_stack(StackWrapper(name="empty", components=[]))
+
+    statements = []
+
+    def _count_statement(*args, **kwargs):
+        statements.append(args)
+
+    event.listen(zen_store.engine, "before_cursor_execute", _count_statement)
+    try:
+        stack_configurations = zen_store.stack_configurations
+        assert len(statements) == 1
+        stacks = zen_store.stacks
+        assert len(statements) == 2
+        stack = zen_store.get_stack("stack_0")
+        assert len(statements) == 3
+    finally:
+        event.remove(
+            zen_store.engine, "before_cursor_execute", _count_statement
+        )
+
+    assert len(stacks) == 7
+    assert stack_configurations["empty"] == {}
+    assert stack_configurations["stack_0"] == zen_store.get_stack_configuration(
+        "default"
+    )
+    assert {s.name: s for s in stacks}["stack_0"].components == stack.components
+    assert {c.uuid for c in stack.components} == {
+        c.uuid for c in default_stack.components
+    }
+
+
+def test_rest_zen_store_reuses_pooled_session(mocker):
+    """Test that the REST store sends all requests through a single session
+    which only retries idempotent requests or requests rejected by a busy
+    server."""
+    zen_store = RestZenStore().initialize(
+        "http://127.0.0.1:8000",
+        skip_default_registrations=True,
+        skip_migration=True,
+    )
+    mocker.patch.object(
+        RestZenStore, "_get_authentication", return_value=("default", "")
+    )
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"true"
+    mock_request = mocker.patch.object(
+        requests.Session, "request", return_value=response
+    )
+
+    session = zen_store.session
+    assert zen_store.stacks_empty is True
+    assert zen_store.get(STACKS_EMPTY) is True
+    assert zen_store.session is session
+    assert mock_request.call_count == 2
+    assert mock_request.call_args[1]["timeout"] == REST_STORE_TIMEOUT
+
+    retries = session.get_adapter(zen_store.url).max_retries
+    assert retries.is_retry("GET", status_code=502)
+    assert retries.is_retry("GET", status_code=503)
+    assert not retries.is_retry("POST", status_code=502)
+    assert retries.is_retry("POST", status_code=503)
+
+
+def test_zen_store_caches_reads_until_write(fresh_zen_store, mocker):
+    """Test that stack reads are cached until the zen store writes."""
+    mocker.patch("zenml.zen_stores.base_zen_store.ZEN_STORE_CACHE_TTL", 10)
+    zen_store = fresh_zen_store
+    spy = mocker.spy(zen_store, "_get_stack")
+
+    stack = zen_store.get_stack("default")
+    assert zen_store.get_stack("default") == stack
+    assert zen_store.get_stack("default") is not stack
+    assert spy.call_count == 1
+
+    # missing stacks are looked up again every time
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            zen_store.get_stack("new_stack")
+    assert spy.call_count == 3
+
+    zen_store.register_stack(
+        StackWrapper(name="new_stack", components=stack.components)
+    )
+    call_count = spy.call_count
+    assert zen_store.get_stack("new_stack").name == "new_stack"
+    assert zen_store.get_stack("new_stack").name == "new_stack"
+    assert spy.call_count == call_count + 1
+
+
+def test_zen_store_cache_ttl_defaults(fresh_zen_store):
+    """Test that only the REST zen store caches entities by default."""
+    if fresh_zen_store.type == StoreType.REST:
+        assert fresh_zen_store.cache_ttl > 0
+    else:
+        assert fresh_zen_store.cache_ttl == 0
+
+
+def test_rest_zen_store_revalidates_with_etags(fresh_zen_store, mocker):
+    """Test that unchanged responses aren't sent again by the ZenServer."""
+    if fresh_zen_store.type != StoreType.REST:
+        pytest.skip("ETags are only used by the REST zen store.")
+
+    zen_store = fresh_zen_store
+    spy = mocker.spy(zen_store.session, "request")
+
+    stacks = zen_store.get(STACKS)
+    assert spy.spy_return.status_code == 200
+    assert zen_store.get(STACKS) == stacks
+    assert spy.spy_return.status_code == 304
+
+    zen_store.deregister_stack("default")
+    assert zen_store.get(STACKS) == []
+    assert spy.spy_return.status_code == 200
+
+    # only the most recent responses are kept
+    mocker.patch(
+        "zenml.zen_stores.rest_zen_store.REST_STORE_ETAG_CACHE_SIZE", 1
+    )
+    zen_store.get(USERS)
+    assert list(zen_store._etag_cache) == [USERS]
+
+
 def test_user_management(fresh_zen_store):
     """Tests user creation and deletion."""
     # starts with a default user
@@ -767,3 +907,118 @@ def test_pipeline_run_management(
     different_run = run.copy(update={"name": "different_run_name"})
     with does_not_raise():
         fresh_zen_store.register_pipeline_run(different_run)
+
+
+def test_pipeline_run_pagination(
+    fresh_zen_store, one_step_pipeline, empty_step
+):
+    """Test filtering and paginating pipeline runs."""
+    pipeline = one_step_pipeline(empty_step())
+    default_user = fresh_zen_store.get_user(DEFAULT_USERNAME)
+    other_user = fresh_zen_store.create_user("aria")
+    start_time = datetime(2022, 6, 1)
+
+    runs = [
+        PipelineRunWrapper(
+            name=f"run_{index}",
+            pipeline=PipelineWrapper.from_pipeline(pipeline),
+            stack=StackWrapper.from_stack(Stack.default_local_stack()),
+            runtime_configuration={},
+            user_id=other_user.id if index % 2 else default_user.id,
+            create_time=start_time + timedelta(hours=index),
+        )
+        for index in range(5)
+    ]
+    # register out of order to make sure runs are ordered by creation time
+    for run in reversed(runs):
+        fresh_zen_store.register_pipeline_run(run)
+
+    def _names(runs):
+        return [run.name for run in runs]
+
+    assert fresh_zen_store.get_pipeline_runs(pipeline.name) == runs
+    first_page = fresh_zen_store.get_pipeline_runs(pipeline.name, limit=2)
+    assert first_page == runs[:2]
+    second_page = fresh_zen_store.get_pipeline_runs(
+        pipeline.name, after=first_page[-1].name, limit=2
+    )
+    assert second_page == runs[2:4]
+
+    assert _names(
+        fresh_zen_store.get_pipeline_runs(
+            pipeline.name, since=start_time + timedelta(hours=3)
+        )
+    ) == ["run_3", "run_4"]
+    assert _names(
+        fresh_zen_store.get_pipeline_runs(pipeline.name, user_id=other_user.id)
+    ) == ["run_1", "run_3"]
+
+    latest_runs = fresh_zen_store.get_pipeline_runs(
+        pipeline.name, descending=True, limit=2
+    )
+    assert _names(latest_runs) == ["run_4", "run_3"]
+    assert _names(
+        fresh_zen_store.get_pipeline_run_summaries(
+            pipeline.name, descending=True, after=latest_runs[-1].name
+        )
+    ) == ["run_2", "run_1", "run_0"]
+
+    summaries = fresh_zen_store.get_pipeline_run_summaries(
+        pipeline.name, after="run_2"
+    )
+    assert _names(summaries) == ["run_3", "run_4"]
+    assert summaries[0] == PipelineRunSummary.from_pipeline_run_wrapper(runs[3])
+
+    with pytest.raises(KeyError):
+        fresh_zen_store.get_pipeline_runs(pipeline.name, after="not_a_run")
+
+
+def test_get_stack_components_by_names(fresh_zen_store):
+    """Test fetching multiple stack components at once."""
+    components = fresh_zen_store.get_stack_components_by_names(
+        [
+            (StackComponentType.ORCHESTRATOR, "default"),
+            (StackComponentType.ORCHESTRATOR, "not_a_component"),
+            (StackComponentType.ARTIFACT_STORE, "default"),
+        ]
+    )
+
+    assert [(c.type, c.name) for c in components] == [
+        (StackComponentType.ORCHESTRATOR, "default"),
+        (StackComponentType.ARTIFACT_STORE, "default"),
+    ]
+    assert fresh_zen_store.get_stack_components_by_names([]) == []
+
+
+def test_register_stack_rolls_back_new_components(fresh_zen_store, mocker):
+    """Test that components registered along with a stack are removed again
+    if the stack can't be saved."""
+    if fresh_zen_store.type == StoreType.REST:
+        pytest.skip("Stacks are saved by the ZenServer for REST zen stores.")
+
+    zen_store = fresh_zen_store
+    stack = zen_store.get_stack("default")
+    orchestrator = ComponentWrapper.from_component(
+        LocalOrchestrator(name="new_orchestrator")
+    )
+    components = [
+        component
+        for component in stack.components
+        if component.type != StackComponentType.ORCHESTRATOR
+    ] + [orchestrator]
+    mocker.patch.object(
+        zen_store, "_save_stack", side_effect=RuntimeError("save failed")
+    )
+
+    with pytest.raises(RuntimeError):
+        zen_store.register_stack(
+            StackWrapper(name="new_stack", components=components)
+        )
+
+    with pytest.raises(KeyError):
+        zen_store.get_stack_component(
+            StackComponentType.ORCHESTRATOR, "new_orchestrator"
+        )
+    assert zen_store.get_stack_component(
+        StackComponentType.ARTIFACT_STORE, "default"
+    )